@@ -13,6 +13,7 @@ from intentkit.models.credit import (
     CreditEventTable,
     CreditTransaction,
     CreditTransactionTable,
+    OwnerType,
 )
 from intentkit.models.db import get_session, init_db
 
@@ -92,11 +93,33 @@ async def check_account_balance_consistency() -> List[AccountCheckingResult]:
                 total_balance = (
                     account.free_credits + account.reward_credits + account.credits
                 )
+                pending_balance = Decimal("0")
 
                 # Calculate the expected balance from all transactions, regardless of credit type
+                # Platform accounts may have pending deltas, so the row, the deltas and the
+                # transactions are read in one statement to see a single snapshot
                 # If account has last_event_id, only include transactions from events up to and including that event
                 # If no last_event_id, include all transactions for the account
-                if account.last_event_id:
+                if account.owner_type == OwnerType.PLATFORM:
+                    query = text("""
+                    SELECT
+                        a.free_credits + a.reward_credits + a.credits as balance,
+                        (SELECT COALESCE(SUM(d.free_credits + d.reward_credits + d.credits), 0)
+                         FROM credit_account_deltas d
+                         WHERE d.account_id = a.id) as pending,
+                        (SELECT SUM(change_amount) FROM credit_transactions
+                         WHERE account_id = a.id AND credit_debit = 'credit') as credits,
+                        (SELECT SUM(change_amount) FROM credit_transactions
+                         WHERE account_id = a.id AND credit_debit = 'debit') as debits
+                    FROM credit_accounts a
+                    WHERE a.id = :account_id
+                """)
+
+                    tx_result = await session.execute(
+                        query,
+                        {"account_id": account.id},
+                    )
+                elif account.last_event_id:
                     query = text("""
                     SELECT 
                         SUM(CASE WHEN credit_debit = 'credit' THEN change_amount ELSE 0 END) as credits,
@@ -128,6 +151,10 @@ async def check_account_balance_consistency() -> List[AccountCheckingResult]:
                         {"account_id": account.id},
                     )
                 tx_data = tx_result.fetchone()
+                if account.owner_type == OwnerType.PLATFORM:
+                    total_balance = tx_data.balance
+                    pending_balance = tx_data.pending
+                    total_balance += pending_balance
 
                 credits = tx_data.credits or Decimal("0")
                 debits = tx_data.debits or Decimal("0")
@@ -147,6 +174,7 @@ async def check_account_balance_consistency() -> List[AccountCheckingResult]:
                         "free_credits": float(account.free_credits),
                         "reward_credits": float(account.reward_credits),
                         "credits": float(account.credits),
+                        "pending_balance": float(pending_balance),
                         "expected_balance": float(expected_balance),
                         "total_credits": float(credits),
                         "total_debits": float(debits),
@@ -406,6 +434,7 @@ async def check_total_credit_balance() -> List[AccountCheckingResult]:
     """Check if the sum of all free_credits, reward_credits, and credits across all accounts is 0.
 
     This verifies that the overall credit system is balanced, with all credits accounted for.
+    Pending platform account deltas are part of the balance until they are folded.
 
     Returns:
         List of checking results
@@ -419,7 +448,11 @@ async def check_total_credit_balance() -> List[AccountCheckingResult]:
             SUM(reward_credits) as total_reward_credits,
             SUM(credits) as total_permanent_credits,
             SUM(free_credits) + SUM(reward_credits) + SUM(credits) as grand_total
-        FROM credit_accounts
+        FROM (
+            SELECT free_credits, reward_credits, credits FROM credit_accounts
+            UNION ALL
+            SELECT free_credits, reward_credits, credits FROM credit_account_deltas
+        ) balances
     """)
 
         result = await session.execute(query)
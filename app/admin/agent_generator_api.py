@@ -3,11 +3,14 @@
 FastAPI endpoints for generating agent schemas from natural language prompts.
 """
 
+import asyncio
+import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, validator
 
 from app.admin.generator import generate_validated_agent_schema
@@ -20,7 +23,10 @@ from app.admin.generator.llm_logger import (
     LLMLogger,
     create_llm_logger,
 )
-from app.admin.generator.utils import generate_tags_from_nation_api
+from app.admin.generator.utils import (
+    ProgressCallback,
+    generate_tags_from_nation_api,
+)
 from intentkit.models.agent import AgentUpdate
 
 logger = logging.getLogger(__name__)
@@ -186,16 +192,117 @@ async def generate_agent(
       - 400: Invalid request (missing user_id, invalid prompt format or length)
       - 500: Agent generation failed after retries
     """
-    # Create or reuse LLM logger based on project_id
+    llm_logger = _get_llm_logger(request)
+    project_id = llm_logger.request_id
+
+    try:
+        return await _generate_agent(request, llm_logger)
+    except Exception as e:
+        # All internal retries and AI self-correction failed
+        logger.error(
+            f"Agent generation failed after all attempts (project_id={project_id}): {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "AgentGenerationFailed",
+                "msg": f"Failed to generate valid agent: {str(e)}",
+                "project_id": project_id,
+            },
+        )
+
+
+@router.post(
+    "/generate/stream",
+    summary="Generate Agent with Progress Events",
+)
+async def generate_agent_stream(
+    request: AgentGenerateRequest,
+) -> StreamingResponse:
+    """Generate an agent schema, streaming progress with Server-Sent Events.
+
+    Takes the same request body as `/agent/generate`. Useful for showing progress
+    while the agent is generated, which can take a while.
+
+    **Stream Format:**
+    * `event: progress` - Data is `{"stage": ..., "project_id": ..., **details}`,
+      stages are `attempt_started`, `skills_identified`, `autonomous_detected`,
+      `attributes_generated`, `validated` and `summary_generated`
+    * `event: result` - Data is the `AgentGenerateResponse`, sent last on success
+    * `event: error` - Data is `{"error": ..., "msg": ..., "project_id": ...}`,
+      sent last on failure
+
+    **Returns:**
+    * `StreamingResponse` - SSE stream of progress events and the result
+    """
+    llm_logger = _get_llm_logger(request)
+    project_id = llm_logger.request_id
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def progress(stage: str, data: Dict[str, Any]) -> None:
+        await events.put(
+            ("progress", {"stage": stage, "project_id": project_id, **data})
+        )
+
+    async def run():
+        try:
+            response = await _generate_agent(request, llm_logger, progress)
+            await events.put(("result", response.model_dump(mode="json")))
+        except Exception as e:
+            logger.error(
+                f"Agent generation failed after all attempts (project_id={project_id}): {str(e)}",
+                exc_info=True,
+            )
+            await events.put(
+                (
+                    "error",
+                    {
+                        "error": "AgentGenerationFailed",
+                        "msg": f"Failed to generate valid agent: {str(e)}",
+                        "project_id": project_id,
+                    },
+                )
+            )
+
+    async def stream_gen():
+        task = asyncio.create_task(run())
+        try:
+            while True:
+                event, data = await events.get()
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+                if event != "progress":
+                    break
+        finally:
+            # Client went away, stop generating
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(
+        stream_gen(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+    )
+
+
+def _get_llm_logger(request: AgentGenerateRequest) -> LLMLogger:
+    """Create or reuse the LLM logger based on project_id."""
     if request.project_id:
         llm_logger = LLMLogger(request_id=request.project_id, user_id=request.user_id)
-        project_id = request.project_id
-        logger.info(f"Using existing project_id: {project_id}")
+        logger.info(f"Using existing project_id: {request.project_id}")
     else:
         llm_logger = create_llm_logger(user_id=request.user_id)
-        project_id = llm_logger.request_id
-        logger.info(f"Created new project_id: {project_id}")
+        logger.info(f"Created new project_id: {llm_logger.request_id}")
+    return llm_logger
+
 
+async def _generate_agent(
+    request: AgentGenerateRequest,
+    llm_logger: LLMLogger,
+    progress: Optional[ProgressCallback] = None,
+) -> AgentGenerateResponse:
+    """Generate the agent schema and tags for a request."""
+    project_id = llm_logger.request_id
     logger.info(
         f"Agent generation request received: {request.prompt[:100]}... "
         f"(project_id={project_id})"
@@ -209,78 +316,61 @@ async def generate_agent(
             f"Processing agent update with existing agent data (project_id={project_id})"
         )
 
-    try:
-        # Generate agent schema with automatic validation and AI self-correction
-        (
-            agent_schema,
-            identified_skills,
-            summary,
-        ) = await generate_validated_agent_schema(
-            prompt=request.prompt,
-            user_id=request.user_id,
-            existing_agent=request.existing_agent,
-            llm_logger=llm_logger,
-        )
+    # Generate agent schema with automatic validation and AI self-correction
+    (
+        agent_schema,
+        identified_skills,
+        summary,
+    ) = await generate_validated_agent_schema(
+        prompt=request.prompt,
+        user_id=request.user_id,
+        existing_agent=request.existing_agent,
+        llm_logger=llm_logger,
+        progress=progress,
+    )
 
-        # Generate tags using Nation API
-        tags = await generate_tags_from_nation_api(agent_schema, request.prompt)
+    # Generate tags using Nation API
+    tags = await generate_tags_from_nation_api(agent_schema, request.prompt)
 
+    logger.info(f"Agent generation completed successfully (project_id={project_id})")
+    if is_update:
         logger.info(
-            f"Agent generation completed successfully (project_id={project_id})"
+            f"Agent schema updated via minimal changes with AI self-correction (project_id={project_id})"
         )
-        if is_update:
-            logger.info(
-                f"Agent schema updated via minimal changes with AI self-correction (project_id={project_id})"
-            )
-        else:
-            logger.info(
-                f"New agent schema generated successfully with validation (project_id={project_id})"
-            )
-
-        # Extract autonomous tasks and activated skills from the schema
-        autonomous_tasks = agent_schema.get("autonomous", [])
-        activated_skills = list(agent_schema.get("skills", {}).keys())
-
-        # Enhanced logging for autonomous functionality
-        if autonomous_tasks:
-            logger.info(f" Autonomous tasks detected: {len(autonomous_tasks)} tasks")
-            for task in autonomous_tasks:
-                schedule_info = (
-                    f"{task.get('minutes')} minutes"
-                    if task.get("minutes")
-                    else task.get("cron", "unknown")
-                )
-                logger.info(f"  '{task.get('name', 'Unnamed Task')}' - {schedule_info}")
-        else:
-            logger.info(" No autonomous tasks in generated agent")
-
+    else:
         logger.info(
-            f" Activated skills: {len(activated_skills)} skills - {activated_skills}"
+            f"New agent schema generated successfully with validation (project_id={project_id})"
         )
 
-        return AgentGenerateResponse(
-            agent=agent_schema,
-            project_id=project_id,
-            summary=summary,
-            tags=tags,
-            autonomous_tasks=autonomous_tasks,
-            activated_skills=activated_skills,
-        )
+    # Extract autonomous tasks and activated skills from the schema
+    autonomous_tasks = agent_schema.get("autonomous", [])
+    activated_skills = list(agent_schema.get("skills", {}).keys())
+
+    # Enhanced logging for autonomous functionality
+    if autonomous_tasks:
+        logger.info(f" Autonomous tasks detected: {len(autonomous_tasks)} tasks")
+        for task in autonomous_tasks:
+            schedule_info = (
+                f"{task.get('minutes')} minutes"
+                if task.get("minutes")
+                else task.get("cron", "unknown")
+            )
+            logger.info(f"  '{task.get('name', 'Unnamed Task')}' - {schedule_info}")
+    else:
+        logger.info(" No autonomous tasks in generated agent")
 
-    except Exception as e:
-        # All internal retries and AI self-correction failed
-        logger.error(
-            f"Agent generation failed after all attempts (project_id={project_id}): {str(e)}",
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "AgentGenerationFailed",
-                "msg": f"Failed to generate valid agent: {str(e)}",
-                "project_id": project_id,
-            },
-        )
+    logger.info(
+        f" Activated skills: {len(activated_skills)} skills - {activated_skills}"
+    )
+
+    return AgentGenerateResponse(
+        agent=agent_schema,
+        project_id=project_id,
+        summary=summary,
+        tags=tags,
+        autonomous_tasks=autonomous_tasks,
+        activated_skills=activated_skills,
+    )
 
 
 @router.get(
@@ -1,4 +1,3 @@
-import importlib
 import logging
 from typing import Annotated, Optional, TypedDict
 
@@ -40,7 +39,7 @@ from intentkit.models.agent import (
 from intentkit.models.agent_data import AgentData, AgentDataTable
 from intentkit.models.db import get_db
 from intentkit.models.user import User
-from intentkit.skills import __all__ as skill_categories
+from intentkit.skills.registry import get_skill_registry
 from intentkit.utils.slack_alert import send_slack_message
 
 admin_router_readonly = APIRouter()
@@ -757,10 +756,11 @@ async def export_agent(
         agent.skills = {}
 
     # Process all skill categories
-    for category in skill_categories:
+    skill_registry = get_skill_registry()
+    for category in skill_registry.categories:
         try:
-            # Dynamically import the skill module
-            skill_module = importlib.import_module(f"intentkit.skills.{category}")
+            # Import the skill module, its Config class lists the fields
+            skill_module = skill_registry.module(category)
 
             # Check if the module has a Config class and get_skills function
             if hasattr(skill_module, "Config") and hasattr(skill_module, "get_skills"):
@@ -775,16 +775,8 @@ async def export_agent(
                 if "states" not in category_config:
                     category_config["states"] = {}
 
-                # Get all available skill states from the module
-                available_skills = []
-                if hasattr(skill_module, "SkillStates") and hasattr(
-                    skill_module.SkillStates, "__annotations__"
-                ):
-                    available_skills = list(
-                        skill_module.SkillStates.__annotations__.keys()
-                    )
                 # Add missing skills with disabled state
-                for skill_name in available_skills:
+                for skill_name in skill_registry.tool_names(category):
                     if skill_name not in category_config["states"]:
                         category_config["states"][skill_name] = "disabled"
 
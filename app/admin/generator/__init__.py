@@ -19,6 +19,11 @@ from .conversation_service import (
     get_project_metadata,
     get_projects_by_user,
 )
+from .llm_client import (
+    FakeLLMClient,
+    get_llm_client,
+    set_llm_client,
+)
 from .llm_logger import (
     LLMLogger,
     create_llm_logger,
@@ -29,6 +34,7 @@ from .skill_processor import (
 )
 from .utils import (
     ALLOWED_MODELS,
+    ProgressCallback,
     extract_token_usage,
     generate_agent_summary,
     generate_request_id,
@@ -53,6 +59,10 @@ __all__ = [
     "get_conversation_history",
     "get_project_metadata",
     "get_projects_by_user",
+    # LLM client
+    "get_llm_client",
+    "set_llm_client",
+    "FakeLLMClient",
     # LLM logging
     "create_llm_logger",
     "generate_request_id",
@@ -62,6 +72,7 @@ __all__ = [
     "filter_skills_for_auto_generation",
     # Utilities
     "extract_token_usage",
+    "ProgressCallback",
     "ALLOWED_MODELS",
     # Validation
     "validate_schema",
@@ -4,12 +4,12 @@ Main orchestrator for AI-powered agent generation from natural language prompts.
 This module coordinates the skill processing, validation, and AI assistance modules.
 """
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-from intentkit.config.config import config
 from intentkit.models.agent import AgentUpdate
 
 from .ai_assistant import (
@@ -18,11 +18,13 @@ from .ai_assistant import (
     generate_validated_agent,
 )
 from .autonomous_generator import generate_autonomous_configuration
+from .llm_client import get_llm_client
 from .skill_processor import (
     filter_skills_for_auto_generation,
     identify_skills,
     merge_autonomous_skills,
 )
+from .utils import ProgressCallback, report_progress
 
 if TYPE_CHECKING:
     from .llm_logger import LLMLogger
@@ -35,6 +37,7 @@ async def generate_agent_schema(
     user_id: Optional[str] = None,
     existing_agent: Optional[AgentUpdate] = None,
     llm_logger: Optional["LLMLogger"] = None,
+    progress: Optional[ProgressCallback] = None,
 ) -> Tuple[Dict[str, Any], Set[str], Dict[str, Any]]:
     """Generate agent schema from a natural language prompt.
 
@@ -46,6 +49,7 @@ async def generate_agent_schema(
      user_id: Optional user ID for ownership and validation
      existing_agent: Optional existing agent to update (preserves configuration)
      llm_logger: Optional LLM logger for tracking individual API calls
+     progress: Optional callback receiving progress events
 
     Returns:
      A tuple of (agent_schema, identified_skills, token_usage)
@@ -54,13 +58,7 @@ async def generate_agent_schema(
         f"Generating agent schema from prompt: '{prompt[:50]}{'...' if len(prompt) > 50 else ''}'"
     )
 
-    # Get OpenAI API key from config
-    api_key = config.openai_api_key
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY is not set in configuration")
-
-    # Create OpenAI client
-    client = OpenAI(api_key=api_key)
+    client = get_llm_client()
 
     if existing_agent:
         # Update existing agent - preserves configuration, makes minimal changes
@@ -71,6 +69,7 @@ async def generate_agent_schema(
             client=client,
             user_id=user_id,
             llm_logger=llm_logger,
+            progress=progress,
         )
     else:
         # Create new agent from scratch
@@ -80,6 +79,7 @@ async def generate_agent_schema(
             client=client,
             user_id=user_id,
             llm_logger=llm_logger,
+            progress=progress,
         )
 
     logger.info(f"Generated agent schema with {len(skills)} skills: {list(skills)}")
@@ -88,62 +88,84 @@ async def generate_agent_schema(
 
 async def _generate_new_agent_schema(
     prompt: str,
-    client: OpenAI,
+    client: AsyncOpenAI,
     user_id: Optional[str] = None,
     llm_logger: Optional["LLMLogger"] = None,
+    progress: Optional[ProgressCallback] = None,
 ) -> Tuple[Dict[str, Any], Set[str], Dict[str, Any]]:
     """Generate a completely new agent schema from a prompt.
 
+    Autonomous detection and attribute generation only depend on the prompt
+    and the keyword matched skills, so both LLM calls run concurrently.
+
     Args:
      prompt: Natural language prompt
-     client: OpenAI client
+     client: AsyncOpenAI client
      user_id: Optional user ID
      llm_logger: Optional LLM logger for tracking API calls
+     progress: Optional callback receiving progress events
 
     Returns:
      A tuple of (agent_schema, identified_skills, token_usage)
     """
-    # Step 1: Check for autonomous patterns first
-    logger.info(" Step 1: Checking for autonomous task patterns")
-    autonomous_result = await generate_autonomous_configuration(
-        prompt, client, llm_logger=llm_logger
+    # Step 1: Identify required skills from the prompt, no LLM call involved
+    logger.info(" Step 1: Identifying skills from prompt")
+    skills_config = await identify_skills(prompt, client, llm_logger=llm_logger)
+    skills_config = await filter_skills_for_auto_generation(skills_config)
+    await report_progress(
+        progress, "skills_identified", skills=list(skills_config.keys())
+    )
+
+    # Step 2: Check for autonomous patterns and generate agent attributes
+    # (name, purpose, personality, etc.) at the same time
+    logger.info(" Step 2: Checking autonomous patterns and generating attributes")
+
+    async def detect_autonomous():
+        result = await generate_autonomous_configuration(
+            prompt, client, llm_logger=llm_logger
+        )
+        await report_progress(
+            progress,
+            "autonomous_detected",
+            tasks=len(result[0]) if result else 0,
+        )
+        return result
+
+    async def generate_attributes():
+        result = await generate_agent_attributes(
+            prompt, skills_config, client, llm_logger=llm_logger, user_id=user_id
+        )
+        await report_progress(
+            progress, "attributes_generated", name=result[0].get("name")
+        )
+        return result
+
+    autonomous_result, (attributes, token_usage) = await asyncio.gather(
+        detect_autonomous(), generate_attributes()
     )
 
     autonomous_configs = []
-    autonomous_skills = []
     if autonomous_result:
         autonomous_configs, autonomous_skills = autonomous_result
         logger.info(f"Generated {len(autonomous_configs)} autonomous tasks")
         logger.info(f"Autonomous tasks require skills: {autonomous_skills}")
+        if autonomous_skills:
+            # Merge autonomous skills with identified skills
+            logger.info(
+                f"Merging {len(autonomous_skills)} autonomous skills with identified skills"
+            )
+            skills_config = merge_autonomous_skills(skills_config, autonomous_skills)
+            # Filter out skills that require agent owner API keys
+            skills_config = await filter_skills_for_auto_generation(skills_config)
     else:
         logger.info(
             " No autonomous patterns detected, proceeding with standard agent generation"
         )
 
-    # Step 2: Identify required skills from the prompt
-    logger.info(" Step 2: Identifying skills from prompt")
-    skills_config = await identify_skills(prompt, client, llm_logger=llm_logger)
-
-    # Merge autonomous skills with identified skills
-    if autonomous_skills:
-        logger.info(
-            f"Merging {len(autonomous_skills)} autonomous skills with identified skills"
-        )
-        skills_config = merge_autonomous_skills(skills_config, autonomous_skills)
-
-    # Filter out skills that require agent owner API keys
-    skills_config = await filter_skills_for_auto_generation(skills_config)
-
     logger.info(f"Final identified skills: {list(skills_config.keys())}")
 
-    # Step 3: Generate agent attributes (name, purpose, personality, etc.)
-    logger.info(" Step 3: Generating agent attributes")
-    attributes, token_usage = await generate_agent_attributes(
-        prompt, skills_config, client, llm_logger=llm_logger, user_id=user_id
-    )
-
-    # Step 4: Combine into complete agent schema
-    logger.info(" Step 4: Assembling complete agent schema")
+    # Step 3: Combine into complete agent schema
+    logger.info(" Step 3: Assembling complete agent schema")
     schema = {
         **attributes,
         "skills": skills_config,
@@ -186,6 +208,7 @@ async def generate_validated_agent_schema(
     user_id: Optional[str] = None,
     existing_agent: Optional[AgentUpdate] = None,
     llm_logger: Optional["LLMLogger"] = None,
+    progress: Optional[ProgressCallback] = None,
 ) -> Tuple[Dict[str, Any], Set[str], str]:
     """Generate and validate agent schema with summary.
 
@@ -194,6 +217,7 @@ async def generate_validated_agent_schema(
      user_id: Optional user ID for ownership and validation
      existing_agent: Optional existing agent to update
      llm_logger: Optional LLM logger for tracking individual API calls
+     progress: Optional callback receiving progress events
 
     Returns:
      A tuple of (agent_schema, identified_skills, summary_message)
@@ -203,4 +227,5 @@ async def generate_validated_agent_schema(
         user_id=user_id,
         existing_agent=existing_agent,
         llm_logger=llm_logger,
+        progress=progress,
     )
@@ -6,14 +6,14 @@ This module handles core AI operations for agent generation including:
 - AI-powered error correction and schema fixing
 """
 
+import asyncio
 import json
 import logging
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-from intentkit.config.config import config
 from intentkit.models.agent import AgentUpdate
 from intentkit.models.db import get_session
 from intentkit.models.generator import (
@@ -23,12 +23,18 @@ from intentkit.models.generator import (
 
 from .autonomous_generator import generate_autonomous_configuration
 from .conversation_service import ConversationService, get_conversation_history
+from .llm_client import get_llm_client
 from .skill_processor import (
     filter_skills_for_auto_generation,
     identify_skills,
     merge_autonomous_skills,
 )
-from .utils import extract_token_usage, generate_agent_summary
+from .utils import (
+    ProgressCallback,
+    extract_token_usage,
+    generate_agent_summary,
+    report_progress,
+)
 from .validation import (
     validate_agent_create,
     validate_schema,
@@ -43,9 +49,10 @@ logger = logging.getLogger(__name__)
 async def enhance_agent(
     prompt: str,
     existing_agent: "AgentUpdate",
-    client: OpenAI,
+    client: AsyncOpenAI,
     user_id: Optional[str] = None,
     llm_logger: Optional["LLMLogger"] = None,
+    progress: Optional[ProgressCallback] = None,
 ) -> Tuple[Dict[str, Any], Set[str], Dict[str, Any]]:
     """Generate minimal updates to an existing agent based on a prompt.
 
@@ -55,9 +62,10 @@ async def enhance_agent(
     Args:
         prompt: The natural language prompt describing desired changes
         existing_agent: The current agent configuration
-        client: OpenAI client for API calls
+        client: AsyncOpenAI client for API calls
         user_id: Optional user ID for validation
         llm_logger: Optional LLM logger for tracking API calls
+        progress: Optional callback receiving progress events
 
     Returns:
         A tuple of (updated_schema, identified_skills, token_usage)
@@ -85,10 +93,17 @@ async def enhance_agent(
     # Convert existing agent to dictionary format
     existing_schema = existing_agent.model_dump(exclude_unset=True)
 
-    # Check for autonomous patterns first
+    # Check for autonomous patterns and identify skills from the prompt,
+    # the two are independent so they run concurrently
     logger.info("Checking for autonomous patterns in update prompt")
-    autonomous_result = await generate_autonomous_configuration(
-        prompt, client, llm_logger=llm_logger
+    autonomous_result, identified_skills_config = await asyncio.gather(
+        generate_autonomous_configuration(prompt, client, llm_logger=llm_logger),
+        identify_skills(prompt, client, llm_logger=llm_logger),
+    )
+    await report_progress(
+        progress,
+        "autonomous_detected",
+        tasks=len(autonomous_result[0]) if autonomous_result else 0,
     )
 
     autonomous_configs = []
@@ -98,10 +113,6 @@ async def enhance_agent(
         logger.info(f"Generated {len(autonomous_configs)} autonomous tasks for update")
         logger.info(f"Autonomous tasks require skills: {autonomous_skills}")
 
-    # Use the real skill processor to identify skills from prompt
-    identified_skills_config = await identify_skills(
-        prompt, client, llm_logger=llm_logger
-    )
     identified_skill_names = set(identified_skills_config.keys())
 
     # Merge autonomous skills with identified skills
@@ -111,6 +122,9 @@ async def enhance_agent(
     identified_skill_names.update(autonomous_skills)
 
     logger.info(f"Real skills identified from prompt: {identified_skill_names}")
+    await report_progress(
+        progress, "skills_identified", skills=sorted(identified_skill_names)
+    )
 
     # Start with existing configuration
     updated_schema = existing_schema.copy()
@@ -257,7 +271,7 @@ Make minimal changes based on the prompt. If this is part of an ongoing conversa
                 call_start_time = time.time()
 
                 # Make OpenAI API call
-                response = client.chat.completions.create(
+                response = await client.chat.completions.create(
                     model="gpt-4.1-nano",
                     messages=messages,
                     temperature=0.3,
@@ -300,7 +314,7 @@ Make minimal changes based on the prompt. If this is part of an ongoing conversa
                 total_token_usage = extract_token_usage(response)
         else:
             # Make call without logging (fallback)
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4.1-nano",
                 messages=messages,
                 temperature=0.3,
@@ -344,7 +358,7 @@ Make minimal changes based on the prompt. If this is part of an ongoing conversa
 async def generate_agent_attributes(
     prompt: str,
     skills_config: Dict[str, Any],
-    client: OpenAI,
+    client: AsyncOpenAI,
     llm_logger: Optional["LLMLogger"] = None,
     user_id: Optional[str] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -353,7 +367,7 @@ async def generate_agent_attributes(
     Args:
         prompt: The natural language prompt
         skills_config: Configuration of identified skills
-        client: OpenAI client for API calls
+        client: AsyncOpenAI client for API calls
         llm_logger: Optional LLM logger for tracking API calls
 
     Returns:
@@ -425,7 +439,7 @@ If this is part of an ongoing conversation, consider the previous context while
             call_start_time = time.time()
 
             # Make OpenAI API call
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4.1-nano",
                 messages=messages,
                 temperature=0.7,
@@ -466,7 +480,7 @@ If this is part of an ongoing conversation, consider the previous context while
             token_usage = extract_token_usage(response)
     else:
         # Make call without logging (fallback)
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4.1-nano",
             messages=messages,
             temperature=0.7,
@@ -498,6 +512,7 @@ async def generate_validated_agent(
     existing_agent: Optional["AgentUpdate"] = None,
     llm_logger: Optional["LLMLogger"] = None,
     max_attempts: int = 3,
+    progress: Optional[ProgressCallback] = None,
 ) -> Tuple[Dict[str, Any], Set[str], str]:
     """Generate agent schema with automatic validation retry and AI self-correction.
 
@@ -513,6 +528,7 @@ async def generate_validated_agent(
         existing_agent: Optional existing agent to update
         llm_logger: Optional LLM logger for tracking API calls
         max_attempts: Maximum number of generation attempts
+        progress: Optional callback receiving progress events
 
     Returns:
         A tuple of (validated_schema, identified_skills, summary_message)
@@ -544,22 +560,18 @@ async def generate_validated_agent(
     total_output_tokens = 0
     all_token_details = []
 
-    # Get OpenAI API key from config
-    api_key = config.openai_api_key
-    if not api_key:
-        error_msg = "OPENAI_API_KEY is not set in configuration"
+    try:
+        client = get_llm_client()
+    except ValueError as e:
         # Update log with error
         async with get_session() as session:
             await generation_log.update_completion(
                 session=session,
                 success=False,
-                error_message=error_msg,
+                error_message=str(e),
                 generation_time_ms=int((time.time() - start_time) * 1000),
             )
-        raise ValueError(error_msg)
-
-    # Create OpenAI client
-    client = OpenAI(api_key=api_key)
+        raise
 
     last_schema = None
     last_errors = []
@@ -569,6 +581,7 @@ async def generate_validated_agent(
         for attempt in range(max_attempts):
             try:
                 logger.info(f"Schema generation attempt {attempt + 1}/{max_attempts}")
+                await report_progress(progress, "attempt_started", attempt=attempt + 1)
 
                 if attempt == 0:
                     # First attempt: Generate from scratch
@@ -579,6 +592,7 @@ async def generate_validated_agent(
                         user_id=user_id,
                         existing_agent=existing_agent,
                         llm_logger=llm_logger,
+                        progress=progress,
                     )
                     last_schema = schema
                     identified_skills = skills
@@ -613,8 +627,15 @@ async def generate_validated_agent(
                         all_token_details.append(token_usage)
 
                 # Validate the schema
-                schema_validation = await validate_schema(schema)
-                agent_validation = await validate_agent_create(schema, user_id)
+                schema_validation, agent_validation = await asyncio.gather(
+                    validate_schema(schema), validate_agent_create(schema, user_id)
+                )
+                await report_progress(
+                    progress,
+                    "validated",
+                    attempt=attempt + 1,
+                    valid=schema_validation.valid and agent_validation.valid,
+                )
 
                 # Check if validation passed
                 if schema_validation.valid and agent_validation.valid:
@@ -627,6 +648,7 @@ async def generate_validated_agent(
                         client=client,
                         llm_logger=llm_logger,
                     )
+                    await report_progress(progress, "summary_generated")
 
                     # Store assistant response in conversation
                     if conversation_service:
@@ -736,7 +758,7 @@ async def fix_agent_schema_with_ai_logged(
     original_prompt: str,
     failed_schema: Dict[str, Any],
     validation_errors: List[str],
-    client: OpenAI,
+    client: AsyncOpenAI,
     user_id: Optional[str] = None,
     existing_agent: Optional["AgentUpdate"] = None,
     llm_logger: Optional["LLMLogger"] = None,
@@ -748,7 +770,7 @@ async def fix_agent_schema_with_ai_logged(
         original_prompt: The original user prompt
         failed_schema: The schema that failed validation
         validation_errors: List of validation error messages
-        client: OpenAI client for API calls
+        client: AsyncOpenAI client for API calls
         user_id: Optional user ID for validation
         existing_agent: Optional existing agent context
         llm_logger: Optional LLM logger for tracking API calls
@@ -822,7 +844,7 @@ Please fix these errors and return the corrected agent schema as valid JSON.""",
             call_start_time = time.time()
 
             # Make OpenAI API call
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4.1-nano",
                 messages=messages,
                 temperature=0.3,
@@ -875,7 +897,7 @@ Please fix these errors and return the corrected agent schema as valid JSON.""",
             token_usage = extract_token_usage(response)
     else:
         # Make call without logging (fallback)
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4.1-nano",
             messages=messages,
             temperature=0.3,
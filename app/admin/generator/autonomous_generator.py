@@ -10,10 +10,10 @@ import time
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from epyxid import XID
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from intentkit.models.agent import AgentAutonomous
-from intentkit.skills import __all__ as available_skill_categories
+from intentkit.skills.registry import get_skill_registry
 
 if TYPE_CHECKING:
     from .llm_logger import LLMLogger
@@ -23,14 +23,14 @@ logger = logging.getLogger(__name__)
 
 async def generate_autonomous_configuration(
     prompt: str,
-    client: OpenAI,
+    client: AsyncOpenAI,
     llm_logger: Optional["LLMLogger"] = None,
 ) -> Optional[Tuple[List[AgentAutonomous], List[str]]]:
     """Generate autonomous configuration from a prompt using AI.
 
     Args:
       prompt: The natural language prompt to analyze
-      client: OpenAI client for LLM analysis
+      client: AsyncOpenAI client for LLM analysis
       llm_logger: Optional LLM logger for tracking API calls
 
     Returns:
@@ -38,6 +38,7 @@ async def generate_autonomous_configuration(
       None otherwise
     """
     logger.info("Using AI to analyze prompt for autonomous patterns")
+    available_skill_categories = get_skill_registry().categories
     logger.debug(
         f"Analyzing prompt: '{prompt[:100]}{'...' if len(prompt) > 100 else ''}'"
     )
@@ -110,7 +111,7 @@ Be accurate and only detect true autonomous patterns with clear scheduling inten
 
                 try:
                     # Make OpenAI API call
-                    response = client.chat.completions.create(
+                    response = await client.chat.completions.create(
                         model="gpt-4.1",
                         messages=messages,
                         temperature=0.1,
@@ -136,7 +137,7 @@ Be accurate and only detect true autonomous patterns with clear scheduling inten
         else:
             # Make call without logging (fallback)
             try:
-                response = client.chat.completions.create(
+                response = await client.chat.completions.create(
                     model="gpt-4.1", messages=messages, temperature=0.1, max_tokens=500
                 )
             except Exception as api_error:
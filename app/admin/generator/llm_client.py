@@ -0,0 +1,137 @@
+"""LLM Client Module.
+
+Provides the async OpenAI client shared by the generator modules.
+With FAKE_LLM enabled, or a client set by tests, a local fake answers
+instead, so the generator pipeline can run without network access.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from epyxid import XID
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
+
+from intentkit.config.config import config
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a generator LLM call is abandoned
+LLM_TIMEOUT = 60.0
+
+_client: Optional[Any] = None
+
+
+def get_llm_client() -> Any:
+    """Get the process-wide LLM client.
+
+    Returns:
+        An AsyncOpenAI client, or a FakeLLMClient if FAKE_LLM is enabled
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set and no fake is used
+    """
+    global _client
+    if _client is None:
+        if config.fake_llm:
+            logger.info("Using fake LLM client for agent generation")
+            _client = FakeLLMClient()
+        else:
+            if not config.openai_api_key:
+                raise ValueError("OPENAI_API_KEY is not set in configuration")
+            _client = AsyncOpenAI(api_key=config.openai_api_key, timeout=LLM_TIMEOUT)
+    return _client
+
+
+def set_llm_client(client: Optional[Any]) -> None:
+    """Replace the LLM client, for tests. None restores the default."""
+    global _client
+    _client = client
+
+
+def default_fake_response(messages: List[Dict[str, Any]]) -> str:
+    """Answer generator prompts with fixed, valid content."""
+    system = messages[0].get("content", "") if messages else ""
+    if "autonomous task patterns" in system:
+        return json.dumps({"has_autonomous": False})
+    if "generating agent attributes" in system:
+        return json.dumps(
+            {
+                "name": "Test Agent",
+                "purpose": "An agent generated by the fake LLM.",
+                "personality": "Concise and predictable.",
+                "principles": "• Answer deterministically",
+            }
+        )
+    if "updating an existing agent" in system or "fixing IntentKit" in system:
+        # Echo the schema sent in the last message back unchanged
+        content = messages[-1].get("content", "")
+        start = content.find("{")
+        end = content.rfind("}")
+        if start != -1 and end > start:
+            return content[start : end + 1]
+        return "{}"
+    if "congratulatory message" in system:
+        return "Congratulations! Your agent is ready."
+    if "tag" in system.lower() or "tag" in messages[-1].get("content", "").lower():
+        return "[]"
+    return "{}"
+
+
+class _FakeCompletions:
+    def __init__(self, responder: Callable[[List[Dict[str, Any]]], str]):
+        self.responder = responder
+        self.calls: List[Dict[str, Any]] = []
+
+    async def create(self, **kwargs) -> ChatCompletion:
+        self.calls.append(kwargs)
+        messages = kwargs.get("messages", [])
+        content = self.responder(messages)
+        prompt_tokens = sum(len(str(m.get("content", ""))) // 4 for m in messages)
+        completion_tokens = len(content) // 4
+        return ChatCompletion.model_validate(
+            {
+                "id": f"fake-{XID()}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": kwargs.get("model", "fake"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            }
+        )
+
+
+class _FakeChat:
+    def __init__(self, completions: _FakeCompletions):
+        self.completions = completions
+
+
+class FakeLLMClient:
+    """Local stand-in for AsyncOpenAI, supporting chat.completions.create.
+
+    Args:
+        responder: Maps the request messages to the reply content,
+            default_fake_response if not given
+    """
+
+    def __init__(
+        self, responder: Optional[Callable[[List[Dict[str, Any]]], str]] = None
+    ):
+        self.chat = _FakeChat(_FakeCompletions(responder or default_fake_response))
+
+    @property
+    def calls(self) -> List[Dict[str, Any]]:
+        """Arguments of every create call made so far."""
+        return self.chat.completions.calls
@@ -4,247 +4,100 @@ This module handles all skill-related operations for agent generation including:
 - Skill identification from prompts
 - Skill validation and filtering
 - Keyword and AI-based skill matching
+
+Skill categories, states and schemas come from the skill registry manifest,
+no skill module is imported here.
 """
 
-import importlib
-import json
 import logging
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-from intentkit.skills import __all__ as available_skill_categories
+from intentkit.skills.registry import get_skill_registry
 
 if TYPE_CHECKING:
     from .llm_logger import LLMLogger
 
 logger = logging.getLogger(__name__)
 
-# Get available skill categories from the skills module
-AVAILABLE_SKILL_CATEGORIES = set(available_skill_categories)
-
-# Cache for skill states to avoid repeated imports
-_skill_states_cache: Dict[str, Set[str]] = {}
-_all_skills_cache: Dict[str, Dict[str, Set[str]]] = {}
-_skill_schemas_cache: Dict[str, Dict[str, Any]] = {}
-
 
 def load_skill_schema(skill_name: str) -> Optional[Dict[str, Any]]:
-    """Load schema.json for a specific skill."""
-    if skill_name in _skill_schemas_cache:
-        return _skill_schemas_cache[skill_name]
-
-    try:
-        # Get the skills directory path
-        # From intentkit/app/admin/generator/skill_processor.py to intentkit/skills/
-        skills_dir = Path(__file__).parent.parent.parent.parent / "intentkit" / "skills"
-        schema_path = skills_dir / skill_name / "schema.json"
-
-        if schema_path.exists():
-            with open(schema_path, "r") as f:
-                schema = json.load(f)
-                _skill_schemas_cache[skill_name] = schema
-                return schema
-        else:
-            logger.warning(f"Schema file not found for skill: {skill_name}")
-            return None
-    except Exception as e:
-        logger.error(f"Error loading schema for skill {skill_name}: {e}")
-        return None
+    """Get schema.json of a specific skill."""
+    schema = get_skill_registry().schema(skill_name)
+    if schema is None:
+        logger.warning(f"Schema file not found for skill: {skill_name}")
+    return schema
 
 
 def get_agent_owner_api_key_skills() -> Set[str]:
     """Get skills that require agent owner API keys."""
-    agent_owner_skills = set()
-
-    for skill_name in AVAILABLE_SKILL_CATEGORIES:
-        try:
-            schema = load_skill_schema(skill_name)
-            if (
-                schema
-                and "properties" in schema
-                and "api_key_provider" in schema["properties"]
-            ):
-                api_key_provider = schema["properties"]["api_key_provider"]
-                if "enum" in api_key_provider and api_key_provider["enum"] == [
-                    "agent_owner"
-                ]:
-                    agent_owner_skills.add(skill_name)
-        except Exception as e:
-            logger.warning(
-                f"Error checking API key requirement for skill {skill_name}: {e}"
-            )
-
-    return agent_owner_skills
+    registry = get_skill_registry()
+    return {
+        name
+        for name in registry.categories
+        if registry.get(name).api_key_providers == ["agent_owner"]
+    }
 
 
 def get_configurable_api_key_skills() -> Set[str]:
     """Get skills with configurable API key providers."""
-    configurable_skills = set()
-
-    for skill_name in AVAILABLE_SKILL_CATEGORIES:
-        try:
-            schema = load_skill_schema(skill_name)
-            if (
-                schema
-                and "properties" in schema
-                and "api_key_provider" in schema["properties"]
-            ):
-                api_key_provider = schema["properties"]["api_key_provider"]
-                if "enum" in api_key_provider:
-                    enum_values = set(api_key_provider["enum"])
-                    if "platform" in enum_values and "agent_owner" in enum_values:
-                        configurable_skills.add(skill_name)
-        except Exception as e:
-            logger.warning(
-                f"Error checking API key configurability for skill {skill_name}: {e}"
-            )
-
-    return configurable_skills
+    registry = get_skill_registry()
+    return {
+        name
+        for name in registry.categories
+        if {"platform", "agent_owner"} <= set(registry.get(name).api_key_providers)
+    }
 
 
 def get_skill_keyword_config() -> Dict[str, List[str]]:
     """Generate skill keyword configuration from schemas."""
+    registry = get_skill_registry()
     config = {}
-
-    for skill_name in AVAILABLE_SKILL_CATEGORIES:
-        try:
-            schema = load_skill_schema(skill_name)
-            keywords = [skill_name]  # Always include skill name
-
-            if schema:
-                # Add title words
-                if "title" in schema:
-                    keywords.extend(schema["title"].lower().split())
-
-                # Add x-tags
-                if "x-tags" in schema:
-                    keywords.extend([tag.lower() for tag in schema["x-tags"]])
-
-            config[skill_name] = keywords
-        except Exception as e:
-            logger.warning(f"Error getting keywords for skill {skill_name}: {e}")
-            config[skill_name] = [skill_name]
-
+    for skill_name in registry.categories:
+        info = registry.get(skill_name)
+        keywords = [skill_name]  # Always include skill name
+        # Add title words and x-tags
+        keywords.extend(info.title.lower().split())
+        keywords.extend(tag.lower() for tag in info.tags)
+        config[skill_name] = keywords
     return config
 
 
 def get_skill_state_default(skill_name: str, state_name: str) -> str:
     """Get the default value for a specific skill state from its schema."""
-    try:
-        schema = load_skill_schema(skill_name)
-        if (
-            schema
-            and "properties" in schema
-            and "states" in schema["properties"]
-            and "properties" in schema["properties"]["states"]
-            and state_name in schema["properties"]["states"]["properties"]
-        ):
-            state_config = schema["properties"]["states"]["properties"][state_name]
-
-            # Return the default value if specified
-            if "default" in state_config:
-                return state_config["default"]
-
-            # If no default, use the first valid enum value
-            if "enum" in state_config and state_config["enum"]:
-                return state_config["enum"][0]
-
-        # Fallback to "private"
-        return "private"
-
-    except Exception as e:
-        logger.warning(f"Error getting default for {skill_name}.{state_name}: {e}")
-        return "private"
+    info = get_skill_registry().get(skill_name)
+    if info and state_name in info.states:
+        return info.states[state_name]
+    # Fallback to "private"
+    return "private"
 
 
 def get_skill_default_api_key_provider(skill_name: str) -> str:
     """Get the default API key provider for a skill from its schema."""
-    try:
-        schema = load_skill_schema(skill_name)
-        if (
-            schema
-            and "properties" in schema
-            and "api_key_provider" in schema["properties"]
-        ):
-            api_key_provider = schema["properties"]["api_key_provider"]
-
-            # Return the default value if specified
-            if "default" in api_key_provider:
-                return api_key_provider["default"]
-
-            # If no default, prefer platform if available
-            if "enum" in api_key_provider and api_key_provider["enum"]:
-                if "platform" in api_key_provider["enum"]:
-                    return "platform"
-                return api_key_provider["enum"][0]
-
-        # Fallback to "platform"
-        return "platform"
-
-    except Exception as e:
-        logger.warning(f"Error getting API key provider default for {skill_name}: {e}")
-        return "platform"
+    info = get_skill_registry().get(skill_name)
+    if info:
+        return info.default_api_key_provider
+    # Fallback to "platform"
+    return "platform"
 
 
 def get_skill_states(skill_category: str) -> Set[str]:
-    """Get the actual skill states for a given skill category by importing its module."""
-    if skill_category in _skill_states_cache:
-        return _skill_states_cache[skill_category]
-
-    try:
-        # Import the skill category module
-        skill_module = importlib.import_module(f"intentkit.skills.{skill_category}")
-
-        # Look for the SkillStates TypedDict class
-        if hasattr(skill_module, "SkillStates"):
-            skill_states_class = getattr(skill_module, "SkillStates")
-            # Get the annotations which contain the state names
-            if hasattr(skill_states_class, "__annotations__"):
-                states = set(skill_states_class.__annotations__.keys())
-                _skill_states_cache[skill_category] = states
-                return states
-
-        logger.warning(f"Could not find SkillStates for {skill_category}")
-
-    except ImportError as e:
-        logger.warning(f"Could not import skill category {skill_category}: {e}")
-
-    # Fallback: try to extract states from schema.json
-    try:
-        schema = load_skill_schema(skill_category)
-        if (
-            schema
-            and "properties" in schema
-            and "states" in schema["properties"]
-            and "properties" in schema["properties"]["states"]
-        ):
-            states = set(schema["properties"]["states"]["properties"].keys())
-            logger.info(f"Using schema-based states for {skill_category}: {states}")
-            _skill_states_cache[skill_category] = states
-            return states
-    except Exception as e:
-        logger.warning(
-            f"Could not extract states from schema for {skill_category}: {e}"
-        )
-
-    logger.warning(f"No states found for skill category {skill_category}")
-    return set()
+    """Get the actual skill states for a given skill category."""
+    states = set(get_skill_registry().tool_names(skill_category))
+    if not states:
+        logger.warning(f"No states found for skill category {skill_category}")
+    return states
 
 
 def get_all_real_skills() -> Dict[str, Set[str]]:
     """Get ALL real skills and their states from the codebase."""
-    if _all_skills_cache:
-        return _all_skills_cache
-
+    registry = get_skill_registry()
     all_skills = {}
-    for skill_category in AVAILABLE_SKILL_CATEGORIES:
-        states = get_skill_states(skill_category)
+    for skill_category in registry.categories:
+        states = set(registry.tool_names(skill_category))
         if states:
             all_skills[skill_category] = states
-
-    _all_skills_cache.update(all_skills)
     return all_skills
 
 
@@ -383,17 +236,17 @@ async def validate_skills_exist(skills_config: Dict[str, Any]) -> Dict[str, Any]
      Validated skills configuration with only existing skills
     """
     logger.debug(f"Validating skills exist - input: {list(skills_config.keys())}")
-    logger.debug(f"Available skill categories: {list(AVAILABLE_SKILL_CATEGORIES)}")
+    registry = get_skill_registry()
 
     validated_skills = {}
 
     for skill_name, skill_config in skills_config.items():
-        if skill_name in AVAILABLE_SKILL_CATEGORIES:
+        if registry.has(skill_name):
             validated_skills[skill_name] = skill_config
             logger.debug(f"Skill {skill_name} exists and validated")
         else:
             logger.warning(
-                f"Skipping non-existent skill '{skill_name}' - only available skills: {list(AVAILABLE_SKILL_CATEGORIES)}"
+                f"Skipping non-existent skill '{skill_name}' - only available skills: {registry.categories}"
             )
 
     logger.debug(f"Validated skills output: {list(validated_skills.keys())}")
@@ -442,13 +295,13 @@ async def filter_skills_for_auto_generation(
 
 
 async def identify_skills(
-    prompt: str, client: OpenAI, llm_logger: Optional["LLMLogger"] = None
+    prompt: str, client: AsyncOpenAI, llm_logger: Optional["LLMLogger"] = None
 ) -> Dict[str, Any]:
     """Identify relevant skills from the prompt using only real skill data.
 
     Args:
      prompt: The natural language prompt
-     client: OpenAI client (not used, kept for compatibility)
+     client: AsyncOpenAI client (not used, kept for compatibility)
      llm_logger: Optional LLM logger for tracking API calls (not used in this implementation)
 
     Returns:
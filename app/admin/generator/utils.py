@@ -7,14 +7,16 @@ import json
 import logging
 import random
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set
 
 import httpx
 from epyxid import XID
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from intentkit.config.config import config
 
+from .llm_client import get_llm_client
+
 if TYPE_CHECKING:
     from .llm_logger import LLMLogger
 
@@ -76,6 +78,28 @@ def extract_token_usage(response) -> Dict[str, Any]:
     return usage_info
 
 
+# Receives generation progress events as (stage, data)
+ProgressCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+async def report_progress(
+    progress: Optional[ProgressCallback], stage: str, **data: Any
+) -> None:
+    """Send a progress event, never failing the generation.
+
+    Args:
+        progress: Optional progress callback
+        stage: Name of the generation stage reached
+        **data: Details of the stage
+    """
+    if not progress:
+        return
+    try:
+        await progress(stage, data)
+    except Exception as e:
+        logger.warning(f"Failed to report generation progress {stage}: {e}")
+
+
 def generate_request_id() -> str:
     """Generate a unique request ID for grouping related conversations."""
     return str(XID())
@@ -84,7 +108,7 @@ def generate_request_id() -> str:
 async def generate_agent_summary(
     schema: Dict[str, Any],
     identified_skills: Set[str],
-    client: OpenAI,
+    client: AsyncOpenAI,
     llm_logger: Optional["LLMLogger"] = None,
 ) -> str:
     """Generate a human-readable summary of the created agent.
@@ -92,7 +116,7 @@ async def generate_agent_summary(
     Args:
         schema: The generated agent schema
         identified_skills: Skills identified for the agent
-        client: OpenAI client for API calls
+        client: AsyncOpenAI client for API calls
         llm_logger: Optional LLM logger for tracking API calls
 
     Returns:
@@ -149,7 +173,7 @@ Write a congratulatory message.""",
             call_start_time = time.time()
 
             # Make OpenAI API call
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4.1-nano",
                 messages=messages,
                 temperature=0.7,
@@ -177,7 +201,7 @@ Write a congratulatory message.""",
             return summary
     else:
         # Make call without logging (fallback)
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4.1-nano",
             messages=messages,
             temperature=0.7,
@@ -343,11 +367,11 @@ async def select_tags_with_llm(
 ) -> List[str]:
     """Use LLM to select appropriate tag names."""
     try:
-        if not config.openai_api_key:
+        if not config.openai_api_key and not config.fake_llm:
             logger.warning("OpenAI API key not configured")
             return []
 
-        client = OpenAI(api_key=config.openai_api_key)
+        client = get_llm_client()
 
         random_seed = int(time.time() * 1000) % 10000
         random.seed(random_seed)
@@ -400,7 +424,7 @@ Your selection:"""
         logger.info("Calling OpenAI for tag selection with randomized prompt")
 
         # Increase temperature for more diverse outputs
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4.1-nano",
             messages=[{"role": "user", "content": llm_prompt}],
             temperature=0.8,
@@ -9,8 +9,14 @@ from apscheduler.triggers.cron import CronTrigger
 from app.services.twitter.oauth2_refresh import refresh_expiring_tokens
 from intentkit.config.config import config
 from intentkit.core.agent import update_agent_action_cost
-from intentkit.core.credit import refill_all_free_credits
+from intentkit.core.credit import (
+    fold_platform_account_deltas,
+    refill_all_free_credits,
+)
 from intentkit.models.agent_data import AgentQuota
+from intentkit.models.archive import archive_partitions
+from intentkit.models.db import get_engine
+from intentkit.models.db_mig import partition_tables
 from intentkit.models.redis import get_redis, send_heartbeat
 
 logger = logging.getLogger(__name__)
@@ -31,6 +37,18 @@ async def send_scheduler_heartbeat():
         logger.error(f"Error sending scheduler heartbeat: {e}")
 
 
+async def maintain_partitions():
+    """Create upcoming monthly history partitions and archive cold ones."""
+    engine = get_engine()
+    await partition_tables(engine, config.db["partition_months_ahead"])
+    if config.db_archive_after_months > 0:
+        archived = await archive_partitions(
+            engine, config.db_archive_after_months, config.db_archive_dir
+        )
+        if archived:
+            logger.info(f"Archived partitions: {', '.join(archived)}")
+
+
 def create_scheduler():
     """Create and configure the APScheduler with all periodic tasks."""
     # Job Store
@@ -47,23 +65,34 @@ def create_scheduler():
 
     scheduler = AsyncIOScheduler(jobstores=jobstores)
 
-    # Reset daily quotas at UTC 00:00
-    scheduler.add_job(
-        AgentQuota.reset_daily_quotas,
-        trigger=CronTrigger(hour=0, minute=0, timezone="UTC"),
-        id="reset_daily_quotas",
-        name="Reset daily quotas",
-        replace_existing=True,
-    )
+    if config.redis_host:
+        # Quota counters are in Redis, their calendar buckets expire by
+        # themselves, the changes are flushed to the database every minute
+        scheduler.add_job(
+            AgentQuota.flush_counters,
+            trigger=CronTrigger(minute="*", timezone="UTC"),
+            id="flush_quota_counters",
+            name="Flush quota counters",
+            replace_existing=True,
+        )
+    else:
+        # Reset daily quotas at UTC 00:00
+        scheduler.add_job(
+            AgentQuota.reset_daily_quotas,
+            trigger=CronTrigger(hour=0, minute=0, timezone="UTC"),
+            id="reset_daily_quotas",
+            name="Reset daily quotas",
+            replace_existing=True,
+        )
 
-    # Reset monthly quotas at UTC 00:00 on the first day of each month
-    scheduler.add_job(
-        AgentQuota.reset_monthly_quotas,
-        trigger=CronTrigger(day=1, hour=0, minute=0, timezone="UTC"),
-        id="reset_monthly_quotas",
-        name="Reset monthly quotas",
-        replace_existing=True,
-    )
+        # Reset monthly quotas at UTC 00:00 on the first day of each month
+        scheduler.add_job(
+            AgentQuota.reset_monthly_quotas,
+            trigger=CronTrigger(day=1, hour=0, minute=0, timezone="UTC"),
+            id="reset_monthly_quotas",
+            name="Reset monthly quotas",
+            replace_existing=True,
+        )
 
     # Check for expiring tokens every 5 minutes
     scheduler.add_job(
@@ -83,6 +112,15 @@ def create_scheduler():
         replace_existing=True,
     )
 
+    # Fold deferred platform account deltas every minute
+    scheduler.add_job(
+        fold_platform_account_deltas,
+        trigger=CronTrigger(minute="*", timezone="UTC"),
+        id="fold_platform_account_deltas",
+        name="Fold platform account deltas",
+        replace_existing=True,
+    )
+
     # Update agent action costs hourly
     scheduler.add_job(
         update_agent_action_cost,
@@ -92,6 +130,16 @@ def create_scheduler():
         replace_existing=True,
     )
 
+    # Create next partitions and archive old ones daily
+    if config.db["partition_months_ahead"] > 0:
+        scheduler.add_job(
+            maintain_partitions,
+            trigger=CronTrigger(hour=1, minute=10, timezone="UTC"),
+            id="maintain_partitions",
+            name="Maintain history partitions",
+            replace_existing=True,
+        )
+
     # Send heartbeat every minute
     if config.redis_host:
         scheduler.add_job(
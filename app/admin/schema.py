@@ -1,4 +1,3 @@
-import json
 import logging
 from pathlib import Path
 
@@ -10,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from intentkit.config.config import config
 from intentkit.models.agent import Agent
 from intentkit.models.db import get_db
+from intentkit.skills.registry import get_skill_registry
 
 logger = logging.getLogger(__name__)
 
@@ -67,17 +67,8 @@ async def get_skill_schema(
     **Raises:**
     * `HTTPException` - If the skill is not found or name is invalid
     """
-    base_path = PROJECT_ROOT / "intentkit" / "skills"
-    schema_path = base_path / skill / "schema.json"
-    normalized_path = schema_path.resolve()
-
-    if not normalized_path.is_relative_to(base_path):
-        raise HTTPException(status_code=400, detail="Invalid skill name")
-
-    try:
-        with open(normalized_path) as f:
-            schema = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+    schema = get_skill_registry().schema(skill)
+    if schema is None:
         raise HTTPException(status_code=404, detail="Skill schema not found")
 
     return JSONResponse(content=schema, media_type="application/json")
@@ -36,9 +36,14 @@ from app.services.twitter.oauth2 import router as twitter_oauth2_router
 from app.services.twitter.oauth2_callback import router as twitter_callback_router
 from intentkit.config.config import config
 from intentkit.core.api import core_router
-from intentkit.models.agent import AgentTable
+from intentkit.models.agent import AgentTable, load_agent_schema
 from intentkit.models.db import get_session, init_db
-from intentkit.models.redis import init_redis
+from intentkit.models.redis import (
+    init_redis,
+    start_agent_listener,
+    stop_agent_listener,
+)
+from intentkit.models.skill import AgentSkillData
 from intentkit.utils.error import (
     IntentKitAPIError,
     http_exception_handler,
@@ -46,6 +51,7 @@ from intentkit.utils.error import (
     intentkit_other_error_handler,
     request_validation_exception_handler,
 )
+from intentkit.utils.http_client import close_http_clients
 
 # init logger
 logger = logging.getLogger(__name__)
@@ -140,6 +146,8 @@ async def lifespan(app: FastAPI):
     """
     # Initialize database
     await init_db(**config.db)
+    # Load chain configs and other config needing network access
+    await config.ainit()
 
     # Initialize Redis if configured
     if config.redis_host:
@@ -148,6 +156,11 @@ async def lifespan(app: FastAPI):
             port=config.redis_port,
             db=config.redis_db,
         )
+        # Evict local agent caches when agents change in other processes
+        start_agent_listener()
+
+    # Resolve the agent schema before the first schema or generator request
+    load_agent_schema()
 
     # Create example agent if no agents exist
     await create_example_agent()
@@ -156,6 +169,9 @@ async def lifespan(app: FastAPI):
     yield
     # Clean up will run after the API server shutdown
     logger.info("Cleaning up and shutdown...")
+    await AgentSkillData.flush_pending()
+    await stop_agent_listener()
+    await close_http_clients()
 
 
 app = FastAPI(
@@ -19,7 +19,11 @@ from intentkit.models.redis import (
     get_redis,
     init_redis,
     send_heartbeat,
+    start_agent_listener,
+    stop_agent_listener,
 )
+from intentkit.models.skill import AgentSkillData
+from intentkit.utils.http_client import close_http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -167,6 +171,8 @@ if __name__ == "__main__":
     async def main():
         # Initialize database
         await init_db(**config.db)
+        # Load chain configs and other config needing network access
+        await config.ainit()
         # Initialize Redis if configured
         if config.redis_host:
             await init_redis(
@@ -174,6 +180,8 @@ if __name__ == "__main__":
                 port=config.redis_port,
                 db=config.redis_db,
             )
+            # Evict local agent caches when agents change in other processes
+            start_agent_listener()
 
         # Add job to schedule agent autonomous tasks every 5 minutes
         # Run it immediately on startup and then every 5 minutes
@@ -215,12 +223,15 @@ if __name__ == "__main__":
 
         # Define the cleanup function that will be called on exit
         async def cleanup_resources():
+            await AgentSkillData.flush_pending()
             try:
                 if config.redis_host:
+                    await stop_agent_listener()
                     redis_client = get_redis()
                     await clean_heartbeat(redis_client, "autonomous")
             except Exception as e:
                 logger.error(f"Error cleaning up heartbeat: {e}")
+            await close_http_clients()
 
         try:
             logger.info("Starting autonomous agents scheduler...")
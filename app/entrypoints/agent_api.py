@@ -346,27 +346,28 @@ async def get_messages(
     limit: int = Query(
         20, ge=1, le=100, description="Maximum number of messages to return"
     ),
+    include_details: bool = Query(
+        True, description="Include attachments and skill calls of the messages"
+    ),
 ) -> ChatMessagesResponse:
     """Get the message history for a chat thread with cursor-based pagination."""
     agent_id = agent_token.agent_id
-    chat = await Chat.get(chat_id)
-    if not chat or chat.agent_id != agent_id:
+    if not await Chat.belongs_to(db, chat_id, agent_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Chat not found"
         )
 
-    stmt = (
-        select(ChatMessageTable)
-        .where(
-            ChatMessageTable.agent_id == agent_id, ChatMessageTable.chat_id == chat_id
+    try:
+        messages = await ChatMessage.history(
+            db,
+            agent_id,
+            chat_id=chat_id,
+            cursor=cursor,
+            limit=limit + 1,
+            include_details=include_details,
         )
-        .order_by(desc(ChatMessageTable.id))
-        .limit(limit + 1)
-    )
-    if cursor:
-        stmt = stmt.where(ChatMessageTable.id < cursor)
-    result = await db.scalars(stmt)
-    messages = result.all()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     has_more = len(messages) > limit
     messages_to_return = messages[:limit]
     next_cursor = (
@@ -374,7 +375,7 @@ async def get_messages(
     )
     # Return as ChatMessagesResponse object
     return ChatMessagesResponse(
-        data=[ChatMessage.model_validate(m) for m in messages_to_return],
+        data=messages_to_return,
         has_more=has_more,
         next_cursor=next_cursor,
     )
@@ -1,4 +1,5 @@
 import logging
+import time
 from typing import Any, Dict, List, Optional
 
 from epyxid import XID
@@ -7,12 +8,14 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.auth import AgentToken, verify_agent_token
-from intentkit.core.engine import execute_agent
+from intentkit.core.engine import execute_agent, stream_agent
 from intentkit.models.agent import Agent
 from intentkit.models.chat import (
     AuthorType,
+    ChatMessage,
     ChatMessageAttachment,
     ChatMessageAttachmentType,
+    ChatMessageChunk,
     ChatMessageCreate,
 )
 
@@ -54,6 +57,9 @@ class OpenAIChatCompletionRequest(BaseModel):
     stream: Optional[bool] = Field(
         None, description="If set, partial message deltas will be sent"
     )
+    stream_options: Optional[Dict[str, Any]] = Field(
+        None, description="Options for streaming, supports include_usage"
+    )
     stop: Optional[str | List[str]] = Field(
         None, description="Up to 4 sequences where the API will stop generating"
     )
@@ -111,6 +117,9 @@ class OpenAIChatCompletionChunk(BaseModel):
     choices: List[OpenAIChoiceDelta] = Field(
         ..., description="A list of chat completion choices"
     )
+    usage: Optional[OpenAIUsage] = Field(
+        None, description="Usage statistics, only in the last chunk if requested"
+    )
     system_fingerprint: Optional[str] = Field(None, description="System fingerprint")
 
 
@@ -246,22 +255,16 @@ def create_streaming_response(content: str, request_id: str, model: str, created
     yield "data: [DONE]\n\n"
 
 
-def create_streaming_response_batched(
-    content_parts: List[str], request_id: str, model: str, created: int
-):
-    """Create a streaming response generator for OpenAI-compatible streaming with batched content.
-
-    Args:
-        content_parts: List of content parts to stream in batches
-        request_id: The request ID
-        model: The model name
-        created: The creation timestamp
-
-    Yields:
-        str: Server-sent events formatted chunks
-    """
-    # First chunk with role
-    first_chunk = OpenAIChatCompletionChunk(
+def _content_chunk(
+    content: Optional[str],
+    request_id: str,
+    model: str,
+    created: int,
+    role: Optional[str] = None,
+    finish_reason: Optional[str] = None,
+) -> str:
+    """Format one chat.completion.chunk server-sent event."""
+    chunk = OpenAIChatCompletionChunk(
         id=request_id,
         object="chat.completion.chunk",
         created=created,
@@ -269,68 +272,103 @@ def create_streaming_response_batched(
         choices=[
             OpenAIChoiceDelta(
                 index=0,
-                delta=OpenAIDelta(role="assistant", content=None),
-                finish_reason=None,
+                delta=OpenAIDelta(role=role, content=content),
+                finish_reason=finish_reason,
             )
         ],
         system_fingerprint=None,
     )
-    yield f"data: {first_chunk.model_dump_json()}\n\n"
+    return f"data: {chunk.model_dump_json()}\n\n"
 
-    # Stream each content part as a separate batch
-    for i, content_part in enumerate(content_parts):
-        if content_part:
-            # Add newline between parts (except for the first one)
-            if i > 0:
-                newline_chunk = OpenAIChatCompletionChunk(
-                    id=request_id,
-                    object="chat.completion.chunk",
-                    created=created,
-                    model=model,
-                    choices=[
-                        OpenAIChoiceDelta(
-                            index=0,
-                            delta=OpenAIDelta(role=None, content="\n"),
-                            finish_reason=None,
-                        )
-                    ],
-                    system_fingerprint=None,
-                )
-                yield f"data: {newline_chunk.model_dump_json()}\n\n"
-
-            # Stream the content part
-            content_chunk = OpenAIChatCompletionChunk(
-                id=request_id,
-                object="chat.completion.chunk",
-                created=created,
-                model=model,
-                choices=[
-                    OpenAIChoiceDelta(
-                        index=0,
-                        delta=OpenAIDelta(role=None, content=content_part),
-                        finish_reason=None,
-                    )
-                ],
-                system_fingerprint=None,
-            )
-            yield f"data: {content_chunk.model_dump_json()}\n\n"
+
+def message_content_parts(msg: ChatMessage) -> List[str]:
+    """Convert a response message to the text parts shown to OpenAI clients.
+
+    Args:
+        msg: The response message
+
+    Returns:
+        List[str]: Text parts, skill messages show "running skill_name..." per call
+    """
+    if msg.author_type == AuthorType.AGENT or msg.author_type == AuthorType.SYSTEM:
+        # For agent and system messages, use the content field
+        return [msg.message] if msg.message else []
+    if msg.author_type == AuthorType.SKILL:
+        # For skill messages, show "running skill_name..." for each skill call
+        if msg.skill_calls:
+            return [
+                f"running {skill_call.get('name', 'unknown')}..."
+                for skill_call in msg.skill_calls
+            ]
+        return ["running unknown..."]
+    return []
+
+
+async def create_streaming_response_live(
+    user_message: ChatMessageCreate,
+    request_id: str,
+    model: str,
+    created: int,
+    include_usage: bool = False,
+):
+    """Stream the agent run as OpenAI-compatible chunks while it is generated.
+
+    LLM tokens are sent as soon as the model produces them. Parts are separated
+    by a newline, the same way as the non-streaming response. Agent messages
+    whose tokens were already streamed are not sent again.
+
+    Args:
+        user_message: The user message to run the agent with
+        request_id: The request ID
+        model: The model name
+        created: The creation timestamp
+        include_usage: Send a final chunk with the real token usage
+
+    Yields:
+        str: Server-sent events formatted chunks
+    """
+    # First chunk with role
+    yield _content_chunk(None, request_id, model, created, role="assistant")
+
+    usage = OpenAIUsage()
+    has_content = False  # whether any part was sent, for the separators
+    streamed = False  # whether tokens of the current step were sent
+    async for item in stream_agent(user_message, stream_tokens=True):
+        if isinstance(item, ChatMessageChunk):
+            if not streamed and has_content:
+                yield _content_chunk("\n", request_id, model, created)
+            streamed = True
+            has_content = True
+            yield _content_chunk(item.content, request_id, model, created)
+            continue
+
+        usage.prompt_tokens += item.input_tokens or 0
+        usage.completion_tokens += item.output_tokens or 0
+        if item.author_type == AuthorType.AGENT and streamed:
+            streamed = False
+            continue
+        streamed = False
+        for part in message_content_parts(item):
+            if has_content:
+                yield _content_chunk("\n", request_id, model, created)
+            has_content = True
+            yield _content_chunk(part, request_id, model, created)
 
     # Final chunk with finish_reason
-    final_chunk = OpenAIChatCompletionChunk(
-        id=request_id,
-        object="chat.completion.chunk",
-        created=created,
-        model=model,
-        choices=[
-            OpenAIChoiceDelta(
-                index=0,
-                delta=OpenAIDelta(role=None, content=None),
-                finish_reason="stop",
-            )
-        ],
-        system_fingerprint=None,
-    )
-    yield f"data: {final_chunk.model_dump_json()}\n\n"
+    yield _content_chunk(None, request_id, model, created, finish_reason="stop")
+
+    if include_usage:
+        usage.total_tokens = usage.prompt_tokens + usage.completion_tokens
+        usage_chunk = OpenAIChatCompletionChunk(
+            id=request_id,
+            object="chat.completion.chunk",
+            created=created,
+            model=model,
+            choices=[],
+            usage=usage,
+            system_fingerprint=None,
+        )
+        yield f"data: {usage_chunk.model_dump_json()}\n\n"
 
     # End of stream
     yield "data: [DONE]\n\n"
@@ -413,6 +451,26 @@ async def create_chat_completion(
         super_mode=None,
     )
 
+    request_id = f"chatcmpl-{XID()}"
+    created = int(time.time())
+
+    # Check if streaming is requested
+    if request.stream:
+        include_usage = bool(
+            request.stream_options and request.stream_options.get("include_usage")
+        )
+        return StreamingResponse(
+            create_streaming_response_live(
+                user_message, request_id, request.model, created, include_usage
+            ),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
+            },
+        )
+
     # Execute agent
     response_messages = await execute_agent(user_message)
 
@@ -425,61 +483,37 @@ async def create_chat_completion(
 
     # Convert response messages to content list
     content_parts = []
+    prompt_tokens = 0
+    completion_tokens = 0
     for msg in response_messages:
-        if msg.author_type == AuthorType.AGENT or msg.author_type == AuthorType.SYSTEM:
-            # For agent and system messages, use the content field
-            if msg.message:
-                content_parts.append(msg.message)
-        elif msg.author_type == AuthorType.SKILL:
-            # For skill messages, show "running skill_name..." for each skill call
-            if msg.skill_calls and len(msg.skill_calls) > 0:
-                for skill_call in msg.skill_calls:
-                    skill_name = skill_call.get("name", "unknown")
-                    content_parts.append(f"running {skill_name}...")
-            else:
-                content_parts.append("running unknown...")
+        content_parts.extend(message_content_parts(msg))
+        prompt_tokens += msg.input_tokens or 0
+        completion_tokens += msg.output_tokens or 0
 
     # Combine all content parts
     content = "\n".join(content_parts) if content_parts else ""
 
-    # Create OpenAI-compatible response
-    import time
-
-    request_id = f"chatcmpl-{XID()}"
-    created = int(time.time())
-
-    # Check if streaming is requested
-    if request.stream:
-        # Return streaming response with batched content
-        return StreamingResponse(
-            create_streaming_response_batched(
-                content_parts, request_id, request.model, created
-            ),
-            media_type="text/plain",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Content-Type": "text/plain; charset=utf-8",
-            },
-        )
-    else:
-        # Return regular response
-        response = OpenAIChatCompletionResponse(
-            id=request_id,
-            object="chat.completion",
-            created=created,
-            model=request.model,
-            choices=[
-                OpenAIChoice(
-                    index=0,
-                    message=OpenAIMessage(role="assistant", content=content),
-                    finish_reason="stop",
-                )
-            ],
-            usage=OpenAIUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
-            system_fingerprint=None,
-        )
+    # Return regular response
+    response = OpenAIChatCompletionResponse(
+        id=request_id,
+        object="chat.completion",
+        created=created,
+        model=request.model,
+        choices=[
+            OpenAIChoice(
+                index=0,
+                message=OpenAIMessage(role="assistant", content=content),
+                finish_reason="stop",
+            )
+        ],
+        usage=OpenAIUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        ),
+        system_fingerprint=None,
+    )
 
-        logger.debug(f"OpenAI-compatible response: {response}")
+    logger.debug(f"OpenAI-compatible response: {response}")
 
-        return response
+    return response
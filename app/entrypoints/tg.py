@@ -1,7 +1,6 @@
 import asyncio
 import logging
 import signal
-import sys
 
 from sqlalchemy import select
 
@@ -12,7 +11,8 @@ from intentkit.config.config import config
 from intentkit.models.agent import Agent, AgentTable
 from intentkit.models.agent_data import AgentData
 from intentkit.models.db import get_session, init_db
-from intentkit.models.redis import init_redis
+from intentkit.models.redis import init_redis, start_agent_listener
+from intentkit.models.skill import AgentSkillData
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +87,8 @@ class AgentScheduler:
 async def run_telegram_server() -> None:
     # Initialize database connection
     await init_db(**config.db)
+    # Load chain configs and other config needing network access
+    await config.ainit()
 
     # Initialize Redis if configured
     if config.redis_host:
@@ -95,16 +97,20 @@ async def run_telegram_server() -> None:
             port=config.redis_port,
             db=config.redis_db,
         )
+        # Evict local agent caches when agents change in other processes
+        start_agent_listener()
 
     # Signal handler for graceful shutdown
-    def signal_handler(signum, frame):
+    shutdown_event = asyncio.Event()
+
+    def signal_handler():
         logger.info("Received termination signal. Shutting down gracefully...")
-        scheduler.shutdown()
-        sys.exit(0)
+        shutdown_event.set()
 
     # Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, signal_handler)
 
     logger.info("Initialize bot pool...")
     bot_pool = BotPool(config.tg_base_url)
@@ -122,9 +128,11 @@ async def run_telegram_server() -> None:
         asyncio.get_running_loop(), config.tg_server_host, int(config.tg_server_port)
     )
 
-    # Keep the server running
+    # Keep the server running until a termination signal
     try:
-        while True:
-            await asyncio.sleep(3600)  # Sleep for an hour
+        await shutdown_event.wait()
     except asyncio.CancelledError:
         logging.info("Server shutdown initiated")
+    finally:
+        # Agents run here too, write their pending skill data
+        await AgentSkillData.flush_pending()
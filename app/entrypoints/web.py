@@ -259,20 +259,31 @@ async def get_chat_history(
     aid: str = Path(..., description="Agent ID"),
     chat_id: str = Query(..., description="Chat ID to get history for"),
     user_id: Optional[str] = Query(None, description="User ID"),
+    cursor: Optional[str] = Query(
+        None, description="ID of the oldest message already loaded"
+    ),
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of messages"),
+    include_details: bool = Query(
+        True, description="Include attachments and skill calls"
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> List[ChatMessage]:
-    """Get last 50 messages for a specific chat.
+    """Get the latest messages for a specific chat.
 
     **Path Parameters:**
     * `aid` - Agent ID
 
     **Query Parameters:**
     * `chat_id` - Chat ID to get history for
+    * `cursor` - ID of the oldest message already loaded, to get the messages before it
+    * `limit` - Maximum number of messages, default 50
+    * `include_details` - Set false to leave out attachments and skill calls
 
     **Returns:**
     * `List[ChatMessage]` - List of chat messages, ordered by creation time ascending
 
     **Raises:**
+    * `400` - Invalid cursor
     * `404` - Agent not found
     """
     # Get agent and check if exists
@@ -280,17 +291,22 @@ async def get_chat_history(
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    # Get chat messages (last 50 in DESC order)
-    result = await db.scalars(
-        select(ChatMessageTable)
-        .where(ChatMessageTable.agent_id == aid, ChatMessageTable.chat_id == chat_id)
-        .order_by(desc(ChatMessageTable.created_at))
-        .limit(50)
-    )
-    messages = result.all()
+    # Get chat messages (a page in DESC order)
+    try:
+        messages = await ChatMessage.history(
+            db,
+            aid,
+            chat_id=chat_id,
+            cursor=cursor,
+            limit=limit,
+            include_details=include_details,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # If the user_id exists, check if the chat belongs to the user
-    if user_id:
+    # If the user_id exists, check if the chat belongs to the user,
+    # an empty page exposes nothing
+    if user_id and messages:
         for message in messages:
             if message.user_id == user_id:
                 break
@@ -300,9 +316,7 @@ async def get_chat_history(
             raise HTTPException(status_code=403, detail="Chat not belongs to user")
 
     # Reverse messages to get chronological order
-    messages = [ChatMessage.model_validate(message) for message in messages[::-1]]
-
-    return messages
+    return messages[::-1]
 
 
 @chat_router.get(
@@ -765,17 +779,30 @@ async def delete_chat(
 )
 async def get_skill_history(
     aid: str = Path(..., description="Agent ID"),
+    cursor: Optional[str] = Query(
+        None, description="ID of the oldest message already loaded"
+    ),
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of messages"),
+    include_details: bool = Query(
+        True, description="Include attachments and skill calls"
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> List[ChatMessage]:
-    """Get last 50 skill messages for a specific agent.
+    """Get the latest skill messages for a specific agent.
 
     **Path Parameters:**
     * `aid` - Agent ID
 
+    **Query Parameters:**
+    * `cursor` - ID of the oldest message already loaded, to get the messages before it
+    * `limit` - Maximum number of messages, default 50
+    * `include_details` - Set false to leave out attachments and skill calls
+
     **Returns:**
     * `List[ChatMessage]` - List of skill messages, ordered by creation time ascending
 
     **Raises:**
+    * `400` - Invalid cursor
     * `404` - Agent not found
     """
     # Get agent and check if exists
@@ -783,22 +810,21 @@ async def get_skill_history(
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    # Get skill messages (last 50 in DESC order)
-    result = await db.scalars(
-        select(ChatMessageTable)
-        .where(
-            ChatMessageTable.agent_id == aid,
-            ChatMessageTable.author_type == AuthorType.SKILL,
+    # Get skill messages (a page in DESC order)
+    try:
+        messages = await ChatMessage.history(
+            db,
+            aid,
+            author_type=AuthorType.SKILL,
+            cursor=cursor,
+            limit=limit,
+            include_details=include_details,
         )
-        .order_by(desc(ChatMessageTable.created_at))
-        .limit(50)
-    )
-    messages = result.all()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # Reverse messages to get chronological order
-    messages = [ChatMessage.model_validate(message) for message in messages[::-1]]
-
-    return messages
+    return messages[::-1]
 
 
 @chat_router_readonly.get(
@@ -17,6 +17,7 @@ from app.admin import (
 )
 from app.entrypoints.web import chat_router_readonly
 from intentkit.config.config import config
+from intentkit.models.agent import load_agent_schema
 from intentkit.models.db import init_db
 from intentkit.models.redis import init_redis
 from intentkit.utils.error import (
@@ -54,6 +55,9 @@ async def lifespan(app: FastAPI):
             db=config.redis_db,
         )
 
+    # Resolve the agent schema before the first schema request
+    load_agent_schema()
+
     logger.info("Readonly API server starting")
     yield
     logger.info("Readonly API server shutting down")
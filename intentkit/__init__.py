@@ -7,11 +7,33 @@ __version__ = "0.0.1"
 __author__ = "hyacinthus"
 __email__ = "hyacinthus@gmail.com"
 
-# Core components
-# Abstract base classes
-from .core.engine import create_agent, stream_agent
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core.engine import create_agent, stream_agent
+
+# Core components, imported on first access so that importing a submodule
+# like intentkit.models does not load the engine and its LLM dependencies
+_LAZY_ATTRS = {
+    "create_agent": ".core.engine",
+    "stream_agent": ".core.engine",
+}
 
 __all__ = [
     "create_agent",
     "stream_agent",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 
 from intentkit.models.agent import Agent, AgentAutonomous
 from intentkit.models.agent_data import AgentData, AgentQuota
+from intentkit.models.skill import AgentSkillBlob
 
 
 class SkillStoreABC(ABC):
@@ -79,7 +80,11 @@ class SkillStoreABC(ABC):
     @staticmethod
     @abstractmethod
     async def save_agent_skill_data(
-        agent_id: str, skill: str, key: str, data: Dict[str, Any]
+        agent_id: str,
+        skill: str,
+        key: str,
+        data: Dict[str, Any],
+        write_behind: bool = False,
     ) -> None:
         """Save or update skill data for an agent.
 
@@ -88,6 +93,8 @@ class SkillStoreABC(ABC):
             skill: Name of the skill
             key: Data key
             data: JSON data to store
+            write_behind: Write after a short delay, coalescing repeated
+                writes, for hot keys whose other readers tolerate lag
         """
         pass
 
@@ -103,6 +110,85 @@ class SkillStoreABC(ABC):
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    async def list_agent_skill_blobs(
+        agent_id: str, skill: str, key: str
+    ) -> List[AgentSkillBlob]:
+        """List the binary blobs stored under a key, in append order.
+
+        Args:
+            agent_id: ID of the agent
+            skill: Name of the skill
+            key: Data key
+
+        Returns:
+            List of blob metadata, without the content
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    async def get_agent_skill_blob_data(ids: List[str]) -> Dict[str, bytes]:
+        """Load the content of binary blobs.
+
+        Args:
+            ids: IDs of the blobs
+
+        Returns:
+            Dictionary mapping blob ID to content
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    async def append_agent_skill_blob(
+        agent_id: str, skill: str, key: str, data: bytes
+    ) -> str:
+        """Append a binary blob to a key.
+
+        Args:
+            agent_id: ID of the agent
+            skill: Name of the skill
+            key: Data key
+            data: Binary content
+
+        Returns:
+            ID of the new blob
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    async def replace_agent_skill_blobs(
+        agent_id: str, skill: str, key: str, data: bytes, replaced: List[str]
+    ) -> Optional[str]:
+        """Replace some blobs of a key by a single blob.
+
+        Args:
+            agent_id: ID of the agent
+            skill: Name of the skill
+            key: Data key
+            data: Binary content replacing the blobs
+            replaced: IDs of the blobs to replace
+
+        Returns:
+            ID of the new blob, None if the blobs changed meanwhile
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    async def delete_agent_skill_blobs(agent_id: str, skill: str, key: str) -> None:
+        """Delete all binary blobs of a key.
+
+        Args:
+            agent_id: ID of the agent
+            skill: Name of the skill
+            key: Data key
+        """
+        pass
+
     @staticmethod
     @abstractmethod
     async def get_thread_skill_data(
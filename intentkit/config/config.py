@@ -1,14 +1,14 @@
 # app/config.py
+import importlib.util
 import json
 import logging
 import os
+import tempfile
 
 from dotenv import load_dotenv
 
 from intentkit.utils.chain import ChainProvider, QuicknodeChainProvider
 from intentkit.utils.logging import setup_logging
-from intentkit.utils.s3 import init_s3
-from intentkit.utils.slack_alert import init_slack
 
 # Load environment variables from .env file
 load_dotenv()
@@ -60,6 +60,28 @@ class Config:
         # ==== this part can be load from env or aws secrets manager
         self.db["auto_migrate"] = self.load("DB_AUTO_MIGRATE", "true") == "true"
         self.db["pool_size"] = self.load_int("DB_POOL_SIZE", 3)
+        # Monthly partitions of chat and credit history, 0 keeps the tables plain
+        self.db["partition_months_ahead"] = self.load_int(
+            "DB_PARTITION_MONTHS_AHEAD", 0
+        )
+        # Chat message partitions older than this many months are archived to
+        # Parquet and dropped, 0 keeps them forever
+        self.db_archive_after_months = self.load_int("DB_ARCHIVE_AFTER_MONTHS", 0)
+        self.db_archive_dir = self.load("DB_ARCHIVE_DIR")
+        if self.db_archive_after_months > 0:
+            # Archived partitions are dropped, the files must outlive the container
+            if not self.db_archive_dir or not (
+                os.path.isabs(self.db_archive_dir) or "://" in self.db_archive_dir
+            ):
+                raise ValueError(
+                    "DB_ARCHIVE_DIR must be an absolute path or a URI like "
+                    "s3://bucket/prefix when DB_ARCHIVE_AFTER_MONTHS is set"
+                )
+            if importlib.util.find_spec("pyarrow") is None:
+                raise ImportError(
+                    "DB_ARCHIVE_AFTER_MONTHS needs pyarrow, "
+                    "install intentkit with the archive extra"
+                )
         self.debug = self.load("DEBUG") == "true"
         self.debug_checkpoint = (
             self.load("DEBUG_CHECKPOINT", "false") == "true"
@@ -71,6 +93,7 @@ class Config:
         # AWS
         self.aws_s3_bucket = self.load("AWS_S3_BUCKET")
         self.aws_s3_cdn_url = self.load("AWS_S3_CDN_URL")
+        self.aws_s3_endpoint_url = self.load("AWS_S3_ENDPOINT_URL")
         # Internal API
         self.internal_base_url = self.load("INTERNAL_BASE_URL", "http://intent-api")
         self.admin_auth_enabled = self.load("ADMIN_AUTH_ENABLED", "false") == "true"
@@ -83,6 +106,10 @@ class Config:
         )
         # Payment
         self.payment_enabled = self.load("PAYMENT_ENABLED", "false") == "true"
+        # Append platform account changes as deltas, folded in by the scheduler
+        self.credit_platform_deferred = (
+            self.load("CREDIT_PLATFORM_DEFERRED", "false") == "true"
+        )
         # Open API for agent
         self.open_api_base_url = self.load("OPEN_API_BASE_URL", "http://localhost:8000")
         # CDP - AgentKit 0.6.0 Configuration
@@ -99,6 +126,12 @@ class Config:
         # LLM Config
         self.system_prompt = self.load("SYSTEM_PROMPT")
         self.input_token_limit = self.load_int("INPUT_TOKEN_LIMIT", 60000)
+        # Agent executor cache, 0 means unlimited
+        self.executor_cache_size = self.load_int("EXECUTOR_CACHE_SIZE", 500)
+        self.executor_cache_memory_mb = self.load_int("EXECUTOR_CACHE_MEMORY_MB", 0)
+        self.executor_cache_ttl = self.load_int(
+            "EXECUTOR_CACHE_TTL", 3600
+        )  # idle seconds
         # XMTP
         self.xmtp_system_prompt = self.load(
             "XMTP_SYSTEM_PROMPT",
@@ -131,6 +164,11 @@ class Config:
         self.tavily_api_key = self.load("TAVILY_API_KEY")
         self.cookiefun_api_key = self.load("COOKIEFUN_API_KEY")
         self.firecrawl_api_key = self.load("FIRECRAWL_API_KEY")
+        # Local dir for vector index files, empty means the system temp dir
+        self.vector_index_cache_dir = self.load("VECTOR_INDEX_CACHE_DIR")
+        # Local deterministic embeddings instead of OpenAI, for tests only
+        self.fake_embeddings = self.load("FAKE_EMBEDDINGS", "false") == "true"
+        self.fake_llm = self.load("FAKE_LLM", "false") == "true"
         # Sentry
         self.sentry_dsn = self.load("SENTRY_DSN")
         self.sentry_sample_rate = self.load_float("SENTRY_SAMPLE_RATE", 0.1)
@@ -140,14 +178,16 @@ class Config:
         self.sentry_profiles_sample_rate = self.load_float(
             "SENTRY_PROFILES_SAMPLE_RATE", 0.01
         )
-        # RPC Providers
+        # RPC Providers, chain configs are loaded by ainit
         self.quicknode_api_key = self.load("QUICKNODE_API_KEY")
+        self.chain_config_snapshot = self.load(
+            "CHAIN_CONFIG_SNAPSHOT",
+            os.path.join(tempfile.gettempdir(), "intentkit_chain_configs.json"),
+        )
         if self.quicknode_api_key:
             self.chain_provider: ChainProvider = QuicknodeChainProvider(
-                self.quicknode_api_key
+                self.quicknode_api_key, self.chain_config_snapshot
             )
-        if hasattr(self, "chain_provider"):
-            self.chain_provider.init_chain_configs()
         self.rpc_networks = self.load(
             "RPC_NETWORKS", "base-mainnet,base-sepolia,ethereum-sepolia,solana-mainnet"
         )
@@ -163,10 +203,28 @@ class Config:
 
         # If the slack alert token exists, init it
         if self.slack_alert_token and self.slack_alert_channel:
+            from intentkit.utils.slack_alert import init_slack
+
             init_slack(self.slack_alert_token, self.slack_alert_channel)
         # If the AWS S3 bucket and CDN URL exist, init it
         if self.aws_s3_bucket and self.aws_s3_cdn_url:
-            init_s3(self.aws_s3_bucket, self.aws_s3_cdn_url, self.env)
+            from intentkit.utils.s3 import init_s3
+
+            init_s3(
+                self.aws_s3_bucket,
+                self.aws_s3_cdn_url,
+                self.env,
+                self.aws_s3_endpoint_url,
+            )
+
+    async def ainit(self):
+        """Run initialization that needs network access.
+
+        Kept out of import so importing the config stays fast, call once at
+        process start before agents run.
+        """
+        if hasattr(self, "chain_provider"):
+            await self.chain_provider.init()
 
     def load(self, key, default=None):
         """Load a secret from the secrets map or env"""
@@ -1,15 +1,17 @@
 import logging
+import math
 import time
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Dict, List
 
-from sqlalchemy import func, select, text, update
+from sqlalchemy import bindparam, delete, func, insert, select, text, update
 
 from intentkit.models.agent import Agent, AgentAutonomous, AgentTable
-from intentkit.models.agent_data import AgentQuotaTable
+from intentkit.models.agent_data import AgentActionCostTable, AgentQuotaTable
 from intentkit.models.credit import CreditEventTable, EventType, UpstreamType
 from intentkit.models.db import get_session
+from intentkit.models.redis import publish_agent_changed
 from intentkit.utils.error import IntentKitAPIError
 
 logger = logging.getLogger(__name__)
@@ -192,87 +194,242 @@ async def agent_action_cost(agent_id: str) -> Dict[str, Decimal]:
         return result
 
 
+# Action costs are computed over this many hours of hourly rollups
+ACTION_COST_WINDOW_HOURS = 72
+# Actions running longer than this are only partially attributed to their hour
+ACTION_COST_MAX_DURATION = timedelta(hours=1)
+# Relative width of the histogram buckets, 5% keeps quintile averages close
+ACTION_COST_BUCKET_BASE = 1.05
+# Agents with fewer actions from other users than this get default costs
+ACTION_COST_MIN_ACTIONS = 10
+
+
+def _action_cost_bucket(cost: Decimal) -> int:
+    """Histogram bucket of an action cost, zero and negative costs share bucket -1000."""
+    if cost <= 0:
+        return -1000
+    return math.floor(math.log(float(cost), ACTION_COST_BUCKET_BASE))
+
+
+async def rollup_agent_action_costs(hour: datetime) -> int:
+    """
+    Rebuild the action cost rollups of all agents for one hour.
+
+    Only the credit events around that hour are read, and the rebuild replaces
+    existing rollups, so running it again for the same hour is safe.
+
+    Args:
+        hour: Start of the hour, in UTC
+
+    Returns:
+        int: Number of agents with actions in that hour
+    """
+    hour_end = hour + timedelta(hours=1)
+    query = text("""
+        WITH actions AS (
+            SELECT
+                ce.agent_id,
+                SUM(ce.total_amount) AS action_cost,
+                MIN(ce.created_at) AS started_at,
+                BOOL_OR(ce.user_id != a.owner) AS external
+            FROM credit_events ce
+            JOIN agents a ON a.id = ce.agent_id
+            WHERE ce.created_at >= :lookback_start
+              AND ce.created_at < :window_end
+              AND ce.upstream_type = :upstream_type
+              AND ce.event_type IN (:event_type_message, :event_type_skill_call)
+              AND ce.start_message_id IS NOT NULL
+            GROUP BY ce.agent_id, ce.start_message_id
+        )
+        SELECT agent_id, action_cost, external
+        FROM actions
+        WHERE started_at >= :hour_start AND started_at < :hour_end
+    """)
+    params = {
+        "lookback_start": hour - ACTION_COST_MAX_DURATION,
+        "window_end": hour_end + ACTION_COST_MAX_DURATION,
+        "hour_start": hour,
+        "hour_end": hour_end,
+        "upstream_type": UpstreamType.EXECUTOR,
+        "event_type_message": EventType.MESSAGE,
+        "event_type_skill_call": EventType.SKILL_CALL,
+    }
+
+    rollups: Dict[str, Dict] = {}
+    async with get_session() as session:
+        result = await session.execute(query, params)
+        for agent_id, action_cost, external in result:
+            action_cost = Decimal(str(action_cost or 0))
+            rollup = rollups.get(agent_id)
+            if rollup is None:
+                rollup = rollups[agent_id] = {
+                    "agent_id": agent_id,
+                    "hour": hour,
+                    "action_count": 0,
+                    "external_action_count": 0,
+                    "total_cost": Decimal("0"),
+                    "min_cost": action_cost,
+                    "max_cost": action_cost,
+                    "histogram": {},
+                }
+            rollup["action_count"] += 1
+            if external:
+                rollup["external_action_count"] += 1
+            rollup["total_cost"] += action_cost
+            rollup["min_cost"] = min(rollup["min_cost"], action_cost)
+            rollup["max_cost"] = max(rollup["max_cost"], action_cost)
+            bucket = rollup["histogram"].setdefault(
+                str(_action_cost_bucket(action_cost)), [0, "0"]
+            )
+            bucket[0] += 1
+            bucket[1] = str(Decimal(bucket[1]) + action_cost)
+
+        await session.execute(
+            delete(AgentActionCostTable).where(AgentActionCostTable.hour == hour)
+        )
+        if rollups:
+            await session.execute(insert(AgentActionCostTable), list(rollups.values()))
+        await session.commit()
+    return len(rollups)
+
+
+def _merge_action_costs(rollups: List[AgentActionCostTable]) -> Dict[str, Decimal]:
+    """
+    Merge hourly rollups of one agent into the action cost metrics.
+
+    avg, min and max are exact. low, medium and high follow the NTILE(5) split
+    of the exact calculation, using each histogram bucket's mean for its
+    actions, so they are accurate to about the bucket width.
+    """
+    default_value = Decimal("0")
+    metrics = {
+        "avg_action_cost": default_value,
+        "min_action_cost": default_value,
+        "max_action_cost": default_value,
+        "low_action_cost": default_value,
+        "medium_action_cost": default_value,
+        "high_action_cost": default_value,
+    }
+    external_count = sum(rollup.external_action_count for rollup in rollups)
+    count = sum(rollup.action_count for rollup in rollups)
+    if external_count < ACTION_COST_MIN_ACTIONS or count == 0:
+        return metrics
+
+    total = sum((rollup.total_cost for rollup in rollups), Decimal("0"))
+    histogram: Dict[int, List] = {}
+    for rollup in rollups:
+        for bucket, (bucket_count, bucket_sum) in rollup.histogram.items():
+            merged = histogram.setdefault(int(bucket), [0, Decimal("0")])
+            merged[0] += bucket_count
+            merged[1] += Decimal(bucket_sum)
+
+    # NTILE(5) puts the remainder in the first groups
+    sizes = [count // 5 + (1 if i < count % 5 else 0) for i in range(5)]
+    sums = [Decimal("0")] * 5
+    group = 0
+    room = sizes[0]
+    for bucket in sorted(histogram):
+        bucket_count, bucket_sum = histogram[bucket]
+        mean = bucket_sum / bucket_count
+        while bucket_count > 0 and group < 5:
+            if room == 0:
+                group += 1
+                room = sizes[group] if group < 5 else 0
+                continue
+            taken = min(room, bucket_count)
+            sums[group] += mean * taken
+            room -= taken
+            bucket_count -= taken
+
+    def average(groups: range):
+        size = sum(sizes[i] for i in groups)
+        if size == 0:
+            return default_value
+        return (sum(sums[i] for i in groups) / size).quantize(Decimal("0.0001"))
+
+    metrics.update(
+        avg_action_cost=(total / count).quantize(Decimal("0.0001")),
+        min_action_cost=min(rollup.min_cost for rollup in rollups),
+        max_action_cost=max(rollup.max_cost for rollup in rollups),
+        low_action_cost=average(range(0, 1)),
+        medium_action_cost=average(range(1, 4)),
+        high_action_cost=average(range(4, 5)),
+    )
+    return metrics
+
+
 async def update_agent_action_cost():
     """
     Update action costs for all agents.
 
-    This function processes agents in batches of 100 to avoid memory issues.
-    For each agent, it calculates various action cost metrics:
+    Action costs come from hourly rollups in agent_action_costs, see
+    rollup_agent_action_costs. Each run rolls up every complete hour from the
+    latest rolled up one, which is rebuilt so late expenses of long actions
+    are counted, so hours missed while the scheduler was down are filled in.
+    At least the last two hours are rolled up, and the whole window on the
+    first run. Metrics are then merged from the rollups of the last three
+    days, and only agents with rollups are updated, in one bulk UPDATE. An
+    agent whose last rollup ages out is reset to the default values once.
+
+    Metrics calculated:
     - avg_action_cost: average cost per action
     - min_action_cost: minimum cost per action
     - max_action_cost: maximum cost per action
     - low_action_cost: average cost of the lowest 20% of actions
     - medium_action_cost: average cost of the middle 60% of actions
     - high_action_cost: average cost of the highest 20% of actions
-
-    It then updates the corresponding record in the agent_quotas table.
     """
     logger.info("Starting update of agent average action costs")
     start_time = time.time()
-    batch_size = 100
-    last_id = None
-    total_updated = 0
-
-    while True:
-        # Get a batch of agent IDs ordered by ID
-        async with get_session() as session:
-            query = select(AgentTable.id).order_by(AgentTable.id)
+    current_hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    cutoff = current_hour - timedelta(hours=ACTION_COST_WINDOW_HOURS)
 
-            # Apply pagination if we have a last_id from previous batch
-            if last_id:
-                query = query.where(AgentTable.id > last_id)
-
-            query = query.limit(batch_size)
-            result = await session.execute(query)
-            agent_ids = [row[0] for row in result]
-
-            # If no more agents, we're done
-            if not agent_ids:
-                break
+    async with get_session() as session:
+        latest = await session.scalar(select(func.max(AgentActionCostTable.hour)))
+    start = cutoff
+    if latest is not None:
+        if latest.tzinfo is None:
+            # SQLite returns naive UTC times
+            latest = latest.replace(tzinfo=timezone.utc)
+        start = max(cutoff, min(latest, current_hour - timedelta(hours=2)))
+    hours = int((current_hour - start) / timedelta(hours=1))
+    for offset in range(hours, 0, -1):
+        hour = current_hour - timedelta(hours=offset)
+        try:
+            await rollup_agent_action_costs(hour)
+        except Exception as e:
+            logger.error(f"Error rolling up action costs for {hour}: {str(e)}")
 
-            # Update last_id for next batch
-            last_id = agent_ids[-1]
+    async with get_session() as session:
+        result = await session.scalars(
+            select(AgentActionCostTable).order_by(AgentActionCostTable.agent_id)
+        )
+        rollups_by_agent: Dict[str, List[AgentActionCostTable]] = {}
+        for rollup in result:
+            rollups_by_agent.setdefault(rollup.agent_id, []).append(rollup)
+
+        params = []
+        for agent_id, rollups in rollups_by_agent.items():
+            costs = _merge_action_costs(
+                [rollup for rollup in rollups if rollup.hour >= cutoff]
+            )
+            params.append({"agent_id": agent_id, **costs})
 
-        # Process this batch of agents
-        logger.info(
-            f"Processing batch of {len(agent_ids)} agents starting with ID {agent_ids[0]}"
+        if params:
+            # executemany, the keys matching columns make up the SET clause
+            table = AgentQuotaTable.__table__
+            await session.execute(
+                update(table).where(table.c.id == bindparam("agent_id")), params
+            )
+        # Rollups out of the window are no longer needed
+        await session.execute(
+            delete(AgentActionCostTable).where(AgentActionCostTable.hour < cutoff)
         )
-        batch_start_time = time.time()
-
-        for agent_id in agent_ids:
-            try:
-                # Calculate action costs for this agent
-                costs = await agent_action_cost(agent_id)
-
-                # Update the agent's quota record
-                async with get_session() as session:
-                    update_stmt = (
-                        update(AgentQuotaTable)
-                        .where(AgentQuotaTable.id == agent_id)
-                        .values(
-                            avg_action_cost=costs["avg_action_cost"],
-                            min_action_cost=costs["min_action_cost"],
-                            max_action_cost=costs["max_action_cost"],
-                            low_action_cost=costs["low_action_cost"],
-                            medium_action_cost=costs["medium_action_cost"],
-                            high_action_cost=costs["high_action_cost"],
-                        )
-                    )
-                    await session.execute(update_stmt)
-                    await session.commit()
-
-                total_updated += 1
-            except Exception as e:
-                logger.error(
-                    f"Error updating action costs for agent {agent_id}: {str(e)}"
-                )
-
-        batch_time = time.time() - batch_start_time
-        logger.info(f"Completed batch in {batch_time:.3f}s")
+        await session.commit()
 
     total_time = time.time() - start_time
     logger.info(
-        f"Finished updating action costs for {total_updated} agents in {total_time:.3f}s"
+        f"Finished updating action costs for {len(params)} agents in {total_time:.3f}s"
     )
 
 
@@ -341,6 +498,7 @@ async def add_autonomous_task(agent_id: str, task: AgentAutonomous) -> AgentAuto
         )
         await session.execute(update_stmt)
         await session.commit()
+    await publish_agent_changed(agent_id)
 
     logger.info(f"Added autonomous task {task.id} to agent {agent_id}")
     return task
@@ -394,6 +552,7 @@ async def delete_autonomous_task(agent_id: str, task_id: str) -> None:
         )
         await session.execute(update_stmt)
         await session.commit()
+    await publish_agent_changed(agent_id)
 
     logger.info(f"Deleted autonomous task {task_id} from agent {agent_id}")
 
@@ -459,6 +618,7 @@ async def update_autonomous_task(
         )
         await session.execute(update_stmt)
         await session.commit()
+    await publish_agent_changed(agent_id)
 
     logger.info(f"Updated autonomous task {task_id} for agent {agent_id}")
     return updated_task
@@ -3,13 +3,13 @@
 This module provides the core API endpoints for agent execution and management.
 """
 
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Body
 from fastapi.responses import StreamingResponse
 from pydantic import AfterValidator
 
-from intentkit.core.engine import execute_agent, stream_agent
+from intentkit.core.engine import execute_agent, executor_cache_stats, stream_agent
 from intentkit.models.chat import ChatMessage, ChatMessageCreate
 
 core_router = APIRouter(prefix="/core", tags=["Core"])
@@ -98,3 +98,18 @@ async def stream(
         media_type="text/event-stream",
         headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
     )
+
+
+@core_router.get("/executor-cache")
+async def executor_cache() -> dict[str, Any]:
+    """Get the agent executor cache counters of this worker process.
+
+    **Response:**
+    * `entries`, `bytes` - Current size of the cache, bytes are approximate
+    * `hits`, `misses`, `evictions`, `expirations`, `stale` - Lookup counters
+    * `cold_starts`, `cold_start_p50`, `cold_start_p99`, `cold_start_max` -
+      Executor build latency in seconds
+    * `coalesced` - Cold starts that waited for a build already in flight
+      instead of running a duplicate one
+    """
+    return executor_cache_stats()
@@ -1,14 +1,17 @@
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from epyxid import XID
 from fastapi import HTTPException
 from pydantic import BaseModel
-from sqlalchemy import desc, select
+from sqlalchemy import case, desc, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from intentkit.config.config import config
 from intentkit.models.agent import Agent
 from intentkit.models.agent_data import AgentData
 from intentkit.models.app_setting import AppSetting
@@ -23,6 +26,7 @@ from intentkit.models.credit import (
     DEFAULT_PLATFORM_ACCOUNT_REWARD,
     DEFAULT_PLATFORM_ACCOUNT_SKILL,
     CreditAccount,
+    CreditAccountDeltaTable,
     CreditAccountTable,
     CreditDebit,
     CreditEvent,
@@ -771,6 +775,21 @@ async def fetch_credit_event_by_id(
     return CreditEvent.model_validate(result)
 
 
+class MessageExpense(BaseModel):
+    """An LLM message to bill in an expense batch."""
+
+    message_id: str
+    base_llm_amount: Decimal
+
+
+class SkillExpense(BaseModel):
+    """A skill call to bill in an expense batch."""
+
+    message_id: str
+    skill_call_id: str
+    skill_name: str
+
+
 async def expense_message(
     session: AsyncSession,
     user_id: str,
@@ -791,235 +810,16 @@ async def expense_message(
         base_llm_amount: Amount of LLM costs
 
     Returns:
-        Updated user credit account
+        CreditEvent: The created credit event
     """
-    # Check for idempotency - prevent duplicate transactions
-    await CreditEvent.check_upstream_tx_id_exists(
-        session, UpstreamType.EXECUTOR, message_id
-    )
-
-    # Ensure base_llm_amount has 4 decimal places
-    base_llm_amount = base_llm_amount.quantize(FOURPLACES, rounding=ROUND_HALF_UP)
-
-    if base_llm_amount < Decimal("0"):
-        raise ValueError("Base LLM amount must be non-negative")
-
-    # Get payment settings
-    payment_settings = await AppSetting.payment()
-
-    # Calculate amount with exact 4 decimal places
-    base_original_amount = base_llm_amount
-    base_amount = base_original_amount
-    fee_platform_amount = (
-        base_amount * payment_settings.fee_platform_percentage / Decimal("100")
-    ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
-    fee_agent_amount = Decimal("0")
-    if agent.fee_percentage and user_id != agent.owner:
-        fee_agent_amount = (
-            (base_amount + fee_platform_amount) * agent.fee_percentage / Decimal("100")
-        ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
-    total_amount = (base_amount + fee_platform_amount + fee_agent_amount).quantize(
-        FOURPLACES, rounding=ROUND_HALF_UP
-    )
-
-    # 1. Create credit event record first to get event_id
-    event_id = str(XID())
-
-    # 2. Update user account - deduct credits
-    user_account, details = await CreditAccount.expense_in_session(
-        session=session,
-        owner_type=OwnerType.USER,
-        owner_id=user_id,
-        amount=total_amount,
-        event_id=event_id,
-    )
-
-    # If using free credits, add to agent's free_income_daily
-    if details.get(CreditType.FREE):
-        from intentkit.models.agent_data import AgentQuota
-
-        await AgentQuota.add_free_income_in_session(
-            session=session, id=agent.id, amount=details.get(CreditType.FREE)
-        )
-
-    # 3. Update fee account - add credits
-    message_account = await CreditAccount.income_in_session(
-        session=session,
-        owner_type=OwnerType.PLATFORM,
-        owner_id=DEFAULT_PLATFORM_ACCOUNT_MESSAGE,
-        credit_type=CreditType.PERMANENT,
-        amount=base_amount,
-        event_id=event_id,
-    )
-    platform_fee_account = await CreditAccount.income_in_session(
-        session=session,
-        owner_type=OwnerType.PLATFORM,
-        owner_id=DEFAULT_PLATFORM_ACCOUNT_FEE,
-        credit_type=CreditType.PERMANENT,
-        amount=fee_platform_amount,
-        event_id=event_id,
-    )
-    if fee_agent_amount > 0:
-        agent_account = await CreditAccount.income_in_session(
-            session=session,
-            owner_type=OwnerType.AGENT,
-            owner_id=agent.id,
-            credit_type=CreditType.REWARD,
-            amount=fee_agent_amount,
-            event_id=event_id,
-        )
-
-    # 4. Create credit event record
-    # Set the appropriate credit amount field based on credit type
-    free_amount = details.get(CreditType.FREE, Decimal("0"))
-    reward_amount = details.get(CreditType.REWARD, Decimal("0"))
-    permanent_amount = details.get(CreditType.PERMANENT, Decimal("0"))
-    if CreditType.PERMANENT in details:
-        credit_type = CreditType.PERMANENT
-    elif CreditType.REWARD in details:
-        credit_type = CreditType.REWARD
-    else:
-        credit_type = CreditType.FREE
-
-    # Calculate fee_platform amounts by credit type
-    fee_platform_free_amount = Decimal("0")
-    fee_platform_reward_amount = Decimal("0")
-    fee_platform_permanent_amount = Decimal("0")
-
-    if fee_platform_amount > Decimal("0") and total_amount > Decimal("0"):
-        # Calculate proportions based on the formula
-        if free_amount > Decimal("0"):
-            fee_platform_free_amount = (
-                free_amount * fee_platform_amount / total_amount
-            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
-
-        if reward_amount > Decimal("0"):
-            fee_platform_reward_amount = (
-                reward_amount * fee_platform_amount / total_amount
-            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
-
-        # Calculate permanent amount as the remainder to ensure the sum equals fee_platform_amount
-        fee_platform_permanent_amount = (
-            fee_platform_amount - fee_platform_free_amount - fee_platform_reward_amount
-        ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
-
-    # Calculate fee_agent amounts by credit type
-    fee_agent_free_amount = Decimal("0")
-    fee_agent_reward_amount = Decimal("0")
-    fee_agent_permanent_amount = Decimal("0")
-
-    if fee_agent_amount > Decimal("0") and total_amount > Decimal("0"):
-        # Calculate proportions based on the formula
-        if free_amount > Decimal("0"):
-            fee_agent_free_amount = (
-                free_amount * fee_agent_amount / total_amount
-            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
-
-        if reward_amount > Decimal("0"):
-            fee_agent_reward_amount = (
-                reward_amount * fee_agent_amount / total_amount
-            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
-
-        # Calculate permanent amount as the remainder to ensure the sum equals fee_agent_amount
-        fee_agent_permanent_amount = (
-            fee_agent_amount - fee_agent_free_amount - fee_agent_reward_amount
-        ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
-
-    # Get agent wallet address
-    agent_data = await AgentData.get(agent.id)
-    agent_wallet_address = agent_data.evm_wallet_address if agent_data else None
-
-    event = CreditEventTable(
-        id=event_id,
-        account_id=user_account.id,
-        event_type=EventType.MESSAGE,
-        user_id=user_id,
-        upstream_type=UpstreamType.EXECUTOR,
-        upstream_tx_id=message_id,
-        direction=Direction.EXPENSE,
-        agent_id=agent.id,
-        message_id=message_id,
-        start_message_id=start_message_id,
-        model=agent.model,
-        total_amount=total_amount,
-        credit_type=credit_type,
-        credit_types=list(details.keys()),
-        balance_after=user_account.credits
-        + user_account.free_credits
-        + user_account.reward_credits,
-        base_amount=base_amount,
-        base_original_amount=base_original_amount,
-        base_llm_amount=base_llm_amount,
-        fee_platform_amount=fee_platform_amount,
-        fee_platform_free_amount=fee_platform_free_amount,
-        fee_platform_reward_amount=fee_platform_reward_amount,
-        fee_platform_permanent_amount=fee_platform_permanent_amount,
-        fee_agent_amount=fee_agent_amount,
-        fee_agent_account=agent_account.id if fee_agent_amount > 0 else None,
-        fee_agent_free_amount=fee_agent_free_amount,
-        fee_agent_reward_amount=fee_agent_reward_amount,
-        fee_agent_permanent_amount=fee_agent_permanent_amount,
-        free_amount=free_amount,
-        reward_amount=reward_amount,
-        permanent_amount=permanent_amount,
-        agent_wallet_address=agent_wallet_address,
+    events = await expense_batch(
+        session,
+        user_id,
+        start_message_id,
+        agent,
+        [MessageExpense(message_id=message_id, base_llm_amount=base_llm_amount)],
     )
-    session.add(event)
-    await session.flush()
-
-    # 4. Create credit transaction records
-    # 4.1 User account transaction (debit)
-    user_tx = CreditTransactionTable(
-        id=str(XID()),
-        account_id=user_account.id,
-        event_id=event_id,
-        tx_type=TransactionType.PAY,
-        credit_debit=CreditDebit.DEBIT,
-        change_amount=total_amount,
-        credit_type=credit_type,
-    )
-    session.add(user_tx)
-
-    # 4.2 Message account transaction (credit)
-    message_tx = CreditTransactionTable(
-        id=str(XID()),
-        account_id=message_account.id,
-        event_id=event_id,
-        tx_type=TransactionType.RECEIVE_BASE_LLM,
-        credit_debit=CreditDebit.CREDIT,
-        change_amount=base_amount,
-        credit_type=credit_type,
-    )
-    session.add(message_tx)
-
-    # 4.3 Platform fee account transaction (credit)
-    platform_tx = CreditTransactionTable(
-        id=str(XID()),
-        account_id=platform_fee_account.id,
-        event_id=event_id,
-        tx_type=TransactionType.RECEIVE_FEE_PLATFORM,
-        credit_debit=CreditDebit.CREDIT,
-        change_amount=fee_platform_amount,
-        credit_type=credit_type,
-    )
-    session.add(platform_tx)
-
-    # 4.4 Agent fee account transaction (credit)
-    if fee_agent_amount > 0:
-        agent_tx = CreditTransactionTable(
-            id=str(XID()),
-            account_id=agent_account.id,
-            event_id=event_id,
-            tx_type=TransactionType.RECEIVE_FEE_AGENT,
-            credit_debit=CreditDebit.CREDIT,
-            change_amount=fee_agent_amount,
-            credit_type=credit_type,
-        )
-        session.add(agent_tx)
-
-    await session.refresh(event)
-
-    return CreditEvent.model_validate(event)
+    return events[0]
 
 
 class SkillCost(BaseModel):
@@ -1125,7 +925,7 @@ async def expense_skill(
     agent: Agent,
 ) -> CreditEvent:
     """
-    Deduct credits from a user account for message expenses.
+    Deduct credits from a user account for skill expenses.
     Don't forget to commit the session after calling this function.
 
     Args:
@@ -1140,428 +940,601 @@ async def expense_skill(
     Returns:
         CreditEvent: The created credit event
     """
-    # Check for idempotency - prevent duplicate transactions
-    upstream_tx_id = f"{message_id}_{skill_call_id}"
-    await CreditEvent.check_upstream_tx_id_exists(
-        session, UpstreamType.EXECUTOR, upstream_tx_id
+    events = await expense_batch(
+        session,
+        user_id,
+        start_message_id,
+        agent,
+        [
+            SkillExpense(
+                message_id=message_id,
+                skill_call_id=skill_call_id,
+                skill_name=skill_name,
+            )
+        ],
     )
-    logger.info(f"[{agent.id}] skill payment {skill_name}")
+    return events[0]
 
-    # Calculate skill cost using the skill_cost function
-    skill_cost_info = await skill_cost(skill_name, user_id, agent)
 
-    # 1. Create credit event record first to get event_id
-    event_id = str(XID())
+def _platform_deferred(owner_type: OwnerType) -> bool:
+    """Whether changes to this account type go to credit_account_deltas."""
+    return config.credit_platform_deferred and owner_type == OwnerType.PLATFORM
 
-    # 2. Update user account - deduct credits
-    user_account, details = await CreditAccount.expense_in_session(
-        session=session,
-        owner_type=OwnerType.USER,
-        owner_id=user_id,
-        amount=skill_cost_info.total_amount,
-        event_id=event_id,
-    )
 
-    # If using free credits, add to agent's free_income_daily
-    if CreditType.FREE in details:
-        from intentkit.models.agent_data import AgentQuota
+async def _platform_change_in_session(
+    session: AsyncSession,
+    owner_id: str,
+    credit_type: CreditType,
+    amount: Decimal,
+    event_id: str,
+) -> str:
+    """Add a signed amount to a platform account, deferred if enabled.
 
-        await AgentQuota.add_free_income_in_session(
-            session=session, id=agent.id, amount=details[CreditType.FREE]
+    Returns:
+        str: The platform account id
+    """
+    if _platform_deferred(OwnerType.PLATFORM):
+        return await CreditAccount.defer_change_in_session(
+            session, owner_id, {credit_type: amount}, event_id
         )
-
-    # 3. Update fee account - add credits
-    skill_account = await CreditAccount.income_in_session(
-        session=session,
+    account = await CreditAccount.change_in_session(
+        session,
         owner_type=OwnerType.PLATFORM,
-        owner_id=DEFAULT_PLATFORM_ACCOUNT_SKILL,
-        credit_type=CreditType.PERMANENT,
-        amount=skill_cost_info.base_amount,
-        event_id=event_id,
-    )
-    platform_account = await CreditAccount.income_in_session(
-        session=session,
-        owner_type=OwnerType.PLATFORM,
-        owner_id=DEFAULT_PLATFORM_ACCOUNT_FEE,
-        credit_type=CreditType.PERMANENT,
-        amount=skill_cost_info.fee_platform_amount,
+        owner_id=owner_id,
+        changes={credit_type: amount},
         event_id=event_id,
     )
-    if skill_cost_info.fee_dev_amount > 0:
-        dev_account = await CreditAccount.income_in_session(
-            session=session,
-            owner_type=skill_cost_info.fee_dev_user_type,
-            owner_id=skill_cost_info.fee_dev_user,
-            credit_type=CreditType.REWARD,  # put dev fee in reward
-            amount=skill_cost_info.fee_dev_amount,
-            event_id=event_id,
-        )
-    if skill_cost_info.fee_agent_amount > 0:
-        agent_account = await CreditAccount.income_in_session(
-            session=session,
-            owner_type=OwnerType.AGENT,
-            owner_id=agent.id,
-            credit_type=CreditType.REWARD,
-            amount=skill_cost_info.fee_agent_amount,
-            event_id=event_id,
-        )
+    return account.id
 
-    # 4. Create credit event record
-    # Set the appropriate credit amount field based on credit type
-    free_amount = details.get(CreditType.FREE, Decimal("0"))
-    reward_amount = details.get(CreditType.REWARD, Decimal("0"))
-    permanent_amount = details.get(CreditType.PERMANENT, Decimal("0"))
-    if CreditType.PERMANENT in details:
-        credit_type = CreditType.PERMANENT
-    elif CreditType.REWARD in details:
-        credit_type = CreditType.REWARD
-    else:
-        credit_type = CreditType.FREE
 
-    # Calculate fee_platform amounts by credit type
-    fee_platform_free_amount = Decimal("0")
-    fee_platform_reward_amount = Decimal("0")
-    fee_platform_permanent_amount = Decimal("0")
+async def fold_platform_account_deltas() -> None:
+    """Fold pending platform account deltas into the account rows.
 
-    if skill_cost_info.fee_platform_amount > Decimal(
-        "0"
-    ) and skill_cost_info.total_amount > Decimal("0"):
-        # Calculate proportions based on the formula
-        if free_amount > Decimal("0"):
-            fee_platform_free_amount = (
-                free_amount
-                * skill_cost_info.fee_platform_amount
-                / skill_cost_info.total_amount
-            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
+    Runs in the scheduler. It keeps running after deferred mode is turned off,
+    so the deltas left behind are drained.
+    """
+    total = 0
+    while True:
+        async with get_session() as session:
+            folded = await CreditAccount.fold_deltas_in_session(session)
+            await session.commit()
+        total += folded
+        if folded == 0:
+            break
+    if total:
+        logger.info(f"Folded {total} platform account deltas")
 
-        if reward_amount > Decimal("0"):
-            fee_platform_reward_amount = (
-                reward_amount
-                * skill_cost_info.fee_platform_amount
-                / skill_cost_info.total_amount
-            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
 
-        # Calculate permanent amount as the remainder to ensure the sum equals fee_platform_amount
-        fee_platform_permanent_amount = (
-            skill_cost_info.fee_platform_amount
-            - fee_platform_free_amount
-            - fee_platform_reward_amount
-        ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
+def _split_by_credit_type(
+    amount: Decimal,
+    free_amount: Decimal,
+    reward_amount: Decimal,
+    total_amount: Decimal,
+) -> Tuple[Decimal, Decimal, Decimal]:
+    """Split a fee into free, reward and permanent parts in proportion to the payment.
 
-    # Calculate fee_agent amounts by credit type
-    fee_agent_free_amount = Decimal("0")
-    fee_agent_reward_amount = Decimal("0")
-    fee_agent_permanent_amount = Decimal("0")
+    The permanent part is the remainder, so the three parts always sum to amount.
+    """
+    zero = Decimal("0")
+    if amount <= zero or total_amount <= zero:
+        return zero, zero, zero
+    free_part = zero
+    reward_part = zero
+    if free_amount > zero:
+        free_part = (free_amount * amount / total_amount).quantize(
+            FOURPLACES, rounding=ROUND_HALF_UP
+        )
+    if reward_amount > zero:
+        reward_part = (reward_amount * amount / total_amount).quantize(
+            FOURPLACES, rounding=ROUND_HALF_UP
+        )
+    permanent_part = (amount - free_part - reward_part).quantize(
+        FOURPLACES, rounding=ROUND_HALF_UP
+    )
+    return free_part, reward_part, permanent_part
 
-    if skill_cost_info.fee_agent_amount > Decimal(
-        "0"
-    ) and skill_cost_info.total_amount > Decimal("0"):
-        # Calculate proportions based on the formula
-        if free_amount > Decimal("0"):
-            fee_agent_free_amount = (
-                free_amount
-                * skill_cost_info.fee_agent_amount
-                / skill_cost_info.total_amount
-            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
 
-        if reward_amount > Decimal("0"):
-            fee_agent_reward_amount = (
-                reward_amount
-                * skill_cost_info.fee_agent_amount
-                / skill_cost_info.total_amount
-            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
+async def expense_batch(
+    session: AsyncSession,
+    user_id: str,
+    start_message_id: str,
+    agent: Agent,
+    items: List[MessageExpense | SkillExpense],
+) -> List[CreditEvent]:
+    """
+    Deduct credits for all messages and skill calls of one agent step at once.
+    Don't forget to commit the session after calling this function.
 
-        # Calculate permanent amount as the remainder to ensure the sum equals fee_agent_amount
-        fee_agent_permanent_amount = (
-            skill_cost_info.fee_agent_amount
-            - fee_agent_free_amount
-            - fee_agent_reward_amount
-        ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
+    Every event and transaction is built in memory first. The database then
+    sees one idempotency check, one UPDATE per touched account, and one
+    multi-row INSERT per ledger table.
 
-    # Calculate fee_dev amounts by credit type
-    fee_dev_free_amount = Decimal("0")
-    fee_dev_reward_amount = Decimal("0")
-    fee_dev_permanent_amount = Decimal("0")
+    Args:
+        session: Async session to use for database operations
+        user_id: ID of the user to deduct credits from
+        start_message_id: ID of the starting message in a conversation
+        agent: Agent that incurred the expenses
+        items: Messages and skill calls to bill, in order
 
-    if skill_cost_info.fee_dev_amount > Decimal(
-        "0"
-    ) and skill_cost_info.total_amount > Decimal("0"):
-        # Calculate proportions based on the formula
-        if free_amount > Decimal("0"):
-            fee_dev_free_amount = (
-                free_amount
-                * skill_cost_info.fee_dev_amount
-                / skill_cost_info.total_amount
-            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
+    Returns:
+        List[CreditEvent]: The created credit events, in the order of items
+    """
+    if not items:
+        return []
 
-        if reward_amount > Decimal("0"):
-            fee_dev_reward_amount = (
-                reward_amount
-                * skill_cost_info.fee_dev_amount
-                / skill_cost_info.total_amount
-            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
+    # Check for idempotency - prevent duplicate transactions
+    upstream_tx_ids = [
+        f"{item.message_id}_{item.skill_call_id}"
+        if isinstance(item, SkillExpense)
+        else item.message_id
+        for item in items
+    ]
+    await CreditEvent.check_upstream_tx_ids_exist(
+        session, UpstreamType.EXECUTOR, upstream_tx_ids
+    )
 
-        # Calculate permanent amount as the remainder to ensure the sum equals fee_dev_amount
-        fee_dev_permanent_amount = (
-            skill_cost_info.fee_dev_amount - fee_dev_free_amount - fee_dev_reward_amount
+    # Calculate all costs before touching any account
+    payment_settings = await AppSetting.payment()
+    costs: List[SkillCost] = []
+    for item in items:
+        if isinstance(item, SkillExpense):
+            logger.info(f"[{agent.id}] skill payment {item.skill_name}")
+            costs.append(await skill_cost(item.skill_name, user_id, agent))
+            continue
+        # Ensure base_llm_amount has 4 decimal places
+        base_llm_amount = item.base_llm_amount.quantize(
+            FOURPLACES, rounding=ROUND_HALF_UP
+        )
+        if base_llm_amount < Decimal("0"):
+            raise ValueError("Base LLM amount must be non-negative")
+        base_amount = base_llm_amount
+        fee_platform_amount = (
+            base_amount * payment_settings.fee_platform_percentage / Decimal("100")
         ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
+        fee_agent_amount = Decimal("0")
+        if agent.fee_percentage and user_id != agent.owner:
+            fee_agent_amount = (
+                (base_amount + fee_platform_amount)
+                * agent.fee_percentage
+                / Decimal("100")
+            ).quantize(FOURPLACES, rounding=ROUND_HALF_UP)
+        costs.append(
+            SkillCost(
+                total_amount=(
+                    base_amount + fee_platform_amount + fee_agent_amount
+                ).quantize(FOURPLACES, rounding=ROUND_HALF_UP),
+                base_amount=base_amount,
+                base_discount_amount=Decimal("0"),
+                base_original_amount=base_amount,
+                base_skill_amount=Decimal("0"),
+                fee_platform_amount=fee_platform_amount,
+                fee_dev_user=DEFAULT_PLATFORM_ACCOUNT_DEV,
+                fee_dev_user_type=OwnerType.PLATFORM,
+                fee_dev_amount=Decimal("0"),
+                fee_agent_amount=fee_agent_amount,
+            )
+        )
 
     # Get agent wallet address
     agent_data = await AgentData.get(agent.id)
     agent_wallet_address = agent_data.evm_wallet_address if agent_data else None
 
-    event = CreditEventTable(
-        id=event_id,
-        account_id=user_account.id,
-        event_type=EventType.SKILL_CALL,
-        user_id=user_id,
-        upstream_type=UpstreamType.EXECUTOR,
-        upstream_tx_id=upstream_tx_id,
-        direction=Direction.EXPENSE,
-        agent_id=agent.id,
-        message_id=message_id,
-        start_message_id=start_message_id,
-        skill_call_id=skill_call_id,
-        skill_name=skill_name,
-        total_amount=skill_cost_info.total_amount,
-        credit_type=credit_type,
-        credit_types=details.keys(),
-        balance_after=user_account.credits
-        + user_account.free_credits
-        + user_account.reward_credits,
-        base_amount=skill_cost_info.base_amount,
-        base_original_amount=skill_cost_info.base_original_amount,
-        base_skill_amount=skill_cost_info.base_skill_amount,
-        fee_platform_amount=skill_cost_info.fee_platform_amount,
-        fee_platform_free_amount=fee_platform_free_amount,
-        fee_platform_reward_amount=fee_platform_reward_amount,
-        fee_platform_permanent_amount=fee_platform_permanent_amount,
-        fee_agent_amount=skill_cost_info.fee_agent_amount,
-        fee_agent_account=agent_account.id
-        if skill_cost_info.fee_agent_amount > 0
-        else None,
-        fee_agent_free_amount=fee_agent_free_amount,
-        fee_agent_reward_amount=fee_agent_reward_amount,
-        fee_agent_permanent_amount=fee_agent_permanent_amount,
-        fee_dev_amount=skill_cost_info.fee_dev_amount,
-        fee_dev_account=dev_account.id if skill_cost_info.fee_dev_amount > 0 else None,
-        fee_dev_free_amount=fee_dev_free_amount,
-        fee_dev_reward_amount=fee_dev_reward_amount,
-        fee_dev_permanent_amount=fee_dev_permanent_amount,
-        free_amount=free_amount,
-        reward_amount=reward_amount,
-        permanent_amount=permanent_amount,
-        agent_wallet_address=agent_wallet_address,
+    # Lock the user account, then split every expense against the running balance
+    user_account = await CreditAccount.get_or_create_in_session(
+        session, OwnerType.USER, user_id, for_update=True
     )
-    session.add(event)
-    await session.flush()
+    balance = user_account.model_copy()
 
-    # 4. Create credit transaction records
-    # 4.1 User account transaction (debit)
-    user_tx = CreditTransactionTable(
-        id=str(XID()),
-        account_id=user_account.id,
-        event_id=event_id,
-        tx_type=TransactionType.PAY,
-        credit_debit=CreditDebit.DEBIT,
-        change_amount=skill_cost_info.total_amount,
-        credit_type=credit_type,
-    )
-    session.add(user_tx)
-
-    # 4.2 Skill account transaction (credit)
-    skill_tx = CreditTransactionTable(
-        id=str(XID()),
-        account_id=skill_account.id,
-        event_id=event_id,
-        tx_type=TransactionType.RECEIVE_BASE_SKILL,
-        credit_debit=CreditDebit.CREDIT,
-        change_amount=skill_cost_info.base_amount,
-        credit_type=credit_type,
-    )
-    session.add(skill_tx)
-
-    # 4.3 Platform fee account transaction (credit)
-    platform_tx = CreditTransactionTable(
-        id=str(XID()),
-        account_id=platform_account.id,
-        event_id=event_id,
-        tx_type=TransactionType.RECEIVE_FEE_PLATFORM,
-        credit_debit=CreditDebit.CREDIT,
-        change_amount=skill_cost_info.fee_platform_amount,
-        credit_type=credit_type,
-    )
-    session.add(platform_tx)
+    # Signed changes and last event id per account, keyed by (owner_type, owner_id)
+    changes: Dict[Tuple[OwnerType, str], Dict[CreditType, Decimal]] = {}
+    last_event_ids: Dict[Tuple[OwnerType, str], str] = {}
 
-    # 4.4 Dev user transaction (credit)
-    if skill_cost_info.fee_dev_amount > 0:
-        dev_tx = CreditTransactionTable(
-            id=str(XID()),
-            account_id=dev_account.id,
-            event_id=event_id,
-            tx_type=TransactionType.RECEIVE_FEE_DEV,
-            credit_debit=CreditDebit.CREDIT,
-            change_amount=skill_cost_info.fee_dev_amount,
-            credit_type=CreditType.REWARD,
+    def change(key: Tuple[OwnerType, str], credit_type: CreditType, amount, event_id):
+        account_changes = changes.setdefault(key, {})
+        account_changes[credit_type] = (
+            account_changes.get(credit_type, Decimal("0")) + amount
         )
-        session.add(dev_tx)
-
-    # 4.5 Agent fee account transaction (credit)
-    if skill_cost_info.fee_agent_amount > 0:
-        agent_tx = CreditTransactionTable(
-            id=str(XID()),
-            account_id=agent_account.id,
-            event_id=event_id,
-            tx_type=TransactionType.RECEIVE_FEE_AGENT,
-            credit_debit=CreditDebit.CREDIT,
-            change_amount=skill_cost_info.fee_agent_amount,
+        last_event_ids[key] = event_id
+
+    user_key = (OwnerType.USER, user_id)
+    agent_key = (OwnerType.AGENT, agent.id)
+    fee_key = (OwnerType.PLATFORM, DEFAULT_PLATFORM_ACCOUNT_FEE)
+    event_rows = []
+    tx_rows = []
+    free_income = Decimal("0")
+
+    for item, upstream_tx_id, cost in zip(items, upstream_tx_ids, costs):
+        is_skill = isinstance(item, SkillExpense)
+        event_id = str(XID())
+
+        # 1. User account - deduct credits
+        details = balance.split_expense(cost.total_amount)
+        for detail_type, amount in details.items():
+            change(user_key, detail_type, -amount, event_id)
+            setattr(
+                balance, detail_type.value, getattr(balance, detail_type.value) - amount
+            )
+        free_amount = details.get(CreditType.FREE, Decimal("0"))
+        reward_amount = details.get(CreditType.REWARD, Decimal("0"))
+        permanent_amount = details.get(CreditType.PERMANENT, Decimal("0"))
+        free_income += free_amount
+        if CreditType.PERMANENT in details:
+            credit_type = CreditType.PERMANENT
+        elif CreditType.REWARD in details:
+            credit_type = CreditType.REWARD
+        else:
+            credit_type = CreditType.FREE
+
+        # 2. Receiving accounts - add credits
+        base_key = (
+            OwnerType.PLATFORM,
+            DEFAULT_PLATFORM_ACCOUNT_SKILL
+            if is_skill
+            else DEFAULT_PLATFORM_ACCOUNT_MESSAGE,
+        )
+        dev_key = (cost.fee_dev_user_type, cost.fee_dev_user)
+        change(base_key, CreditType.PERMANENT, cost.base_amount, event_id)
+        change(fee_key, CreditType.PERMANENT, cost.fee_platform_amount, event_id)
+        if cost.fee_dev_amount > 0:
+            # put dev fee in reward
+            change(dev_key, CreditType.REWARD, cost.fee_dev_amount, event_id)
+        if cost.fee_agent_amount > 0:
+            change(agent_key, CreditType.REWARD, cost.fee_agent_amount, event_id)
+
+        # 3. Credit event record, account ids are filled after the updates
+        fee_platform_split = _split_by_credit_type(
+            cost.fee_platform_amount, free_amount, reward_amount, cost.total_amount
+        )
+        fee_agent_split = _split_by_credit_type(
+            cost.fee_agent_amount, free_amount, reward_amount, cost.total_amount
+        )
+        event_row = dict(
+            id=event_id,
+            account_id=user_key,
+            event_type=EventType.SKILL_CALL if is_skill else EventType.MESSAGE,
+            user_id=user_id,
+            upstream_type=UpstreamType.EXECUTOR,
+            upstream_tx_id=upstream_tx_id,
+            direction=Direction.EXPENSE,
+            agent_id=agent.id,
+            message_id=item.message_id,
+            start_message_id=start_message_id,
+            total_amount=cost.total_amount,
             credit_type=credit_type,
+            credit_types=list(details.keys()),
+            balance_after=balance.balance,
+            base_amount=cost.base_amount,
+            base_original_amount=cost.base_original_amount,
+            fee_platform_amount=cost.fee_platform_amount,
+            fee_platform_free_amount=fee_platform_split[0],
+            fee_platform_reward_amount=fee_platform_split[1],
+            fee_platform_permanent_amount=fee_platform_split[2],
+            fee_agent_amount=cost.fee_agent_amount,
+            fee_agent_account=agent_key if cost.fee_agent_amount > 0 else None,
+            fee_agent_free_amount=fee_agent_split[0],
+            fee_agent_reward_amount=fee_agent_split[1],
+            fee_agent_permanent_amount=fee_agent_split[2],
+            free_amount=free_amount,
+            reward_amount=reward_amount,
+            permanent_amount=permanent_amount,
+            agent_wallet_address=agent_wallet_address,
         )
-        session.add(agent_tx)
-
-    # Commit all changes
-    await session.refresh(event)
-
-    return CreditEvent.model_validate(event)
-
+        # Every row has the same keys so the INSERT is a single statement
+        if is_skill:
+            fee_dev_split = _split_by_credit_type(
+                cost.fee_dev_amount, free_amount, reward_amount, cost.total_amount
+            )
+            event_row.update(
+                model=None,
+                skill_call_id=item.skill_call_id,
+                skill_name=item.skill_name,
+                base_llm_amount=Decimal("0"),
+                base_skill_amount=cost.base_skill_amount,
+                fee_dev_amount=cost.fee_dev_amount,
+                fee_dev_account=dev_key if cost.fee_dev_amount > 0 else None,
+                fee_dev_free_amount=fee_dev_split[0],
+                fee_dev_reward_amount=fee_dev_split[1],
+                fee_dev_permanent_amount=fee_dev_split[2],
+            )
+        else:
+            event_row.update(
+                model=agent.model,
+                skill_call_id=None,
+                skill_name=None,
+                base_llm_amount=cost.base_amount,
+                base_skill_amount=Decimal("0"),
+                fee_dev_amount=Decimal("0"),
+                fee_dev_account=None,
+                fee_dev_free_amount=None,
+                fee_dev_reward_amount=None,
+                fee_dev_permanent_amount=None,
+            )
+        event_rows.append(event_row)
+
+        # 4. Credit transaction records
+        txs = [
+            (user_key, TransactionType.PAY, CreditDebit.DEBIT, cost.total_amount),
+            (
+                base_key,
+                TransactionType.RECEIVE_BASE_SKILL
+                if is_skill
+                else TransactionType.RECEIVE_BASE_LLM,
+                CreditDebit.CREDIT,
+                cost.base_amount,
+            ),
+            (
+                fee_key,
+                TransactionType.RECEIVE_FEE_PLATFORM,
+                CreditDebit.CREDIT,
+                cost.fee_platform_amount,
+            ),
+        ]
+        if cost.fee_dev_amount > 0:
+            txs.append(
+                (
+                    dev_key,
+                    TransactionType.RECEIVE_FEE_DEV,
+                    CreditDebit.CREDIT,
+                    cost.fee_dev_amount,
+                )
+            )
+        if cost.fee_agent_amount > 0:
+            txs.append(
+                (
+                    agent_key,
+                    TransactionType.RECEIVE_FEE_AGENT,
+                    CreditDebit.CREDIT,
+                    cost.fee_agent_amount,
+                )
+            )
+        for account_key, tx_type, credit_debit, change_amount in txs:
+            tx_rows.append(
+                dict(
+                    id=str(XID()),
+                    account_id=account_key,
+                    event_id=event_id,
+                    tx_type=tx_type,
+                    credit_debit=credit_debit,
+                    change_amount=change_amount,
+                    # dev fee is always paid in reward credits
+                    credit_type=CreditType.REWARD
+                    if tx_type == TransactionType.RECEIVE_FEE_DEV
+                    else credit_type,
+                )
+            )
+
+    # One UPDATE per account, user first, the rest in a stable order.
+    # In deferred mode platform accounts get delta rows instead of an UPDATE.
+    account_ids: Dict[Tuple[OwnerType, str], str] = {}
+    delta_rows = []
+    for key in sorted(changes, key=lambda k: (k != user_key, k[0], k[1])):
+        if _platform_deferred(key[0]):
+            delta_rows.append(
+                CreditAccount.delta_row(key[1], changes[key], last_event_ids[key])
+            )
+            account_ids[key] = key[1]
+            continue
+        account = await CreditAccount.change_in_session(
+            session,
+            owner_type=key[0],
+            owner_id=key[1],
+            changes=changes[key],
+            event_id=last_event_ids[key],
+        )
+        account_ids[key] = account.id
+    if delta_rows:
+        await session.execute(insert(CreditAccountDeltaTable), delta_rows)
 
-async def refill_free_credits_for_account(
-    session: AsyncSession,
-    account: CreditAccount,
-):
-    """
-    Refill free credits for a single account based on its refill_amount and free_quota.
+    # If using free credits, add to agent's free_income_daily
+    if free_income > 0:
+        from intentkit.models.agent_data import AgentQuota
 
-    Args:
-        session: Async session to use for database operations
-        account: The credit account to refill
-    """
-    # Skip if refill_amount is zero or free_credits already equals or exceeds free_quota
-    if (
-        account.refill_amount <= Decimal("0")
-        or account.free_credits >= account.free_quota
-    ):
-        return
+        await AgentQuota.add_free_income_in_session(
+            session=session, id=agent.id, amount=free_income
+        )
 
-    # Calculate the amount to add
-    # If adding refill_amount would exceed free_quota, only add what's needed to reach free_quota
-    amount_to_add = min(
-        account.refill_amount, account.free_quota - account.free_credits
+    for event_row in event_rows:
+        for field in ("account_id", "fee_agent_account", "fee_dev_account"):
+            if event_row.get(field):
+                event_row[field] = account_ids[event_row[field]]
+    for tx_row in tx_rows:
+        tx_row["account_id"] = account_ids[tx_row["account_id"]]
+
+    result = await session.scalars(
+        insert(CreditEventTable).returning(
+            CreditEventTable, sort_by_parameter_order=True
+        ),
+        event_rows,
     )
+    events = [CreditEvent.model_validate(event) for event in result.all()]
+    await session.execute(insert(CreditTransactionTable), tx_rows)
 
-    if amount_to_add <= Decimal("0"):
-        return  # Nothing to add
+    return events
 
-    # 1. Create credit event record first to get event_id
-    event_id = str(XID())
 
-    # 2. Update user account - add free credits
-    updated_account = await CreditAccount.income_in_session(
-        session=session,
-        owner_type=account.owner_type,
-        owner_id=account.owner_id,
-        amount=amount_to_add,
-        credit_type=CreditType.FREE,
-        event_id=event_id,
-    )
+async def refill_free_credits_chunk(account_ids: List[str]) -> int:
+    """
+    Refill free credits for a chunk of accounts with set-based statements.
 
-    # 3. Update platform refill account - deduct credits
-    platform_account = await CreditAccount.deduction_in_session(
-        session=session,
-        owner_type=OwnerType.PLATFORM,
-        owner_id=DEFAULT_PLATFORM_ACCOUNT_REFILL,
-        credit_type=CreditType.FREE,
-        amount=amount_to_add,
-        event_id=event_id,
-    )
+    One UPDATE ... RETURNING computes and applies every refill amount, then the
+    events and transactions are written with one multi-row INSERT per table and
+    the platform refill account is charged once for the whole chunk.
+    Accounts no longer eligible when the chunk runs are skipped.
 
-    # 4. Create credit event record
-    event = CreditEventTable(
-        id=event_id,
-        account_id=updated_account.id,
-        event_type=EventType.REFILL,
-        user_id=account.owner_id,
-        upstream_type=UpstreamType.SCHEDULER,
-        upstream_tx_id=str(XID()),
-        direction=Direction.INCOME,
-        credit_type=CreditType.FREE,
-        credit_types=[CreditType.FREE],
-        total_amount=amount_to_add,
-        balance_after=updated_account.credits
-        + updated_account.free_credits
-        + updated_account.reward_credits,
-        base_amount=amount_to_add,
-        base_original_amount=amount_to_add,
-        free_amount=amount_to_add,  # Set free_amount since this is a free credit refill
-        reward_amount=Decimal("0"),  # No reward credits involved
-        permanent_amount=Decimal("0"),  # No permanent credits involved
-        agent_wallet_address=None,  # No agent involved in refill
-        note=f"Hourly free credits refill of {amount_to_add}",
-    )
-    session.add(event)
-    await session.flush()
+    Args:
+        account_ids: IDs of the accounts to refill
 
-    # 4. Create credit transaction records
-    # 4.1 User account transaction (credit)
-    user_tx = CreditTransactionTable(
-        id=str(XID()),
-        account_id=updated_account.id,
-        event_id=event_id,
-        tx_type=TransactionType.REFILL,
-        credit_debit=CreditDebit.CREDIT,
-        change_amount=amount_to_add,
-        credit_type=CreditType.FREE,
+    Returns:
+        int: Number of refilled accounts
+    """
+    if not account_ids:
+        return 0
+    # Pre-generate event ids, each account records its own as last_event_id
+    event_ids = {account_id: str(XID()) for account_id in account_ids}
+
+    source = aliased(CreditAccountTable)
+    refill = (
+        select(
+            source.id.label("id"),
+            case(
+                (
+                    source.refill_amount < source.free_quota - source.free_credits,
+                    source.refill_amount,
+                ),
+                else_=source.free_quota - source.free_credits,
+            ).label("amount"),
+        )
+        .where(
+            source.id.in_(account_ids),
+            source.refill_amount > 0,
+            source.free_credits < source.free_quota,
+        )
+        .with_for_update()
+        .subquery()
     )
-    session.add(user_tx)
-
-    # 4.2 Platform refill account transaction (debit)
-    platform_tx = CreditTransactionTable(
-        id=str(XID()),
-        account_id=platform_account.id,
-        event_id=event_id,
-        tx_type=TransactionType.REFILL,
-        credit_debit=CreditDebit.DEBIT,
-        change_amount=amount_to_add,
-        credit_type=CreditType.FREE,
+    stmt = (
+        update(CreditAccountTable)
+        .where(CreditAccountTable.id == refill.c.id)
+        .values(
+            free_credits=CreditAccountTable.free_credits + refill.c.amount,
+            income_at=datetime.now(timezone.utc),
+            last_event_id=case(event_ids, value=CreditAccountTable.id),
+        )
+        .returning(
+            CreditAccountTable.id,
+            CreditAccountTable.owner_id,
+            CreditAccountTable.free_credits,
+            CreditAccountTable.reward_credits,
+            CreditAccountTable.credits,
+            refill.c.amount,
+        )
     )
-    session.add(platform_tx)
 
-    # Commit changes
-    await session.commit()
-    logger.info(
-        f"Refilled {amount_to_add} free credits for account {account.owner_type} {account.owner_id}"
-    )
+    async with get_session() as session:
+        result = await session.execute(stmt)
+        rows = result.all()
+        if not rows:
+            await session.commit()
+            return 0
+
+        event_rows = []
+        tx_rows = []
+        total_amount = Decimal("0")
+        for row in rows:
+            event_id = event_ids[row.id]
+            total_amount += row.amount
+            event_rows.append(
+                dict(
+                    id=event_id,
+                    account_id=row.id,
+                    event_type=EventType.REFILL,
+                    user_id=row.owner_id,
+                    upstream_type=UpstreamType.SCHEDULER,
+                    upstream_tx_id=str(XID()),
+                    direction=Direction.INCOME,
+                    credit_type=CreditType.FREE,
+                    credit_types=[CreditType.FREE],
+                    total_amount=row.amount,
+                    balance_after=row.credits + row.free_credits + row.reward_credits,
+                    base_amount=row.amount,
+                    base_original_amount=row.amount,
+                    free_amount=row.amount,
+                    reward_amount=Decimal("0"),
+                    permanent_amount=Decimal("0"),
+                    agent_wallet_address=None,
+                    note=f"Hourly free credits refill of {row.amount}",
+                )
+            )
+            # User account transaction (credit)
+            tx_rows.append(
+                dict(
+                    id=str(XID()),
+                    account_id=row.id,
+                    event_id=event_id,
+                    tx_type=TransactionType.REFILL,
+                    credit_debit=CreditDebit.CREDIT,
+                    change_amount=row.amount,
+                    credit_type=CreditType.FREE,
+                )
+            )
+            # Platform refill account transaction (debit)
+            tx_rows.append(
+                dict(
+                    id=str(XID()),
+                    account_id=DEFAULT_PLATFORM_ACCOUNT_REFILL,
+                    event_id=event_id,
+                    tx_type=TransactionType.REFILL,
+                    credit_debit=CreditDebit.DEBIT,
+                    change_amount=row.amount,
+                    credit_type=CreditType.FREE,
+                )
+            )
+
+        await _platform_change_in_session(
+            session,
+            DEFAULT_PLATFORM_ACCOUNT_REFILL,
+            CreditType.FREE,
+            -total_amount,
+            max(event_row["id"] for event_row in event_rows),
+        )
+        await session.execute(insert(CreditEventTable), event_rows)
+        await session.execute(insert(CreditTransactionTable), tx_rows)
+        await session.commit()
+    return len(rows)
 
 
-async def refill_all_free_credits():
+async def refill_all_free_credits(chunk_size: int = 1000, concurrency: int = 4):
     """
     Find all eligible accounts and refill their free credits.
     Eligible accounts are those with refill_amount > 0 and free_credits < free_quota.
-    """
-    async with get_session() as session:
-        # Find all accounts that need refilling
-        stmt = select(CreditAccountTable).where(
-            CreditAccountTable.refill_amount > 0,
-            CreditAccountTable.free_credits < CreditAccountTable.free_quota,
-        )
-        result = await session.execute(stmt)
-        accounts_data = result.scalars().all()
 
-        # Convert to Pydantic models
-        accounts = [CreditAccount.model_validate(account) for account in accounts_data]
+    Account ids are streamed with keyset pagination, and each chunk is refilled
+    by refill_free_credits_chunk, with at most `concurrency` chunks in flight.
 
-    # Process each account
+    Args:
+        chunk_size: Number of accounts refilled in one transaction
+        concurrency: Max number of chunks refilled at the same time
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = []
     refilled_count = 0
-    for account in accounts:
+    failed_chunks = 0
+
+    async def run_chunk(account_ids: List[str]):
+        nonlocal refilled_count, failed_chunks
+        try:
+            refilled_count += await refill_free_credits_chunk(account_ids)
+        except Exception as e:
+            failed_chunks += 1
+            logger.error(
+                f"Error refilling accounts {account_ids[0]} to {account_ids[-1]}: {str(e)}"
+            )
+        finally:
+            semaphore.release()
+
+    last_id = ""
+    while True:
         async with get_session() as session:
-            try:
-                await refill_free_credits_for_account(session, account)
-                refilled_count += 1
-            except Exception as e:
-                logger.error(f"Error refilling account {account.id}: {str(e)}")
-            # Continue with other accounts even if one fails
-            continue
-    logger.info(f"Refilled {refilled_count} accounts")
+            stmt = (
+                select(CreditAccountTable.id)
+                .where(
+                    CreditAccountTable.id > last_id,
+                    CreditAccountTable.refill_amount > 0,
+                    CreditAccountTable.free_credits < CreditAccountTable.free_quota,
+                )
+                .order_by(CreditAccountTable.id)
+                .limit(chunk_size)
+            )
+            account_ids = list((await session.scalars(stmt)).all())
+        if not account_ids:
+            break
+        last_id = account_ids[-1]
+        # Wait for a free slot before reading the next page
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(run_chunk(account_ids)))
+
+    await asyncio.gather(*tasks)
+    logger.info(f"Refilled {refilled_count} accounts, {failed_chunks} chunks failed")
 
 
 async def expense_summarize(
@@ -1637,21 +1610,19 @@ async def expense_summarize(
         )
 
     # 3. Update fee account - add credits
-    memory_account = await CreditAccount.income_in_session(
-        session=session,
-        owner_type=OwnerType.PLATFORM,
-        owner_id=DEFAULT_PLATFORM_ACCOUNT_MEMORY,
-        credit_type=CreditType.PERMANENT,
-        amount=base_amount,
-        event_id=event_id,
+    memory_account_id = await _platform_change_in_session(
+        session,
+        DEFAULT_PLATFORM_ACCOUNT_MEMORY,
+        CreditType.PERMANENT,
+        base_amount,
+        event_id,
     )
-    platform_fee_account = await CreditAccount.income_in_session(
-        session=session,
-        owner_type=OwnerType.PLATFORM,
-        owner_id=DEFAULT_PLATFORM_ACCOUNT_FEE,
-        credit_type=CreditType.PERMANENT,
-        amount=fee_platform_amount,
-        event_id=event_id,
+    platform_fee_account_id = await _platform_change_in_session(
+        session,
+        DEFAULT_PLATFORM_ACCOUNT_FEE,
+        CreditType.PERMANENT,
+        fee_platform_amount,
+        event_id,
     )
     if fee_agent_amount > 0:
         agent_account = await CreditAccount.income_in_session(
@@ -1775,7 +1746,7 @@ async def expense_summarize(
     # 4.2 Memory account transaction (credit)
     memory_tx = CreditTransactionTable(
         id=str(XID()),
-        account_id=memory_account.id,
+        account_id=memory_account_id,
         event_id=event_id,
         tx_type=TransactionType.RECEIVE_BASE_MEMORY,
         credit_debit=CreditDebit.CREDIT,
@@ -1787,7 +1758,7 @@ async def expense_summarize(
     # 4.3 Platform fee account transaction (credit)
     platform_tx = CreditTransactionTable(
         id=str(XID()),
-        account_id=platform_fee_account.id,
+        account_id=platform_fee_account_id,
         event_id=event_id,
         tx_type=TransactionType.RECEIVE_FEE_PLATFORM,
         credit_debit=CreditDebit.CREDIT,
@@ -7,22 +7,23 @@ This module provides functionality for initializing and executing AI agents. It
 - Memory management with PostgreSQL
 - Integration with CDP and Twitter
 
-The module uses a global cache to store initialized agents for better performance.
+The module uses a bounded LRU cache to store initialized agents for better performance.
 """
 
-import importlib
+import asyncio
 import logging
 import re
 import textwrap
 import time
 import traceback
-from datetime import datetime
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Optional
 
 import sqlalchemy
 from epyxid import XID
 from fastapi import HTTPException
 from langchain_core.messages import (
+    AIMessageChunk,
     BaseMessage,
     HumanMessage,
 )
@@ -35,7 +36,13 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from intentkit.abstracts.graph import AgentContext, AgentError, AgentState
 from intentkit.config.config import config
-from intentkit.core.credit import expense_message, expense_skill
+from intentkit.core.credit import (
+    MessageExpense,
+    SkillExpense,
+    expense_batch,
+    expense_message,
+)
+from intentkit.core.executor_cache import ExecutorCache, estimate_size
 from intentkit.core.node import PreModelNode, post_model_node
 from intentkit.core.prompt import (
     create_formatted_prompt_function,
@@ -48,30 +55,99 @@ from intentkit.models.app_setting import AppSetting, SystemMessageType
 from intentkit.models.chat import (
     AuthorType,
     ChatMessage,
+    ChatMessageChunk,
     ChatMessageCreate,
     ChatMessageSkillCall,
 )
 from intentkit.models.credit import CreditAccount, OwnerType
 from intentkit.models.db import get_langgraph_checkpointer, get_session
-from intentkit.models.llm import LLMModelInfo, LLMProvider
+from intentkit.models.llm import (
+    LLMModel,
+    LLMModelInfo,
+    LLMProvider,
+    create_llm_model,
+    shared_llm_instances,
+)
+from intentkit.models.redis import (
+    ALL_AGENTS,
+    agent_listener_ready,
+    on_agent_changed,
+    publish_agent_changed,
+)
 from intentkit.models.skill import AgentSkillData, ThreadSkillData
 from intentkit.models.user import User
+from intentkit.skills.registry import get_skill_registry
 from intentkit.utils.error import IntentKitAPIError
 
 logger = logging.getLogger(__name__)
 
 
-# Global variable to cache all agent executors
-_agents: dict[str, CompiledStateGraph] = {}
-_private_agents: dict[str, CompiledStateGraph] = {}
+# Global cache of agent executors, keyed by agent id and private mode
+_executors = ExecutorCache(
+    max_entries=config.executor_cache_size,
+    max_bytes=config.executor_cache_memory_mb * 1024 * 1024,
+    ttl=config.executor_cache_ttl,
+)
+
+# Executor builds in flight, keyed by agent id, private mode and agent version.
+# Concurrent cold starts of the same agent wait for one build instead of each
+# running their own.
+_executor_builds: dict[tuple[str, bool, Any], asyncio.Task] = {}
+
+# Agent configs read by the hot path. They are only trusted while this process
+# receives agent changed events, see intentkit.models.redis.start_agent_listener
+_AGENT_CONFIG_CACHE_SIZE = 10000
+_agent_configs: OrderedDict[str, Agent] = OrderedDict()
+# Bumped on every agent changed event, guards against caching a stale read
+_agent_configs_version = 0
+
+
+def _on_agent_changed(agent_id: str) -> None:
+    global _agent_configs_version
+    _agent_configs_version += 1
+    if agent_id == ALL_AGENTS:
+        # events may have been missed, executors are still checked by updated_at
+        _agent_configs.clear()
+        return
+    _agent_configs.pop(agent_id, None)
+    _executors.invalidate(agent_id)
+
+
+on_agent_changed(_on_agent_changed)
+
 
-# Global dictionaries to cache agent update times
-_agents_updated: dict[str, datetime] = {}
-_private_agents_updated: dict[str, datetime] = {}
+async def get_agent(agent_id: str) -> Optional[Agent]:
+    """Get an agent config, from the local cache when it can be trusted.
+
+    While the process is subscribed to agent changed events, agents are served
+    from memory without a database round trip. Otherwise this is Agent.get.
+
+    Args:
+        agent_id: ID of the agent
+
+    Returns:
+        Optional[Agent]: The agent, None if not found
+    """
+    if agent_listener_ready():
+        agent = _agent_configs.get(agent_id)
+        if agent is not None:
+            _agent_configs.move_to_end(agent_id)
+            return agent
+    version = _agent_configs_version
+    agent = await Agent.get(agent_id)
+    # do not cache if the agent changed while we were reading it
+    if agent and agent_listener_ready() and version == _agent_configs_version:
+        _agent_configs[agent_id] = agent
+        if len(_agent_configs) > _AGENT_CONFIG_CACHE_SIZE:
+            _agent_configs.popitem(last=False)
+    return agent
 
 
 async def create_agent(
-    agent: Agent, is_private: bool = False, has_search: bool = False
+    agent: Agent,
+    is_private: bool = False,
+    has_search: bool = False,
+    llm_model: Optional[LLMModel] = None,
 ) -> CompiledStateGraph:
     """Create an AI agent with specified configuration and tools.
 
@@ -85,6 +161,7 @@ async def create_agent(
         agent (Agent): Agent configuration object
         is_private (bool, optional): Flag indicating whether the agent is private. Defaults to False.
         has_search (bool, optional): Flag indicating whether to include search tools. Defaults to False.
+        llm_model (LLMModel, optional): Already resolved LLM model, created from the agent if not given.
 
     Returns:
         CompiledStateGraph: Initialized LangChain agent
@@ -92,18 +169,16 @@ async def create_agent(
     agent_data = await AgentData.get(agent.id)
 
     # ==== Initialize LLM using the LLM abstraction.
-    from intentkit.models.llm import create_llm_model
-
-    # Create the LLM model instance
-    llm_model = await create_llm_model(
-        model_name=agent.model,
-        temperature=agent.temperature,
-        frequency_penalty=agent.frequency_penalty,
-        presence_penalty=agent.presence_penalty,
-    )
+    if llm_model is None:
+        llm_model = await create_llm_model(
+            model_name=agent.model,
+            temperature=agent.temperature,
+            frequency_penalty=agent.frequency_penalty,
+            presence_penalty=agent.presence_penalty,
+        )
 
-    # Get the LLM instance
-    llm = await llm_model.create_instance(config)
+    # Get the shared LLM instance
+    llm = await llm_model.get_instance(config)
 
     # Get the token limit from the model info
     input_token_limit = min(config.input_token_limit, llm_model.info.context_length)
@@ -115,19 +190,16 @@ async def create_agent(
     tools: list[BaseTool | dict] = []
 
     if agent.skills:
+        skill_registry = get_skill_registry()
         for k, v in agent.skills.items():
             if not v.get("enabled", False):
                 continue
             try:
-                skill_module = importlib.import_module(f"intentkit.skills.{k}")
-                if hasattr(skill_module, "get_skills"):
-                    skill_tools = await skill_module.get_skills(
-                        v, is_private, skill_store, agent_id=agent.id
-                    )
-                    if skill_tools and len(skill_tools) > 0:
-                        tools.extend(skill_tools)
-                else:
-                    logger.error(f"Skill {k} does not have get_skills function")
+                skill_tools = await skill_registry.get_tools(
+                    k, v, is_private, skill_store, agent_id=agent.id
+                )
+                if skill_tools:
+                    tools.extend(skill_tools)
             except ImportError as e:
                 logger.error(f"Could not import skill module: {k} ({e})")
 
@@ -191,72 +263,114 @@ async def initialize_agent(aid, is_private=False):
         is_private (bool, optional): Flag indicating whether the agent is private. Defaults to False.
 
     Returns:
-        Agent: Initialized LangChain agent
+        CompiledStateGraph: Initialized LangChain agent
 
     Raises:
         HTTPException: If agent not found (404) or database error (500)
     """
-    # get the agent from the database
-    agent: Optional[Agent] = await Agent.get(aid)
+    # get the agent config
+    agent: Optional[Agent] = await get_agent(aid)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    # Determine if search should be enabled based on model capabilities
-    from intentkit.models.llm import create_llm_model
-
+    # Resolve the model once, it is reused by create_agent
     llm_model = await create_llm_model(
         model_name=agent.model,
         temperature=agent.temperature,
         frequency_penalty=agent.frequency_penalty,
         presence_penalty=agent.presence_penalty,
     )
+
+    # Determine if search should be enabled based on model capabilities
     has_search = (
         llm_model.info.provider == LLMProvider.OPENAI and llm_model.info.supports_search
     )
 
     # Create the agent using the new create_agent function
-    executor = await create_agent(agent, is_private, has_search)
-
-    # Cache the agent executor
-    if is_private:
-        _private_agents[aid] = executor
-        _private_agents_updated[aid] = agent.updated_at
-    else:
-        _agents[aid] = executor
-        _agents_updated[aid] = agent.updated_at
+    executor = await create_agent(agent, is_private, has_search, llm_model)
+
+    # Cache the agent executor with its approximate memory footprint,
+    # objects shared with other agents are not counted
+    size = estimate_size(
+        executor,
+        exclude=(
+            get_langgraph_checkpointer(),
+            config,
+            skill_store,
+            *shared_llm_instances(),
+        ),
+    )
+    _executors.put(aid, is_private, executor, agent.updated_at, size)
+    logger.info(
+        f"Initialized agent {aid}, private mode: {is_private}, size: {size} bytes"
+    )
+    return executor
 
 
 async def agent_executor(
     agent_id: str, is_private: bool
 ) -> (CompiledStateGraph, float):
     start = time.perf_counter()
-    agent = await Agent.get(agent_id)
+    agent = await get_agent(agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
-    agents = _private_agents if is_private else _agents
-    agents_updated = _private_agents_updated if is_private else _agents_updated
 
-    # Check if agent needs reinitialization due to updates
-    needs_reinit = False
-    if agent_id in agents:
-        if (
-            agent_id not in agents_updated
-            or agent.updated_at != agents_updated[agent_id]
-        ):
-            needs_reinit = True
-            logger.info(
-                f"Reinitializing agent {agent_id} due to updates, private mode: {is_private}"
-            )
+    # A cached executor built before the last agent update is dropped here
+    entry = _executors.get(agent_id, is_private, agent.updated_at)
+    if entry:
+        return entry.executor, 0.0
+
+    # cold start or needs reinitialization, only one build per agent version
+    key = (agent_id, is_private, agent.updated_at)
+    build = _executor_builds.get(key)
+    if build is None:
+        build = asyncio.create_task(initialize_agent(agent_id, is_private))
+        _executor_builds[key] = build
+        build.add_done_callback(lambda task: _finish_executor_build(key, task))
+        is_builder = True
+    else:
+        _executors.record_coalesced()
+        is_builder = False
+    # shield the build, a cancelled request must not cancel the other waiters
+    executor = await asyncio.shield(build)
+    cold_start_cost = time.perf_counter() - start
+    if is_builder:
+        _executors.record_cold_start(cold_start_cost)
+    return executor, cold_start_cost
+
+
+def _finish_executor_build(key: tuple[str, bool, Any], task: asyncio.Task) -> None:
+    _executor_builds.pop(key, None)
+    # mark the exception as retrieved, every waiter may have been cancelled
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Executor build for {key[0]} failed: {task.exception()}")
+
 
-    # cold start or needs reinitialization
-    cold_start_cost = 0.0
-    if (agent_id not in agents) or needs_reinit:
-        await initialize_agent(agent_id, is_private)
-        cold_start_cost = time.perf_counter() - start
-    return agents[agent_id], cold_start_cost
+def executor_cache_stats() -> dict[str, Any]:
+    """Get the counters of the agent executor cache in this process.
 
+    Returns:
+        dict: Entries, approximate bytes, hit/miss/eviction counters and
+            cold start latency percentiles
+    """
+    return _executors.stats()
+
+
+def _token_text(message: Any) -> str:
+    """Text of a streamed AIMessageChunk, tool call chunks have none."""
+    content = getattr(message, "content", None)
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            part if isinstance(part, str) else part.get("text", "")
+            for part in content
+            if isinstance(part, (str, dict))
+        )
+    return ""
 
-async def stream_agent(message: ChatMessageCreate):
+
+async def stream_agent(message: ChatMessageCreate, stream_tokens: bool = False):
     """
     Stream agent execution results as an async generator.
 
@@ -268,9 +382,12 @@ async def stream_agent(message: ChatMessageCreate):
 
     Args:
         message (ChatMessageCreate): The chat message containing agent_id, chat_id, and message content
+        stream_tokens (bool): Also yield ChatMessageChunk for LLM tokens as they
+            are generated, before the ChatMessage of the same step
 
     Yields:
         ChatMessage: Individual response messages including timing information
+        ChatMessageChunk: LLM tokens, only when stream_tokens is True
     """
     start = time.perf_counter()
     # make sure reply_to is set
@@ -280,7 +397,7 @@ async def stream_agent(message: ChatMessageCreate):
     input = await message.save()
 
     # agent
-    agent = await Agent.get(input.agent_id)
+    agent = await get_agent(input.agent_id)
 
     # model
     model = await LLMModelInfo.get(agent.model)
@@ -463,9 +580,31 @@ async def stream_agent(message: ChatMessageCreate):
     # run
     cached_tool_step = None
     try:
-        async for chunk in executor.astream(
-            {"messages": messages}, context=context, config=stream_config
+        async for event in executor.astream(
+            {"messages": messages},
+            context=context,
+            config=stream_config,
+            stream_mode=["updates", "messages"] if stream_tokens else "updates",
         ):
+            if stream_tokens:
+                mode, chunk = event
+                if mode == "messages":
+                    token, metadata = chunk
+                    # only the agent node answers the user, skip hooks and tools
+                    if metadata.get("langgraph_node") == "agent" and isinstance(
+                        token, AIMessageChunk
+                    ):
+                        text = _token_text(token)
+                        if text:
+                            yield ChatMessageChunk(
+                                agent_id=input.agent_id,
+                                chat_id=input.chat_id,
+                                reply_to=input.id,
+                                content=text,
+                            )
+                    continue
+            else:
+                chunk = event
             this_time = time.perf_counter()
             logger.debug(f"stream chunk: {chunk}", extra={"thread_id": thread_id})
             if "agent" in chunk and "messages" in chunk["agent"]:
@@ -634,39 +773,48 @@ async def stream_agent(message: ChatMessageCreate):
                 # save message and credit in one transaction
                 async with get_session() as session:
                     if payment_enabled:
+                        # bill the message and all skill calls in one ledger batch
+                        expense_items = []
                         # message payment, only first call in a group has message bill
                         if have_first_call_in_cache:
                             message_amount = await model.calculate_cost(
                                 skill_message_create.input_tokens,
                                 skill_message_create.output_tokens,
                             )
-                            message_payment_event = await expense_message(
-                                session,
-                                payer,
-                                skill_message_create.id,
-                                input.id,
-                                message_amount,
-                                agent,
+                            expense_items.append(
+                                MessageExpense(
+                                    message_id=skill_message_create.id,
+                                    base_llm_amount=message_amount,
+                                )
+                            )
+                        # skill payment
+                        paid_skill_calls = [
+                            skill_call
+                            for skill_call in skill_calls
+                            if skill_call["success"]
+                        ]
+                        for skill_call in paid_skill_calls:
+                            expense_items.append(
+                                SkillExpense(
+                                    message_id=skill_message_create.id,
+                                    skill_call_id=skill_call["id"],
+                                    skill_name=skill_call["name"],
+                                )
                             )
+                        payment_events = await expense_batch(
+                            session, payer, input.id, agent, expense_items
+                        )
+                        if have_first_call_in_cache:
+                            message_payment_event = payment_events.pop(0)
                             skill_message_create.credit_event_id = (
                                 message_payment_event.id
                             )
                             skill_message_create.credit_cost = (
                                 message_payment_event.total_amount
                             )
-                        # skill payment
-                        for skill_call in skill_calls:
-                            if not skill_call["success"]:
-                                continue
-                            payment_event = await expense_skill(
-                                session,
-                                payer,
-                                skill_message_create.id,
-                                input.id,
-                                skill_call["id"],
-                                skill_call["name"],
-                                agent,
-                            )
+                        for skill_call, payment_event in zip(
+                            paid_skill_calls, payment_events
+                        ):
                             skill_call["credit_event_id"] = payment_event.id
                             skill_call["credit_cost"] = payment_event.total_amount
                             logger.info(
@@ -890,6 +1038,7 @@ async def clean_agent_memory(
                 .values(updated_at=func.now())
             )
             await db.commit()
+        await publish_agent_changed(agent_id)
 
         logger.info(f"Agent [{agent_id}] data cleaned up successfully.")
         return "Agent data cleaned up successfully."
@@ -0,0 +1,270 @@
+"""Agent executor cache.
+
+Compiled LangGraph executors are expensive to build and hold the LLM client,
+the tool instances and the compiled graph. This module keeps them in a bounded
+LRU cache so a long running worker has a predictable memory ceiling.
+
+Entries are evicted when:
+- the number of entries exceeds ``max_entries``
+- the approximate memory of all entries exceeds ``max_bytes``
+- an entry has not been used for ``ttl`` seconds
+"""
+
+import gc
+import logging
+import sys
+import time
+import types
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from langgraph.graph.state import CompiledStateGraph
+
+logger = logging.getLogger(__name__)
+
+# Objects of these types are shared by every executor, so they are not counted
+_SKIP_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType,
+)
+
+# Upper bound of objects visited when estimating one entry
+_SIZE_WALK_LIMIT = 50_000
+
+# Number of recent cold starts kept for percentile calculation
+_COLD_START_SAMPLES = 1000
+
+
+def estimate_size(
+    obj: Any, exclude: Iterable[Any] = (), limit: int = _SIZE_WALK_LIMIT
+) -> int:
+    """Estimate the memory retained by an object graph.
+
+    The walk follows ``gc.get_referents`` and sums ``sys.getsizeof``. Modules,
+    classes and functions are skipped because they are shared across agents,
+    and so is everything in ``exclude`` (checkpointer, global config, ...).
+    The walk stops after ``limit`` objects, so the result is a lower bound.
+
+    Args:
+        obj: Root object
+        exclude: Shared objects that must not be counted
+        limit: Maximum number of objects to visit
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    seen = {id(o) for o in exclude}
+    stack = [obj]
+    total = 0
+    visited = 0
+    while stack and visited < limit:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIP_TYPES):
+            continue
+        seen.add(id(current))
+        visited += 1
+        try:
+            total += sys.getsizeof(current)
+        except TypeError:
+            continue
+        stack.extend(gc.get_referents(current))
+    return total
+
+
+@dataclass
+class ExecutorEntry:
+    """A cached executor with its bookkeeping."""
+
+    executor: CompiledStateGraph
+    updated_at: datetime
+    size: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+    last_access: float = field(default_factory=time.monotonic)
+
+
+class ExecutorCache:
+    """Size, memory and TTL bounded LRU cache of agent executors.
+
+    Keys are ``(agent_id, is_private)``. The cache is only touched from the
+    event loop thread, so it does not need a lock.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 500,
+        max_bytes: int = 0,
+        ttl: int = 0,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of cached executors, 0 means unlimited
+            max_bytes: Maximum approximate memory of all entries, 0 means unlimited
+            ttl: Idle seconds before an entry expires, 0 means never
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, bool], ExecutorEntry] = OrderedDict()
+        self._bytes = 0
+        # counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale = 0
+        self.coalesced = 0
+        self.cold_starts = 0
+        self.cold_start_total = 0.0
+        self.cold_start_max = 0.0
+        self._cold_start_samples: deque[float] = deque(maxlen=_COLD_START_SAMPLES)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple[str, bool]) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(
+        self,
+        agent_id: str,
+        is_private: bool,
+        updated_at: Optional[datetime] = None,
+    ) -> Optional[ExecutorEntry]:
+        """Get an entry and mark it as recently used.
+
+        Expired entries, and entries built from an older agent version than
+        ``updated_at`` when it is given, are removed and reported as a miss.
+        """
+        key = (agent_id, is_private)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and self.ttl and now - entry.last_access > self.ttl:
+            self._remove(key)
+            self.expirations += 1
+            entry = None
+        if (
+            entry is not None
+            and updated_at is not None
+            and entry.updated_at != updated_at
+        ):
+            self._remove(key)
+            self.stale += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry.last_access = now
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        agent_id: str,
+        is_private: bool,
+        executor: CompiledStateGraph,
+        updated_at: datetime,
+        size: int = 0,
+    ) -> None:
+        """Insert or replace an entry, then evict until the cache is in bounds."""
+        key = (agent_id, is_private)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = ExecutorEntry(
+            executor=executor, updated_at=updated_at, size=size
+        )
+        self._bytes += size
+        self._evict()
+
+    def invalidate(self, agent_id: str, is_private: Optional[bool] = None) -> None:
+        """Drop the entries of an agent, both modes unless is_private is given."""
+        modes = (True, False) if is_private is None else (is_private,)
+        for mode in modes:
+            self._remove((agent_id, mode))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def record_cold_start(self, seconds: float) -> None:
+        """Record the time spent building an executor."""
+        self.cold_starts += 1
+        self.cold_start_total += seconds
+        self.cold_start_max = max(self.cold_start_max, seconds)
+        self._cold_start_samples.append(seconds)
+
+    def record_coalesced(self) -> None:
+        """Record a cold start that waited for a build already in flight."""
+        self.coalesced += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache counters and cold start latency percentiles."""
+        samples = sorted(self._cold_start_samples)
+
+        def percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale": self.stale,
+            "cold_starts": self.cold_starts,
+            "coalesced": self.coalesced,
+            "cold_start_avg": (
+                self.cold_start_total / self.cold_starts if self.cold_starts else 0.0
+            ),
+            "cold_start_p50": percentile(0.50),
+            "cold_start_p99": percentile(0.99),
+            "cold_start_max": self.cold_start_max,
+        }
+
+    def _remove(self, key: tuple[str, bool]) -> Optional[ExecutorEntry]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
+
+    def _evict(self) -> None:
+        # expired entries go first, they are cheap to lose
+        if self.ttl:
+            now = time.monotonic()
+            for key in [
+                k for k, e in self._entries.items() if now - e.last_access > self.ttl
+            ]:
+                self._remove(key)
+                self.expirations += 1
+        # then least recently used ones, but never the newest entry
+        while len(self._entries) > 1 and (
+            (self.max_entries and len(self._entries) > self.max_entries)
+            or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            key, entry = next(iter(self._entries.items()))
+            self._remove(key)
+            self.evictions += 1
+            logger.info(
+                f"Evicted executor {key[0]}{'-private' if key[1] else ''} "
+                f"({entry.size} bytes), cache now {len(self._entries)} entries, "
+                f"{self._bytes} bytes"
+            )
@@ -1,4 +1,5 @@
 import re
+import time
 from typing import Callable, Optional
 
 from eth_utils import is_address
@@ -35,6 +36,15 @@ user confirmation before broadcasting any approval transactions for security rea
 """
 
 
+# Pattern to match @skill:category:config_name with word boundaries
+SKILL_PATTERN = re.compile(r"\b@skill:([^:]+):([^\s]+)\b")
+
+# Memoized skill names of @skill:category:config_name patterns
+SKILL_NAME_CACHE_TTL = 180  # seconds
+SKILL_NAME_CACHE_SIZE = 10000
+_skill_names: dict[tuple[str, str], tuple[float, Optional[str]]] = {}
+
+
 # ============================================================================
 # CORE PROMPT BUILDING FUNCTIONS
 # ============================================================================
@@ -198,6 +208,22 @@ def agent_prompt(agent: Agent, agent_data: AgentData) -> str:
     return build_agent_prompt(agent, agent_data)
 
 
+async def _skill_name(category: str, config_name: str) -> Optional[str]:
+    """Get the skill name of a category and config name, memoized for a while."""
+    key = (category, config_name)
+    cached = _skill_names.get(key)
+    now = time.monotonic()
+    if cached and now - cached[0] < SKILL_NAME_CACHE_TTL:
+        return cached[1]
+    skill = await Skill.get_by_config_name(category, config_name)
+    name = skill.name if skill else None
+    # patterns also come from user messages, keep the memo bounded
+    if len(_skill_names) >= SKILL_NAME_CACHE_SIZE:
+        _skill_names.clear()
+    _skill_names[key] = (now, name)
+    return name
+
+
 async def explain_prompt(message: str) -> str:
     """
     Process message to replace @skill:*:* patterns with (call skill xxxxx) format.
@@ -209,32 +235,23 @@ async def explain_prompt(message: str) -> str:
     Returns:
         str: The processed message with @skill patterns replaced
     """
-    # Pattern to match @skill:category:config_name with word boundaries
-    pattern = r"\b@skill:([^:]+):([^\s]+)\b"
-
-    async def replace_skill_pattern(match):
-        category = match.group(1)
-        config_name = match.group(2)
-
-        # Get skill by category and config_name
-        skill = await Skill.get_by_config_name(category, config_name)
-
-        if skill:
-            return f"(call skill {skill.name})"
-        else:
-            # If skill not found, keep original pattern
-            return match.group(0)
-
     # Find all matches
-    matches = list(re.finditer(pattern, message))
+    matches = list(SKILL_PATTERN.finditer(message))
+    if not matches:
+        return message
 
-    # Process matches in reverse order to maintain string positions
-    result = message
-    for match in reversed(matches):
-        replacement = await replace_skill_pattern(match)
-        result = result[: match.start()] + replacement + result[match.end() :]
+    # Build the result from the pieces between matches
+    parts = []
+    last_end = 0
+    for match in matches:
+        name = await _skill_name(match.group(1), match.group(2))
+        parts.append(message[last_end : match.start()])
+        # If skill not found, keep original pattern
+        parts.append(f"(call skill {name})" if name else match.group(0))
+        last_end = match.end()
+    parts.append(message[last_end:])
 
-    return result
+    return "".join(parts)
 
 
 # ============================================================================
@@ -353,6 +370,10 @@ def create_formatted_prompt_function(agent: Agent, agent_data: AgentData) -> Cal
     tailored to a specific agent. The returned function will be used by the
     agent's runtime to format prompts for each conversation.
 
+    The static parts of the prompt (base prompt, prompt_append and entrypoint
+    rules) are compiled once per executor, on the first call. Each call only
+    adds the sections that depend on the runtime context.
+
     Args:
         agent: The agent configuration
         agent_data: The agent's runtime data
@@ -364,60 +385,69 @@ def create_formatted_prompt_function(agent: Agent, agent_data: AgentData) -> Cal
     prompt = build_agent_prompt(agent, agent_data)
     escaped_prompt = escape_prompt(prompt)
 
-    # Process with admin LLM skill control if enabled
-    async def get_base_prompt():
-        if config.admin_llm_skill_control:
-            return await explain_prompt(escaped_prompt)
-        return escaped_prompt
-
-    # Build prompt array
-    prompt_array = [
-        ("placeholder", "{system_prompt}"),
-        ("placeholder", "{messages}"),
-    ]
-
-    if agent.prompt_append:
-        # Escape any curly braces in prompt_append
-        escaped_append = escape_prompt(agent.prompt_append)
-        prompt_array.append(("system", escaped_append))
+    # Compiled prompt parts, filled on first use because explain_prompt is async
+    compiled: dict[str, object] = {}
+    # Entrypoint rules, keyed by entrypoint, and by chat for autonomous tasks
+    entrypoint_sections: dict[tuple[str, Optional[str]], str] = {}
 
-    prompt_temp = ChatPromptTemplate.from_messages(prompt_array)
+    async def compile_static_parts() -> None:
+        base_prompt = escaped_prompt
+        if config.admin_llm_skill_control:
+            base_prompt = await explain_prompt(escaped_prompt)
+
+        # Build prompt array
+        prompt_array = [
+            ("placeholder", "{system_prompt}"),
+            ("placeholder", "{messages}"),
+        ]
+        if agent.prompt_append:
+            # Escape any curly braces in prompt_append
+            escaped_append = escape_prompt(agent.prompt_append)
+            # Process prompt_append with admin LLM skill control if needed
+            if config.admin_llm_skill_control:
+                escaped_append = await explain_prompt(escaped_append)
+            prompt_array.append(("system", escaped_append))
+
+        compiled["base_prompt"] = base_prompt
+        compiled["prompt_temp"] = ChatPromptTemplate.from_messages(prompt_array)
+
+    async def entrypoint_section(context: AgentContext) -> str:
+        key = (
+            context.entrypoint,
+            context.chat_id if context.entrypoint == AuthorType.TRIGGER.value else None,
+        )
+        section = entrypoint_sections.get(key)
+        if section is None:
+            entrypoint_prompt = await build_entrypoint_prompt(agent, context)
+            section = (
+                f"## Entrypoint rules{entrypoint_prompt}\n\n"
+                if entrypoint_prompt
+                else ""
+            )
+            entrypoint_sections[key] = section
+        return section
 
     async def formatted_prompt(
         state: AgentState, runtime: Runtime[AgentContext]
     ) -> list[BaseMessage]:
-        # Get base prompt (with potential admin LLM skill control processing)
-        final_system_prompt = await get_base_prompt()
+        if not compiled:
+            await compile_static_parts()
 
         context = runtime.context
-
-        # Add entrypoint prompt if applicable
-        entrypoint_prompt = await build_entrypoint_prompt(agent, context)
-        if entrypoint_prompt:
-            final_system_prompt = (
-                f"{final_system_prompt}## Entrypoint rules{entrypoint_prompt}\n\n"
-            )
-
-        # Add user info if user_id is a valid EVM wallet address
-        user_info = _build_user_info_section(context)
-        if user_info:
-            final_system_prompt = f"{final_system_prompt}{user_info}"
-
-        # Add internal info
-        internal_info = build_internal_info_prompt(context)
-        final_system_prompt = f"{final_system_prompt}{internal_info}"
-
-        # Process prompt_append with admin LLM skill control if needed
-        if agent.prompt_append and config.admin_llm_skill_control:
-            # Find the system message in prompt_array and process it
-            for i, (role, content) in enumerate(prompt_array):
-                if role == "system":
-                    processed_append = await explain_prompt(content)
-                    prompt_array[i] = ("system", processed_append)
-                    break
+        final_system_prompt = "".join(
+            [
+                compiled["base_prompt"],
+                # Add entrypoint prompt if applicable
+                await entrypoint_section(context),
+                # Add user info if user_id is a valid EVM wallet address
+                _build_user_info_section(context),
+                # Add internal info
+                build_internal_info_prompt(context),
+            ]
+        )
 
         system_prompt = [("system", final_system_prompt)]
-        return prompt_temp.invoke(
+        return compiled["prompt_temp"].invoke(
             {
                 "messages": state["messages"],
                 "system_prompt": system_prompt,
@@ -17,6 +17,7 @@ from intentkit.core.agent import (
 from intentkit.models.agent import Agent, AgentAutonomous
 from intentkit.models.agent_data import AgentData, AgentQuota
 from intentkit.models.skill import (
+    AgentSkillBlob,
     AgentSkillData,
     AgentSkillDataCreate,
     ThreadSkillData,
@@ -72,7 +73,11 @@ class SkillStore(SkillStoreABC):
 
     @staticmethod
     async def save_agent_skill_data(
-        agent_id: str, skill: str, key: str, data: Dict[str, Any]
+        agent_id: str,
+        skill: str,
+        key: str,
+        data: Dict[str, Any],
+        write_behind: bool = False,
     ) -> None:
         """Save or update skill data for an agent.
 
@@ -81,7 +86,12 @@ class SkillStore(SkillStoreABC):
             skill: Name of the skill
             key: Data key
             data: JSON data to store
+            write_behind: Write after a short delay, coalescing repeated
+                writes, for hot keys whose other readers tolerate lag
         """
+        if write_behind:
+            await AgentSkillData.save_later(agent_id, skill, key, data)
+            return
         skill_data = AgentSkillDataCreate(
             agent_id=agent_id,
             skill=skill,
@@ -101,6 +111,80 @@ class SkillStore(SkillStoreABC):
         """
         await AgentSkillData.delete(agent_id, skill, key)
 
+    @staticmethod
+    async def list_agent_skill_blobs(
+        agent_id: str, skill: str, key: str
+    ) -> List[AgentSkillBlob]:
+        """List the binary blobs stored under a key, in append order.
+
+        Args:
+            agent_id: ID of the agent
+            skill: Name of the skill
+            key: Data key
+
+        Returns:
+            List of blob metadata, without the content
+        """
+        return await AgentSkillBlob.list(agent_id, skill, key)
+
+    @staticmethod
+    async def get_agent_skill_blob_data(ids: List[str]) -> Dict[str, bytes]:
+        """Load the content of binary blobs.
+
+        Args:
+            ids: IDs of the blobs
+
+        Returns:
+            Dictionary mapping blob ID to content
+        """
+        return await AgentSkillBlob.get_data(ids)
+
+    @staticmethod
+    async def append_agent_skill_blob(
+        agent_id: str, skill: str, key: str, data: bytes
+    ) -> str:
+        """Append a binary blob to a key.
+
+        Args:
+            agent_id: ID of the agent
+            skill: Name of the skill
+            key: Data key
+            data: Binary content
+
+        Returns:
+            ID of the new blob
+        """
+        return await AgentSkillBlob.append(agent_id, skill, key, data)
+
+    @staticmethod
+    async def replace_agent_skill_blobs(
+        agent_id: str, skill: str, key: str, data: bytes, replaced: List[str]
+    ) -> Optional[str]:
+        """Replace some blobs of a key by a single blob.
+
+        Args:
+            agent_id: ID of the agent
+            skill: Name of the skill
+            key: Data key
+            data: Binary content replacing the blobs
+            replaced: IDs of the blobs to replace
+
+        Returns:
+            ID of the new blob, None if the blobs changed meanwhile
+        """
+        return await AgentSkillBlob.replace(agent_id, skill, key, data, replaced)
+
+    @staticmethod
+    async def delete_agent_skill_blobs(agent_id: str, skill: str, key: str) -> None:
+        """Delete all binary blobs of a key.
+
+        Args:
+            agent_id: ID of the agent
+            skill: Name of the skill
+            key: Data key
+        """
+        await AgentSkillBlob.delete(agent_id, skill, key)
+
     @staticmethod
     async def get_thread_skill_data(
         thread_id: str, skill: str, key: str
@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 import re
@@ -16,6 +17,7 @@ from intentkit.models.agent_data import AgentData
 from intentkit.models.base import Base
 from intentkit.models.db import get_session
 from intentkit.models.llm import LLMModelInfo, LLMModelInfoTable, LLMProvider
+from intentkit.models.redis import publish_agent_changed
 from intentkit.models.skill import SkillTable
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 from pydantic import Field as PydanticField
@@ -35,6 +37,32 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+AGENT_SCHEMA_PATH = Path(__file__).parent / "agent_schema.json"
+
+# agent_schema.json with references resolved, loaded once per process
+_agent_schema: Optional[Dict] = None
+# (filter_owner_api_skills, admin_llm_skill_control) -> (table versions, schema)
+_json_schema_cache: Dict[tuple, tuple] = {}
+
+
+def load_agent_schema() -> Dict:
+    """Load agent_schema.json with all skill schema references resolved.
+
+    The file is read once per process, call it at startup so the first
+    request does not pay for it. The result is shared, copy it to modify.
+
+    Returns:
+        Dict containing the resolved agent schema
+    """
+    global _agent_schema
+    if _agent_schema is None:
+        base_uri = f"file://{AGENT_SCHEMA_PATH}"
+        with open(AGENT_SCHEMA_PATH) as f:
+            _agent_schema = jsonref.load(
+                f, base_uri=base_uri, proxies=False, lazy_load=False
+            )
+    return _agent_schema
+
 
 class AgentAutonomous(BaseModel):
     """Autonomous agent configuration."""
@@ -980,7 +1008,8 @@ class AgentUpdate(BaseModel):
                 setattr(db_agent, key, value)
             await db.commit()
             await db.refresh(db_agent)
-            return Agent.model_validate(db_agent)
+        await publish_agent_changed(id)
+        return Agent.model_validate(db_agent)
 
     async def override(self, id: str) -> "Agent":
         # Validate autonomous schedule settings if present
@@ -1002,7 +1031,8 @@ class AgentUpdate(BaseModel):
                 setattr(db_agent, key, value)
             await db.commit()
             await db.refresh(db_agent)
-            return Agent.model_validate(db_agent)
+        await publish_agent_changed(id)
+        return Agent.model_validate(db_agent)
 
 
 class AgentCreate(AgentUpdate):
@@ -1053,7 +1083,9 @@ class AgentCreate(AgentUpdate):
             db.add(db_agent)
             await db.commit()
             await db.refresh(db_agent)
-            return Agent.model_validate(db_agent)
+        # the id may have been cached as not found
+        await publish_agent_changed(self.id)
+        return Agent.model_validate(db_agent)
 
     async def create_or_update(self) -> ("Agent", bool):
         # Validation is now handled by field validators
@@ -1081,7 +1113,8 @@ class AgentCreate(AgentUpdate):
                     setattr(db_agent, key, value)
             await db.commit()
             await db.refresh(db_agent)
-            return Agent.model_validate(db_agent), is_new
+        await publish_agent_changed(self.id)
+        return Agent.model_validate(db_agent), is_new
 
 
 class Agent(AgentCreate):
@@ -1298,6 +1331,9 @@ class Agent(AgentCreate):
         This is the shared function that handles admin configuration filtering
         for both the API endpoint and agent generation.
 
+        Compiled schemas are cached until the LLM model or skill tables
+        change. The returned schema is shared, callers must not modify it.
+
         Args:
             db: Database session (optional, will create if not provided)
             filter_owner_api_skills: Whether to filter out skills that require agent owner API keys
@@ -1313,160 +1349,175 @@ class Agent(AgentCreate):
                     session, filter_owner_api_skills, admin_llm_skill_control
                 )
 
-        # Get the schema file path relative to this file
-        current_dir = Path(__file__).parent
-        agent_schema_path = current_dir / "agent_schema.json"
-
-        base_uri = f"file://{agent_schema_path}"
-        with open(agent_schema_path) as f:
-            schema = jsonref.load(f, base_uri=base_uri, proxies=False, lazy_load=False)
-
-            # Get the model property from the schema
-            model_property = schema.get("properties", {}).get("model", {})
-
-            if admin_llm_skill_control:
-                # Process model property - use LLMModelInfo as primary source
-                if model_property:
-                    # Query all LLM models from the database
-                    stmt = select(LLMModelInfoTable).where(LLMModelInfoTable.enabled)
-                    result = await db.execute(stmt)
-                    models = result.scalars().all()
-
-                    # Create new lists based on LLMModelInfo
-                    new_enum = []
-                    new_enum_title = []
-                    new_enum_category = []
-                    new_enum_support_skill = []
-
-                    # Process each model from database
-                    for model in models:
-                        model_info = LLMModelInfo.model_validate(model)
-
-                        # Add model ID to enum
-                        new_enum.append(model_info.id)
-
-                        # Add model name as title
-                        new_enum_title.append(model_info.name)
-
-                        # Add provider display name as category
-                        provider = (
-                            LLMProvider(model_info.provider)
-                            if isinstance(model_info.provider, str)
-                            else model_info.provider
-                        )
-                        new_enum_category.append(provider.display_name())
-
-                        # Add skill support information
-                        new_enum_support_skill.append(model_info.supports_skill_calls)
-
-                    # Update the schema with the new lists constructed from LLMModelInfo
-                    model_property["enum"] = new_enum
-                    model_property["x-enum-title"] = new_enum_title
-                    model_property["x-enum-category"] = new_enum_category
-                    model_property["x-support-skill"] = new_enum_support_skill
-
-                    # If the default model is not in the new enum, update it if possible
-                    if (
-                        "default" in model_property
-                        and model_property["default"] not in new_enum
-                        and new_enum
+        versions = None
+        if admin_llm_skill_control:
+            versions = await cls._json_schema_versions(db)
+        cache_key = (filter_owner_api_skills, admin_llm_skill_control)
+        cached = _json_schema_cache.get(cache_key)
+        if cached and cached[0] == versions:
+            return cached[1]
+
+        schema = copy.deepcopy(load_agent_schema())
+
+        # Get the model property from the schema
+        model_property = schema.get("properties", {}).get("model", {})
+
+        if admin_llm_skill_control:
+            # Process model property - use LLMModelInfo as primary source
+            if model_property:
+                # Query all LLM models from the database
+                stmt = select(LLMModelInfoTable).where(LLMModelInfoTable.enabled)
+                result = await db.execute(stmt)
+                models = result.scalars().all()
+
+                # Create new lists based on LLMModelInfo
+                new_enum = []
+                new_enum_title = []
+                new_enum_category = []
+                new_enum_support_skill = []
+
+                # Process each model from database
+                for model in models:
+                    model_info = LLMModelInfo.model_validate(model)
+
+                    # Add model ID to enum
+                    new_enum.append(model_info.id)
+
+                    # Add model name as title
+                    new_enum_title.append(model_info.name)
+
+                    # Add provider display name as category
+                    provider = (
+                        LLMProvider(model_info.provider)
+                        if isinstance(model_info.provider, str)
+                        else model_info.provider
+                    )
+                    new_enum_category.append(provider.display_name())
+
+                    # Add skill support information
+                    new_enum_support_skill.append(model_info.supports_skill_calls)
+
+                # Update the schema with the new lists constructed from LLMModelInfo
+                model_property["enum"] = new_enum
+                model_property["x-enum-title"] = new_enum_title
+                model_property["x-enum-category"] = new_enum_category
+                model_property["x-support-skill"] = new_enum_support_skill
+
+                # If the default model is not in the new enum, update it if possible
+                if (
+                    "default" in model_property
+                    and model_property["default"] not in new_enum
+                    and new_enum
+                ):
+                    model_property["default"] = new_enum[0]
+
+            # Process skills property
+            skills_property = schema.get("properties", {}).get("skills", {})
+            skills_properties = skills_property.get("properties", {})
+
+            if skills_properties:
+                # Load all skills from the database
+                # Query all skills grouped by category with enabled status
+                stmt = select(
+                    SkillTable.category,
+                    func.bool_or(SkillTable.enabled).label("any_enabled"),
+                ).group_by(SkillTable.category)
+                result = await db.execute(stmt)
+                category_status = {row.category: row.any_enabled for row in result}
+
+                # Query all skills with their price levels for adding x-price-level fields
+                skills_stmt = select(
+                    SkillTable.category,
+                    SkillTable.config_name,
+                    SkillTable.price_level,
+                    SkillTable.enabled,
+                ).where(SkillTable.enabled)
+                skills_result = await db.execute(skills_stmt)
+                skills_data = {}
+                category_price_levels = {}
+
+                for row in skills_result:
+                    if row.category not in skills_data:
+                        skills_data[row.category] = {}
+                        category_price_levels[row.category] = []
+
+                    if row.config_name:
+                        skills_data[row.category][row.config_name] = row.price_level
+
+                    if row.price_level is not None:
+                        category_price_levels[row.category].append(row.price_level)
+
+                # Calculate average price levels for categories
+                category_avg_price_levels = {}
+                for category, price_levels in category_price_levels.items():
+                    if price_levels:
+                        avg_price_level = int(sum(price_levels) / len(price_levels))
+                        category_avg_price_levels[category] = avg_price_level
+
+                # Create a copy of keys to avoid modifying during iteration
+                skill_keys = list(skills_properties.keys())
+
+                # Process each skill in the schema
+                for skill_category in skill_keys:
+                    if skill_category not in category_status:
+                        # If category not found in database, remove it from schema
+                        skills_properties.pop(skill_category, None)
+                    elif not category_status[skill_category]:
+                        # If category exists but all skills are disabled, remove it
+                        skills_properties.pop(skill_category, None)
+                    elif filter_owner_api_skills and cls._is_agent_owner_only_skill(
+                        skills_properties[skill_category]
                     ):
-                        model_property["default"] = new_enum[0]
-
-                # Process skills property
-                skills_property = schema.get("properties", {}).get("skills", {})
-                skills_properties = skills_property.get("properties", {})
-
-                if skills_properties:
-                    # Load all skills from the database
-                    # Query all skills grouped by category with enabled status
-                    stmt = select(
-                        SkillTable.category,
-                        func.bool_or(SkillTable.enabled).label("any_enabled"),
-                    ).group_by(SkillTable.category)
-                    result = await db.execute(stmt)
-                    category_status = {row.category: row.any_enabled for row in result}
-
-                    # Query all skills with their price levels for adding x-price-level fields
-                    skills_stmt = select(
-                        SkillTable.category,
-                        SkillTable.config_name,
-                        SkillTable.price_level,
-                        SkillTable.enabled,
-                    ).where(SkillTable.enabled)
-                    skills_result = await db.execute(skills_stmt)
-                    skills_data = {}
-                    category_price_levels = {}
-
-                    for row in skills_result:
-                        if row.category not in skills_data:
-                            skills_data[row.category] = {}
-                            category_price_levels[row.category] = []
-
-                        if row.config_name:
-                            skills_data[row.category][row.config_name] = row.price_level
-
-                        if row.price_level is not None:
-                            category_price_levels[row.category].append(row.price_level)
-
-                    # Calculate average price levels for categories
-                    category_avg_price_levels = {}
-                    for category, price_levels in category_price_levels.items():
-                        if price_levels:
-                            avg_price_level = int(sum(price_levels) / len(price_levels))
-                            category_avg_price_levels[category] = avg_price_level
-
-                    # Create a copy of keys to avoid modifying during iteration
-                    skill_keys = list(skills_properties.keys())
-
-                    # Process each skill in the schema
-                    for skill_category in skill_keys:
-                        if skill_category not in category_status:
-                            # If category not found in database, remove it from schema
-                            skills_properties.pop(skill_category, None)
-                        elif not category_status[skill_category]:
-                            # If category exists but all skills are disabled, remove it
-                            skills_properties.pop(skill_category, None)
-                        elif filter_owner_api_skills and cls._is_agent_owner_only_skill(
-                            skills_properties[skill_category]
-                        ):
-                            # If filtering owner API skills and this skill requires it, remove it
-                            skills_properties.pop(skill_category, None)
-                            logger.info(
-                                f"Filtered out skill '{skill_category}' from auto-generation: requires agent owner API key"
+                        # If filtering owner API skills and this skill requires it, remove it
+                        skills_properties.pop(skill_category, None)
+                        logger.info(
+                            f"Filtered out skill '{skill_category}' from auto-generation: requires agent owner API key"
+                        )
+                    else:
+                        # Add x-avg-price-level to category level
+                        if skill_category in category_avg_price_levels:
+                            skills_properties[skill_category]["x-avg-price-level"] = (
+                                category_avg_price_levels[skill_category]
                             )
-                        else:
-                            # Add x-avg-price-level to category level
-                            if skill_category in category_avg_price_levels:
-                                skills_properties[skill_category][
-                                    "x-avg-price-level"
-                                ] = category_avg_price_levels[skill_category]
-
-                            # Add x-price-level to individual skill states
-                            if skill_category in skills_data:
-                                skill_states = (
-                                    skills_properties[skill_category]
-                                    .get("properties", {})
-                                    .get("states", {})
-                                    .get("properties", {})
-                                )
-                                for state_name, state_config in skill_states.items():
-                                    if (
-                                        state_name in skills_data[skill_category]
-                                        and skills_data[skill_category][state_name]
-                                        is not None
-                                    ):
-                                        state_config["x-price-level"] = skills_data[
-                                            skill_category
-                                        ][state_name]
-
-            # Log the changes for debugging
-            logger.debug(
-                f"Schema processed with LLM and skill controls enabled: {admin_llm_skill_control}, "
-                f"filtered owner API skills: {filter_owner_api_skills}"
-            )
 
-            return schema
+                        # Add x-price-level to individual skill states
+                        if skill_category in skills_data:
+                            skill_states = (
+                                skills_properties[skill_category]
+                                .get("properties", {})
+                                .get("states", {})
+                                .get("properties", {})
+                            )
+                            for state_name, state_config in skill_states.items():
+                                if (
+                                    state_name in skills_data[skill_category]
+                                    and skills_data[skill_category][state_name]
+                                    is not None
+                                ):
+                                    state_config["x-price-level"] = skills_data[
+                                        skill_category
+                                    ][state_name]
+
+        # Log the changes for debugging
+        logger.debug(
+            f"Schema processed with LLM and skill controls enabled: {admin_llm_skill_control}, "
+            f"filtered owner API skills: {filter_owner_api_skills}"
+        )
+
+        _json_schema_cache[cache_key] = (versions, schema)
+        return schema
+
+    @staticmethod
+    async def _json_schema_versions(db: AsyncSession) -> tuple:
+        """Fingerprint of the LLM model and skill tables the schema depends on."""
+        stmt = select(
+            select(func.count()).select_from(LLMModelInfoTable).scalar_subquery(),
+            select(func.max(LLMModelInfoTable.updated_at)).scalar_subquery(),
+            select(func.count()).select_from(SkillTable).scalar_subquery(),
+            select(func.max(SkillTable.updated_at)).scalar_subquery(),
+        )
+        result = await db.execute(stmt)
+        return tuple(result.one())
 
 
 class AgentResponse(BaseModel):
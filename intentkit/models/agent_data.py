@@ -1,11 +1,12 @@
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Annotated, Any, Dict, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
 from fastapi import HTTPException
 from intentkit.models.base import Base
 from intentkit.models.db import get_session
+from intentkit.models.redis import get_redis
 from pydantic import BaseModel, ConfigDict
 from pydantic import Field as PydanticField
 from sqlalchemy import (
@@ -13,10 +14,13 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Index,
     Numeric,
     String,
+    bindparam,
     func,
     select,
+    update,
 )
 from sqlalchemy.dialects.postgresql import JSON, JSONB
 
@@ -517,6 +521,168 @@ class AgentQuotaTable(Base):
     )
 
 
+class AgentActionCostTable(Base):
+    """Hourly rollup of agent action costs.
+
+    An action is all message and skill call expenses sharing a start_message_id,
+    it belongs to the hour of its first expense. The histogram maps a log scale
+    bucket to [count, sum] of action costs, so rollups of any hour range can be
+    merged into cost metrics without scanning credit_events again.
+    """
+
+    __tablename__ = "agent_action_costs"
+    __table_args__ = (Index("ix_agent_action_costs_hour", "hour"),)
+
+    agent_id = Column(String, primary_key=True)
+    hour = Column(DateTime(timezone=True), primary_key=True)
+    action_count = Column(BigInteger, default=0, nullable=False)
+    # actions paid by users other than the agent owner
+    external_action_count = Column(BigInteger, default=0, nullable=False)
+    total_cost = Column(Numeric(22, 4), default=0, nullable=False)
+    min_cost = Column(Numeric(22, 4), default=0, nullable=False)
+    max_cost = Column(Numeric(22, 4), default=0, nullable=False)
+    histogram = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+# Quota counters live in Redis when it is configured. Increments are atomic
+# HINCRBY calls on hashes bucketed by UTC day and month, so the calendar resets
+# are key expiry. Totals are kept in agent_quotas, increments to them wait in
+# a pending hash until flush_counters adds them with one bulk UPDATE, which
+# also stores the current day and month counts for reporting.
+QUOTA_KEY_PREFIX = "intentkit:quota:"
+QUOTA_DIRTY_KEY = "intentkit:quota:dirty"
+# Agents flushed per round
+QUOTA_FLUSH_BATCH = 500
+# Buckets are kept a day past their period, so a late flush still sees them
+QUOTA_BUCKET_GRACE = timedelta(days=1)
+# Counter name -> AgentQuota field of the daily and monthly buckets
+QUOTA_DAILY_FIELDS = {
+    "message": "message_count_daily",
+    "twitter": "twitter_count_daily",
+    "free_income": "free_income_daily",
+}
+QUOTA_MONTHLY_FIELDS = {
+    "message": "message_count_monthly",
+    "autonomous": "autonomous_count_monthly",
+}
+
+
+def _quota_redis():
+    """Redis client for quota counters, None to use the database directly."""
+    try:
+        return get_redis()
+    except RuntimeError:
+        return None
+
+
+def _quota_keys(agent_id: str, now: datetime) -> tuple[str, str, str]:
+    """Keys of the pending, daily and monthly hashes of an agent."""
+    prefix = f"{QUOTA_KEY_PREFIX}{agent_id}"
+    return (
+        f"{prefix}:pending",
+        f"{prefix}:d:{now:%Y%m%d}",
+        f"{prefix}:m:{now:%Y%m}",
+    )
+
+
+def _quota_expiry(now: datetime) -> tuple[datetime, datetime]:
+    """Expiry times of the daily and monthly buckets of now."""
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    next_day = day_start + timedelta(days=1)
+    next_month = (day_start.replace(day=1) + timedelta(days=32)).replace(day=1)
+    return next_day + QUOTA_BUCKET_GRACE, next_month + QUOTA_BUCKET_GRACE
+
+
+def _bucket_seed(row, fields: Dict[str, str], period_start: datetime) -> dict:
+    """Counts of a stored quota row for a bucket, zero if written before the period."""
+    updated_at = row.updated_at if row is not None else None
+    if updated_at is not None and updated_at.tzinfo is None:
+        # SQLite returns naive UTC times
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    current = updated_at is not None and updated_at >= period_start
+    return {
+        name: str(getattr(row, field) or 0) if current else "0"
+        for name, field in fields.items()
+    }
+
+
+def _queue_seeds(pipe, seeds: List[tuple[str, dict, datetime]]) -> None:
+    """Queue seeding of buckets, counts added meanwhile are kept."""
+    for key, values, expiry in seeds:
+        for name, value in values.items():
+            pipe.hsetnx(key, name, value)
+        pipe.expireat(key, expiry)
+
+
+async def _incr_counters(
+    agent_id: str,
+    name: str,
+    daily: bool = False,
+    monthly: bool = False,
+    amount: int | Decimal = 1,
+) -> None:
+    """Atomically add to the counters of an agent in Redis.
+
+    Args:
+        agent_id: Agent ID
+        name: Counter name, message, autonomous, twitter or free_income
+        daily: Count in the daily bucket
+        monthly: Count in the monthly bucket
+        amount: Amount to add, a Decimal is added as float
+    """
+    redis = _quota_redis()
+    now = datetime.now(timezone.utc)
+    pending_key, day_key, month_key = _quota_keys(agent_id, now)
+    day_expiry, month_expiry = _quota_expiry(now)
+    is_float = isinstance(amount, Decimal)
+
+    # A bucket is seeded from the stored row when it is created, so counts
+    # stored before it existed, as on the first start with Redis, still count
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    buckets = []
+    if daily or is_float:
+        buckets.append((day_key, QUOTA_DAILY_FIELDS, day_start, day_expiry))
+    if monthly:
+        month_start = day_start.replace(day=1)
+        buckets.append((month_key, QUOTA_MONTHLY_FIELDS, month_start, month_expiry))
+    async with redis.pipeline(transaction=False) as pipe:
+        for key, _, _, _ in buckets:
+            pipe.exists(key)
+        exists = await pipe.execute()
+    seeds = []
+    missing = [bucket for bucket, found in zip(buckets, exists) if not found]
+    if missing:
+        async with get_session() as db:
+            row = await db.get(AgentQuotaTable, agent_id)
+        seeds = [
+            (key, _bucket_seed(row, fields, start), expiry)
+            for key, fields, start, expiry in missing
+        ]
+
+    async with redis.pipeline(transaction=True) as pipe:
+        _queue_seeds(pipe, seeds)
+        if is_float:
+            pipe.hincrbyfloat(day_key, name, str(amount))
+        else:
+            pipe.hincrby(pending_key, name, amount)
+            pipe.hset(pending_key, f"last_{name}_time", now.isoformat())
+            if daily:
+                pipe.hincrby(day_key, name, amount)
+        if daily or is_float:
+            pipe.expireat(day_key, day_expiry)
+        if monthly:
+            pipe.hincrby(month_key, name, amount)
+            pipe.expireat(month_key, month_expiry)
+        pipe.sadd(QUOTA_DIRTY_KEY, agent_id)
+        await pipe.execute()
+
+
 class AgentQuota(BaseModel):
     """AgentQuota model."""
 
@@ -673,7 +839,49 @@ class AgentQuota(BaseModel):
                 await db.commit()
                 await db.refresh(quota_record)
 
-            return cls.model_validate(quota_record)
+            quota = cls.model_validate(quota_record)
+
+        if _quota_redis():
+            await quota._apply_counters()
+        return quota
+
+    async def _apply_counters(self) -> None:
+        """Overlay the live counters in Redis on the stored row."""
+        redis = _quota_redis()
+        now = datetime.now(timezone.utc)
+        keys = _quota_keys(self.id, now)
+        async with redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hgetall(key)
+            pending, day, month = await pipe.execute()
+
+        # A missing bucket is seeded from the row, as in _incr_counters
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        day_expiry, month_expiry = _quota_expiry(now)
+        seeds = []
+        if not day:
+            day = _bucket_seed(self, QUOTA_DAILY_FIELDS, day_start)
+            seeds.append((keys[1], day, day_expiry))
+        if not month:
+            month = _bucket_seed(self, QUOTA_MONTHLY_FIELDS, day_start.replace(day=1))
+            seeds.append((keys[2], month, month_expiry))
+        if seeds:
+            async with redis.pipeline(transaction=True) as pipe:
+                _queue_seeds(pipe, seeds)
+                await pipe.execute()
+
+        self.message_count_total += int(pending.get("message", 0))
+        self.autonomous_count_total += int(pending.get("autonomous", 0))
+        self.twitter_count_total += int(pending.get("twitter", 0))
+        for name in ("message", "autonomous", "twitter"):
+            last_time = pending.get(f"last_{name}_time")
+            if last_time:
+                setattr(self, f"last_{name}_time", datetime.fromisoformat(last_time))
+        self.message_count_daily = int(day.get("message", 0))
+        self.twitter_count_daily = int(day.get("twitter", 0))
+        self.free_income_daily = Decimal(day.get("free_income", "0"))
+        self.message_count_monthly = int(month.get("message", 0))
+        self.autonomous_count_monthly = int(month.get("autonomous", 0))
 
     def has_message_quota(self) -> bool:
         """Check if the agent has message quota.
@@ -732,6 +940,10 @@ class AgentQuota(BaseModel):
         Raises:
             HTTPException: If there are database errors
         """
+        if _quota_redis():
+            # Counted even if the session rolls back, erring on the safe side
+            await _incr_counters(id, "free_income", amount=amount)
+            return
         try:
             # Check if the record exists using session.get
             quota_record = await session.get(AgentQuotaTable, id)
@@ -742,8 +954,6 @@ class AgentQuota(BaseModel):
                 session.add(quota_record)
             else:
                 # Use update statement with func to directly add the amount
-                from sqlalchemy import update
-
                 stmt = update(AgentQuotaTable).where(AgentQuotaTable.id == id)
                 stmt = stmt.values(
                     free_income_daily=func.coalesce(
@@ -756,43 +966,57 @@ class AgentQuota(BaseModel):
             logger.error(f"Error adding free income: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
-    async def add_message(self) -> None:
-        """Add a message to the agent's message count."""
+    async def _add_in_database(self, values: Dict[str, Any]) -> None:
+        """Increment counters with one UPDATE, without Redis."""
+        table = AgentQuotaTable.__table__
         async with get_session() as db:
-            quota_record = await db.get(AgentQuotaTable, self.id)
-
-            if quota_record:
-                # Update record
-                quota_record.message_count_total += 1
-                quota_record.message_count_monthly += 1
-                quota_record.message_count_daily += 1
-                quota_record.last_message_time = datetime.now(timezone.utc)
-                db.add(quota_record)
-                await db.commit()
+            result = await db.execute(
+                update(table)
+                .where(table.c.id == self.id)
+                .values(**values)
+                .returning(table)
+            )
+            row = result.mappings().first()
+            await db.commit()
+        if row:
+            for key in values:
+                setattr(self, key, row[key])
 
-                # Update this instance
-                await db.refresh(quota_record)
-                self.message_count_total = quota_record.message_count_total
-                self.message_count_monthly = quota_record.message_count_monthly
-                self.message_count_daily = quota_record.message_count_daily
-                self.last_message_time = quota_record.last_message_time
-                self.updated_at = quota_record.updated_at
+    async def add_message(self) -> None:
+        """Add a message to the agent's message count."""
+        if _quota_redis():
+            await _incr_counters(self.id, "message", daily=True, monthly=True)
+            self.message_count_total += 1
+            self.message_count_monthly += 1
+            self.message_count_daily += 1
+            self.last_message_time = datetime.now(timezone.utc)
+            return
+        table = AgentQuotaTable.__table__
+        await self._add_in_database(
+            {
+                "message_count_total": table.c.message_count_total + 1,
+                "message_count_monthly": table.c.message_count_monthly + 1,
+                "message_count_daily": table.c.message_count_daily + 1,
+                "last_message_time": datetime.now(timezone.utc),
+            }
+        )
 
     async def add_autonomous(self) -> None:
         """Add an autonomous operation to the agent's autonomous count."""
-        async with get_session() as db:
-            quota_record = await db.get(AgentQuotaTable, self.id)
-            if quota_record:
-                # Update record
-                quota_record.autonomous_count_total += 1
-                quota_record.autonomous_count_monthly += 1
-                quota_record.last_autonomous_time = datetime.now(timezone.utc)
-                db.add(quota_record)
-                await db.commit()
-
-                # Update this instance
-                await db.refresh(quota_record)
-                self.model_validate(quota_record)
+        if _quota_redis():
+            await _incr_counters(self.id, "autonomous", monthly=True)
+            self.autonomous_count_total += 1
+            self.autonomous_count_monthly += 1
+            self.last_autonomous_time = datetime.now(timezone.utc)
+            return
+        table = AgentQuotaTable.__table__
+        await self._add_in_database(
+            {
+                "autonomous_count_total": table.c.autonomous_count_total + 1,
+                "autonomous_count_monthly": table.c.autonomous_count_monthly + 1,
+                "last_autonomous_time": datetime.now(timezone.utc),
+            }
+        )
 
     async def add_twitter_message(self) -> None:
         """Add a twitter message to the agent's twitter count.
@@ -800,28 +1024,155 @@ class AgentQuota(BaseModel):
         Raises:
             HTTPException: If there are database errors
         """
-        async with get_session() as db:
-            quota_record = await db.get(AgentQuotaTable, self.id)
+        if _quota_redis():
+            await _incr_counters(self.id, "twitter", daily=True)
+            self.twitter_count_total += 1
+            self.twitter_count_daily += 1
+            self.last_twitter_time = datetime.now(timezone.utc)
+            return
+        table = AgentQuotaTable.__table__
+        await self._add_in_database(
+            {
+                "twitter_count_total": table.c.twitter_count_total + 1,
+                "twitter_count_daily": table.c.twitter_count_daily + 1,
+                "last_twitter_time": datetime.now(timezone.utc),
+            }
+        )
 
-            if quota_record:
-                # Update record
-                quota_record.twitter_count_total += 1
-                quota_record.twitter_count_daily += 1
-                quota_record.last_twitter_time = datetime.now(timezone.utc)
-                db.add(quota_record)
-                await db.commit()
+    @staticmethod
+    async def flush_counters() -> int:
+        """Write the Redis counters of changed agents to agent_quotas.
 
-                # Update this instance
-                await db.refresh(quota_record)
-                self.model_validate(quota_record)
+        Runs in the scheduler when Redis is configured. Pending total
+        increments are taken out of Redis atomically and added in one bulk
+        UPDATE, they are put back if the UPDATE fails.
+
+        Returns:
+            int: Number of agents flushed
+        """
+        redis = _quota_redis()
+        if not redis:
+            return 0
+        flushed = 0
+        while True:
+            agent_ids: List[str] = await redis.spop(QUOTA_DIRTY_KEY, QUOTA_FLUSH_BATCH)
+            if not agent_ids:
+                break
+            now = datetime.now(timezone.utc)
+            async with redis.pipeline(transaction=True) as pipe:
+                for agent_id in agent_ids:
+                    pending_key, day_key, month_key = _quota_keys(agent_id, now)
+                    pipe.hgetall(pending_key)
+                    pipe.delete(pending_key)
+                    pipe.hgetall(day_key)
+                    pipe.hgetall(month_key)
+                results = await pipe.execute()
+
+            params = []
+            for i, agent_id in enumerate(agent_ids):
+                pending, _, day, month = results[i * 4 : i * 4 + 4]
+                last_times = {
+                    f"p_last_{name}_time": datetime.fromisoformat(
+                        pending[f"last_{name}_time"]
+                    )
+                    if pending.get(f"last_{name}_time")
+                    else None
+                    for name in ("message", "autonomous", "twitter")
+                }
+                params.append(
+                    {
+                        "p_id": agent_id,
+                        "p_message": int(pending.get("message", 0)),
+                        "p_autonomous": int(pending.get("autonomous", 0)),
+                        "p_twitter": int(pending.get("twitter", 0)),
+                        **last_times,
+                        "p_message_daily": int(day.get("message", 0)),
+                        "p_twitter_daily": int(day.get("twitter", 0)),
+                        "p_free_income_daily": Decimal(day.get("free_income", "0")),
+                        "p_message_monthly": int(month.get("message", 0)),
+                        "p_autonomous_monthly": int(month.get("autonomous", 0)),
+                    }
+                )
+
+            try:
+                await AgentQuota._flush_in_database(params)
+            except Exception as e:
+                logger.error(f"Error flushing quota counters, restoring them: {e}")
+                await AgentQuota._restore_pending(results, agent_ids)
+                raise
+            flushed += len(agent_ids)
+        if flushed:
+            logger.info(f"Flushed quota counters of {flushed} agents")
+        return flushed
+
+    @staticmethod
+    async def _flush_in_database(params: List[Dict[str, Any]]) -> None:
+        table = AgentQuotaTable.__table__
+        async with get_session() as session:
+            ids = [p["p_id"] for p in params]
+            existing = set(
+                await session.scalars(select(table.c.id).where(table.c.id.in_(ids)))
+            )
+            for agent_id in ids:
+                if agent_id not in existing:
+                    session.add(AgentQuotaTable(id=agent_id))
+            await session.flush()
+
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("p_id"))
+                .values(
+                    message_count_total=table.c.message_count_total
+                    + bindparam("p_message"),
+                    autonomous_count_total=table.c.autonomous_count_total
+                    + bindparam("p_autonomous"),
+                    twitter_count_total=table.c.twitter_count_total
+                    + bindparam("p_twitter"),
+                    last_message_time=func.coalesce(
+                        bindparam("p_last_message_time"), table.c.last_message_time
+                    ),
+                    last_autonomous_time=func.coalesce(
+                        bindparam("p_last_autonomous_time"),
+                        table.c.last_autonomous_time,
+                    ),
+                    last_twitter_time=func.coalesce(
+                        bindparam("p_last_twitter_time"), table.c.last_twitter_time
+                    ),
+                    message_count_daily=bindparam("p_message_daily"),
+                    twitter_count_daily=bindparam("p_twitter_daily"),
+                    free_income_daily=bindparam("p_free_income_daily"),
+                    message_count_monthly=bindparam("p_message_monthly"),
+                    autonomous_count_monthly=bindparam("p_autonomous_monthly"),
+                )
+            )
+            await session.execute(stmt, params)
+            await session.commit()
+
+    @staticmethod
+    async def _restore_pending(results: List[Any], agent_ids: List[str]) -> None:
+        """Put taken pending increments back after a failed flush."""
+        redis = _quota_redis()
+        now = datetime.now(timezone.utc)
+        async with redis.pipeline(transaction=True) as pipe:
+            for i, agent_id in enumerate(agent_ids):
+                pending = results[i * 4]
+                pending_key, _, _ = _quota_keys(agent_id, now)
+                for field, value in pending.items():
+                    if field.startswith("last_"):
+                        pipe.hsetnx(pending_key, field, value)
+                    else:
+                        pipe.hincrby(pending_key, field, int(value))
+                pipe.sadd(QUOTA_DIRTY_KEY, agent_id)
+            await pipe.execute()
 
     @staticmethod
     async def reset_daily_quotas():
         """Reset daily quotas for all agents at UTC 00:00.
         Resets message_count_daily and twitter_count_daily to 0.
+        Not needed with Redis counters, their daily buckets expire.
         """
-        from sqlalchemy import update
-
+        if _quota_redis():
+            return
         async with get_session() as session:
             stmt = update(AgentQuotaTable).values(
                 message_count_daily=0,
@@ -835,9 +1186,10 @@ class AgentQuota(BaseModel):
     async def reset_monthly_quotas():
         """Reset monthly quotas for all agents at the start of each month.
         Resets message_count_monthly and autonomous_count_monthly to 0.
+        Not needed with Redis counters, their monthly buckets expire.
         """
-        from sqlalchemy import update
-
+        if _quota_redis():
+            return
         async with get_session() as session:
             stmt = update(AgentQuotaTable).values(
                 message_count_monthly=0, autonomous_count_monthly=0
@@ -0,0 +1,172 @@
+"""Archival of cold history partitions to compressed Parquet files."""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, List
+from uuid import uuid4
+
+from intentkit.models.base import Base
+from intentkit.models.db_mig import list_partitions, month_start
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    select,
+    text,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched from the database and written to Parquet at a time
+ARCHIVE_BATCH_SIZE = 10000
+
+# Partitioned tables whose old partitions may be archived. The credit tables
+# are left out, balance checks sum every transaction of an account.
+ARCHIVED_TABLES = ("chat_messages",)
+
+
+def _arrow_type(column_type) -> Any:
+    """Arrow type of a column, None for JSON and arrays, kept as JSON text."""
+    import pyarrow as pa
+
+    # Float is a Numeric in SQLAlchemy, check it first
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, Numeric):
+        return pa.decimal128(column_type.precision or 38, column_type.scale or 0)
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us", tz="UTC")
+    if isinstance(column_type, String):
+        return pa.string()
+    return None
+
+
+async def archive_partition(
+    engine, table_name: str, partition: str, destination: str
+) -> int:
+    """Export a partition to a zstd compressed Parquet file.
+
+    Rows are streamed in batches of ARCHIVE_BATCH_SIZE. The file is written
+    next to destination, moved into place once complete and read back to
+    check its row count.
+
+    Args:
+        engine: SQLAlchemy engine
+        table_name: Partitioned table the partition belongs to
+        partition: Name of the partition
+        destination: Absolute path or URI, like s3://bucket/key, of the file
+
+    Returns:
+        Number of archived rows
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        RuntimeError: If the written file does not hold every exported row
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.fs as pafs
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("pyarrow is required to archive partitions") from e
+
+    table = Base.metadata.tables[table_name].to_metadata(MetaData(), name=partition)
+    types = {column.name: _arrow_type(column.type) for column in table.columns}
+    schema = pa.schema(
+        [(name, arrow_type or pa.string()) for name, arrow_type in types.items()]
+    )
+    json_columns = [name for name, arrow_type in types.items() if arrow_type is None]
+
+    fs, path = await asyncio.to_thread(pafs.FileSystem.from_uri, destination)
+    await asyncio.to_thread(fs.create_dir, path.rsplit("/", 1)[0], recursive=True)
+    tmp_path = f"{path}.{uuid4().hex}.tmp"
+    writer = await asyncio.to_thread(
+        pq.ParquetWriter, tmp_path, schema, filesystem=fs, compression="zstd"
+    )
+    rows = 0
+    try:
+        async with engine.connect() as conn:
+            result = await conn.stream(select(*table.columns))
+            async for batch in result.mappings().partitions(ARCHIVE_BATCH_SIZE):
+                records = [dict(row) for row in batch]
+                for record in records:
+                    for name in json_columns:
+                        if record[name] is not None:
+                            record[name] = json.dumps(record[name], default=str)
+                arrow_batch = pa.Table.from_pylist(records, schema=schema)
+                await asyncio.to_thread(writer.write_table, arrow_batch)
+                rows += len(records)
+    except BaseException:
+        await asyncio.to_thread(writer.close)
+        await asyncio.to_thread(fs.delete_file, tmp_path)
+        raise
+    await asyncio.to_thread(writer.close)
+    await asyncio.to_thread(fs.move, tmp_path, path)
+
+    metadata = await asyncio.to_thread(pq.read_metadata, path, filesystem=fs)
+    if metadata.num_rows != rows:
+        raise RuntimeError(
+            f"Archive {destination} holds {metadata.num_rows} rows, "
+            f"{rows} were exported"
+        )
+    return rows
+
+
+async def archive_partitions(engine, after_months: int, archive_dir: str) -> List[str]:
+    """Archive and drop partitions older than after_months months.
+
+    Each partition of ARCHIVED_TABLES ending before the cutoff is written to
+    {archive_dir}/{table}/{partition}.parquet, then detached and dropped if
+    it still holds exactly the archived rows. The legacy partition is
+    archived once all of it is past the cutoff.
+
+    Args:
+        engine: SQLAlchemy engine
+        after_months: Age in months after which a partition is archived
+        archive_dir: Absolute directory or URI, like s3://bucket/prefix, for
+            the Parquet files
+
+    Returns:
+        Names of the archived partitions
+    """
+    if engine.dialect.name != "postgresql" or after_months <= 0:
+        return []
+    cutoff = month_start(datetime.now(timezone.utc), -after_months)
+    archived = []
+    for table_name in ARCHIVED_TABLES:
+        async with engine.connect() as conn:
+            partitions = await list_partitions(conn, table_name)
+        for partition, upper in partitions:
+            if upper is None or upper > cutoff:
+                continue
+            destination = f"{archive_dir.rstrip('/')}/{table_name}/{partition}.parquet"
+            rows = await archive_partition(engine, table_name, partition, destination)
+            async with engine.begin() as conn:
+                # Block writes to the partition until it is dropped
+                await conn.execute(text(f"LOCK TABLE {partition} IN SHARE MODE"))
+                count = await conn.scalar(text(f"SELECT count(*) FROM {partition}"))
+                if count != rows:
+                    logger.error(
+                        f"Partition {partition} holds {count} rows, {rows} were "
+                        f"archived to {destination}, keeping it"
+                    )
+                    continue
+                await conn.execute(
+                    text(f"ALTER TABLE {table_name} DETACH PARTITION {partition}")
+                )
+                await conn.execute(text(f"DROP TABLE {partition}"))
+            logger.info(
+                f"Archived {rows} rows of partition {partition} to {destination}"
+            )
+            archived.append(partition)
+    return archived
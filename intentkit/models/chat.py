@@ -20,11 +20,15 @@ from sqlalchemy import (
     desc,
     func,
     select,
+    tuple_,
     update,
 )
 from sqlalchemy.dialects.postgresql import JSON, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# JSON columns left out of history pages unless details are requested
+CHAT_MESSAGE_DETAIL_COLUMNS = ("attachments", "skill_calls")
+
 
 class ChatMessageAttachmentType(str, Enum):
     """Type of chat message attachment."""
@@ -189,8 +193,21 @@ class ChatMessageTable(Base):
     __tablename__ = "chat_messages"
     __table_args__ = (
         Index("ix_chat_messages_chat_id", "chat_id"),
-        Index("ix_chat_messages_agent_id_author_type", "agent_id", "author_type"),
-        Index("ix_chat_messages_agent_id_chat_id", "agent_id", "chat_id"),
+        # History pages, see ChatMessage.history
+        Index(
+            "ix_chat_messages_agent_chat_created",
+            "agent_id",
+            "chat_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_chat_messages_agent_author_created",
+            "agent_id",
+            "author_type",
+            "created_at",
+            "id",
+        ),
     )
 
     id = Column(
@@ -430,6 +447,18 @@ class ChatMessageCreate(BaseModel):
         )
 
 
+class ChatMessageChunk(BaseModel):
+    """A piece of an agent message streamed while the LLM generates it.
+
+    Chunks are not saved, the complete ChatMessage follows them.
+    """
+
+    agent_id: Annotated[str, Field(description="ID of the agent")]
+    chat_id: Annotated[str, Field(description="ID of the chat")]
+    reply_to: Annotated[str, Field(description="ID of the input message")]
+    content: Annotated[str, Field(description="Text generated since the last chunk")]
+
+
 class ChatMessage(ChatMessageCreate):
     """Chat message model with all fields including server-generated ones."""
 
@@ -534,12 +563,78 @@ class ChatMessage(ChatMessageCreate):
                 return ChatMessage.model_validate(raw)
             return None
 
+    @classmethod
+    async def history(
+        cls,
+        db: AsyncSession,
+        agent_id: str,
+        chat_id: Optional[str] = None,
+        author_type: Optional[AuthorType] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        include_details: bool = True,
+    ) -> List["ChatMessage"]:
+        """Get a page of agent messages, newest first.
+
+        Pages are keyset paginated on (created_at, id), so each page is a range
+        scan of ix_chat_messages_agent_chat_created when chat_id is given, or of
+        ix_chat_messages_agent_author_created when author_type is given.
+
+        Args:
+            db: Database session
+            agent_id: ID of the agent
+            chat_id: Only messages of this chat
+            author_type: Only messages of this author type
+            cursor: ID of the last message of the previous page, the page
+                starts right after it
+            limit: Maximum number of messages to return
+            include_details: Load CHAT_MESSAGE_DETAIL_COLUMNS, they are None
+                in the returned messages otherwise
+
+        Returns:
+            Messages ordered by creation time descending
+
+        Raises:
+            ValueError: If the cursor message does not exist
+        """
+        columns = [
+            column
+            for column in ChatMessageTable.__table__.columns
+            if include_details or column.name not in CHAT_MESSAGE_DETAIL_COLUMNS
+        ]
+        stmt = select(*columns).where(ChatMessageTable.agent_id == agent_id)
+        if chat_id is not None:
+            stmt = stmt.where(ChatMessageTable.chat_id == chat_id)
+        if author_type is not None:
+            stmt = stmt.where(ChatMessageTable.author_type == author_type)
+        if cursor:
+            cursor_created_at = await db.scalar(
+                select(ChatMessageTable.created_at).where(ChatMessageTable.id == cursor)
+            )
+            if cursor_created_at is None:
+                raise ValueError(f"Cursor message {cursor} not found")
+            stmt = stmt.where(
+                tuple_(ChatMessageTable.created_at, ChatMessageTable.id)
+                < tuple_(cursor_created_at, cursor),
+                # Row comparisons do not prune partitions, this bound does
+                ChatMessageTable.created_at <= cursor_created_at,
+            )
+        stmt = stmt.order_by(
+            desc(ChatMessageTable.created_at), desc(ChatMessageTable.id)
+        ).limit(limit)
+        result = await db.execute(stmt)
+        return [cls.model_validate(row) for row in result]
+
 
 class ChatTable(Base):
     """Chat database table model."""
 
     __tablename__ = "chats"
-    __table_args__ = (Index("ix_chats_agent_user", "agent_id", "user_id"),)
+    __table_args__ = (
+        Index("ix_chats_agent_user", "agent_id", "user_id"),
+        # Lets ownership checks in Chat.belongs_to use an index-only scan
+        Index("ix_chats_id_agent_id", "id", "agent_id"),
+    )
 
     id = Column(
         String,
@@ -624,6 +719,27 @@ class Chat(ChatCreate):
         datetime, Field(description="Timestamp when this chat was updated")
     ]
 
+    @classmethod
+    async def belongs_to(cls, db: AsyncSession, id: str, agent_id: str) -> bool:
+        """Check that a chat exists and belongs to an agent.
+
+        Only reads ix_chats_id_agent_id, without loading the chat.
+
+        Args:
+            db: Database session
+            id: ID of the chat
+            agent_id: ID of the agent
+
+        Returns:
+            True if the chat belongs to the agent
+        """
+        found = await db.scalar(
+            select(ChatTable.id).where(
+                ChatTable.id == id, ChatTable.agent_id == agent_id
+            )
+        )
+        return found is not None
+
     @classmethod
     async def get(cls, id: str) -> Optional["Chat"]:
         """Get a chat by its ID.
@@ -18,7 +18,9 @@ from sqlalchemy import (
     Index,
     Numeric,
     String,
+    delete,
     func,
+    insert,
     select,
     update,
 )
@@ -127,6 +129,52 @@ class CreditAccountTable(Base):
     )
 
 
+class CreditAccountDeltaTable(Base):
+    """Pending credit changes of platform accounts.
+
+    In deferred mode billing appends a row here instead of updating the hot
+    platform account row, so concurrent transactions do not queue on its row
+    lock. A scheduler job folds the rows into credit_accounts. Until then the
+    real balance of an account is its row plus its pending deltas.
+    """
+
+    __tablename__ = "credit_account_deltas"
+    __table_args__ = (Index("ix_credit_account_deltas_account_id", "account_id"),)
+
+    id = Column(
+        String,
+        primary_key=True,
+    )
+    account_id = Column(
+        String,
+        nullable=False,
+    )
+    event_id = Column(
+        String,
+        nullable=False,
+    )
+    free_credits = Column(
+        Numeric(22, 4),
+        default=0,
+        nullable=False,
+    )
+    reward_credits = Column(
+        Numeric(22, 4),
+        default=0,
+        nullable=False,
+    )
+    credits = Column(
+        Numeric(22, 4),
+        default=0,
+        nullable=False,
+    )
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
 class CreditAccount(BaseModel):
     """Credit account model with all fields."""
 
@@ -338,25 +386,7 @@ class CreditAccount(BaseModel):
         account = await cls.get_or_create_in_session(session, owner_type, owner_id)
 
         # expense
-        details = {}
-
-        amount_left = amount
-
-        if amount_left <= account.free_credits:
-            details[CreditType.FREE] = amount_left
-            amount_left = Decimal("0")
-        else:
-            if account.free_credits > 0:
-                details[CreditType.FREE] = account.free_credits
-                amount_left -= account.free_credits
-            if amount_left <= account.reward_credits:
-                details[CreditType.REWARD] = amount_left
-                amount_left = Decimal("0")
-            else:
-                if account.reward_credits > 0:
-                    details[CreditType.REWARD] = account.reward_credits
-                    amount_left -= account.reward_credits
-                details[CreditType.PERMANENT] = amount_left
+        details = account.split_expense(amount)
 
         # Create values dict based on what's in details, defaulting to 0 for missing keys
         values_dict = {
@@ -387,6 +417,35 @@ class CreditAccount(BaseModel):
             raise HTTPException(status_code=500, detail="Failed to expense credits")
         return cls.model_validate(res), details
 
+    def split_expense(self, amount: Decimal) -> Dict[CreditType, Decimal]:
+        """Split an expense over the credit types, free first, then reward, then permanent.
+
+        Args:
+            amount: The amount of credits to spend
+
+        Returns:
+            Dict[CreditType, Decimal]: Amount taken from each credit type
+        """
+        details = {}
+        amount_left = amount
+
+        if amount_left <= self.free_credits:
+            details[CreditType.FREE] = amount_left
+            amount_left = Decimal("0")
+        else:
+            if self.free_credits > 0:
+                details[CreditType.FREE] = self.free_credits
+                amount_left -= self.free_credits
+            if amount_left <= self.reward_credits:
+                details[CreditType.REWARD] = amount_left
+                amount_left = Decimal("0")
+            else:
+                if self.reward_credits > 0:
+                    details[CreditType.REWARD] = self.reward_credits
+                    amount_left -= self.reward_credits
+                details[CreditType.PERMANENT] = amount_left
+        return details
+
     def has_sufficient_credits(self, amount: Decimal) -> bool:
         """Check if the account has enough credits to cover the specified amount.
 
@@ -432,6 +491,175 @@ class CreditAccount(BaseModel):
             raise HTTPException(status_code=500, detail="Failed to income credits")
         return cls.model_validate(res)
 
+    @classmethod
+    async def change_in_session(
+        cls,
+        session: AsyncSession,
+        owner_type: OwnerType,
+        owner_id: str,
+        changes: Dict[CreditType, Decimal],
+        event_id: Optional[str] = None,
+    ) -> "CreditAccount":
+        """Apply signed changes of several credit types to an account in one UPDATE.
+
+        Positive amounts are income, negative amounts are expense. The account is
+        created only when the UPDATE finds no row, so existing accounts cost a
+        single round trip.
+
+        Args:
+            session: Async session to use for database operations
+            owner_type: Type of the owner
+            owner_id: ID of the owner
+            changes: Signed amount to add to each credit type
+            event_id: ID of the last event that modified this account
+
+        Returns:
+            CreditAccount: The updated account
+        """
+        now = datetime.now(timezone.utc)
+        values_dict = {}
+        for credit_type, amount in changes.items():
+            values_dict[credit_type.value] = (
+                getattr(CreditAccountTable, credit_type.value) + amount
+            )
+            if amount > 0:
+                values_dict["income_at"] = now
+            elif amount < 0:
+                values_dict["expense_at"] = now
+        if event_id:
+            values_dict["last_event_id"] = event_id
+
+        stmt = (
+            update(CreditAccountTable)
+            .where(
+                CreditAccountTable.owner_type == owner_type,
+                CreditAccountTable.owner_id == owner_id,
+            )
+            .values(values_dict)
+            .returning(CreditAccountTable)
+        )
+        res = await session.scalar(stmt)
+        if not res:
+            await cls.create_in_session(session, owner_type, owner_id)
+            res = await session.scalar(stmt)
+        if not res:
+            raise HTTPException(status_code=500, detail="Failed to change credits")
+        return cls.model_validate(res)
+
+    @staticmethod
+    def delta_row(
+        owner_id: str, changes: Dict[CreditType, Decimal], event_id: str
+    ) -> Dict[str, Any]:
+        """Build a credit_account_deltas row for a platform account.
+
+        Platform account ids are the same as their owner ids, so no lookup is
+        needed. Insert the rows with one multi-row INSERT.
+
+        Args:
+            owner_id: ID of the platform account
+            changes: Signed amount to add to each credit type
+            event_id: ID of the event causing the change
+
+        Returns:
+            Dict[str, Any]: Column values of the delta row
+        """
+        return {
+            "id": str(XID()),
+            "account_id": owner_id,
+            "event_id": event_id,
+            CreditType.FREE.value: changes.get(CreditType.FREE, Decimal("0")),
+            CreditType.REWARD.value: changes.get(CreditType.REWARD, Decimal("0")),
+            CreditType.PERMANENT.value: changes.get(CreditType.PERMANENT, Decimal("0")),
+        }
+
+    @classmethod
+    async def defer_change_in_session(
+        cls,
+        session: AsyncSession,
+        owner_id: str,
+        changes: Dict[CreditType, Decimal],
+        event_id: str,
+    ) -> str:
+        """Append a pending change to a platform account without locking its row.
+
+        Args:
+            session: Async session to use for database operations
+            owner_id: ID of the platform account
+            changes: Signed amount to add to each credit type
+            event_id: ID of the event causing the change
+
+        Returns:
+            str: The account id
+        """
+        await session.execute(
+            insert(CreditAccountDeltaTable),
+            [cls.delta_row(owner_id, changes, event_id)],
+        )
+        return owner_id
+
+    @classmethod
+    async def fold_deltas_in_session(
+        cls, session: AsyncSession, limit: int = 10000
+    ) -> int:
+        """Fold pending deltas into their platform account rows.
+
+        Deltas are deleted and applied in the same transaction, so a delta is
+        either pending or part of the balance, never both.
+
+        Args:
+            session: Async session to use for database operations
+            limit: Max number of deltas to fold in one call
+
+        Returns:
+            int: Number of folded deltas
+        """
+        pending = (
+            select(CreditAccountDeltaTable.id)
+            .order_by(CreditAccountDeltaTable.id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = await session.execute(
+            delete(CreditAccountDeltaTable)
+            .where(CreditAccountDeltaTable.id.in_(pending))
+            .returning(
+                CreditAccountDeltaTable.account_id,
+                CreditAccountDeltaTable.event_id,
+                CreditAccountDeltaTable.free_credits,
+                CreditAccountDeltaTable.reward_credits,
+                CreditAccountDeltaTable.credits,
+            )
+        )
+        rows = result.all()
+
+        changes: Dict[str, Dict[CreditType, Decimal]] = {}
+        last_event_ids: Dict[str, str] = {}
+        for row in rows:
+            account_changes = changes.setdefault(row.account_id, {})
+            for credit_type in (
+                CreditType.FREE,
+                CreditType.REWARD,
+                CreditType.PERMANENT,
+            ):
+                amount = getattr(row, credit_type.value)
+                if amount:
+                    account_changes[credit_type] = (
+                        account_changes.get(credit_type, Decimal("0")) + amount
+                    )
+            # event ids are XIDs, they sort by creation time
+            if row.event_id > last_event_ids.get(row.account_id, ""):
+                last_event_ids[row.account_id] = row.event_id
+
+        for account_id in sorted(changes):
+            await cls.change_in_session(
+                session,
+                owner_type=OwnerType.PLATFORM,
+                owner_id=account_id,
+                changes=changes[account_id],
+                event_id=last_event_ids[account_id],
+            )
+        return len(rows)
+
     @classmethod
     async def create_in_session(
         cls,
@@ -1116,6 +1344,47 @@ class CreditEvent(BaseModel):
                 detail=f"Transaction with upstream_tx_id '{upstream_tx_id}' already exists. Do not resubmit.",
             )
 
+    @classmethod
+    async def check_upstream_tx_ids_exist(
+        cls,
+        session: AsyncSession,
+        upstream_type: UpstreamType,
+        upstream_tx_ids: List[str],
+    ) -> None:
+        """
+        Batch version of check_upstream_tx_id_exists, one query for all ids.
+
+        Args:
+            session: Database session
+            upstream_type: Type of the upstream transaction
+            upstream_tx_ids: IDs of the upstream transactions
+
+        Raises:
+            HTTPException: If any of the upstream_tx_ids is repeated or already exists
+        """
+        seen = set()
+        for upstream_tx_id in upstream_tx_ids:
+            if upstream_tx_id in seen:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Transaction with upstream_tx_id '{upstream_tx_id}' is repeated in the batch.",
+                )
+            seen.add(upstream_tx_id)
+        stmt = (
+            select(CreditEventTable.upstream_tx_id)
+            .where(
+                CreditEventTable.upstream_type == upstream_type,
+                CreditEventTable.upstream_tx_id.in_(upstream_tx_ids),
+            )
+            .limit(1)
+        )
+        result = await session.scalar(stmt)
+        if result:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Transaction with upstream_tx_id '{result}' already exists. Do not resubmit.",
+            )
+
 
 class TransactionType(str, Enum):
     """Type of credit transaction."""
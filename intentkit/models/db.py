@@ -26,6 +26,9 @@ async def init_db(
     pool_size: Annotated[
         int, Field(default=3, description="Database connection pool size")
     ] = 3,
+    partition_months_ahead: Annotated[
+        int, Field(default=0, description="Months of partitions to create ahead")
+    ] = 0,
 ) -> None:
     """Initialize the database and handle schema updates.
 
@@ -37,6 +40,8 @@ async def init_db(
         port: Database port (default: 5432)
         auto_migrate: Whether to run migrations automatically (default: True)
         pool_size: Database connection pool size (default: 3)
+        partition_months_ahead: Partition chat and credit history by month with
+            partitions created this many months ahead, 0 to disable (default: 0)
     """
     global engine, _langgraph_checkpointer
     # Initialize psycopg pool and AsyncPostgresSaver if not already initialized
@@ -76,7 +81,7 @@ async def init_db(
                 connect_args={"check_same_thread": False},
             )
         if auto_migrate:
-            await safe_migrate(engine)
+            await safe_migrate(engine, partition_months_ahead)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -1,13 +1,28 @@
 """Database migration utilities."""
 
 import logging
-from typing import Callable
+import re
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Set, Tuple
 
 from intentkit.models.base import Base
-from sqlalchemy import Column, MetaData, inspect, text
+from sqlalchemy import Column, Index, MetaData, inspect, text
 
 logger = logging.getLogger(__name__)
 
+# Table -> timestamp column it is partitioned by month on PostgreSQL
+PARTITIONED_TABLES = {
+    "chat_messages": "created_at",
+    "credit_events": "created_at",
+    "credit_transactions": "created_at",
+}
+
+# Index -> the wider index replacing it, dropped once the replacement exists
+SUPERSEDED_INDEXES = {
+    "ix_chat_messages_agent_id_chat_id": "ix_chat_messages_agent_chat_created",
+    "ix_chat_messages_agent_id_author_type": "ix_chat_messages_agent_author_created",
+}
+
 
 async def add_column_if_not_exists(
     conn, dialect, table_name: str, column: Column
@@ -66,11 +81,389 @@ async def update_table_schema(conn, dialect, model_cls) -> None:
             await add_column_if_not_exists(conn, dialect, table_name, column)
 
 
-async def safe_migrate(engine) -> None:
+def _index_sql(
+    index: Index, table_name: str, partition_key: Optional[str] = None
+) -> str:
+    """CREATE INDEX statement of a model index.
+
+    A unique index on a partitioned table must contain the partition key,
+    unique indexes without it are created as plain indexes for lookups and
+    enforced by a guard table, see _create_unique_guard.
+    """
+    columns = [column.name for column in index.columns]
+    unique = index.unique and (partition_key is None or partition_key in columns)
+    return (
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {index.name} "
+        f"ON {table_name} ({', '.join(columns)})"
+    )
+
+
+def _needs_unique_guard(index: Index, partition_key: str) -> bool:
+    return index.unique and partition_key not in [c.name for c in index.columns]
+
+
+async def _create_unique_guard(
+    conn, table_name: str, index: Index, source: Optional[str] = None
+) -> None:
+    """Enforce a unique index of a partitioned table across all partitions.
+
+    The indexed values are kept in the unpartitioned {index}_guard table with
+    a primary key on them. A trigger inserts the values of every new row in
+    the same transaction, so a duplicate fails the insert like the unique
+    index did. As with a unique index, rows with a NULL value are not
+    checked. Rows are only inserted and deleted, updates of the indexed
+    columns are not tracked.
+
+    Args:
+        conn: SQLAlchemy conn, in a transaction
+        table_name: Partitioned table of the index
+        index: Unique index to enforce
+        source: Table holding the existing rows, table_name if not given
+    """
+    source = source or table_name
+    guard = f"{index.name}_guard"
+    # Hold off writes between filling the guard and creating the trigger
+    await conn.execute(text(f"LOCK TABLE {table_name} IN SHARE ROW EXCLUSIVE MODE"))
+    columns = [column.name for column in index.columns]
+    column_list = ", ".join(columns)
+    not_null = " AND ".join(f"{{row}}.{column} IS NOT NULL" for column in columns)
+
+    await conn.execute(
+        text(
+            f"CREATE TABLE {guard} AS SELECT {column_list} FROM {source} "
+            f"WHERE {not_null.format(row=source)}"
+        )
+    )
+    await conn.execute(text(f"ALTER TABLE {guard} ADD PRIMARY KEY ({column_list})"))
+    new_values = ", ".join(f"NEW.{column}" for column in columns)
+    old_match = " AND ".join(f"{column} = OLD.{column}" for column in columns)
+    await conn.execute(
+        text(
+            f"CREATE OR REPLACE FUNCTION {guard}_sync() RETURNS trigger AS $$\n"
+            "BEGIN\n"
+            "  IF TG_OP = 'INSERT' THEN\n"
+            f"    IF {not_null.format(row='NEW')} THEN\n"
+            f"      INSERT INTO {guard} ({column_list}) VALUES ({new_values});\n"
+            "    END IF;\n"
+            "  ELSE\n"
+            f"    DELETE FROM {guard} WHERE {old_match};\n"
+            "  END IF;\n"
+            "  RETURN NULL;\n"
+            "END\n"
+            "$$ LANGUAGE plpgsql"
+        )
+    )
+    await conn.execute(
+        text(
+            f"CREATE TRIGGER {guard} AFTER INSERT OR DELETE ON {table_name} "
+            f"FOR EACH ROW EXECUTE FUNCTION {guard}_sync()"
+        )
+    )
+    logger.info(f"Enforcing unique index {index.name} with table {guard}")
+
+
+async def get_partitioned_tables(conn) -> Set[str]:
+    """Names of the partitioned tables, always empty outside PostgreSQL."""
+    if conn.dialect.name != "postgresql":
+        return set()
+    result = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = current_schema()"
+        )
+    )
+    return set(result.scalars())
+
+
+async def _drop_index(
+    conn, name: str, concurrently: bool, partitioned: bool = False
+) -> None:
+    # Indexes of partitioned tables can not be dropped concurrently
+    concurrent = "CONCURRENTLY " if concurrently and not partitioned else ""
+    await conn.execute(text(f"DROP INDEX {concurrent}IF EXISTS {name}"))
+
+
+async def migrate_indexes(engine) -> None:
+    """Create model indexes missing on existing tables and drop superseded ones.
+
+    create_all only creates indexes together with their table. On PostgreSQL
+    indexes are built and dropped concurrently, so large tables stay writable,
+    except on partitioned tables which do not support it.
+    A failed index is logged and retried on the next start, an invalid index
+    left behind by a failed concurrent build is dropped and built again.
+    A superseded index is only dropped once its replacement is valid.
+
+    Args:
+        engine: SQLAlchemy engine
+    """
+    dialect = engine.dialect
+    concurrently = dialect.name == "postgresql"
+
+    def _get_indexes(connection):
+        inspector = inspect(connection)
+        return {
+            index["name"]
+            for table_name in inspector.get_table_names()
+            for index in inspector.get_indexes(table_name)
+        }
+
+    invalid = set()
+    async with engine.connect() as conn:
+        if concurrently:
+            # Unlike the inspector, pg_index also lists partitioned indexes
+            # and tells whether an index can be used
+            result = await conn.execute(
+                text(
+                    "SELECT c.relname, i.indisvalid FROM pg_index i "
+                    "JOIN pg_class c ON c.oid = i.indexrelid "
+                    "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                    "WHERE n.nspname = current_schema()"
+                )
+            )
+            existing = set()
+            for name, valid in result:
+                (existing if valid else invalid).add(name)
+        else:
+            existing = await conn.run_sync(_get_indexes)
+        partitioned = await get_partitioned_tables(conn)
+
+    # Concurrent index builds cannot run inside a transaction
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name in existing:
+                    continue
+                if index.name in invalid:
+                    try:
+                        await _drop_index(
+                            conn, index.name, concurrently, table.name in partitioned
+                        )
+                        logger.warning(f"Dropped invalid index {index.name}")
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to drop invalid index {index.name}: {str(e)}"
+                        )
+                        continue
+                if table.name in partitioned:
+                    key = PARTITIONED_TABLES[table.name]
+                    # The guard outlives an invalid index, only create it once
+                    if _needs_unique_guard(index, key) and index.name not in invalid:
+                        try:
+                            async with engine.begin() as guard_conn:
+                                await _create_unique_guard(
+                                    guard_conn, table.name, index
+                                )
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to create unique guard of {index.name}: "
+                                f"{str(e)}"
+                            )
+                            continue
+                    sql = _index_sql(index, table.name, key)
+                else:
+                    sql = _index_sql(index, table.name)
+                    if concurrently:
+                        sql = re.sub(
+                            r"^CREATE (UNIQUE )?INDEX",
+                            r"CREATE \1INDEX CONCURRENTLY",
+                            sql,
+                        )
+                try:
+                    await conn.execute(text(sql))
+                    existing.add(index.name)
+                    logger.info(f"Created index {index.name} on table {table.name}")
+                except Exception as e:
+                    logger.error(f"Failed to create index {index.name}: {str(e)}")
+
+        for name, replacement in SUPERSEDED_INDEXES.items():
+            if name not in existing | invalid or replacement not in existing:
+                continue
+            try:
+                await _drop_index(conn, name, concurrently)
+                logger.info(f"Dropped index {name}, superseded by {replacement}")
+            except Exception as e:
+                logger.error(f"Failed to drop index {name}: {str(e)}")
+
+
+def month_start(dt: datetime, months: int = 0) -> datetime:
+    """First instant of the month of dt in UTC, shifted by a number of months."""
+    dt = dt.astimezone(timezone.utc)
+    index = dt.year * 12 + dt.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def month_partition_name(table_name: str, start: datetime) -> str:
+    return f"{table_name}_p{start:%Y%m}"
+
+
+async def list_partitions(
+    conn, table_name: str
+) -> List[Tuple[str, Optional[datetime]]]:
+    """List the partitions of a table with their exclusive upper bound.
+
+    Returns:
+        (partition name, upper bound) sorted by upper bound, None for the
+        default partition
+    """
+    result = await conn.execute(
+        text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+            "FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "JOIN pg_namespace n ON n.oid = p.relnamespace "
+            "WHERE p.relname = :table AND n.nspname = current_schema()"
+        ),
+        {"table": table_name},
+    )
+    partitions = []
+    for name, bound in result:
+        match = re.search(r"TO \('([^']+)'\)", bound or "")
+        upper = datetime.fromisoformat(match.group(1)) if match else None
+        partitions.append((name, upper))
+    partitions.sort(key=lambda p: (p[1] is None, p[1] or datetime.min))
+    return partitions
+
+
+async def _convert_to_partitioned(conn, table_name: str, key: str) -> None:
+    """Turn a plain table into a table partitioned by month on key.
+
+    The existing table becomes the {table}_legacy partition holding everything
+    before next month, monthly partitions follow it. It runs in one
+    transaction: the table is locked while the new primary key and the
+    indexes missing on the legacy table are built, and while the range
+    constraint is validated. An empty table is simply replaced.
+    """
+    table = Base.metadata.tables[table_name]
+    legacy = f"{table_name}_legacy"
+    boundary = month_start(datetime.now(timezone.utc), 1)
+
+    await conn.execute(text(f"ALTER TABLE {table_name} RENAME TO {legacy}"))
+    # Index names are per schema, free them for the new table
+    result = await conn.execute(
+        text(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = :table"
+        ),
+        {"table": legacy},
+    )
+    for index_name in result.scalars().all():
+        await conn.execute(
+            text(f"ALTER INDEX {index_name} RENAME TO {index_name[:56]}_legacy")
+        )
+
+    await conn.execute(
+        text(
+            f"CREATE TABLE {table_name} (LIKE {legacy} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE ({key})"
+        )
+    )
+    await conn.execute(text(f"ALTER TABLE {table_name} ADD PRIMARY KEY (id, {key})"))
+    for index in table.indexes:
+        await conn.execute(text(_index_sql(index, table_name, key)))
+        if _needs_unique_guard(index, key):
+            # Filled from the legacy rows, which are unique already
+            await _create_unique_guard(conn, table_name, index, source=legacy)
+
+    has_rows = await conn.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {legacy})"))
+    if not has_rows:
+        await conn.execute(text(f"DROP TABLE {legacy}"))
+        logger.info(f"Partitioned empty table {table_name} by month")
+        return
+
+    # With the constraint in place attaching does not scan the table again
+    await conn.execute(
+        text(
+            f"ALTER TABLE {legacy} ADD CONSTRAINT {legacy}_range "
+            f"CHECK ({key} IS NOT NULL AND {key} < '{boundary.isoformat()}')"
+        )
+    )
+    await conn.execute(
+        text(
+            f"ALTER TABLE {table_name} ATTACH PARTITION {legacy} "
+            f"FOR VALUES FROM (MINVALUE) TO ('{boundary.isoformat()}')"
+        )
+    )
+    logger.info(
+        f"Partitioned table {table_name} by month, "
+        f"rows before {boundary:%Y-%m} are in {legacy}"
+    )
+
+
+async def create_month_partitions(conn, table_name: str, months_ahead: int) -> None:
+    """Create the monthly partitions of a table up to months_ahead months.
+
+    A default partition catches rows outside every month, so inserts never
+    fail when the maintenance job has not run in time.
+    """
+    now = datetime.now(timezone.utc)
+    partitions = await list_partitions(conn, table_name)
+    uppers = [upper for _, upper in partitions if upper is not None]
+    start = max(uppers) if uppers else month_start(now)
+    end = month_start(now, months_ahead + 1)
+    while start < end:
+        next_start = month_start(start, 1)
+        name = month_partition_name(table_name, start)
+        try:
+            # Savepoint, so a failed month keeps the transaction usable
+            async with conn.begin_nested():
+                await conn.execute(
+                    text(
+                        f"CREATE TABLE {name} PARTITION OF {table_name} "
+                        f"FOR VALUES FROM ('{start.isoformat()}') "
+                        f"TO ('{next_start.isoformat()}')"
+                    )
+                )
+            logger.info(f"Created partition {name}")
+        except Exception as e:
+            logger.error(f"Failed to create partition {name}: {str(e)}")
+            break
+        start = next_start
+    await conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {table_name}_default "
+            f"PARTITION OF {table_name} DEFAULT"
+        )
+    )
+
+
+async def partition_tables(engine, months_ahead: int) -> None:
+    """Partition PARTITIONED_TABLES by month and create upcoming partitions.
+
+    Only supported on PostgreSQL. Safe to run from several processes at once,
+    each table is handled under an advisory lock.
+
+    Args:
+        engine: SQLAlchemy engine
+        months_ahead: Number of future months to create partitions for
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    for table_name, key in PARTITIONED_TABLES.items():
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(
+                    text("SELECT pg_advisory_xact_lock(hashtext(:name))"),
+                    {"name": f"intentkit_partition_{table_name}"},
+                )
+                if table_name not in await get_partitioned_tables(conn):
+                    await _convert_to_partitioned(conn, table_name, key)
+                await create_month_partitions(conn, table_name, months_ahead)
+        except Exception as e:
+            logger.error(f"Error partitioning table {table_name}: {str(e)}")
+            raise
+
+
+async def safe_migrate(engine, partition_months_ahead: int = 0) -> None:
     """Safely migrate all SQLAlchemy models by adding new columns.
 
     Args:
         engine: SQLAlchemy engine
+        partition_months_ahead: Partition PARTITIONED_TABLES by month with
+            partitions created this many months ahead, 0 keeps them plain
     """
     logger.info("Starting database schema migration")
     dialect = engine.dialect
@@ -99,4 +492,8 @@ async def safe_migrate(engine) -> None:
             logger.error(f"Error updating database schema: {str(e)}")
             raise
 
+    await migrate_indexes(engine)
+    if partition_months_ahead > 0:
+        await partition_tables(engine, partition_months_ahead)
+
     logger.info("Database schema updated successfully")
@@ -1,5 +1,6 @@
 import json
 import logging
+from collections import OrderedDict
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
@@ -18,6 +19,12 @@ logger = logging.getLogger(__name__)
 
 _credit_per_usdc = None
 
+# Shared LLM clients, keyed by the LLM class and all of its parameters.
+# Agents with the same model and sampling parameters reuse one client and its
+# HTTP connection pool, instead of one pool per agent executor.
+_LLM_INSTANCE_CACHE_SIZE = 256
+_llm_instances: OrderedDict[tuple[str, str], LanguageModelLike] = OrderedDict()
+
 
 class LLMProvider(str, Enum):
     OPENAI = "openai"
@@ -573,15 +580,31 @@ class LLMModel(BaseModel):
         """Create and return the LLM instance based on the configuration."""
         raise NotImplementedError("Subclasses must implement create_instance")
 
+    async def get_instance(self, config: Any) -> LanguageModelLike:
+        """Get a shared LLM instance for this configuration.
+
+        Chat model clients are stateless between calls, so every agent with the
+        same provider, model, sampling parameters and model info shares one
+        instance and its connection pool. The instance is created on first use.
+        """
+        key = (type(self).__name__, self.model_dump_json())
+        instance = _llm_instances.get(key)
+        if instance is not None:
+            _llm_instances.move_to_end(key)
+            return instance
+        instance = await self.create_instance(config)
+        _llm_instances[key] = instance
+        if len(_llm_instances) > _LLM_INSTANCE_CACHE_SIZE:
+            _llm_instances.popitem(last=False)
+        return instance
+
     async def get_token_limit(self) -> int:
         """Get the token limit for this model."""
-        info = await self.model_info()
-        return info.context_length
+        return self.info.context_length
 
     async def calculate_cost(self, input_tokens: int, output_tokens: int) -> Decimal:
         """Calculate the cost for a given number of tokens."""
-        info = await self.model_info()
-        return await info.calculate_cost(input_tokens, output_tokens)
+        return await self.info.calculate_cost(input_tokens, output_tokens)
 
 
 class OpenAILLM(LLMModel):
@@ -591,7 +614,7 @@ class OpenAILLM(LLMModel):
         """Create and return a ChatOpenAI instance."""
         from langchain_openai import ChatOpenAI
 
-        info = await self.model_info()
+        info = self.info
 
         kwargs = {
             "model_name": self.model_name,
@@ -625,7 +648,7 @@ class DeepseekLLM(LLMModel):
 
         from langchain_deepseek import ChatDeepSeek
 
-        info = await self.model_info()
+        info = self.info
 
         kwargs = {
             "model": self.model_name,
@@ -658,7 +681,7 @@ class XAILLM(LLMModel):
 
         from langchain_xai import ChatXAI
 
-        info = await self.model_info()
+        info = self.info
 
         kwargs = {
             "model_name": self.model_name,
@@ -689,7 +712,7 @@ class EternalLLM(LLMModel):
         """Create and return a ChatOpenAI instance configured for Eternal AI."""
         from langchain_openai import ChatOpenAI
 
-        info = await self.model_info()
+        info = self.info
 
         # Override model name for Eternal AI
         actual_model = "unsloth/Llama-3.3-70B-Instruct-bnb-4bit"
@@ -721,7 +744,7 @@ class ReigentLLM(LLMModel):
         """Create and return a ChatOpenAI instance configured for Reigent."""
         from langchain_openai import ChatOpenAI
 
-        info = await self.model_info()
+        info = self.info
 
         kwargs = {
             "openai_api_key": config.reigent_api_key,
@@ -743,7 +766,7 @@ class VeniceLLM(LLMModel):
         """Create and return a ChatOpenAI instance configured for Venice."""
         from langchain_openai import ChatOpenAI
 
-        info = await self.model_info()
+        info = self.info
 
         kwargs = {
             "openai_api_key": config.venice_api_key,
@@ -754,6 +777,11 @@ class VeniceLLM(LLMModel):
         return ChatOpenAI(**kwargs)
 
 
+def shared_llm_instances() -> list[LanguageModelLike]:
+    """Get the LLM instances shared across agents, see LLMModel.get_instance."""
+    return list(_llm_instances.values())
+
+
 # Factory function to create the appropriate LLM model based on the model name
 async def create_llm_model(
     model_name: str,
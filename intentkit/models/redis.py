@@ -1,7 +1,8 @@
 """Redis client module for IntentKit."""
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 from redis.asyncio import Redis
 
@@ -10,6 +11,19 @@ logger = logging.getLogger(__name__)
 # Global Redis client instance
 _redis_client: Optional[Redis] = None
 
+# Agent change events, every process evicts its local agent caches on them
+AGENT_CHANGED_CHANNEL = "intentkit:agent:changed"
+# Payload telling subscribers to drop everything, sent when events may be lost
+ALL_AGENTS = "*"
+
+# Skill data change events, payload is the changed scope, like agent:<id>
+SKILL_DATA_CHANGED_CHANNEL = "intentkit:skill_data:changed"
+
+_agent_changed_handlers: list[Callable[[str], None]] = []
+_skill_data_changed_handlers: list[Callable[[str], None]] = []
+_agent_listener_task: Optional[asyncio.Task] = None
+_agent_listener_ready = False
+
 
 async def init_redis(
     host: str,
@@ -130,3 +144,145 @@ async def clean_heartbeat(redis_client: Redis, name: str) -> None:
         logger.info(f"Removed heartbeat for {name}")
     except Exception as e:
         logger.error(f"Failed to remove heartbeat for {name}: {e}")
+
+
+def on_agent_changed(handler: Callable[[str], None]) -> None:
+    """Register a handler called with the agent id when an agent changes.
+
+    The handler is called with ``ALL_AGENTS`` when every local cache must be
+    dropped, for example after the subscription reconnects.
+
+    Args:
+        handler: Synchronous callback, it must be cheap and must not raise
+    """
+    if handler not in _agent_changed_handlers:
+        _agent_changed_handlers.append(handler)
+
+
+def on_skill_data_changed(handler: Callable[[str], None]) -> None:
+    """Register a handler called with the scope when skill data changes.
+
+    Events share the agent changed subscription, the handler is called with
+    ``ALL_AGENTS`` when every local cache must be dropped.
+
+    Args:
+        handler: Synchronous callback, it must be cheap and must not raise
+    """
+    if handler not in _skill_data_changed_handlers:
+        _skill_data_changed_handlers.append(handler)
+
+
+def _dispatch(handlers: list[Callable[[str], None]], payload: str) -> None:
+    for handler in handlers:
+        try:
+            handler(payload)
+        except Exception as e:
+            logger.error(f"Change handler failed for {payload}: {e}")
+
+
+def _dispatch_agent_changed(agent_id: str) -> None:
+    _dispatch(_agent_changed_handlers, agent_id)
+
+
+async def publish_agent_changed(agent_id: str) -> None:
+    """Notify all processes that an agent config changed.
+
+    Local caches are evicted immediately, so the publishing process never
+    serves a stale agent. Other processes receive the event over Redis.
+
+    Args:
+        agent_id: ID of the changed agent
+    """
+    _dispatch_agent_changed(agent_id)
+    if _redis_client is None:
+        return
+    try:
+        await _redis_client.publish(AGENT_CHANGED_CHANNEL, agent_id)
+    except Exception as e:
+        logger.error(f"Failed to publish agent changed event for {agent_id}: {e}")
+
+
+async def publish_skill_data_changed(scope: str) -> None:
+    """Notify all processes that skill data of a scope changed.
+
+    Args:
+        scope: Changed scope, like agent:<id> or thread:<id>
+    """
+    _dispatch(_skill_data_changed_handlers, scope)
+    if _redis_client is None:
+        return
+    try:
+        await _redis_client.publish(SKILL_DATA_CHANGED_CHANNEL, scope)
+    except Exception as e:
+        logger.error(f"Failed to publish skill data changed event for {scope}: {e}")
+
+
+def agent_listener_ready() -> bool:
+    """Whether this process is currently subscribed to agent change events.
+
+    Local agent caches are only trustworthy while this is True, otherwise
+    callers must read the agent from the database.
+    """
+    return _agent_listener_ready
+
+
+async def _listen_agent_changed() -> None:
+    global _agent_listener_ready
+    retry_delay = 1
+    while True:
+        pubsub = _redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(AGENT_CHANGED_CHANNEL, SKILL_DATA_CHANGED_CHANNEL)
+            # Events published while we were not subscribed are lost
+            _dispatch_agent_changed(ALL_AGENTS)
+            _dispatch(_skill_data_changed_handlers, ALL_AGENTS)
+            _agent_listener_ready = True
+            retry_delay = 1
+            logger.info("Subscribed to agent changed events")
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                if message.get("channel") == SKILL_DATA_CHANGED_CHANNEL:
+                    _dispatch(_skill_data_changed_handlers, message["data"])
+                else:
+                    _dispatch_agent_changed(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Agent changed subscription lost: {e}")
+        finally:
+            _agent_listener_ready = False
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+        await asyncio.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, 30)
+
+
+def start_agent_listener() -> None:
+    """Start the background subscription to agent change events.
+
+    Call it once per process after ``init_redis``. Without Redis it does
+    nothing and local caches stay disabled.
+    """
+    global _agent_listener_task
+    if _redis_client is None:
+        logger.info("No redis, agent changed events are disabled")
+        return
+    if _agent_listener_task is not None and not _agent_listener_task.done():
+        return
+    _agent_listener_task = asyncio.create_task(_listen_agent_changed())
+
+
+async def stop_agent_listener() -> None:
+    """Stop the agent change subscription started by start_agent_listener."""
+    global _agent_listener_task
+    if _agent_listener_task is None:
+        return
+    _agent_listener_task.cancel()
+    try:
+        await _agent_listener_task
+    except asyncio.CancelledError:
+        pass
+    _agent_listener_task = None
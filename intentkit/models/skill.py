@@ -1,24 +1,132 @@
+import asyncio
+import copy
 import json
+import logging
+from collections import OrderedDict
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Annotated, Any, Dict, Optional
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
+from epyxid import XID
 from intentkit.models.base import Base
 from intentkit.models.db import get_session
-from intentkit.models.redis import get_redis
+from intentkit.models.redis import (
+    ALL_AGENTS,
+    agent_listener_ready,
+    get_redis,
+    on_skill_data_changed,
+    publish_skill_data_changed,
+)
 from pydantic import BaseModel, ConfigDict, Field
+from redis.exceptions import RedisError
 from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Index,
     Integer,
+    LargeBinary,
     Numeric,
     String,
     delete,
     func,
     select,
 )
-from sqlalchemy.dialects.postgresql import JSON, JSONB
+from sqlalchemy.dialects.postgresql import JSON, JSONB, insert
+
+logger = logging.getLogger(__name__)
+
+# Total skill data size allowed per agent
+MAX_AGENT_SKILL_DATA_SIZE = 10 * 1024 * 1024
+# Running total size per agent, recounted from the table when it expires
+SKILL_DATA_SIZE_KEY_PREFIX = "intentkit:skill_data_size:"
+SKILL_DATA_SIZE_TTL = 3600
+# Agents and threads whose skill data is kept in process
+SKILL_DATA_CACHE_SCOPES = 2000
+# Seconds a write-behind value waits before it is written
+SKILL_DATA_WRITE_BEHIND_DELAY = 5
+
+
+class SkillDataSizeError(Exception):
+    """Raised when skill data would exceed the per agent size limit."""
+
+
+_MISSING = object()
+# scope -> (skill, key) -> data, None for keys known to have no data.
+# Only used while this process receives skill data change events.
+_skill_data_cache: OrderedDict[str, Dict[Tuple[str, str], Any]] = OrderedDict()
+# Bumped on every change event, a read started before an event is not cached
+_skill_data_generation: Dict[str, int] = {}
+_skill_data_epoch = 0
+# (agent_id, skill, key) -> data waiting to be written
+_pending_writes: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+_write_behind_task: Optional[asyncio.Task] = None
+
+
+def _on_skill_data_changed(scope: str) -> None:
+    global _skill_data_epoch
+    if scope == ALL_AGENTS:
+        _skill_data_cache.clear()
+        _skill_data_generation.clear()
+        _skill_data_epoch += 1
+        return
+    _skill_data_cache.pop(scope, None)
+    _skill_data_generation[scope] = _skill_data_generation.get(scope, 0) + 1
+
+
+on_skill_data_changed(_on_skill_data_changed)
+
+
+def _cache_version(scope: str) -> Tuple[int, int]:
+    return _skill_data_epoch, _skill_data_generation.get(scope, 0)
+
+
+def _cache_get(scope: str, skill: str, key: str) -> Any:
+    """Cached copy of the data, _MISSING when it must be read."""
+    if not agent_listener_ready():
+        return _MISSING
+    entries = _skill_data_cache.get(scope)
+    if entries is None or (skill, key) not in entries:
+        return _MISSING
+    _skill_data_cache.move_to_end(scope)
+    return copy.deepcopy(entries[(skill, key)])
+
+
+def _cache_set(
+    scope: str, skill: str, key: str, data: Any, version: Tuple[int, int]
+) -> None:
+    """Cache data read at version, unless the scope changed since."""
+    if not agent_listener_ready() or _cache_version(scope) != version:
+        return
+    entries = _skill_data_cache.setdefault(scope, {})
+    entries[(skill, key)] = copy.deepcopy(data)
+    _skill_data_cache.move_to_end(scope)
+    while len(_skill_data_cache) > SKILL_DATA_CACHE_SCOPES:
+        _skill_data_cache.popitem(last=False)
+
+
+def _size_redis():
+    try:
+        return get_redis()
+    except RuntimeError:
+        return None
+
+
+async def _add_size(agent_id: str, delta: int) -> None:
+    """Add to the running size of an agent, if it is being counted."""
+    redis = _size_redis()
+    if not redis or not delta:
+        return
+    try:
+        await redis.eval(
+            "if redis.call('EXISTS', KEYS[1]) == 1 then "
+            "return redis.call('INCRBY', KEYS[1], ARGV[1]) end",
+            1,
+            f"{SKILL_DATA_SIZE_KEY_PREFIX}{agent_id}",
+            delta,
+        )
+    except RedisError as e:
+        logger.info(f"Redis error updating skill data size of {agent_id}: {e}")
 
 
 class AgentSkillDataTable(Base):
@@ -61,7 +169,7 @@ class AgentSkillDataCreate(BaseModel):
             AgentSkillData: The saved agent skill data instance
 
         Raises:
-            Exception: If the total size would exceed the 10MB limit
+            SkillDataSizeError: If the total size would exceed the 10MB limit
         """
         # Calculate the size of the data
         data_size = len(json.dumps(self.data).encode("utf-8"))
@@ -70,46 +178,54 @@ class AgentSkillDataCreate(BaseModel):
             # Check current total size for this agent
             current_total = await AgentSkillData.total_size(self.agent_id)
 
-            record = await db.scalar(
-                select(AgentSkillDataTable).where(
+            # Lock the row so the size delta stays exact under concurrent saves
+            old_size = await db.scalar(
+                select(AgentSkillDataTable.size)
+                .where(
                     AgentSkillDataTable.agent_id == self.agent_id,
                     AgentSkillDataTable.skill == self.skill,
                     AgentSkillDataTable.key == self.key,
                 )
+                .with_for_update()
             )
 
             # Calculate new total size
-            if record:
-                # Update existing record - subtract old size, add new size
-                new_total = current_total - record.size + data_size
-            else:
-                # Create new record - add new size
-                new_total = current_total + data_size
+            new_total = current_total - (old_size or 0) + data_size
 
-            # Check if new total would exceed limit (10MB = 10 * 1024 * 1024 bytes)
-            if new_total > 10 * 1024 * 1024:
-                raise Exception(
+            # Check if new total would exceed limit
+            if new_total > MAX_AGENT_SKILL_DATA_SIZE:
+                raise SkillDataSizeError(
                     f"Total size would exceed 10MB limit. Current: {current_total}, New: {new_total}"
                 )
 
-            if record:
-                # Update existing record
-                record.data = self.data
-                record.size = data_size
-            else:
-                # Create new record
-                record = AgentSkillDataTable(
-                    agent_id=self.agent_id,
-                    skill=self.skill,
-                    key=self.key,
-                    data=self.data,
-                    size=data_size,
-                )
-
-            db.add(record)
+            stmt = insert(AgentSkillDataTable).values(
+                agent_id=self.agent_id,
+                skill=self.skill,
+                key=self.key,
+                data=self.data,
+                size=data_size,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    AgentSkillDataTable.agent_id,
+                    AgentSkillDataTable.skill,
+                    AgentSkillDataTable.key,
+                ],
+                set_={
+                    "data": stmt.excluded.data,
+                    "size": stmt.excluded.size,
+                    "updated_at": datetime.now(timezone.utc),
+                },
+            ).returning(AgentSkillDataTable)
+            record = (await db.scalars(stmt)).one()
+            result = AgentSkillData.model_validate(record)
             await db.commit()
-            await db.refresh(record)
-            return AgentSkillData.model_validate(record)
+
+        await _add_size(self.agent_id, data_size - (old_size or 0))
+        scope = f"agent:{self.agent_id}"
+        await publish_skill_data_changed(scope)
+        _cache_set(scope, self.skill, self.key, self.data, _cache_version(scope))
+        return result
 
 
 class AgentSkillData(AgentSkillDataCreate):
@@ -136,19 +252,38 @@ class AgentSkillData(AgentSkillDataCreate):
     async def total_size(cls, agent_id: str) -> int:
         """Calculate the total size of all skill data for an agent.
 
+        The total is counted once and then kept up to date in Redis.
+
         Args:
             agent_id: ID of the agent
 
         Returns:
             int: Total size in bytes of all skill data for the agent
         """
+        redis = _size_redis()
+        size_key = f"{SKILL_DATA_SIZE_KEY_PREFIX}{agent_id}"
+        if redis:
+            try:
+                cached = await redis.get(size_key)
+                if cached is not None:
+                    return int(cached)
+            except RedisError as e:
+                logger.info(f"Redis error reading skill data size of {agent_id}: {e}")
+                redis = None
+
         async with get_session() as db:
             result = await db.scalar(
                 select(func.coalesce(func.sum(AgentSkillDataTable.size), 0)).where(
                     AgentSkillDataTable.agent_id == agent_id
                 )
             )
-            return result or 0
+        total = result or 0
+        if redis:
+            try:
+                await redis.set(size_key, total, ex=SKILL_DATA_SIZE_TTL, nx=True)
+            except RedisError as e:
+                logger.info(f"Redis error saving skill data size of {agent_id}: {e}")
+        return total
 
     @classmethod
     async def get(cls, agent_id: str, skill: str, key: str) -> Optional[dict]:
@@ -162,15 +297,25 @@ class AgentSkillData(AgentSkillDataCreate):
         Returns:
             Dictionary containing the skill data if found, None otherwise
         """
+        pending = _pending_writes.get((agent_id, skill, key))
+        if pending is not None:
+            return copy.deepcopy(pending)
+        scope = f"agent:{agent_id}"
+        cached = _cache_get(scope, skill, key)
+        if cached is not _MISSING:
+            return cached
+
+        version = _cache_version(scope)
         async with get_session() as db:
             result = await db.scalar(
-                select(AgentSkillDataTable).where(
+                select(AgentSkillDataTable.data).where(
                     AgentSkillDataTable.agent_id == agent_id,
                     AgentSkillDataTable.skill == skill,
                     AgentSkillDataTable.key == key,
                 )
             )
-            return result.data if result else None
+        _cache_set(scope, skill, key, result, version)
+        return result
 
     @classmethod
     async def delete(cls, agent_id: str, skill: str, key: str) -> None:
@@ -181,15 +326,73 @@ class AgentSkillData(AgentSkillDataCreate):
             skill: Name of the skill
             key: Data key
         """
+        _pending_writes.pop((agent_id, skill, key), None)
         async with get_session() as db:
-            await db.execute(
-                delete(AgentSkillDataTable).where(
+            deleted_size = await db.scalar(
+                delete(AgentSkillDataTable)
+                .where(
                     AgentSkillDataTable.agent_id == agent_id,
                     AgentSkillDataTable.skill == skill,
                     AgentSkillDataTable.key == key,
                 )
+                .returning(AgentSkillDataTable.size)
             )
             await db.commit()
+        await _add_size(agent_id, -(deleted_size or 0))
+        await publish_skill_data_changed(f"agent:{agent_id}")
+
+    @classmethod
+    async def save_later(
+        cls, agent_id: str, skill: str, key: str, data: Dict[str, Any]
+    ) -> None:
+        """Save skill data after a short delay, coalescing repeated writes.
+
+        For hot keys like polling cursors, which are saved on every run.
+        Reads in this process see the new value at once, other processes
+        see it once it is written, and a crash loses it. A failed write is
+        retried after the next delay.
+
+        Args:
+            agent_id: ID of the agent
+            skill: Name of the skill
+            key: Data key
+            data: JSON data to store
+        """
+        global _write_behind_task
+        _pending_writes[(agent_id, skill, key)] = copy.deepcopy(data)
+        if _write_behind_task is None or _write_behind_task.done():
+            _write_behind_task = asyncio.create_task(cls._write_behind())
+
+    @classmethod
+    async def _write_behind(cls) -> None:
+        while _pending_writes:
+            await asyncio.sleep(SKILL_DATA_WRITE_BEHIND_DELAY)
+            await cls.flush_pending()
+
+    @classmethod
+    async def flush_pending(cls) -> None:
+        """Write all pending write-behind data, call on shutdown.
+
+        Values failing on a retryable error, like a lost connection, stay
+        pending. Values that can never be written, like those over the size
+        limit, are dropped.
+        """
+        for (agent_id, skill, key), data in list(_pending_writes.items()):
+            try:
+                await AgentSkillDataCreate(
+                    agent_id=agent_id, skill=skill, key=key, data=data
+                ).save()
+            except (SkillDataSizeError, TypeError, ValueError) as e:
+                logger.error(f"Dropped skill data {skill}/{key} of {agent_id}: {e}")
+            except Exception as e:
+                logger.warning(
+                    f"Failed to write skill data {skill}/{key} of {agent_id}, "
+                    f"will retry: {e}"
+                )
+                continue
+            # A newer value saved meanwhile stays pending
+            if _pending_writes.get((agent_id, skill, key)) is data:
+                del _pending_writes[(agent_id, skill, key)]
 
     @classmethod
     async def clean_data(cls, agent_id: str):
@@ -204,6 +407,169 @@ class AgentSkillData(AgentSkillDataCreate):
                     AgentSkillDataTable.agent_id == agent_id
                 )
             )
+            await db.execute(
+                delete(AgentSkillBlobTable).where(
+                    AgentSkillBlobTable.agent_id == agent_id
+                )
+            )
+            await db.commit()
+        for pending_key in [k for k in _pending_writes if k[0] == agent_id]:
+            del _pending_writes[pending_key]
+        redis = _size_redis()
+        if redis:
+            try:
+                await redis.delete(f"{SKILL_DATA_SIZE_KEY_PREFIX}{agent_id}")
+            except RedisError as e:
+                logger.info(f"Redis error removing skill data size of {agent_id}: {e}")
+        await publish_skill_data_changed(f"agent:{agent_id}")
+
+
+class AgentSkillBlobTable(Base):
+    """Database table model for binary skill data of agents.
+
+    A key holds a list of immutable blobs, new content is appended as a new
+    blob instead of rewriting the existing ones.
+    """
+
+    __tablename__ = "agent_skill_blobs"
+    __table_args__ = (
+        Index("ix_agent_skill_blobs_agent_skill_key", "agent_id", "skill", "key"),
+    )
+
+    id = Column(String, primary_key=True)
+    agent_id = Column(String, nullable=False)
+    skill = Column(String, nullable=False)
+    key = Column(String, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    size = Column(Integer, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
+class AgentSkillBlob(BaseModel):
+    """Metadata of a binary skill data blob, the content is loaded separately."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: Annotated[str, Field(description="ID of the blob, sortable by time")]
+    agent_id: Annotated[str, Field(description="ID of the agent this blob belongs to")]
+    skill: Annotated[str, Field(description="Name of the skill this blob is for")]
+    key: Annotated[str, Field(description="Key the blob is stored under")]
+    size: Annotated[int, Field(description="Size of the blob in bytes")]
+    created_at: Annotated[
+        datetime, Field(description="Timestamp when this blob was created")
+    ]
+
+    @classmethod
+    async def append(cls, agent_id: str, skill: str, key: str, data: bytes) -> str:
+        """Append a blob to a key.
+
+        Returns:
+            str: ID of the new blob
+        """
+        blob_id = str(XID())
+        async with get_session() as db:
+            db.add(
+                AgentSkillBlobTable(
+                    id=blob_id,
+                    agent_id=agent_id,
+                    skill=skill,
+                    key=key,
+                    data=data,
+                    size=len(data),
+                )
+            )
+            await db.commit()
+        return blob_id
+
+    @classmethod
+    async def list(cls, agent_id: str, skill: str, key: str) -> List["AgentSkillBlob"]:
+        """List the blobs of a key in append order, without their content."""
+        async with get_session() as db:
+            rows = await db.execute(
+                select(
+                    AgentSkillBlobTable.id,
+                    AgentSkillBlobTable.agent_id,
+                    AgentSkillBlobTable.skill,
+                    AgentSkillBlobTable.key,
+                    AgentSkillBlobTable.size,
+                    AgentSkillBlobTable.created_at,
+                )
+                .where(
+                    AgentSkillBlobTable.agent_id == agent_id,
+                    AgentSkillBlobTable.skill == skill,
+                    AgentSkillBlobTable.key == key,
+                )
+                .order_by(AgentSkillBlobTable.id)
+            )
+            return [cls.model_validate(row) for row in rows]
+
+    @classmethod
+    async def get_data(cls, ids: List[str]) -> Dict[str, bytes]:
+        """Load the content of blobs by ID."""
+        if not ids:
+            return {}
+        async with get_session() as db:
+            rows = await db.execute(
+                select(AgentSkillBlobTable.id, AgentSkillBlobTable.data).where(
+                    AgentSkillBlobTable.id.in_(ids)
+                )
+            )
+            return {row.id: row.data for row in rows}
+
+    @classmethod
+    async def replace(
+        cls, agent_id: str, skill: str, key: str, data: bytes, replaced: List[str]
+    ) -> Optional[str]:
+        """Replace some blobs of a key by one blob, used to compact appends.
+
+        Blobs appended after ``replaced`` was listed are kept.
+
+        Returns:
+            Optional[str]: ID of the new blob, None if some of the replaced
+                blobs were already gone and nothing was changed
+        """
+        blob_id = str(XID())
+        async with get_session() as db:
+            result = await db.execute(
+                delete(AgentSkillBlobTable).where(
+                    AgentSkillBlobTable.agent_id == agent_id,
+                    AgentSkillBlobTable.skill == skill,
+                    AgentSkillBlobTable.key == key,
+                    AgentSkillBlobTable.id.in_(replaced),
+                )
+            )
+            if result.rowcount != len(replaced):
+                # Another process compacted or deleted these blobs meanwhile
+                await db.rollback()
+                return None
+            db.add(
+                AgentSkillBlobTable(
+                    id=blob_id,
+                    agent_id=agent_id,
+                    skill=skill,
+                    key=key,
+                    data=data,
+                    size=len(data),
+                )
+            )
+            await db.commit()
+        return blob_id
+
+    @classmethod
+    async def delete(cls, agent_id: str, skill: str, key: str) -> None:
+        """Delete all blobs of a key."""
+        async with get_session() as db:
+            await db.execute(
+                delete(AgentSkillBlobTable).where(
+                    AgentSkillBlobTable.agent_id == agent_id,
+                    AgentSkillBlobTable.skill == skill,
+                    AgentSkillBlobTable.key == key,
+                )
+            )
             await db.commit()
 
 
@@ -268,7 +634,12 @@ class ThreadSkillDataCreate(BaseModel):
             db.add(record)
             await db.commit()
             await db.refresh(record)
-            return ThreadSkillData.model_validate(record)
+            result = ThreadSkillData.model_validate(record)
+
+        scope = f"thread:{self.thread_id}"
+        await publish_skill_data_changed(scope)
+        _cache_set(scope, self.skill, self.key, self.data, _cache_version(scope))
+        return result
 
 
 class ThreadSkillData(ThreadSkillDataCreate):
@@ -303,15 +674,22 @@ class ThreadSkillData(ThreadSkillDataCreate):
         Returns:
             Dictionary containing the skill data if found, None otherwise
         """
+        scope = f"thread:{thread_id}"
+        cached = _cache_get(scope, skill, key)
+        if cached is not _MISSING:
+            return cached
+
+        version = _cache_version(scope)
         async with get_session() as db:
-            record = await db.scalar(
-                select(ThreadSkillDataTable).where(
+            result = await db.scalar(
+                select(ThreadSkillDataTable.data).where(
                     ThreadSkillDataTable.thread_id == thread_id,
                     ThreadSkillDataTable.skill == skill,
                     ThreadSkillDataTable.key == key,
                 )
             )
-        return record.data if record else None
+        _cache_set(scope, skill, key, result, version)
+        return result
 
     @classmethod
     async def clean_data(
@@ -347,6 +725,10 @@ class ThreadSkillData(ThreadSkillDataCreate):
                     )
                 )
             await db.commit()
+        # Thread scopes are not indexed by agent, all of them are dropped
+        await publish_skill_data_changed(
+            f"thread:{thread_id}" if thread_id else ALL_AGENTS
+        )
 
 
 class SkillTable(Base):
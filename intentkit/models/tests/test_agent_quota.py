@@ -0,0 +1,80 @@
+"""Tests for the Redis quota counters, on SQLite and fakeredis."""
+
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from fakeredis import FakeAsyncRedis
+from intentkit.models import db
+from intentkit.models import redis as redis_module
+from intentkit.models.agent_data import AgentQuota, AgentQuotaTable
+
+
+class TestAgentQuotaCounters(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        db.engine = None
+        await db.init_db(None, None, None, None, "5432", True)
+        redis_module._redis_client = FakeAsyncRedis(decode_responses=True)
+        self.addAsyncCleanup(db.engine.dispose)
+        self.addCleanup(setattr, redis_module, "_redis_client", None)
+
+    async def add_row(self, updated_at: datetime) -> None:
+        async with db.get_session() as session:
+            session.add(
+                AgentQuotaTable(
+                    id="agent",
+                    message_count_total=50,
+                    message_count_daily=7,
+                    message_count_monthly=20,
+                    free_income_daily=Decimal("3.5"),
+                    updated_at=updated_at,
+                )
+            )
+            await session.commit()
+
+    async def stored(self) -> AgentQuotaTable:
+        async with db.get_session() as session:
+            return await session.get(AgentQuotaTable, "agent")
+
+    async def test_increment_seeds_new_bucket_from_row(self):
+        await self.add_row(datetime.now(timezone.utc))
+
+        async with db.get_session() as session:
+            await AgentQuota.add_free_income_in_session(
+                session, "agent", Decimal("1.25")
+            )
+        quota = await AgentQuota.get("agent")
+
+        self.assertEqual(quota.free_income_daily, Decimal("4.75"))
+        self.assertEqual(quota.message_count_daily, 7)
+        self.assertEqual(quota.message_count_monthly, 20)
+
+    async def test_row_from_an_earlier_period_is_not_seeded(self):
+        await self.add_row(datetime(2000, 1, 1, tzinfo=timezone.utc))
+
+        quota = await AgentQuota.get("agent")
+        await quota.add_message()
+        quota = await AgentQuota.get("agent")
+
+        self.assertEqual(quota.message_count_daily, 1)
+        self.assertEqual(quota.message_count_monthly, 1)
+        self.assertEqual(quota.message_count_total, 51)
+
+    async def test_flush_adds_totals_and_keeps_period_counts(self):
+        await self.add_row(datetime.now(timezone.utc))
+
+        quota = await AgentQuota.get("agent")
+        await quota.add_message()
+        await quota.add_message()
+        flushed = await AgentQuota.flush_counters()
+        row = await self.stored()
+
+        self.assertEqual(flushed, 1)
+        self.assertEqual(row.message_count_total, 52)
+        self.assertEqual(row.message_count_daily, 9)
+        self.assertEqual(row.message_count_monthly, 22)
+        self.assertEqual(await AgentQuota.flush_counters(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
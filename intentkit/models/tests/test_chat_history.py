@@ -0,0 +1,106 @@
+"""Tests for keyset paginated chat history, on SQLite."""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from intentkit.models import db
+from intentkit.models.chat import AuthorType, ChatMessage, ChatMessageTable
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class TestChatMessageHistory(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        db.engine = None
+        await db.init_db(None, None, None, None, "5432", True)
+        self.addAsyncCleanup(db.engine.dispose)
+
+        # Pairs of messages share a creation time, ordered by id among them
+        rows = [
+            self.row(f"m{i:02d}", START + timedelta(minutes=i // 2)) for i in range(9)
+        ]
+        rows.append(self.row("other-chat", START, chat_id="c2"))
+        rows.append(self.row("other-agent", START, agent_id="a2"))
+        rows.append(self.row("reply", START, author_type=AuthorType.AGENT))
+        async with db.get_session() as session:
+            session.add_all(rows)
+            await session.commit()
+
+    @staticmethod
+    def row(
+        id: str,
+        created_at: datetime,
+        agent_id: str = "a1",
+        chat_id: str = "c1",
+        author_type: AuthorType = AuthorType.WEB,
+    ) -> ChatMessageTable:
+        return ChatMessageTable(
+            id=id,
+            agent_id=agent_id,
+            chat_id=chat_id,
+            author_id="u1",
+            author_type=author_type,
+            message=f"message {id}",
+            attachments=[{"type": "link", "url": "https://example.com"}],
+            skill_calls=[{"name": "skill", "parameters": {}, "success": True}],
+            created_at=created_at,
+        )
+
+    async def pages(self, limit: int, **kwargs) -> list[list[str]]:
+        pages = []
+        cursor = None
+        async with db.get_session() as session:
+            while True:
+                page = await ChatMessage.history(
+                    session, "a1", cursor=cursor, limit=limit, **kwargs
+                )
+                if not page:
+                    return pages
+                pages.append([message.id for message in page])
+                cursor = page[-1].id
+
+    async def test_pages_cover_every_message_once_newest_first(self):
+        pages = await self.pages(3, chat_id="c1", author_type=AuthorType.WEB)
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 3])
+        self.assertEqual(
+            [id for page in pages for id in page],
+            [f"m{i:02d}" for i in range(8, -1, -1)],
+        )
+
+    async def test_filters_select_chat_and_author_type(self):
+        ids = [id for page in await self.pages(5) for id in page]
+        self.assertEqual(len(ids), 11)
+        self.assertNotIn("other-agent", ids)
+
+        ids = [id for page in await self.pages(5, chat_id="c2") for id in page]
+        self.assertEqual(ids, ["other-chat"])
+
+        ids = [
+            id
+            for page in await self.pages(5, author_type=AuthorType.AGENT)
+            for id in page
+        ]
+        self.assertEqual(ids, ["reply"])
+
+    async def test_details_are_left_out_on_request(self):
+        async with db.get_session() as session:
+            (message,) = await ChatMessage.history(
+                session, "a1", chat_id="c2", include_details=False
+            )
+            (detailed,) = await ChatMessage.history(session, "a1", chat_id="c2")
+
+        self.assertIsNone(message.attachments)
+        self.assertIsNone(message.skill_calls)
+        self.assertEqual(message.message, "message other-chat")
+        self.assertEqual(len(detailed.attachments), 1)
+        self.assertEqual(len(detailed.skill_calls), 1)
+
+    async def test_unknown_cursor_is_rejected(self):
+        async with db.get_session() as session:
+            with self.assertRaises(ValueError):
+                await ChatMessage.history(session, "a1", cursor="missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
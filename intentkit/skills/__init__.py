@@ -4,9 +4,10 @@ import pkgutil
 # Get the directory containing this __init__.py file
 package_dir = os.path.dirname(__file__)
 
-# Discover all modules in the skills directory
+# Discover all skill category packages in the skills directory, helper
+# modules like base and cache are not categories
 __all__ = [
     name
-    for _, name, _ in pkgutil.iter_modules([package_dir])
-    if not name.startswith("_") and not name == "base"
+    for _, name, is_pkg in pkgutil.iter_modules([package_dir])
+    if is_pkg and not name.startswith("_")
 ]
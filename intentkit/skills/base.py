@@ -2,6 +2,7 @@ import asyncio
 import logging
 from typing import Any, Callable, Dict, Literal, NotRequired, Optional, TypedDict, Union
 
+import httpx
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
 from langchain_core.tools.base import ToolException
@@ -11,13 +12,16 @@ from pydantic import (
     ValidationError,
 )
 from pydantic.v1 import ValidationError as ValidationErrorV1
-from redis.exceptions import RedisError
 
 from intentkit.abstracts.graph import AgentContext
 from intentkit.abstracts.skill import SkillStoreABC
 from intentkit.models.agent import Agent
-from intentkit.models.redis import get_redis
-from intentkit.utils.error import RateLimitExceeded
+from intentkit.utils.http_client import get_http_client
+from intentkit.utils.rate_limit import (
+    RateLimitStatus,
+    check_rate_limit,
+    rate_limit_key,
+)
 
 SkillState = Literal["disabled", "public", "private"]
 SkillOwnerState = Literal["disabled", "private"]
@@ -84,14 +88,31 @@ class IntentKitSkill(BaseTool):
     # Logger for the class
     logger: logging.Logger = logging.getLogger(__name__)
 
+    response_cache_ttl: int = 0
+    """Seconds to cache read-only upstream responses of this tool, 0 disables it."""
+
     @property
     def category(self) -> str:
         """Get the category of the skill."""
         raise NotImplementedError
 
+    def http_client(self, upstream: Optional[str] = None) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for an upstream.
+
+        The client keeps connections alive across calls and retries failed
+        requests, do not close it or use it as a context manager.
+
+        Args:
+            upstream: Upstream name, defaults to the skill category
+
+        Returns:
+            httpx.AsyncClient: Shared client for the upstream
+        """
+        return get_http_client(upstream or self.category)
+
     async def user_rate_limit(
         self, user_id: str, limit: int, minutes: int, key: str
-    ) -> None:
+    ) -> Optional[RateLimitStatus]:
         """Check if a user has exceeded the rate limit for this skill.
 
         Args:
@@ -104,45 +125,41 @@ class IntentKitSkill(BaseTool):
             RateLimitExceeded: If the user has exceeded the rate limit
 
         Returns:
-            None: Always returns None if no exception is raised
+            Optional[RateLimitStatus]: The headroom left, None for users without ID
         """
         if not user_id:
             return None  # No rate limiting for users without ID
 
-        try:
-            redis = get_redis()
-            # Create a unique key for this rate limit and user
-            rate_limit_key = f"rate_limit:{key}:{user_id}"
-
-            # Get the current count
-            count = await redis.incr(rate_limit_key)
-
-            # Set expiration if this is the first request
-            if count == 1:
-                await redis.expire(
-                    rate_limit_key, minutes * 60
-                )  # Convert minutes to seconds
-
-            # Check if user has exceeded the limit
-            if count > limit:
-                raise RateLimitExceeded(f"Rate limit exceeded for {key}")
-
-            return None
-
-        except RuntimeError:
-            # Redis client not initialized, log and allow the request
-            self.logger.info(f"Redis not initialized, skipping rate limit for {key}")
-            return None
-        except RedisError as e:
-            # Redis error, log and allow the request
-            self.logger.info(
-                f"Redis error in rate limiting: {e}, skipping rate limit for {key}"
-            )
-            return None
+        return await check_rate_limit(
+            rate_limit_key("user", user_id, key),
+            limit,
+            minutes * 60,
+            message=f"Rate limit exceeded for {key}",
+        )
+
+    async def agent_rate_limit(
+        self, agent_id: str, limit: int, minutes: int
+    ) -> RateLimitStatus:
+        """Check if an agent has exceeded the rate limit for this skill.
+
+        Args:
+            agent_id: The ID of the agent to check
+            limit: Maximum number of requests allowed
+            minutes: Time window in minutes
+
+        Raises:
+            RateLimitExceeded: If the agent has exceeded the rate limit
+
+        Returns:
+            RateLimitStatus: The headroom left
+        """
+        return await check_rate_limit(
+            rate_limit_key("agent", agent_id, self.name), limit, minutes * 60
+        )
 
     async def user_rate_limit_by_skill(
         self, user_id: str, limit: int, minutes: int
-    ) -> None:
+    ) -> Optional[RateLimitStatus]:
         """Check if a user has exceeded the rate limit for this specific skill.
 
         This uses the skill name as the rate limit key.
@@ -159,7 +176,7 @@ class IntentKitSkill(BaseTool):
 
     async def user_rate_limit_by_category(
         self, user_id: str, limit: int, minutes: int
-    ) -> None:
+    ) -> Optional[RateLimitStatus]:
         """Check if a user has exceeded the rate limit for this skill category.
 
         This uses the skill category as the rate limit key, which means the limit
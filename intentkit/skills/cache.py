@@ -0,0 +1,237 @@
+"""Response cache for read-only upstream calls made by skills.
+
+Identical market data queries are sent by many agents, so results are cached
+in two levels: an in-process LRU and Redis shared by all processes.
+Concurrent identical calls are coalesced into one upstream request, and an
+expired entry is still served for one more TTL while it is refreshed in the
+background.
+
+Results are cached as JSON, so every caller gets its own copy and only
+JSON serializable results are cached.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from intentkit.models.redis import get_redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "intentkit:skill_cache:"
+# Max entries kept in process
+LOCAL_CACHE_SIZE = 2000
+
+# key -> (json value, fresh until, stale until), times are unix seconds
+_local: OrderedDict[str, Tuple[str, float, float]] = OrderedDict()
+# key -> pending load shared by concurrent callers
+_inflight: Dict[str, asyncio.Future] = {}
+# Background refresh tasks, referenced so they are not garbage collected
+_refreshing: Dict[str, asyncio.Task] = {}
+
+
+def default_cacheable(result: Any) -> bool:
+    """Results that are errors must not be cached."""
+    if result is None:
+        return False
+    if isinstance(result, dict) and "error" in result:
+        return False
+    return True
+
+
+def _cache_key(namespace: str, parts: Any) -> str:
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    digest = hashlib.sha256(raw.encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}{namespace}:{digest}"
+
+
+def _set_local(key: str, raw: str, fresh_until: float, stale_until: float) -> None:
+    _local[key] = (raw, fresh_until, stale_until)
+    _local.move_to_end(key)
+    while len(_local) > LOCAL_CACHE_SIZE:
+        _local.popitem(last=False)
+
+
+async def _get_remote(key: str) -> Optional[Tuple[str, float, float]]:
+    try:
+        data = await get_redis().get(key)
+    except RuntimeError:
+        # Redis not initialized, local cache only
+        return None
+    except RedisError as e:
+        logger.info(f"Redis error reading skill cache {key}: {e}")
+        return None
+    if not data:
+        return None
+    try:
+        entry = json.loads(data)
+        return entry["v"], entry["f"], entry["s"]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+async def _set_remote(key: str, raw: str, fresh_until: float, stale_until: float):
+    ttl = int(stale_until - time.time()) + 1
+    data = json.dumps({"v": raw, "f": fresh_until, "s": stale_until})
+    try:
+        await get_redis().set(key, data, ex=ttl)
+    except RuntimeError:
+        pass
+    except RedisError as e:
+        logger.info(f"Redis error writing skill cache {key}: {e}")
+
+
+async def _fetch(
+    key: str,
+    fetch: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+    cacheable: Callable[[Any], bool],
+) -> str:
+    """Call upstream and store a cacheable result in both levels."""
+    result = await fetch()
+    raw = json.dumps(result)
+    if cacheable(result):
+        now = time.time()
+        _set_local(key, raw, now + ttl, now + ttl + stale_ttl)
+        await _set_remote(key, raw, now + ttl, now + ttl + stale_ttl)
+    return raw
+
+
+def _refresh(
+    key: str,
+    fetch: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+    cacheable: Callable[[Any], bool],
+) -> None:
+    """Refresh a stale entry in the background, at most once per key."""
+    # Not skipped for a key in _inflight, _load refreshes stale Redis entries
+    if key in _refreshing:
+        return
+
+    async def run():
+        try:
+            await _fetch(key, fetch, ttl, stale_ttl, cacheable)
+        except Exception as e:
+            logger.info(f"Background refresh of skill cache {key} failed: {e}")
+        finally:
+            _refreshing.pop(key, None)
+
+    _refreshing[key] = asyncio.create_task(run())
+
+
+async def _load(
+    key: str,
+    fetch: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+    cacheable: Callable[[Any], bool],
+) -> str:
+    """Read through Redis, then upstream."""
+    entry = await _get_remote(key)
+    if entry:
+        raw, fresh_until, stale_until = entry
+        now = time.time()
+        if now < stale_until:
+            _set_local(key, raw, fresh_until, stale_until)
+            if now >= fresh_until:
+                _refresh(key, fetch, ttl, stale_ttl, cacheable)
+            return raw
+    return await _fetch(key, fetch, ttl, stale_ttl, cacheable)
+
+
+async def cached_call(
+    namespace: str,
+    parts: Any,
+    fetch: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: Optional[int] = None,
+    cacheable: Callable[[Any], bool] = default_cacheable,
+) -> Any:
+    """Return a cached result, calling upstream only when needed.
+
+    Args:
+        namespace: Name of the endpoint, part of the cache key
+        parts: JSON serializable arguments identifying the request
+        fetch: Coroutine function calling upstream
+        ttl: Seconds a result is fresh, 0 disables the cache
+        stale_ttl: Seconds a result is served after expiry while it is
+            refreshed, defaults to ttl
+        cacheable: Predicate deciding whether a result may be cached
+
+    Returns:
+        The result of fetch, from cache or upstream
+    """
+    if ttl <= 0:
+        return await fetch()
+    if stale_ttl is None:
+        stale_ttl = ttl
+
+    key = _cache_key(namespace, parts)
+    entry = _local.get(key)
+    if entry:
+        raw, fresh_until, stale_until = entry
+        now = time.time()
+        if now < stale_until:
+            _local.move_to_end(key)
+            if now >= fresh_until:
+                _refresh(key, fetch, ttl, stale_ttl, cacheable)
+            return json.loads(raw)
+        del _local[key]
+
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_load(key, fetch, ttl, stale_ttl, cacheable))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    return json.loads(await asyncio.shield(future))
+
+
+def response_cache(
+    ttl: int,
+    stale_ttl: Optional[int] = None,
+    ignore: Iterable[str] = ("api_key",),
+    cacheable: Callable[[Any], bool] = default_cacheable,
+):
+    """Cache the result of an async upstream call by its arguments.
+
+    Works on functions and methods, ``self`` is never part of the key.
+
+    Args:
+        ttl: Seconds a result is fresh
+        stale_ttl: Seconds a result is served after expiry while it is
+            refreshed, defaults to ttl
+        ignore: Arguments that do not change the result, like API keys
+        cacheable: Predicate deciding whether a result may be cached
+    """
+    ignored = set(ignore) | {"self"}
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        namespace = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            parts = {k: v for k, v in bound.arguments.items() if k not in ignored}
+            return await cached_call(
+                namespace,
+                parts,
+                lambda: func(*args, **kwargs),
+                ttl,
+                stale_ttl,
+                cacheable,
+            )
+
+        return wrapper
+
+    return decorator
@@ -3,12 +3,18 @@
 import time
 from typing import List
 
-import httpx
+from intentkit.skills.cache import default_cacheable, response_cache
+from intentkit.utils.http_client import get_http_client
 from pydantic import BaseModel, Field
 
 CRYPTO_COMPARE_BASE_URL = "https://min-api.cryptocompare.com"
 
 
+def cacheable(result: dict) -> bool:
+    """CryptoCompare reports some errors with status 200, never cache them."""
+    return default_cacheable(result) and result.get("Response") != "Error"
+
+
 # Input Schemas
 class FetchNewsInput(BaseModel):
     """Input schema for fetching news."""
@@ -70,6 +76,7 @@ class FetchTopVolumeInput(BaseModel):
 
 
 # API Functions
+@response_cache(ttl=30, cacheable=cacheable)
 async def fetch_price(api_key: str, from_symbol: str, to_symbols: List[str]) -> dict:
     """
     Fetch current price for a cryptocurrency in multiple currencies.
@@ -77,13 +84,14 @@ async def fetch_price(api_key: str, from_symbol: str, to_symbols: List[str]) ->
     url = f"{CRYPTO_COMPARE_BASE_URL}/data/price"
     headers = {"Accept": "application/json", "Authorization": f"Bearer {api_key}"}
     params = {"fsym": from_symbol.upper(), "tsyms": ",".join(to_symbols)}
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers)
+    client = get_http_client("cryptocompare")
+    response = await client.get(url, params=params, headers=headers)
     if response.status_code != 200:
         return {"error": f"API returned status code {response.status_code}"}
     return response.json()
 
 
+@response_cache(ttl=300, cacheable=cacheable)
 async def fetch_trading_signals(api_key: str, from_symbol: str) -> dict:
     """
     Fetch the latest trading signals.
@@ -91,13 +99,14 @@ async def fetch_trading_signals(api_key: str, from_symbol: str) -> dict:
     url = f"{CRYPTO_COMPARE_BASE_URL}/data/tradingsignals/intotheblock/latest"
     headers = {"Accept": "application/json", "Authorization": f"Bearer {api_key}"}
     params = {"fsym": from_symbol.upper()}
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers)
+    client = get_http_client("cryptocompare")
+    response = await client.get(url, params=params, headers=headers)
     if response.status_code != 200:
         return {"error": f"API returned status code {response.status_code}"}
     return response.json()
 
 
+@response_cache(ttl=300, cacheable=cacheable)
 async def fetch_top_market_cap(
     api_key: str, limit: int, to_symbol: str = "USD"
 ) -> dict:
@@ -107,13 +116,14 @@ async def fetch_top_market_cap(
     url = f"{CRYPTO_COMPARE_BASE_URL}/data/top/mktcapfull"
     headers = {"Accept": "application/json", "Authorization": f"Bearer {api_key}"}
     params = {"limit": limit, "tsym": to_symbol.upper()}
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers)
+    client = get_http_client("cryptocompare")
+    response = await client.get(url, params=params, headers=headers)
     if response.status_code != 200:
         return {"error": f"API returned status code {response.status_code}"}
     return response.json()
 
 
+@response_cache(ttl=600, cacheable=cacheable)
 async def fetch_top_exchanges(
     api_key: str, from_symbol: str, to_symbol: str = "USD"
 ) -> dict:
@@ -123,13 +133,14 @@ async def fetch_top_exchanges(
     url = f"{CRYPTO_COMPARE_BASE_URL}/data/top/exchanges"
     headers = {"Accept": "application/json", "Authorization": f"Bearer {api_key}"}
     params = {"fsym": from_symbol.upper(), "tsym": to_symbol.upper()}
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers)
+    client = get_http_client("cryptocompare")
+    response = await client.get(url, params=params, headers=headers)
     if response.status_code != 200:
         return {"error": f"API returned status code {response.status_code}"}
     return response.json()
 
 
+@response_cache(ttl=300, cacheable=cacheable)
 async def fetch_top_volume(api_key: str, limit: int, to_symbol: str = "USD") -> dict:
     """
     Fetch top cryptocurrencies by total volume.
@@ -137,13 +148,14 @@ async def fetch_top_volume(api_key: str, limit: int, to_symbol: str = "USD") ->
     url = f"{CRYPTO_COMPARE_BASE_URL}/data/top/totalvolfull"
     headers = {"Accept": "application/json", "Authorization": f"Bearer {api_key}"}
     params = {"limit": limit, "tsym": to_symbol.upper()}
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers)
+    client = get_http_client("cryptocompare")
+    response = await client.get(url, params=params, headers=headers)
     if response.status_code != 200:
         return {"error": f"API returned status code {response.status_code}"}
     return response.json()
 
 
+@response_cache(ttl=300, cacheable=cacheable)
 async def fetch_news(api_key: str, token: str, timestamp: int = None) -> dict:
     """
     Fetch news for a specific token and timestamp.
@@ -152,8 +164,8 @@ async def fetch_news(api_key: str, token: str, timestamp: int = None) -> dict:
         timestamp = int(time.time())
     url = f"{CRYPTO_COMPARE_BASE_URL}/data/v2/news/?lang=EN&lTs={timestamp}&categories={token}&sign=true"
     headers = {"Accept": "application/json", "Authorization": f"Bearer {api_key}"}
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers)
+    client = get_http_client("cryptocompare")
+    response = await client.get(url, headers=headers)
     if response.status_code != 200:
         return {"error": f"API returned status code {response.status_code}"}
     return response.json()
@@ -1,15 +1,15 @@
 """Base class for all CryptoCompare tools."""
 
 import logging
-from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Type
 
-import httpx
 from pydantic import BaseModel, Field
 
 from intentkit.abstracts.skill import SkillStoreABC
 from intentkit.skills.base import IntentKitSkill
-from intentkit.utils.error import RateLimitExceeded
+from intentkit.skills.cache import response_cache
+from intentkit.skills.cryptocompare.api import cacheable
+from intentkit.utils.rate_limit import RateLimitStatus
 
 CRYPTO_COMPARE_BASE_URL = "https://min-api.cryptocompare.com"
 
@@ -38,7 +38,7 @@ class CryptoCompareBaseTool(IntentKitSkill):
 
     async def check_rate_limit(
         self, agent_id: str, max_requests: int = 1, interval: int = 15
-    ) -> None:
+    ) -> RateLimitStatus:
         """Check if the rate limit has been exceeded.
 
         Args:
@@ -46,41 +46,15 @@ class CryptoCompareBaseTool(IntentKitSkill):
             max_requests: Maximum number of requests allowed within the rate limit window.
             interval: Time interval in minutes for the rate limit window.
 
+        Returns:
+            RateLimitStatus: The headroom left.
+
         Raises:
             RateLimitExceeded: If the rate limit has been exceeded.
         """
-        rate_limit = await self.skill_store.get_agent_skill_data(
-            agent_id, self.name, "rate_limit"
-        )
-
-        current_time = datetime.now(tz=timezone.utc)
-
-        if (
-            rate_limit
-            and rate_limit.get("reset_time")
-            and rate_limit["count"] is not None
-            and datetime.fromisoformat(rate_limit["reset_time"]) > current_time
-        ):
-            if rate_limit["count"] >= max_requests:
-                raise RateLimitExceeded("Rate limit exceeded")
-
-            rate_limit["count"] += 1
-            await self.skill_store.save_agent_skill_data(
-                agent_id, self.name, "rate_limit", rate_limit
-            )
-
-            return
-
-        # If no rate limit exists or it has expired, create a new one
-        new_rate_limit = {
-            "count": 1,
-            "reset_time": (current_time + timedelta(minutes=interval)).isoformat(),
-        }
-        await self.skill_store.save_agent_skill_data(
-            agent_id, self.name, "rate_limit", new_rate_limit
-        )
-        return
+        return await self.agent_rate_limit(agent_id, max_requests, interval)
 
+    @response_cache(ttl=30, cacheable=cacheable)
     async def fetch_price(
         self, api_key: str, from_symbol: str, to_symbols: List[str]
     ) -> dict:
@@ -109,13 +83,14 @@ class CryptoCompareBaseTool(IntentKitSkill):
             "fsym": from_symbol.upper(),
             "tsyms": ",".join([s.upper() for s in to_symbols]),
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
+        client = self.http_client()
+        response = await client.get(url, params=params, headers=headers)
         if response.status_code != 200:
             logger.error(f"API returned status code {response.status_code}")
             return {"error": f"API returned status code {response.status_code}"}
         return response.json()
 
+    @response_cache(ttl=300, cacheable=cacheable)
     async def fetch_trading_signals(self, api_key: str, from_symbol: str) -> dict:
         """Fetch the latest trading signals.
 
@@ -134,13 +109,14 @@ class CryptoCompareBaseTool(IntentKitSkill):
             from_symbol = from_symbol[0] if from_symbol else ""
 
         params = {"fsym": from_symbol.upper()}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
+        client = self.http_client()
+        response = await client.get(url, params=params, headers=headers)
         if response.status_code != 200:
             logger.error(f"API returned status code {response.status_code}")
             return {"error": f"API returned status code {response.status_code}"}
         return response.json()
 
+    @response_cache(ttl=300, cacheable=cacheable)
     async def fetch_top_market_cap(
         self, api_key: str, limit: int, to_symbol: str = "USD"
     ) -> dict:
@@ -162,13 +138,14 @@ class CryptoCompareBaseTool(IntentKitSkill):
             to_symbol = to_symbol[0] if to_symbol else "USD"
 
         params = {"limit": limit, "tsym": to_symbol.upper()}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
+        client = self.http_client()
+        response = await client.get(url, params=params, headers=headers)
         if response.status_code != 200:
             logger.error(f"API returned status code {response.status_code}")
             return {"error": f"API returned status code {response.status_code}"}
         return response.json()
 
+    @response_cache(ttl=600, cacheable=cacheable)
     async def fetch_top_exchanges(
         self, api_key: str, from_symbol: str, to_symbol: str = "USD"
     ) -> dict:
@@ -192,13 +169,14 @@ class CryptoCompareBaseTool(IntentKitSkill):
             to_symbol = to_symbol[0] if to_symbol else "USD"
 
         params = {"fsym": from_symbol.upper(), "tsym": to_symbol.upper()}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
+        client = self.http_client()
+        response = await client.get(url, params=params, headers=headers)
         if response.status_code != 200:
             logger.error(f"API returned status code {response.status_code}")
             return {"error": f"API returned status code {response.status_code}"}
         return response.json()
 
+    @response_cache(ttl=300, cacheable=cacheable)
     async def fetch_top_volume(
         self, api_key: str, limit: int, to_symbol: str = "USD"
     ) -> dict:
@@ -220,13 +198,14 @@ class CryptoCompareBaseTool(IntentKitSkill):
             to_symbol = to_symbol[0] if to_symbol else "USD"
 
         params = {"limit": limit, "tsym": to_symbol.upper()}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
+        client = self.http_client()
+        response = await client.get(url, params=params, headers=headers)
         if response.status_code != 200:
             logger.error(f"API returned status code {response.status_code}")
             return {"error": f"API returned status code {response.status_code}"}
         return response.json()
 
+    @response_cache(ttl=300, cacheable=cacheable)
     async def fetch_news(self, api_key: str, token: str, timestamp: int = None) -> dict:
         """Fetch news for a specific token and timestamp.
 
@@ -249,8 +228,8 @@ class CryptoCompareBaseTool(IntentKitSkill):
         if timestamp:
             params["lTs"] = timestamp
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
+        client = self.http_client()
+        response = await client.get(url, params=params, headers=headers)
         if response.status_code != 200:
             logger.error(f"API returned status code {response.status_code}")
             return {"error": f"API returned status code {response.status_code}"}
@@ -71,9 +71,7 @@ from intentkit.skills.defillama.yields.fetch_pool_chart import DefiLlamaFetchPoo
 
 # Yields Tools
 from intentkit.skills.defillama.yields.fetch_pools import DefiLlamaFetchPools
-
-# we cache skills in system level, because they are stateless
-_cache: dict[str, DefiLlamaBaseTool] = {}
+from intentkit.skills.registry import get_skill_registry
 
 logger = logging.getLogger(__name__)
 
@@ -146,6 +144,40 @@ async def get_skills(
     return result
 
 
+# Skill name -> tool class, by DeFi Llama API area
+_SKILL_CLASSES: dict[str, type[DefiLlamaBaseTool]] = {
+    # TVL Skills
+    "fetch_protocols": DefiLlamaFetchProtocols,
+    "fetch_protocol": DefiLlamaFetchProtocol,
+    "fetch_historical_tvl": DefiLlamaFetchHistoricalTvl,
+    "fetch_chain_historical_tvl": DefiLlamaFetchChainHistoricalTvl,
+    "fetch_protocol_current_tvl": DefiLlamaFetchProtocolCurrentTvl,
+    "fetch_chains": DefiLlamaFetchChains,
+    # Coins Skills
+    "fetch_current_prices": DefiLlamaFetchCurrentPrices,
+    "fetch_historical_prices": DefiLlamaFetchHistoricalPrices,
+    "fetch_batch_historical_prices": DefiLlamaFetchBatchHistoricalPrices,
+    "fetch_price_chart": DefiLlamaFetchPriceChart,
+    "fetch_price_percentage": DefiLlamaFetchPricePercentage,
+    "fetch_first_price": DefiLlamaFetchFirstPrice,
+    "fetch_block": DefiLlamaFetchBlock,
+    # Stablecoins Skills
+    "fetch_stablecoins": DefiLlamaFetchStablecoins,
+    "fetch_stablecoin_charts": DefiLlamaFetchStablecoinCharts,
+    "fetch_stablecoin_chains": DefiLlamaFetchStablecoinChains,
+    "fetch_stablecoin_prices": DefiLlamaFetchStablecoinPrices,
+    # Yields Skills
+    "fetch_pools": DefiLlamaFetchPools,
+    "fetch_pool_chart": DefiLlamaFetchPoolChart,
+    # Volumes Skills, handle both base and chain-specific overviews
+    "fetch_dex_overview": DefiLlamaFetchDexOverview,
+    "fetch_dex_summary": DefiLlamaFetchDexSummary,
+    "fetch_options_overview": DefiLlamaFetchOptionsOverview,
+    # Fees Skills
+    "fetch_fees_overview": DefiLlamaFetchFeesOverview,
+}
+
+
 def get_defillama_skill(
     name: str,
     store: SkillStoreABC,
@@ -164,160 +196,10 @@ def get_defillama_skill(
         base and chain-specific endpoints through optional parameters rather than
         separate implementations.
     """
-    # TVL Skills
-    if name == "fetch_protocols":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchProtocols(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_protocol":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchProtocol(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_historical_tvl":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchHistoricalTvl(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_chain_historical_tvl":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchChainHistoricalTvl(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_protocol_current_tvl":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchProtocolCurrentTvl(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_chains":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchChains(
-                skill_store=store,
-            )
-        return _cache[name]
-
-    # Coins Skills
-    elif name == "fetch_current_prices":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchCurrentPrices(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_historical_prices":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchHistoricalPrices(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_batch_historical_prices":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchBatchHistoricalPrices(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_price_chart":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchPriceChart(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_price_percentage":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchPricePercentage(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_first_price":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchFirstPrice(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_block":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchBlock(
-                skill_store=store,
-            )
-        return _cache[name]
-
-    # Stablecoins Skills
-    elif name == "fetch_stablecoins":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchStablecoins(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_stablecoin_charts":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchStablecoinCharts(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_stablecoin_chains":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchStablecoinChains(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_stablecoin_prices":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchStablecoinPrices(
-                skill_store=store,
-            )
-        return _cache[name]
-
-    # Yields Skills
-    elif name == "fetch_pools":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchPools(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_pool_chart":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchPoolChart(
-                skill_store=store,
-            )
-        return _cache[name]
-
-    # Volumes Skills
-    elif name == "fetch_dex_overview":  # Handles both base and chain-specific overviews
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchDexOverview(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif name == "fetch_dex_summary":
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchDexSummary(
-                skill_store=store,
-            )
-        return _cache[name]
-    elif (
-        name == "fetch_options_overview"
-    ):  # Handles both base and chain-specific overviews
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchOptionsOverview(
-                skill_store=store,
-            )
-        return _cache[name]
-
-    # Fees Skills
-    elif (
-        name == "fetch_fees_overview"
-    ):  # Handles both base and chain-specific overviews
-        if name not in _cache:
-            _cache[name] = DefiLlamaFetchFeesOverview(
-                skill_store=store,
-            )
-        return _cache[name]
-
-    else:
+    skill_class = _SKILL_CLASSES.get(name)
+    if skill_class is None:
         logger.warning(f"Unknown DeFi Llama skill: {name}")
         return None
+    return get_skill_registry().shared_tool(
+        "defillama", name, lambda: skill_class(skill_store=store)
+    )
@@ -1,6 +1,6 @@
 """Base class for all DeFi Llama tools."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Type
 
 from pydantic import BaseModel, Field
@@ -10,6 +10,7 @@ from intentkit.skills.base import IntentKitSkill, SkillContext
 from intentkit.skills.defillama.config.chains import (
     get_chain_from_alias,
 )
+from intentkit.utils.error import RateLimitExceeded
 
 DEFILLAMA_BASE_URL = "https://api.llama.fi"
 
@@ -51,33 +52,10 @@ class DefiLlamaBaseTool(IntentKitSkill):
         Returns:
             Rate limit status and error message if limited
         """
-        rate_limit = await self.skill_store.get_agent_skill_data(
-            context.agent_id, self.name, "rate_limit"
-        )
-        current_time = datetime.now(tz=timezone.utc)
-
-        if (
-            rate_limit
-            and rate_limit.get("reset_time")
-            and rate_limit.get("count") is not None
-            and datetime.fromisoformat(rate_limit["reset_time"]) > current_time
-        ):
-            if rate_limit["count"] >= max_requests:
-                return True, "Rate limit exceeded"
-
-            rate_limit["count"] += 1
-            await self.skill_store.save_agent_skill_data(
-                context.agent_id, self.name, "rate_limit", rate_limit
-            )
-            return False, None
-
-        new_rate_limit = {
-            "count": 1,
-            "reset_time": (current_time + timedelta(minutes=interval)).isoformat(),
-        }
-        await self.skill_store.save_agent_skill_data(
-            context.agent_id, self.name, "rate_limit", new_rate_limit
-        )
+        try:
+            await self.agent_rate_limit(context.agent_id, max_requests, interval)
+        except RateLimitExceeded as e:
+            return True, e.message
         return False, None
 
     async def validate_chain(self, chain: str | None) -> tuple[bool, str | None]:
@@ -7,6 +7,7 @@ from pydantic import Field
 
 from intentkit.abstracts.skill import SkillStoreABC
 from intentkit.skills.base import IntentKitSkill
+from intentkit.skills.cache import cached_call
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,33 @@ class DexScreenerBaseTool(IntentKitSkill):
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
+    ) -> ApiResult:
+        """
+        Makes a GET request to the DexScreener API, successful responses are
+        cached for response_cache_ttl seconds.
+
+        Args:
+            path: The API endpoint path (e.g., "/dex/search").
+            params: Optional dictionary of query parameters.
+
+        Returns:
+            A tuple (data, error_details), see _send_get.
+        """
+        if not self.response_cache_ttl:
+            return await self._send_get(path, params)
+        data, error_details = await cached_call(
+            f"{self.category}:{path}",
+            params,
+            lambda: self._send_get(path, params),
+            self.response_cache_ttl,
+            cacheable=lambda result: result[1] is None,
+        )
+        return data, error_details
+
+    async def _send_get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
     ) -> ApiResult:
         """
         Makes an asynchronous GET request to the DexScreener API.
@@ -63,47 +91,45 @@ class DexScreenerBaseTool(IntentKitSkill):
         response = None  # Define response outside try block for access in except
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method, url, params=params, headers=headers
+            client = self.http_client()
+            response = await client.request(method, url, params=params, headers=headers)
+
+            # Attempt to parse JSON response text
+            try:
+                response_data = response.json()
+            except json.JSONDecodeError as json_err:
+                logger.error(
+                    f"Failed to parse JSON response from {url}. Status: {response.status_code}. Response text: {response.text}",
+                    exc_info=True,
                 )
-
-                # Attempt to parse JSON response text
-                try:
-                    response_data = response.json()
-                except json.JSONDecodeError as json_err:
-                    logger.error(
-                        f"Failed to parse JSON response from {url}. Status: {response.status_code}. Response text: {response.text}",
-                        exc_info=True,
-                    )
-                    error_details = {
-                        "error": "Failed to parse DexScreener API response",
-                        "error_type": "parsing_error",
-                        "status_code": response.status_code,
-                        "details": response.text,  # Raw text causing the error
-                        "original_exception": str(json_err),
-                        "url": url,
-                    }
-                    return None, error_details  # Return parsing error
-
-                # Check HTTP status *after* attempting JSON parse
-                if response.is_success:  # 2xx
-                    logger.debug(
-                        f"DexScreener API success response status: {response.status_code}"
-                    )
-                    return response_data, None  # Success
-                else:  # 4xx/5xx
-                    logger.warning(
-                        f"DexScreener API returned error status: {response.status_code} - {response.text}"
-                    )
-                    error_details = {
-                        "error": "DexScreener API request failed",
-                        "error_type": "api_error",
-                        "status_code": response.status_code,
-                        "response_body": response_data,  # Parsed error body if available
-                        "url": url,
-                    }
-                    return None, error_details  # Return API error
+                error_details = {
+                    "error": "Failed to parse DexScreener API response",
+                    "error_type": "parsing_error",
+                    "status_code": response.status_code,
+                    "details": response.text,  # Raw text causing the error
+                    "original_exception": str(json_err),
+                    "url": url,
+                }
+                return None, error_details  # Return parsing error
+
+            # Check HTTP status *after* attempting JSON parse
+            if response.is_success:  # 2xx
+                logger.debug(
+                    f"DexScreener API success response status: {response.status_code}"
+                )
+                return response_data, None  # Success
+            else:  # 4xx/5xx
+                logger.warning(
+                    f"DexScreener API returned error status: {response.status_code} - {response.text}"
+                )
+                error_details = {
+                    "error": "DexScreener API request failed",
+                    "error_type": "api_error",
+                    "status_code": response.status_code,
+                    "response_body": response_data,  # Parsed error body if available
+                    "url": url,
+                }
+                return None, error_details  # Return API error
 
         except httpx.RequestError as req_err:
             logger.error(
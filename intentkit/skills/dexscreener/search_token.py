@@ -66,6 +66,7 @@ class SearchToken(DexScreenerBaseTool):
     """
 
     name: str = "dexscreener_search_token"
+    response_cache_ttl: int = 30
     description: str = (
         f"Searches DexScreener for token pairs matching the provided query string "
         f"(e.g., token symbol like 'WIF', pair address, token name like 'Dogwifhat', or ticker like '$WIF'). "
@@ -192,19 +192,19 @@ class EnsoGetBestYield(EnsoBaseTool):
             "Authorization": f"Bearer {api_token}",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                networks = response.json()
+        client = self.http_client()
+        try:
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            networks = response.json()
 
-                for network in networks:
-                    if network.get("id") == chain_id:
-                        return network.get("name", "Unknown")
+            for network in networks:
+                if network.get("id") == chain_id:
+                    return network.get("name", "Unknown")
 
-                return "Unknown"
-            except Exception:
-                return "Unknown"
+            return "Unknown"
+        except Exception:
+            return "Unknown"
 
     async def _get_protocols(self, api_token: str, chain_id: int) -> list:
         """
@@ -226,21 +226,17 @@ class EnsoGetBestYield(EnsoBaseTool):
 
         params = {"chainId": chain_id}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                return response.json()
-            except httpx.RequestError as req_err:
-                raise ToolException(
-                    f"Request error from Enso API: {req_err}"
-                ) from req_err
-            except httpx.HTTPStatusError as http_err:
-                raise ToolException(
-                    f"HTTP error from Enso API: {http_err}"
-                ) from http_err
-            except Exception as e:
-                raise ToolException(f"Error from Enso API: {e}") from e
+        client = self.http_client()
+        try:
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            return response.json()
+        except httpx.RequestError as req_err:
+            raise ToolException(f"Request error from Enso API: {req_err}") from req_err
+        except httpx.HTTPStatusError as http_err:
+            raise ToolException(f"HTTP error from Enso API: {http_err}") from http_err
+        except Exception as e:
+            raise ToolException(f"Error from Enso API: {e}") from e
 
     async def _get_protocol_tokens(
         self, api_token: str, chain_id: int, protocol_slug: str, token_symbol: str
@@ -270,14 +266,14 @@ class EnsoGetBestYield(EnsoBaseTool):
             "includeMetadata": True,
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                return response.json().get("data", [])
-            except httpx.RequestError:
-                return []
-            except httpx.HTTPStatusError:
-                return []
-            except Exception:
-                return []
+        client = self.http_client()
+        try:
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            return response.json().get("data", [])
+        except httpx.RequestError:
+            return []
+        except httpx.HTTPStatusError:
+            return []
+        except Exception:
+            return []
@@ -64,39 +64,33 @@ class EnsoGetNetworks(EnsoBaseTool):
             "Authorization": f"Bearer {api_token}",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # Send the GET request
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-
-                # Parse the response JSON into the NetworkResponse model
-                json_dict = response.json()
-
-                networks = []
-                networks_memory = {}
-                for item in json_dict:
-                    network = ConnectedNetwork(**item)
-                    networks.append(network)
-                    networks_memory[str(network.id)] = network.model_dump(
-                        exclude_none=True
-                    )
-
-                await self.skill_store.save_agent_skill_data(
-                    context.agent_id,
-                    "enso_get_networks",
-                    "networks",
-                    networks_memory,
-                )
-
-                return EnsoGetNetworksOutput(res=networks)
-            except httpx.RequestError as req_err:
-                raise ToolException(
-                    f"request error from Enso API: {req_err}"
-                ) from req_err
-            except httpx.HTTPStatusError as http_err:
-                raise ToolException(
-                    f"http error from Enso API: {http_err}"
-                ) from http_err
-            except Exception as e:
-                raise ToolException(f"error from Enso API: {e}") from e
+        client = self.http_client()
+        try:
+            # Send the GET request
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+
+            # Parse the response JSON into the NetworkResponse model
+            json_dict = response.json()
+
+            networks = []
+            networks_memory = {}
+            for item in json_dict:
+                network = ConnectedNetwork(**item)
+                networks.append(network)
+                networks_memory[str(network.id)] = network.model_dump(exclude_none=True)
+
+            await self.skill_store.save_agent_skill_data(
+                context.agent_id,
+                "enso_get_networks",
+                "networks",
+                networks_memory,
+            )
+
+            return EnsoGetNetworksOutput(res=networks)
+        except httpx.RequestError as req_err:
+            raise ToolException(f"request error from Enso API: {req_err}") from req_err
+        except httpx.HTTPStatusError as http_err:
+            raise ToolException(f"http error from Enso API: {http_err}") from http_err
+        except Exception as e:
+            raise ToolException(f"error from Enso API: {e}") from e
@@ -66,24 +66,20 @@ class EnsoGetPrices(EnsoBaseTool):
             "Authorization": f"Bearer {api_token}",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                json_dict = response.json()
-
-                # Parse the response into a `PriceInfo` object
-                res = EnsoGetPricesOutput(**json_dict)
-
-                # Return the parsed response
-                return res
-            except httpx.RequestError as req_err:
-                raise ToolException(
-                    f"request error from Enso API: {req_err}"
-                ) from req_err
-            except httpx.HTTPStatusError as http_err:
-                raise ToolException(
-                    f"http error from Enso API: {http_err}"
-                ) from http_err
-            except Exception as e:
-                raise ToolException(f"error from Enso API: {e}") from e
+        client = self.http_client()
+        try:
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            json_dict = response.json()
+
+            # Parse the response into a `PriceInfo` object
+            res = EnsoGetPricesOutput(**json_dict)
+
+            # Return the parsed response
+            return res
+        except httpx.RequestError as req_err:
+            raise ToolException(f"request error from Enso API: {req_err}") from req_err
+        except httpx.HTTPStatusError as http_err:
+            raise ToolException(f"http error from Enso API: {http_err}") from http_err
+        except Exception as e:
+            raise ToolException(f"error from Enso API: {e}") from e
@@ -185,114 +185,108 @@ class EnsoRouteShortcut(EnsoBaseTool):
         api_token = self.get_api_token(context)
         account = await self.get_account(context)
 
-        async with httpx.AsyncClient() as client:
-            try:
-                network_name = None
-                networks = await self.skill_store.get_agent_skill_data(
-                    agent_id, "enso_get_networks", "networks"
+        client = self.http_client()
+        try:
+            network_name = None
+            networks = await self.skill_store.get_agent_skill_data(
+                agent_id, "enso_get_networks", "networks"
+            )
+
+            if networks:
+                network_name = (
+                    networks.get(str(chainId)).get("name")
+                    if networks.get(str(chainId))
+                    else None
                 )
-
-                if networks:
-                    network_name = (
-                        networks.get(str(chainId)).get("name")
-                        if networks.get(str(chainId))
-                        else None
-                    )
-                if network_name is None:
-                    networks = await EnsoGetNetworks(
-                        skill_store=self.skill_store,
-                    ).arun()
-
-                    for network in networks.res:
-                        if network.id == chainId:
-                            network_name = network.name
-
-                if not network_name:
-                    raise ToolException(
-                        f"network name not found for chainId: {chainId}"
-                    )
-
-                headers = {
-                    "accept": "application/json",
-                    "Authorization": f"Bearer {api_token}",
-                }
-
-                token_decimals = await self.skill_store.get_agent_skill_data(
-                    agent_id,
-                    "enso_get_tokens",
-                    "decimals",
+            if network_name is None:
+                networks = await EnsoGetNetworks(
+                    skill_store=self.skill_store,
+                ).arun()
+
+                for network in networks.res:
+                    if network.id == chainId:
+                        network_name = network.name
+
+            if not network_name:
+                raise ToolException(f"network name not found for chainId: {chainId}")
+
+            headers = {
+                "accept": "application/json",
+                "Authorization": f"Bearer {api_token}",
+            }
+
+            token_decimals = await self.skill_store.get_agent_skill_data(
+                agent_id,
+                "enso_get_tokens",
+                "decimals",
+            )
+
+            if not token_decimals:
+                raise ToolException(
+                    "there is not enough information, enso_get_tokens should be called for data, at first."
                 )
 
-                if not token_decimals:
-                    raise ToolException(
-                        "there is not enough information, enso_get_tokens should be called for data, at first."
-                    )
+            if not token_decimals.get(tokenOut[0]):
+                raise ToolException(
+                    f"token decimals information for token {tokenOut[0]} not found"
+                )
 
-                if not token_decimals.get(tokenOut[0]):
-                    raise ToolException(
-                        f"token decimals information for token {tokenOut[0]} not found"
-                    )
+            if not token_decimals.get(tokenIn[0]):
+                raise ToolException(
+                    f"token decimals information for token {tokenIn[0]} not found"
+                )
 
-                if not token_decimals.get(tokenIn[0]):
-                    raise ToolException(
-                        f"token decimals information for token {tokenIn[0]} not found"
+            url = f"{base_url}/api/v1/shortcuts/route"
+
+            # Prepare query parameters
+            params = EnsoRouteShortcutInput(
+                chainId=chainId,
+                amountIn=amountIn,
+                tokenIn=tokenIn,
+                tokenOut=tokenOut,
+            ).model_dump(exclude_none=True)
+
+            params["fromAddress"] = account.address
+
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()  # Raise HTTPError for non-2xx responses
+            json_dict = response.json()
+
+            res = EnsoRouteShortcutOutput(**json_dict)
+            res.network = network_name
+
+            res.amountOut = str(
+                float(res.amountOut) / 10 ** token_decimals[tokenOut[0]]
+            )
+
+            if broadcast_requested:
+                # Use the wallet provider to send the transaction
+                wallet_provider = await self.get_wallet_provider(context)
+
+                # Extract transaction data from the Enso API response
+                tx_data = json_dict.get("tx", {})
+                if tx_data:
+                    # Send the transaction using the wallet provider
+                    tx_hash = wallet_provider.send_transaction(
+                        {
+                            "to": tx_data.get("to"),
+                            "data": tx_data.get("data", "0x"),
+                            "value": tx_data.get("value", 0),
+                        }
                     )
 
-                url = f"{base_url}/api/v1/shortcuts/route"
-
-                # Prepare query parameters
-                params = EnsoRouteShortcutInput(
-                    chainId=chainId,
-                    amountIn=amountIn,
-                    tokenIn=tokenIn,
-                    tokenOut=tokenOut,
-                ).model_dump(exclude_none=True)
-
-                params["fromAddress"] = account.address
-
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()  # Raise HTTPError for non-2xx responses
-                json_dict = response.json()
-
-                res = EnsoRouteShortcutOutput(**json_dict)
-                res.network = network_name
-
-                res.amountOut = str(
-                    float(res.amountOut) / 10 ** token_decimals[tokenOut[0]]
-                )
-
-                if broadcast_requested:
-                    # Use the wallet provider to send the transaction
-                    wallet_provider = await self.get_wallet_provider(context)
-
-                    # Extract transaction data from the Enso API response
-                    tx_data = json_dict.get("tx", {})
-                    if tx_data:
-                        # Send the transaction using the wallet provider
-                        tx_hash = wallet_provider.send_transaction(
-                            {
-                                "to": tx_data.get("to"),
-                                "data": tx_data.get("data", "0x"),
-                                "value": tx_data.get("value", 0),
-                            }
-                        )
-
-                        # Wait for transaction confirmation
-                        wallet_provider.wait_for_transaction_receipt(tx_hash)
-                        res.txHash = tx_hash
-                    else:
-                        # For now, return a placeholder transaction hash if no tx data
-                        res.txHash = "0x0000000000000000000000000000000000000000000000000000000000000000"
-
-                return res
-
-            except httpx.RequestError as req_err:
-                raise ToolException(
-                    f"request error from Enso API: {req_err}"
-                ) from req_err
-            except httpx.HTTPStatusError as http_err:
-                raise ToolException(
-                    f"http error from Enso API: {http_err}"
-                ) from http_err
-            except Exception as e:
-                raise ToolException(f"error from Enso API: {e}") from e
+                    # Wait for transaction confirmation
+                    wallet_provider.wait_for_transaction_receipt(tx_hash)
+                    res.txHash = tx_hash
+                else:
+                    # For now, return a placeholder transaction hash if no tx data
+                    res.txHash = "0x0000000000000000000000000000000000000000000000000000000000000000"
+
+            return res
+
+        except httpx.RequestError as req_err:
+            raise ToolException(f"request error from Enso API: {req_err}") from req_err
+        except httpx.HTTPStatusError as http_err:
+            raise ToolException(f"http error from Enso API: {http_err}") from http_err
+        except Exception as e:
+            raise ToolException(f"error from Enso API: {e}") from e
@@ -171,50 +171,46 @@ class EnsoGetTokens(EnsoBaseTool):
         params["page"] = 1
         params["includeMetadata"] = "true"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                json_dict = response.json()
-
-                token_decimals = await self.skill_store.get_agent_skill_data(
-                    agent_id,
-                    "enso_get_tokens",
-                    "decimals",
-                )
-                if not token_decimals:
-                    token_decimals = {}
-
-                # filter the main tokens from config or the ones that have apy assigned.
-                res = EnsoGetTokensOutput(res=list[TokenResponseCompact]())
-                for item in json_dict["data"]:
-                    main_tokens = [item.upper() for item in main_tokens]
-                    if item.get("apy") or (item.get("symbol").upper() in main_tokens):
-                        token_response = TokenResponseCompact(**item)
-                        res.res.append(token_response)
-                        token_decimals[token_response.address] = token_response.decimals
-                        if (
-                            token_response.underlyingTokens
-                            and len(token_response.underlyingTokens) > 0
-                        ):
-                            for u_token in token_response.underlyingTokens:
-                                token_decimals[u_token.address] = u_token.decimals
-
-                await self.skill_store.save_agent_skill_data(
-                    agent_id,
-                    "enso_get_tokens",
-                    "decimals",
-                    token_decimals,
-                )
-
-                return res
-            except httpx.RequestError as req_err:
-                raise ToolException(
-                    f"request error from Enso API: {req_err}"
-                ) from req_err
-            except httpx.HTTPStatusError as http_err:
-                raise ToolException(
-                    f"http error from Enso API: {http_err}"
-                ) from http_err
-            except Exception as e:
-                raise ToolException(f"error from Enso API: {e}") from e
+        client = self.http_client()
+        try:
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            json_dict = response.json()
+
+            token_decimals = await self.skill_store.get_agent_skill_data(
+                agent_id,
+                "enso_get_tokens",
+                "decimals",
+            )
+            if not token_decimals:
+                token_decimals = {}
+
+            # filter the main tokens from config or the ones that have apy assigned.
+            res = EnsoGetTokensOutput(res=list[TokenResponseCompact]())
+            for item in json_dict["data"]:
+                main_tokens = [item.upper() for item in main_tokens]
+                if item.get("apy") or (item.get("symbol").upper() in main_tokens):
+                    token_response = TokenResponseCompact(**item)
+                    res.res.append(token_response)
+                    token_decimals[token_response.address] = token_response.decimals
+                    if (
+                        token_response.underlyingTokens
+                        and len(token_response.underlyingTokens) > 0
+                    ):
+                        for u_token in token_response.underlyingTokens:
+                            token_decimals[u_token.address] = u_token.decimals
+
+            await self.skill_store.save_agent_skill_data(
+                agent_id,
+                "enso_get_tokens",
+                "decimals",
+                token_decimals,
+            )
+
+            return res
+        except httpx.RequestError as req_err:
+            raise ToolException(f"request error from Enso API: {req_err}") from req_err
+        except httpx.HTTPStatusError as http_err:
+            raise ToolException(f"http error from Enso API: {http_err}") from http_err
+        except Exception as e:
+            raise ToolException(f"error from Enso API: {e}") from e
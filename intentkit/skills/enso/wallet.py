@@ -85,24 +85,24 @@ class EnsoGetWalletBalances(EnsoBaseTool):
         params["eoaAddress"] = account.address
         params["useEoa"] = True
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # Send the GET request
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-
-                # Map the response JSON into the WalletBalance model
-                json_dict = response.json()[:20]
-                res = [WalletBalance(**item) for item in json_dict]
-
-                # Return the parsed response
-                return EnsoGetBalancesOutput(res=res)
-            except httpx.RequestError as req_err:
-                raise ToolException("request error from Enso API") from req_err
-            except httpx.HTTPStatusError as http_err:
-                raise ToolException("http error from Enso API") from http_err
-            except Exception as e:
-                raise ToolException(f"error from Enso API: {e}") from e
+        client = self.http_client()
+        try:
+            # Send the GET request
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+
+            # Map the response JSON into the WalletBalance model
+            json_dict = response.json()[:20]
+            res = [WalletBalance(**item) for item in json_dict]
+
+            # Return the parsed response
+            return EnsoGetBalancesOutput(res=res)
+        except httpx.RequestError as req_err:
+            raise ToolException("request error from Enso API") from req_err
+        except httpx.HTTPStatusError as http_err:
+            raise ToolException("http error from Enso API") from http_err
+        except Exception as e:
+            raise ToolException(f"error from Enso API: {e}") from e
 
 
 class EnsoGetApprovalsInput(BaseModel):
@@ -186,30 +186,26 @@ class EnsoGetWalletApprovals(EnsoBaseTool):
         if kwargs.get("routingStrategy"):
             params.routingStrategy = kwargs["routingStrategy"]
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # Send the GET request
-                response = await client.get(
-                    url, headers=headers, params=params.model_dump(exclude_none=True)
-                )
-                response.raise_for_status()
-
-                # Map the response JSON into the ApprovalsResponse model
-                json_dict = response.json()[:50]
-                res = [WalletAllowance(**item) for item in json_dict]
-
-                # Return the parsed response
-                return EnsoGetApprovalsOutput(res=res)
-            except httpx.RequestError as req_err:
-                raise ToolException(
-                    f"request error from Enso API: {req_err}"
-                ) from req_err
-            except httpx.HTTPStatusError as http_err:
-                raise ToolException(
-                    f"http error from Enso API: {http_err}"
-                ) from http_err
-            except Exception as e:
-                raise ToolException(f"error from Enso API: {e}") from e
+        client = self.http_client()
+        try:
+            # Send the GET request
+            response = await client.get(
+                url, headers=headers, params=params.model_dump(exclude_none=True)
+            )
+            response.raise_for_status()
+
+            # Map the response JSON into the ApprovalsResponse model
+            json_dict = response.json()[:50]
+            res = [WalletAllowance(**item) for item in json_dict]
+
+            # Return the parsed response
+            return EnsoGetApprovalsOutput(res=res)
+        except httpx.RequestError as req_err:
+            raise ToolException(f"request error from Enso API: {req_err}") from req_err
+        except httpx.HTTPStatusError as http_err:
+            raise ToolException(f"http error from Enso API: {http_err}") from http_err
+        except Exception as e:
+            raise ToolException(f"error from Enso API: {e}") from e
 
 
 class EnsoWalletApproveInput(BaseModel):
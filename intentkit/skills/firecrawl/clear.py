@@ -4,6 +4,7 @@ from typing import Type
 from pydantic import BaseModel, Field
 
 from intentkit.skills.firecrawl.base import FirecrawlBaseTool
+from intentkit.skills.web_scraper.utils import VectorStoreManager
 
 logger = logging.getLogger(__name__)
 
@@ -60,11 +61,8 @@ class FirecrawlClearIndexedContent(FirecrawlBaseTool):
         )
 
         try:
-            # Delete vector store data (using web_scraper storage format for compatibility)
-            vector_store_key = f"vector_store_{agent_id}"
-            await self.skill_store.delete_agent_skill_data(
-                agent_id, "web_scraper", vector_store_key
-            )
+            # Delete vector store data (shared with web_scraper)
+            await VectorStoreManager(self.skill_store).delete_vector_store(agent_id)
 
             # Delete metadata
             metadata_key = f"indexed_urls_{agent_id}"
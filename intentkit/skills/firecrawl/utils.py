@@ -5,11 +5,12 @@ import re
 from typing import Any, Dict, List, Optional, Tuple
 
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 from langchain_openai import OpenAIEmbeddings
 
 from intentkit.abstracts.skill import SkillStoreABC
+from intentkit.skills.web_scraper.embeddings import CachedEmbeddings, fake_embeddings
+from intentkit.skills.web_scraper.utils import SegmentedVectorStore, VectorStoreManager
 
 logger = logging.getLogger(__name__)
 
@@ -65,107 +66,39 @@ class FirecrawlVectorStoreManager:
     def __init__(self, skill_store: SkillStoreABC):
         self.skill_store = skill_store
 
-    def create_embeddings(self) -> OpenAIEmbeddings:
-        """Create OpenAI embeddings instance."""
+    def create_embeddings(self) -> CachedEmbeddings:
+        """Create cached OpenAI embeddings instance."""
+        if self.skill_store.get_system_config("fake_embeddings"):
+            return fake_embeddings()
         openai_api_key = self.skill_store.get_system_config("openai_api_key")
         if not openai_api_key:
             raise ValueError("OpenAI API key not found in system configuration")
 
-        return OpenAIEmbeddings(
+        embeddings = OpenAIEmbeddings(
             openai_api_key=openai_api_key, model="text-embedding-3-small"
         )
+        return CachedEmbeddings(embeddings, embeddings.model)
 
-    def encode_vector_store(self, vector_store: FAISS) -> Dict[str, str]:
-        """Encode FAISS vector store to base64 for storage (compatible with web_scraper)."""
-        import base64
-        import os
-        import tempfile
-
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                vector_store.save_local(temp_dir)
-
-                encoded_files = {}
-                for filename in os.listdir(temp_dir):
-                    file_path = os.path.join(temp_dir, filename)
-                    if os.path.isfile(file_path):
-                        with open(file_path, "rb") as f:
-                            encoded_files[filename] = base64.b64encode(f.read()).decode(
-                                "utf-8"
-                            )
-
-                return encoded_files
-        except Exception as e:
-            logger.error(f"Error encoding vector store: {e}")
-            raise
-
-    def decode_vector_store(
-        self, encoded_files: Dict[str, str], embeddings: OpenAIEmbeddings
-    ) -> FAISS:
-        """Decode base64 files back to FAISS vector store (compatible with web_scraper)."""
-        import base64
-        import os
-        import tempfile
-
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Decode and write files
-                for filename, encoded_content in encoded_files.items():
-                    file_path = os.path.join(temp_dir, filename)
-                    with open(file_path, "wb") as f:
-                        f.write(base64.b64decode(encoded_content))
-
-                # Load vector store
-                return FAISS.load_local(
-                    temp_dir,
-                    embeddings,
-                    allow_dangerous_deserialization=True,
-                )
-        except Exception as e:
-            logger.error(f"Error decoding vector store: {e}")
-            raise
-
-    async def load_vector_store(self, agent_id: str) -> Optional[FAISS]:
-        """Load existing vector store for an agent."""
+    async def load_vector_store(self, agent_id: str) -> Optional[SegmentedVectorStore]:
+        """Load existing vector store for an agent (shared with web_scraper)."""
         try:
-            vector_store_key = f"vector_store_{agent_id}"
-            stored_data = await self.skill_store.get_agent_skill_data(
-                agent_id, "web_scraper", vector_store_key
+            return await VectorStoreManager(self.skill_store).load_vector_store(
+                agent_id, self.create_embeddings()
             )
-
-            if not stored_data or "faiss_files" not in stored_data:
-                return None
-
-            embeddings = self.create_embeddings()
-            return self.decode_vector_store(stored_data["faiss_files"], embeddings)
-
         except Exception as e:
             logger.error(f"Error loading vector store for agent {agent_id}: {e}")
             return None
 
-    async def save_vector_store(
-        self,
-        agent_id: str,
-        vector_store: FAISS,
-        chunk_size: int = 1000,
-        chunk_overlap: int = 200,
-    ) -> None:
-        """Save vector store for an agent (compatible with web_scraper format)."""
-        try:
-            vector_store_key = f"vector_store_{agent_id}"
-            encoded_files = self.encode_vector_store(vector_store)
-
-            # Use the same data structure as web_scraper
-            storage_data = {
-                "faiss_files": encoded_files,
-                "chunk_size": chunk_size,
-                "chunk_overlap": chunk_overlap,
-            }
+    async def append_documents(self, agent_id: str, documents: List[Document]) -> bool:
+        """Append documents to the agent vector store (shared with web_scraper).
 
-            await self.skill_store.save_agent_skill_data(
-                agent_id, "web_scraper", vector_store_key, storage_data
+        Returns:
+            bool: Whether the agent already had indexed content
+        """
+        try:
+            return await VectorStoreManager(self.skill_store).append_documents(
+                documents, agent_id, self.create_embeddings()
             )
-
         except Exception as e:
             logger.error(f"Error saving vector store for agent {agent_id}: {e}")
             raise
@@ -235,26 +168,8 @@ async def index_documents(
             logger.warning("No documents to index after splitting")
             return 0, False
 
-        # Create embeddings
-        embeddings = vs_manager.create_embeddings()
-
-        # Try to load existing vector store
-        existing_vector_store = await vs_manager.load_vector_store(agent_id)
-
-        if existing_vector_store:
-            # Add to existing vector store
-            existing_vector_store.add_documents(split_docs)
-            vector_store = existing_vector_store
-            was_merged = True
-        else:
-            # Create new vector store
-            vector_store = FAISS.from_documents(split_docs, embeddings)
-            was_merged = False
-
-        # Save the vector store
-        await vs_manager.save_vector_store(
-            agent_id, vector_store, chunk_size, chunk_overlap
-        )
+        # Append the chunks as a new segment of the agent index
+        was_merged = await vs_manager.append_documents(agent_id, split_docs)
 
         logger.info(
             f"Successfully indexed {len(split_docs)} chunks for agent {agent_id}"
@@ -296,7 +211,7 @@ async def query_indexed_content(
             return []
 
         # Perform similarity search
-        docs = vector_store.similarity_search(query, k=max_results)
+        docs = await vector_store.asimilarity_search(query, k=max_results)
 
         logger.info(f"Found {len(docs)} documents for query: {query}")
         return docs
@@ -5,7 +5,9 @@ from typing import Dict
 
 import httpx
 
+from intentkit.skills.cache import response_cache
 from intentkit.skills.moralis.base import CHAIN_MAPPING
+from intentkit.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -43,20 +45,21 @@ async def fetch_moralis_data(
         params = params or {}
         params["chain"] = CHAIN_MAPPING.get(chain_id, "eth")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.RequestError as e:
-            logger.error(f"API request error: {e}")
-            return {"error": str(e)}
-        except httpx.HTTPStatusError as e:
-            logger.error(f"API error: {e.response.status_code} {e.response.text}")
-            return {"error": f"HTTP error {e.response.status_code}"}
+    client = get_http_client("moralis")
+    try:
+        response = await client.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        return response.json()
+    except httpx.RequestError as e:
+        logger.error(f"API request error: {e}")
+        return {"error": str(e)}
+    except httpx.HTTPStatusError as e:
+        logger.error(f"API error: {e.response.status_code} {e.response.text}")
+        return {"error": f"HTTP error {e.response.status_code}"}
 
 
 # Wallet Balances
+@response_cache(ttl=60)
 async def fetch_wallet_balances(
     api_key: str, address: str, chain_id: int = None
 ) -> dict:
@@ -75,6 +78,7 @@ async def fetch_wallet_balances(
 
 
 # NFT Balances
+@response_cache(ttl=300)
 async def fetch_nft_data(
     api_key: str, address: str, chain_id: int = None, params: dict = None
 ) -> dict:
@@ -99,6 +103,7 @@ async def fetch_nft_data(
 
 
 # Transaction History
+@response_cache(ttl=60)
 async def fetch_transaction_history(
     api_key: str,
     address: str,
@@ -126,6 +131,7 @@ async def fetch_transaction_history(
 
 
 # Token Approvals
+@response_cache(ttl=300)
 async def fetch_token_approvals(
     api_key: str, address: str, chain_id: int = None
 ) -> dict:
@@ -144,6 +150,7 @@ async def fetch_token_approvals(
 
 
 # Net Worth
+@response_cache(ttl=60)
 async def fetch_net_worth(api_key: str, address: str) -> dict:
     """Get wallet net worth.
 
@@ -183,21 +190,20 @@ async def fetch_solana_api(api_key: str, endpoint: str, params: Dict = None) ->
     headers = {"X-API-Key": api_key}
     url = f"{base_url}{endpoint}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.RequestError as e:
-            logger.error(f"Solana API request error: {e}")
-            return {"error": str(e)}
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                f"Solana API error: {e.response.status_code} {e.response.text}"
-            )
-            return {"error": f"HTTP error {e.response.status_code}: {e.response.text}"}
+    client = get_http_client("moralis")
+    try:
+        response = await client.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        return response.json()
+    except httpx.RequestError as e:
+        logger.error(f"Solana API request error: {e}")
+        return {"error": str(e)}
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Solana API error: {e.response.status_code} {e.response.text}")
+        return {"error": f"HTTP error {e.response.status_code}: {e.response.text}"}
 
 
+@response_cache(ttl=60)
 async def get_solana_portfolio(
     api_key: str, address: str, network: str = "mainnet"
 ) -> Dict:
@@ -215,6 +221,7 @@ async def get_solana_portfolio(
     return await fetch_solana_api(api_key, endpoint)
 
 
+@response_cache(ttl=60)
 async def get_solana_balance(
     api_key: str, address: str, network: str = "mainnet"
 ) -> Dict:
@@ -232,6 +239,7 @@ async def get_solana_balance(
     return await fetch_solana_api(api_key, endpoint)
 
 
+@response_cache(ttl=60)
 async def get_solana_spl_tokens(
     api_key: str, address: str, network: str = "mainnet"
 ) -> Dict:
@@ -249,6 +257,7 @@ async def get_solana_spl_tokens(
     return await fetch_solana_api(api_key, endpoint)
 
 
+@response_cache(ttl=300)
 async def get_solana_nfts(api_key: str, address: str, network: str = "mainnet") -> Dict:
     """Get NFTs owned by a Solana wallet.
 
@@ -264,6 +273,7 @@ async def get_solana_nfts(api_key: str, address: str, network: str = "mainnet")
     return await fetch_solana_api(api_key, endpoint)
 
 
+@response_cache(ttl=30)
 async def get_token_price(
     api_key: str, token_address: str, network: str = "mainnet"
 ) -> Dict:
@@ -66,6 +66,7 @@ class TokenBalances(PortfolioBaseTool):
     """
 
     name: str = "portfolio_token_balances"
+    response_cache_ttl: int = 60
     description: str = (
         "Get token balances for a specific wallet address and their token prices in USD. "
         "Includes options to exclude spam and unverified contracts."
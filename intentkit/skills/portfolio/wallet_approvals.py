@@ -38,6 +38,7 @@ class WalletApprovals(PortfolioBaseTool):
     """
 
     name: str = "portfolio_wallet_approvals"
+    response_cache_ttl: int = 300
     description: str = (
         "Retrieve active ERC20 token approvals for the specified wallet address. "
         "This helps identify which contracts have permission to spend tokens."
@@ -27,6 +27,7 @@ class WalletDefiPositions(PortfolioBaseTool):
     """
 
     name: str = "portfolio_wallet_defi_positions"
+    response_cache_ttl: int = 60
     description: str = (
         "Get the DeFi positions summary of a wallet address. "
         "Returns information about liquidity positions, staking, lending, and other DeFi activities."
@@ -69,6 +69,7 @@ class WalletHistory(PortfolioBaseTool):
     """
 
     name: str = "portfolio_wallet_history"
+    response_cache_ttl: int = 30
     description: str = (
         "Retrieve the full transaction history of a specified wallet address, including sends, "
         "receives, token and NFT transfers, and contract interactions."
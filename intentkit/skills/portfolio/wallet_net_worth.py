@@ -42,6 +42,7 @@ class WalletNetWorth(PortfolioBaseTool):
     """
 
     name: str = "portfolio_wallet_net_worth"
+    response_cache_ttl: int = 60
     description: str = (
         "Get the net worth of a wallet in USD across multiple chains. "
         "Filters out spam tokens and low-liquidity assets for more accurate results."
@@ -59,6 +59,7 @@ class WalletNFTs(PortfolioBaseTool):
     """
 
     name: str = "portfolio_wallet_nfts"
+    response_cache_ttl: int = 300
     description: str = (
         "Get NFTs owned by a given wallet address. Results include token details, "
         "metadata, collection information, and optionally prices."
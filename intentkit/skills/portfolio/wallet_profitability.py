@@ -37,6 +37,7 @@ class WalletProfitability(PortfolioBaseTool):
     """
 
     name: str = "portfolio_wallet_profitability"
+    response_cache_ttl: int = 300
     description: str = (
         "Retrieve detailed profitability breakdown for a wallet, including profit/loss per token, "
         "average buy/sell prices, and realized profits. Can be filtered by specific tokens."
@@ -33,6 +33,7 @@ class WalletProfitabilitySummary(PortfolioBaseTool):
     """
 
     name: str = "portfolio_wallet_profitability_summary"
+    response_cache_ttl: int = 300
     description: str = (
         "Retrieve a summary of wallet profitability including total profit/loss, "
         "trade volume, and other metrics. Filter by time period."
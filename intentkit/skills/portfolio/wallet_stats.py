@@ -27,6 +27,7 @@ class WalletStats(PortfolioBaseTool):
     """
 
     name: str = "portfolio_wallet_stats"
+    response_cache_ttl: int = 300
     description: str = (
         "Get statistical information about a wallet, including the number of NFTs, "
         "collections, and transaction counts."
@@ -63,6 +63,7 @@ class WalletSwaps(PortfolioBaseTool):
     """
 
     name: str = "portfolio_wallet_swaps"
+    response_cache_ttl: int = 30
     description: str = (
         "Get all swap-related transactions (buy, sell) for a wallet address. "
         "Note that swaps data is only available from September 2024 onwards."
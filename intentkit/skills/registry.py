@@ -0,0 +1,218 @@
+"""
+Central registry of skill categories.
+
+Everything known about a category without importing it (tool names, state
+defaults, API key providers, the JSON schema and the author) is read from
+manifest.json, which is generated from the schema.json files and skills.toml
+by scripts/build_skill_manifest.py. Skill modules are imported only when an
+agent first uses the category, and stateless tools are shared by all agents
+of the process.
+"""
+
+import importlib
+import json
+import logging
+import tomllib
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from intentkit.abstracts.skill import SkillStoreABC
+
+logger = logging.getLogger(__name__)
+
+SKILLS_DIR = Path(__file__).parent
+MANIFEST_PATH = SKILLS_DIR / "manifest.json"
+AUTHORS_PATH = SKILLS_DIR / "skills.toml"
+
+T = TypeVar("T")
+
+
+class SkillCategoryInfo(BaseModel):
+    """Manifest entry of a skill category."""
+
+    name: str
+    title: str = ""
+    description: str = ""
+    tags: List[str] = Field(default_factory=list)
+    icon: Optional[str] = None
+    author: Optional[str] = None
+    # Tool name -> default state
+    states: Dict[str, str] = Field(default_factory=dict)
+    api_key_providers: List[str] = Field(default_factory=list)
+    default_api_key_provider: str = "platform"
+    json_schema: Dict[str, Any] = Field(default_factory=dict)
+
+
+def _category_info(
+    name: str, schema: Dict[str, Any], author: Optional[str]
+) -> Dict[str, Any]:
+    properties = schema.get("properties", {})
+    states = {}
+    for state, state_schema in (
+        properties.get("states", {}).get("properties", {}).items()
+    ):
+        default = state_schema.get("default")
+        if default is None:
+            default = (state_schema.get("enum") or ["private"])[0]
+        states[state] = default
+
+    provider_schema = properties.get("api_key_provider", {})
+    providers = provider_schema.get("enum", [])
+    default_provider = provider_schema.get("default")
+    if default_provider is None:
+        if not providers or "platform" in providers:
+            default_provider = "platform"
+        else:
+            default_provider = providers[0]
+
+    return {
+        "name": name,
+        "title": schema.get("title", ""),
+        "description": schema.get("description", ""),
+        "tags": schema.get("x-tags", []),
+        "icon": schema.get("x-icon"),
+        "author": author,
+        "states": states,
+        "api_key_providers": providers,
+        "default_api_key_provider": default_provider,
+        "json_schema": schema,
+    }
+
+
+def build_manifest() -> Dict[str, Any]:
+    """Build the manifest from the schema.json files and skills.toml.
+
+    Returns:
+        Dict with a `categories` map of category name to SkillCategoryInfo data
+    """
+    authors = {}
+    if AUTHORS_PATH.exists():
+        with open(AUTHORS_PATH, "rb") as f:
+            authors = tomllib.load(f)
+
+    categories = {}
+    for schema_path in sorted(SKILLS_DIR.glob("*/schema.json")):
+        name = schema_path.parent.name
+        if name.startswith("_"):
+            continue
+        with open(schema_path, encoding="utf-8") as f:
+            schema = json.load(f)
+        author = authors.get(name, {}).get("author_github")
+        categories[name] = _category_info(name, schema, author)
+    return {"categories": categories}
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    """Build the manifest and write it to manifest.json."""
+    manifest = build_manifest()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, ensure_ascii=False, sort_keys=True)
+        f.write("\n")
+    return manifest
+
+
+class SkillRegistry:
+    """Indexed lookup of skill categories, their modules and shared tools.
+
+    Args:
+        manifest: Manifest as produced by build_manifest
+    """
+
+    def __init__(self, manifest: Dict[str, Any]):
+        self._categories: Dict[str, SkillCategoryInfo] = {
+            name: SkillCategoryInfo.model_validate(data)
+            for name, data in manifest["categories"].items()
+        }
+        self._modules: Dict[str, ModuleType] = {}
+        # (category, tool name) -> tool instance shared by all agents
+        self._tools: Dict[tuple, Any] = {}
+
+    @property
+    def categories(self) -> List[str]:
+        """Names of all skill categories."""
+        return list(self._categories)
+
+    def has(self, category: str) -> bool:
+        return category in self._categories
+
+    def get(self, category: str) -> Optional[SkillCategoryInfo]:
+        """Manifest entry of a category, None if it does not exist."""
+        return self._categories.get(category)
+
+    def tool_names(self, category: str) -> List[str]:
+        """Names of the tools of a category, which are also its state keys."""
+        info = self._categories.get(category)
+        return list(info.states) if info else []
+
+    def schema(self, category: str) -> Optional[Dict[str, Any]]:
+        """JSON schema of a category config, shared, copy it to modify."""
+        info = self._categories.get(category)
+        return info.json_schema if info else None
+
+    def module(self, category: str) -> ModuleType:
+        """Import the skill module of a category on first use.
+
+        Raises:
+            ImportError: If the category does not exist or fails to import
+        """
+        module = self._modules.get(category)
+        if module is None:
+            if category not in self._categories:
+                raise ImportError(f"Unknown skill category {category}")
+            module = importlib.import_module(f"intentkit.skills.{category}")
+            self._modules[category] = module
+        return module
+
+    async def get_tools(
+        self,
+        category: str,
+        config: Dict[str, Any],
+        is_private: bool,
+        store: "SkillStoreABC",
+        agent_id: str,
+    ) -> list:
+        """Get the tools of a category enabled by an agent skill config.
+
+        Raises:
+            ImportError: If the category does not exist or fails to import
+        """
+        module = self.module(category)
+        get_skills = getattr(module, "get_skills", None)
+        if get_skills is None:
+            logger.error(f"Skill {category} does not have get_skills function")
+            return []
+        return await get_skills(config, is_private, store, agent_id=agent_id)
+
+    def shared_tool(self, category: str, name: str, factory: Callable[[], T]) -> T:
+        """Get a stateless tool instance, created once per process."""
+        key = (category, name)
+        tool = self._tools.get(key)
+        if tool is None:
+            tool = factory()
+            self._tools[key] = tool
+        return tool
+
+
+_registry: Optional[SkillRegistry] = None
+
+
+def get_skill_registry() -> SkillRegistry:
+    """Get the process-wide skill registry, loaded from manifest.json.
+
+    The manifest is built from the schema files when manifest.json is missing,
+    as in a source checkout where it has not been generated yet.
+    """
+    global _registry
+    if _registry is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            logger.warning("Skill manifest not found, building it from schemas")
+            manifest = build_manifest()
+        _registry = SkillRegistry(manifest)
+    return _registry
@@ -1,7 +1,6 @@
 import logging
 from typing import Type
 
-import httpx
 from pydantic import BaseModel, Field
 
 from intentkit.skills.tavily.base import TavilyBaseTool
@@ -92,51 +91,51 @@ class TavilyExtract(TavilyBaseTool):
 
         # Call Tavily extract API
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/extract",
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    json={
-                        "urls": urls,
-                        "include_images": include_images,
-                        "extract_depth": extract_depth,
-                    },
-                )
+            client = self.http_client()
+            response = await client.post(
+                "https://api.tavily.com/extract",
+                headers={"Authorization": f"Bearer {api_key}"},
+                json={
+                    "urls": urls,
+                    "include_images": include_images,
+                    "extract_depth": extract_depth,
+                },
+            )
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"tavily_extract.py: Error from Tavily API: {response.status_code} - {response.text}"
-                    )
-                    return f"Error extracting web page content: {response.status_code} - {response.text}"
+            if response.status_code != 200:
+                logger.error(
+                    f"tavily_extract.py: Error from Tavily API: {response.status_code} - {response.text}"
+                )
+                return f"Error extracting web page content: {response.status_code} - {response.text}"
 
-                data = response.json()
-                results = data.get("results", [])
+            data = response.json()
+            results = data.get("results", [])
 
-                if not results:
-                    return f"No content could be extracted from URL: '{urls}'"
+            if not results:
+                return f"No content could be extracted from URL: '{urls}'"
 
-                # Format the results
-                formatted_results = f"Web page content extracted from: '{urls}'\n\n"
+            # Format the results
+            formatted_results = f"Web page content extracted from: '{urls}'\n\n"
 
-                for i, result in enumerate(results, 1):
-                    url = result.get("url", "No URL")
-                    raw_content = result.get("raw_content", "No content available")
+            for i, result in enumerate(results, 1):
+                url = result.get("url", "No URL")
+                raw_content = result.get("raw_content", "No content available")
 
-                    # Truncate the content if it's too long (over 2000 characters)
-                    if len(raw_content) > 2000:
-                        raw_content = raw_content[:2000] + "...[content truncated]"
+                # Truncate the content if it's too long (over 2000 characters)
+                if len(raw_content) > 2000:
+                    raw_content = raw_content[:2000] + "...[content truncated]"
 
-                    formatted_results += f"{i}. Content from {url}:\n\n"
-                    formatted_results += f"{raw_content}\n\n"
+                formatted_results += f"{i}. Content from {url}:\n\n"
+                formatted_results += f"{raw_content}\n\n"
 
-                    # Add images if available and requested
-                    if include_images and "images" in result and result["images"]:
-                        formatted_results += "Images:\n"
-                        for j, image_url in enumerate(result["images"], 1):
-                            formatted_results += f"  {j}. {image_url}\n"
-                        formatted_results += "\n"
+                # Add images if available and requested
+                if include_images and "images" in result and result["images"]:
+                    formatted_results += "Images:\n"
+                    for j, image_url in enumerate(result["images"], 1):
+                        formatted_results += f"  {j}. {image_url}\n"
+                    formatted_results += "\n"
 
-                return formatted_results.strip()
+            return formatted_results.strip()
 
         except Exception as e:
             logger.error(
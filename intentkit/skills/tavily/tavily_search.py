@@ -1,7 +1,6 @@
 import logging
 from typing import Type
 
-import httpx
 from pydantic import BaseModel, Field
 
 from intentkit.skills.tavily.base import TavilyBaseTool
@@ -98,43 +97,45 @@ class TavilySearch(TavilyBaseTool):
 
         # Call Tavily search API
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": api_key,
-                        "query": query,
-                        "max_results": max_results,
-                        "include_images": include_images,
-                        "include_raw_content": include_raw_content,
-                    },
+            client = self.http_client()
+            response = await client.post(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": api_key,
+                    "query": query,
+                    "max_results": max_results,
+                    "include_images": include_images,
+                    "include_raw_content": include_raw_content,
+                },
+            )
+
+            if response.status_code != 200:
+                logger.error(
+                    f"tavily.py: Error from Tavily API: {response.status_code} - {response.text}"
+                )
+                return (
+                    f"Error searching the web: {response.status_code} - {response.text}"
                 )
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"tavily.py: Error from Tavily API: {response.status_code} - {response.text}"
-                    )
-                    return f"Error searching the web: {response.status_code} - {response.text}"
-
-                data = response.json()
-                results = data.get("results", [])
+            data = response.json()
+            results = data.get("results", [])
 
-                if not results:
-                    return f"No results found for query: '{query}'"
+            if not results:
+                return f"No results found for query: '{query}'"
 
-                # Format the results
-                formatted_results = f"Web search results for: '{query}'\n\n"
+            # Format the results
+            formatted_results = f"Web search results for: '{query}'\n\n"
 
-                for i, result in enumerate(results, 1):
-                    title = result.get("title", "No title")
-                    content = result.get("content", "No content")
-                    url = result.get("url", "No URL")
+            for i, result in enumerate(results, 1):
+                title = result.get("title", "No title")
+                content = result.get("content", "No content")
+                url = result.get("url", "No URL")
 
-                    formatted_results += f"{i}. {title}\n"
-                    formatted_results += f"{content}\n"
-                    formatted_results += f"Source: {url}\n\n"
+                formatted_results += f"{i}. {title}\n"
+                formatted_results += f"{content}\n"
+                formatted_results += f"Source: {url}\n\n"
 
-                return formatted_results.strip()
+            return formatted_results.strip()
 
         except Exception as e:
             logger.error(f"tavily.py: Error searching web: {e}", exc_info=True)
@@ -0,0 +1,163 @@
+"""Tests for the skill response cache, in process and with fakeredis."""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from fakeredis import FakeAsyncRedis
+from intentkit.models import redis as redis_module
+from intentkit.skills import cache
+from intentkit.skills.cache import response_cache
+
+
+class Upstream:
+    """Fake upstream counting calls and returning the current value."""
+
+    def __init__(self, value="v1"):
+        self.value = value
+        self.calls = 0
+        self.gate = None
+
+    async def fetch(self, symbol: str, api_key: str = "") -> dict:
+        self.calls += 1
+        if self.gate:
+            await self.gate.wait()
+        return {"symbol": symbol, "value": self.value}
+
+
+class ResponseCacheCases:
+    """Cases run with the in-process cache only and with Redis behind it."""
+
+    def setUp(self):
+        cache._local.clear()
+        cache._inflight.clear()
+        cache._refreshing.clear()
+        self.now = 1_000_000.0
+        clock = patch.object(cache.time, "time", lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+        self.upstream = Upstream()
+        self.cached = response_cache(ttl=60)(self.upstream.fetch)
+
+    async def refreshed(self):
+        """Wait for background refreshes to finish."""
+        await asyncio.gather(*list(cache._refreshing.values()))
+
+    async def test_fresh_result_is_served_from_cache(self):
+        first = await self.cached("BTC")
+        self.upstream.value = "v2"
+        second = await self.cached("BTC")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.upstream.calls, 1)
+
+    async def test_callers_get_their_own_copy(self):
+        first = await self.cached("BTC")
+        first["value"] = "changed"
+
+        self.assertEqual((await self.cached("BTC"))["value"], "v1")
+
+    async def test_ignored_arguments_share_an_entry(self):
+        await self.cached("BTC", api_key="a")
+        await self.cached("BTC", api_key="b")
+        await self.cached("ETH", api_key="a")
+
+        self.assertEqual(self.upstream.calls, 2)
+
+    async def test_stale_result_is_served_while_refreshing(self):
+        await self.cached("BTC")
+        self.upstream.value = "v2"
+        self.now += 61
+
+        stale = await self.cached("BTC")
+        await self.refreshed()
+        fresh = await self.cached("BTC")
+
+        self.assertEqual(stale["value"], "v1")
+        self.assertEqual(fresh["value"], "v2")
+        self.assertEqual(self.upstream.calls, 2)
+
+    async def test_stale_entry_is_refreshed_once(self):
+        await self.cached("BTC")
+        self.now += 61
+
+        await asyncio.gather(*(self.cached("BTC") for _ in range(5)))
+        await self.refreshed()
+
+        self.assertEqual(self.upstream.calls, 2)
+
+    async def test_result_past_the_stale_window_is_fetched_again(self):
+        await self.cached("BTC")
+        self.upstream.value = "v2"
+        self.now += 121
+
+        result = await self.cached("BTC")
+
+        self.assertEqual(result["value"], "v2")
+        self.assertEqual(self.upstream.calls, 2)
+
+    async def test_concurrent_calls_share_one_upstream_request(self):
+        self.upstream.gate = asyncio.Event()
+        calls = [asyncio.create_task(self.cached("BTC")) for _ in range(5)]
+        await asyncio.sleep(0)
+        self.upstream.gate.set()
+        results = await asyncio.gather(*calls)
+
+        self.assertEqual(self.upstream.calls, 1)
+        self.assertEqual(len({result["value"] for result in results}), 1)
+
+    async def test_errors_are_not_cached(self):
+        calls = 0
+
+        @response_cache(ttl=60)
+        async def failing() -> dict:
+            nonlocal calls
+            calls += 1
+            return {"error": "upstream down"}
+
+        await failing()
+        await failing()
+
+        self.assertEqual(calls, 2)
+
+
+class TestLocalResponseCache(ResponseCacheCases, unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        redis_module._redis_client = None
+        super().setUp()
+
+
+class TestRedisResponseCache(ResponseCacheCases, unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        redis_module._redis_client = FakeAsyncRedis(decode_responses=True)
+        self.addCleanup(setattr, redis_module, "_redis_client", None)
+        super().setUp()
+
+    async def test_other_processes_read_the_shared_entry(self):
+        await self.cached("BTC")
+        # Another process starts with an empty local cache
+        cache._local.clear()
+        self.upstream.value = "v2"
+
+        result = await self.cached("BTC")
+
+        self.assertEqual(result["value"], "v1")
+        self.assertEqual(self.upstream.calls, 1)
+
+    async def test_other_processes_refresh_a_stale_shared_entry(self):
+        await self.cached("BTC")
+        cache._local.clear()
+        self.upstream.value = "v2"
+        self.now += 61
+
+        stale = await self.cached("BTC")
+        await self.refreshed()
+        cache._local.clear()
+        fresh = await self.cached("BTC")
+
+        self.assertEqual(stale["value"], "v1")
+        self.assertEqual(fresh["value"], "v2")
+
+
+if __name__ == "__main__":
+    unittest.main()
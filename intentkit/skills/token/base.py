@@ -7,6 +7,7 @@ import aiohttp
 
 from intentkit.abstracts.skill import SkillStoreABC
 from intentkit.skills.base import IntentKitSkill
+from intentkit.skills.cache import cached_call
 from intentkit.skills.token.constants import MORALIS_API_BASE_URL
 
 logger = logging.getLogger(__name__)
@@ -67,7 +68,36 @@ class TokenBaseTool(IntentKitSkill):
         params: Dict[str, Any] = None,
         data: Dict[str, Any] = None,
     ) -> Dict[str, Any]:
-        """Make a request to the Moralis API.
+        """Make a request to the Moralis API, GET responses are cached.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (without base URL)
+            api_key: Moralis API key
+            params: Query parameters
+            data: Request body data for POST requests
+
+        Returns:
+            Response data as dictionary
+        """
+        if method != "GET" or not self.response_cache_ttl:
+            return await self._send_request(method, endpoint, api_key, params, data)
+        return await cached_call(
+            f"{self.category}:{endpoint}",
+            self._prepare_params(params) if params else None,
+            lambda: self._send_request(method, endpoint, api_key, params, data),
+            self.response_cache_ttl,
+        )
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        api_key: str,
+        params: Dict[str, Any] = None,
+        data: Dict[str, Any] = None,
+    ) -> Dict[str, Any]:
+        """Send a request to the Moralis API without caching.
 
         Args:
             method: HTTP method (GET, POST, etc.)
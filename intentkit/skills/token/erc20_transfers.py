@@ -61,6 +61,7 @@ class ERC20Transfers(TokenBaseTool):
     """
 
     name: str = "token_erc20_transfers"
+    response_cache_ttl: int = 30
     description: str = (
         "Get ERC20 token transactions for a wallet address, ordered by block number. "
         "Returns transaction details, token information, and wallet interactions."
@@ -27,6 +27,7 @@ class TokenAnalytics(TokenBaseTool):
     """
 
     name: str = "token_analytics"
+    response_cache_ttl: int = 60
     description: str = (
         "Get analytics for a token by token address. "
         "Returns trading volumes, number of buyers/sellers, and liquidity information over various time periods."
@@ -49,6 +49,7 @@ class TokenPrice(TokenBaseTool):
     """
 
     name: str = "token_price"
+    response_cache_ttl: int = 30
     description: str = (
         "Get the token price denominated in the blockchain's native token and USD for a given token contract address. "
         "Returns price, token information and exchange data."
@@ -39,6 +39,7 @@ class TokenSearch(TokenBaseTool):
     """
 
     name: str = "token_search"
+    response_cache_ttl: int = 300
     description: str = (
         "Search for tokens based on contract address, token name or token symbol. "
         "Returns token information including price, market cap, and security information. "
@@ -1,4 +1,3 @@
-from datetime import datetime, timedelta, timezone
 from typing import Type
 
 from langchain.tools.base import ToolException
@@ -6,7 +5,7 @@ from pydantic import BaseModel, Field
 
 from intentkit.abstracts.skill import SkillStoreABC
 from intentkit.skills.base import IntentKitSkill
-from intentkit.utils.error import RateLimitExceeded
+from intentkit.utils.rate_limit import RateLimitStatus
 
 
 class TwitterBaseTool(IntentKitSkill):
@@ -65,7 +64,7 @@ class TwitterBaseTool(IntentKitSkill):
 
     async def check_rate_limit(
         self, agent_id: str, max_requests: int = 1, interval: int = 15
-    ) -> None:
+    ) -> RateLimitStatus:
         """Check if the rate limit has been exceeded.
 
         Args:
@@ -73,37 +72,10 @@ class TwitterBaseTool(IntentKitSkill):
             max_requests: Maximum number of requests allowed within the rate limit window.
             interval: Time interval in minutes for the rate limit window.
 
+        Returns:
+            RateLimitStatus: The headroom left.
+
         Raises:
             RateLimitExceeded: If the rate limit has been exceeded.
         """
-        rate_limit = await self.skill_store.get_agent_skill_data(
-            agent_id, self.name, "rate_limit"
-        )
-
-        current_time = datetime.now(tz=timezone.utc)
-
-        if (
-            rate_limit
-            and rate_limit.get("reset_time")
-            and rate_limit["count"] is not None
-            and datetime.fromisoformat(rate_limit["reset_time"]) > current_time
-        ):
-            if rate_limit["count"] >= max_requests:
-                raise RateLimitExceeded("Rate limit exceeded")
-
-            rate_limit["count"] += 1
-            await self.skill_store.save_agent_skill_data(
-                agent_id, self.name, "rate_limit", rate_limit
-            )
-
-            return
-
-        # If no rate limit exists or it has expired, create a new one
-        new_rate_limit = {
-            "count": 1,
-            "reset_time": (current_time + timedelta(minutes=interval)).isoformat(),
-        }
-        await self.skill_store.save_agent_skill_data(
-            agent_id, self.name, "rate_limit", new_rate_limit
-        )
-        return
+        return await self.agent_rate_limit(agent_id, max_requests, interval)
@@ -114,7 +114,7 @@ class TwitterGetMentions(TwitterBaseTool):
             if mentions.get("meta") and mentions["meta"].get("newest_id"):
                 last["since_id"] = mentions["meta"].get("newest_id")
                 await self.skill_store.save_agent_skill_data(
-                    context.agent_id, self.name, "last", last
+                    context.agent_id, self.name, "last", last, write_behind=True
                 )
 
             return mentions
@@ -102,7 +102,7 @@ class TwitterGetTimeline(TwitterBaseTool):
             if timeline.get("meta") and timeline["meta"].get("newest_id"):
                 last["since_id"] = timeline["meta"]["newest_id"]
                 await self.skill_store.save_agent_skill_data(
-                    context.agent_id, self.name, "last", last
+                    context.agent_id, self.name, "last", last, write_behind=True
                 )
 
             return timeline
@@ -113,7 +113,7 @@ class TwitterGetUserTweets(TwitterBaseTool):
             if tweets.get("meta") and tweets["meta"].get("newest_id"):
                 last["since_id"] = tweets["meta"]["newest_id"]
                 await self.skill_store.save_agent_skill_data(
-                    context.agent_id, self.name, user_id, last
+                    context.agent_id, self.name, user_id, last, write_behind=True
                 )
 
             return tweets
@@ -105,7 +105,7 @@ class TwitterSearchTweets(TwitterBaseTool):
                 last["since_id"] = tweets["meta"]["newest_id"]
                 last["timestamp"] = datetime.datetime.now().isoformat()
                 await self.skill_store.save_agent_skill_data(
-                    context.agent_id, self.name, query, last
+                    context.agent_id, self.name, query, last, write_behind=True
                 )
 
             return tweets
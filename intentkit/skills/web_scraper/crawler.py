@@ -0,0 +1,379 @@
+"""
+Concurrent crawler for web scraper skills.
+
+Pages are fetched by a pool of workers from a shared frontier. Each host has
+its own token bucket, so many hosts are crawled in parallel while every single
+host only sees a polite request rate. Pages are fetched with conditional GETs
+and are skipped when unchanged since the last crawl, and HTML is reduced to
+text while it streams in.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import deque
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+import httpx
+from intentkit.abstracts.skill import SkillStoreABC
+from intentkit.utils.http_client import get_http_client, register_http_upstream
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+CRAWLER_UPSTREAM = "web_crawler"
+# Pages fetched at the same time, across all hosts
+CRAWL_CONCURRENCY = 16
+# Requests a host may receive in a burst before the rate applies
+HOST_BURST = 4
+# Pages larger than this are truncated
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+# Skill data key of the validators of crawled pages
+VALIDATORS_KEY = "crawl_validators"
+VALIDATORS_SKILL = "web_scraper"
+
+TEXT_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+register_http_upstream(
+    CRAWLER_UPSTREAM,
+    max_connections=CRAWL_CONCURRENCY,
+    max_keepalive_connections=CRAWL_CONCURRENCY,
+    timeout=30.0,
+    retries=1,
+)
+
+
+class HostBucket:
+    """Token bucket limiting the request rate to one host."""
+
+    def __init__(self, rate: float, burst: int = HOST_BURST):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class _TextExtractor(HTMLParser):
+    """Incremental HTML to text converter, fed while the page downloads."""
+
+    SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "head"}
+    BLOCK_TAGS = {
+        "p",
+        "div",
+        "br",
+        "li",
+        "tr",
+        "section",
+        "article",
+        "header",
+        "footer",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "pre",
+        "blockquote",
+        "table",
+    }
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.title = ""
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title":
+            self._in_title = True
+        elif tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        elif tag in self.SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif not self._skip_depth:
+            self.parts.append(data)
+
+    def text(self) -> str:
+        lines = (line.strip() for line in "".join(self.parts).splitlines())
+        return "\n".join(line for line in lines if line)
+
+
+class CrawlResult:
+    """Outcome of a crawl."""
+
+    def __init__(self):
+        # Pages with new or changed content
+        self.documents: List[Document] = []
+        # Pages not modified since the last crawl
+        self.unchanged: List[str] = []
+        self.failed: List[str] = []
+        # url -> validators to save once the documents are indexed,
+        # unchanged pages included
+        self.validators: Dict[str, Dict[str, str]] = {}
+
+
+class Crawler:
+    """Fetch a list of pages concurrently with per-host politeness.
+
+    Args:
+        agent_id: Agent the pages are crawled for
+        skill_store: Skill store holding the validators of earlier crawls
+        requests_per_second: Rate limit per host, lowered by robots.txt
+            Crawl-delay when present
+        concurrency: Pages fetched at the same time across all hosts
+    """
+
+    def __init__(
+        self,
+        agent_id: str,
+        skill_store: SkillStoreABC,
+        requests_per_second: float,
+        concurrency: int = CRAWL_CONCURRENCY,
+    ):
+        self.agent_id = agent_id
+        self.skill_store = skill_store
+        self.requests_per_second = requests_per_second
+        self.concurrency = concurrency
+        self._buckets: Dict[str, HostBucket] = {}
+        self._robots: Dict[str, Optional[RobotFileParser]] = {}
+        self._robots_locks: Dict[str, asyncio.Lock] = {}
+
+    async def _get_robots(
+        self, client: httpx.AsyncClient, url: str
+    ) -> Optional[RobotFileParser]:
+        """Fetch and parse robots.txt once per host."""
+        from intentkit.skills.web_scraper.utils import DEFAULT_HEADERS
+
+        host = urlparse(url).netloc
+        lock = self._robots_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            if host in self._robots:
+                return self._robots[host]
+            parser = None
+            try:
+                response = await client.get(
+                    urljoin(url, "/robots.txt"),
+                    headers=DEFAULT_HEADERS,
+                    follow_redirects=True,
+                )
+                if response.status_code == 200:
+                    parser = RobotFileParser()
+                    parser.parse(response.text.splitlines())
+            except httpx.HTTPError as e:
+                logger.info(f"[{self.agent_id}] No robots.txt for {host}: {e}")
+            self._robots[host] = parser
+            return parser
+
+    async def _bucket(self, client: httpx.AsyncClient, url: str) -> HostBucket:
+        host = urlparse(url).netloc
+        if host not in self._buckets:
+            rate = self.requests_per_second
+            robots = await self._get_robots(client, url)
+            delay = robots.crawl_delay("*") if robots else None
+            if delay:
+                rate = min(rate, 1 / float(delay))
+            # Another worker may have created it while robots.txt was fetched
+            self._buckets.setdefault(host, HostBucket(rate))
+        return self._buckets[host]
+
+    async def _fetch(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Dict[str, str],
+        previous: Optional[Dict[str, str]],
+    ) -> Tuple[Optional[Document], Optional[Dict[str, str]]]:
+        """Fetch one page, returning no document when it is unchanged."""
+        headers = dict(headers)
+        if previous:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        async with client.stream(
+            "GET", url, headers=headers, follow_redirects=True
+        ) as response:
+            if response.status_code == 304:
+                return None, previous
+            response.raise_for_status()
+
+            content_type = response.headers.get("Content-Type", "text/html").lower()
+            if not content_type.startswith(TEXT_CONTENT_TYPES):
+                raise ValueError(f"Unsupported content type {content_type}")
+            is_html = not content_type.startswith("text/plain")
+
+            extractor = _TextExtractor()
+            plain_parts = []
+            size = 0
+            async for chunk in response.aiter_text():
+                if is_html:
+                    extractor.feed(chunk)
+                else:
+                    plain_parts.append(chunk)
+                size += len(chunk)
+                if size > MAX_PAGE_BYTES:
+                    logger.info(f"[{self.agent_id}] Truncated large page {url}")
+                    break
+            if is_html:
+                extractor.close()
+                text = extractor.text()
+            else:
+                text = "".join(plain_parts).strip()
+
+            validators = {
+                "hash": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+                "etag": response.headers.get("ETag", ""),
+                "last_modified": response.headers.get("Last-Modified", ""),
+            }
+
+        # Servers without validators still send the same content
+        if previous and previous.get("hash") == validators["hash"]:
+            return None, validators
+        if not text:
+            return None, None
+        metadata = {"source": url, "title": extractor.title.strip()}
+        return Document(page_content=text, metadata=metadata), validators
+
+    async def _fetch_with_fallback(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        previous: Optional[Dict[str, str]],
+    ) -> Tuple[Optional[Document], Optional[Dict[str, str]]]:
+        from intentkit.skills.web_scraper.utils import DEFAULT_HEADERS, FALLBACK_HEADERS
+
+        try:
+            return await self._fetch(client, url, DEFAULT_HEADERS, previous)
+        except httpx.HTTPError as primary_error:
+            logger.warning(
+                f"[{self.agent_id}] Primary headers failed for {url}, trying fallback: {primary_error}"
+            )
+            return await self._fetch(client, url, FALLBACK_HEADERS, previous)
+
+    async def crawl(self, urls: List[str], max_bytes: int) -> CrawlResult:
+        """Crawl pages until all are fetched or max_bytes of text is collected.
+
+        Args:
+            urls: Pages to fetch, each fetched once
+            max_bytes: Stop once the new content reaches this size
+
+        Returns:
+            CrawlResult: New documents, unchanged and failed pages
+        """
+        result = CrawlResult()
+        stored = await self.skill_store.get_agent_skill_data(
+            self.agent_id, VALIDATORS_SKILL, VALIDATORS_KEY
+        )
+        known = stored or {}
+        client = get_http_client(CRAWLER_UPSTREAM)
+
+        # Interleave hosts so a slow host does not hold up the others
+        by_host: Dict[str, deque] = {}
+        for url in dict.fromkeys(urls):
+            by_host.setdefault(urlparse(url).netloc, deque()).append(url)
+        frontier: asyncio.Queue = asyncio.Queue()
+        while by_host:
+            for host in list(by_host):
+                frontier.put_nowait(by_host[host].popleft())
+                if not by_host[host]:
+                    del by_host[host]
+
+        collected = 0
+        stop = asyncio.Event()
+
+        async def worker():
+            nonlocal collected
+            while not stop.is_set():
+                try:
+                    url = frontier.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    bucket = await self._bucket(client, url)
+                    robots = self._robots.get(urlparse(url).netloc)
+                    if robots and not robots.can_fetch("*", url):
+                        logger.info(f"[{self.agent_id}] Disallowed by robots: {url}")
+                        result.failed.append(url)
+                        continue
+                    await bucket.acquire()
+                    document, validators = await self._fetch_with_fallback(
+                        client, url, known.get(url)
+                    )
+                except Exception as e:
+                    logger.error(f"[{self.agent_id}] Error crawling {url}: {e}")
+                    result.failed.append(url)
+                    continue
+
+                if document is None:
+                    if validators:
+                        result.unchanged.append(url)
+                        result.validators[url] = validators
+                    else:
+                        logger.warning(f"[{self.agent_id}] No content from {url}")
+                        result.failed.append(url)
+                    continue
+
+                size = len(document.page_content.encode("utf-8"))
+                if collected + size > max_bytes:
+                    logger.warning(
+                        f"[{self.agent_id}] Adding {url} would exceed size limit, stopping crawl"
+                    )
+                    stop.set()
+                    return
+                collected += size
+                result.documents.append(document)
+                result.validators[url] = validators
+
+        await asyncio.gather(*[worker() for _ in range(self.concurrency)])
+        logger.info(
+            f"[{self.agent_id}] Crawled {len(urls)} URLs: {len(result.documents)} new or changed, "
+            f"{len(result.unchanged)} unchanged, {len(result.failed)} failed"
+        )
+        return result
+
+    async def save_validators(self, validators: Dict[str, Dict[str, str]]) -> None:
+        """Remember validators of indexed pages for the next crawl."""
+        if not validators:
+            return
+        stored = await self.skill_store.get_agent_skill_data(
+            self.agent_id, VALIDATORS_SKILL, VALIDATORS_KEY
+        )
+        merged = dict(stored or {})
+        merged.update(validators)
+        await self.skill_store.save_agent_skill_data(
+            self.agent_id, VALIDATORS_SKILL, VALIDATORS_KEY, merged
+        )
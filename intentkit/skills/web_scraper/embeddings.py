@@ -0,0 +1,169 @@
+"""
+Content-addressed embedding cache for indexing skills.
+
+Vectors are keyed by the hash of the embedding model and the chunk text, so
+re-indexing unchanged content costs no embedding calls, across agents.
+Vectors are kept in an in-process LRU and in Redis when it is available.
+Missing chunks are embedded in batches with bounded concurrency.
+"""
+
+import asyncio
+import base64
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Dict, List
+
+import numpy as np
+from intentkit.models.redis import get_redis
+from langchain_core.embeddings import DeterministicFakeEmbedding, Embeddings
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_KEY_PREFIX = "intentkit:embedding:"
+# Cached vectors expire if the content is not indexed again
+EMBEDDING_TTL = 30 * 24 * 3600
+# Texts per embedding request
+EMBEDDING_BATCH_SIZE = 256
+# Concurrent embedding requests per call
+EMBEDDING_CONCURRENCY = 4
+# Vectors kept in process, as float32 arrays of about 6 KB each
+LOCAL_CACHE_SIZE = 20000
+# Dimension of the stand-in embedder, same as the OpenAI models
+FAKE_EMBEDDING_SIZE = 1536
+
+_local: OrderedDict[str, np.ndarray] = OrderedDict()
+
+
+def _encode(vector: List[float]) -> str:
+    return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode()
+
+
+def _decode(data: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(data), dtype=np.float32)
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper caching document vectors by content hash.
+
+    Query embeddings are not cached, they are rarely repeated.
+    """
+
+    def __init__(self, underlying: Embeddings, namespace: str):
+        """Wrap an embeddings model.
+
+        Args:
+            underlying: Model used for cache misses
+            namespace: Name of the model, vectors of different models never mix
+        """
+        self.underlying = underlying
+        self.namespace = namespace
+
+    def _key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{EMBEDDING_KEY_PREFIX}{self.namespace}:{digest}"
+
+    async def _get_cached(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        remote_keys = []
+        for key in keys:
+            if key in _local:
+                _local.move_to_end(key)
+                found[key] = _local[key].tolist()
+            else:
+                remote_keys.append(key)
+        if not remote_keys:
+            return found
+        try:
+            values = await get_redis().mget(remote_keys)
+        except RuntimeError:
+            # Redis not initialized, local cache only
+            return found
+        except RedisError as e:
+            logger.info(f"Redis error reading embedding cache: {e}")
+            return found
+        for key, value in zip(remote_keys, values):
+            if value:
+                vector = _decode(value)
+                found[key] = vector.tolist()
+                self._set_local(key, vector)
+        return found
+
+    @staticmethod
+    def _set_local(key: str, vector: List[float] | np.ndarray) -> None:
+        # Lists of Python floats take about 8 times the memory of the array
+        _local[key] = np.asarray(vector, dtype=np.float32)
+        _local.move_to_end(key)
+        while len(_local) > LOCAL_CACHE_SIZE:
+            _local.popitem(last=False)
+
+    async def _set_cached(self, vectors: Dict[str, List[float]]) -> None:
+        for key, vector in vectors.items():
+            self._set_local(key, vector)
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                for key, vector in vectors.items():
+                    pipe.set(key, _encode(vector), ex=EMBEDDING_TTL)
+                await pipe.execute()
+        except RuntimeError:
+            pass
+        except RedisError as e:
+            logger.info(f"Redis error writing embedding cache: {e}")
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, only texts not seen before reach the model."""
+        keys = [self._key(text) for text in texts]
+        vectors = await self._get_cached(list(set(keys)))
+
+        # Unique missing texts, repeated chunks are embedded once
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+
+        if missing:
+            missing_keys = list(missing.keys())
+            semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+
+            async def embed_batch(batch_keys: List[str]) -> Dict[str, List[float]]:
+                async with semaphore:
+                    result = await self.underlying.aembed_documents(
+                        [missing[key] for key in batch_keys]
+                    )
+                return dict(zip(batch_keys, result))
+
+            batches = await asyncio.gather(
+                *[
+                    embed_batch(missing_keys[i : i + EMBEDDING_BATCH_SIZE])
+                    for i in range(0, len(missing_keys), EMBEDDING_BATCH_SIZE)
+                ]
+            )
+            new_vectors = {}
+            for batch in batches:
+                new_vectors.update(batch)
+            await self._set_cached(new_vectors)
+            vectors.update(new_vectors)
+
+        logger.info(f"Embedded {len(texts)} texts, {len(missing)} were not cached")
+        return [vectors[key] for key in keys]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents without the cache, the cache is async only."""
+        return self.underlying.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.underlying.aembed_query(text)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.underlying.embed_query(text)
+
+
+def fake_embeddings() -> CachedEmbeddings:
+    """Local deterministic embedder for tests and runs without an embeddings API.
+
+    Equal texts get equal vectors, but similarity carries no meaning.
+    """
+    return CachedEmbeddings(
+        DeterministicFakeEmbedding(size=FAKE_EMBEDDING_SIZE), "fake"
+    )
@@ -101,13 +101,13 @@ class ScrapeAndIndex(WebScraperBaseTool):
                 f"[{agent_id}] Scraping completed: {total_chunks} chunks indexed, merged: {was_merged}"
             )
 
+            # Unchanged pages are valid but add no chunks
             if not valid_urls:
-                logger.error(f"[{agent_id}] No valid URLs provided")
-                return "Error: No valid URLs provided. URLs must start with http:// or https://"
-
-            if total_chunks == 0:
                 logger.error(f"[{agent_id}] No content extracted from URLs")
-                return "Error: No content could be extracted from the provided URLs."
+                return (
+                    "Error: No content could be extracted from the provided URLs. "
+                    "URLs must start with http:// or https://"
+                )
 
             # Get current storage size for response
             vs_manager = VectorStoreManager(self.skill_store)
@@ -191,37 +191,20 @@ class QueryIndexedContent(WebScraperBaseTool):
 
             logger.info(f"[{agent_id}] Starting query operation: '{query}'")
 
-            # Retrieve vector store
-            vector_store_key = f"vector_store_{agent_id}"
-
-            logger.info(f"[{agent_id}] Looking for vector store: {vector_store_key}")
-
-            stored_data = await self.skill_store.get_agent_skill_data(
-                agent_id, "web_scraper", vector_store_key
-            )
+            # Load the vector index, segments already in memory are reused
+            vs_manager = VectorStoreManager(self.skill_store)
+            vector_store = await vs_manager.load_vector_store(agent_id)
 
-            if not stored_data:
+            if not vector_store:
                 logger.warning(f"[{agent_id}] No vector store found")
                 return "No indexed content found. Please use the scrape_and_index tool first to scrape and index some web content before querying."
 
-            if not stored_data or "faiss_files" not in stored_data:
-                logger.warning(f"[{agent_id}] Invalid stored data structure")
-                return "No indexed content found. Please use the scrape_and_index tool first to scrape and index some web content before querying."
-
-            # Create embeddings and decode vector store
-            logger.info(f"[{agent_id}] Decoding vector store")
-            vs_manager = VectorStoreManager(self.skill_store)
-            embeddings = vs_manager.create_embeddings()
-            vector_store = vs_manager.decode_vector_store(
-                stored_data["faiss_files"], embeddings
-            )
-
             logger.info(
-                f"[{agent_id}] Vector store loaded, index count: {vector_store.index.ntotal}"
+                f"[{agent_id}] Vector store loaded, index count: {vector_store.ntotal}"
             )
 
             # Perform similarity search
-            docs = vector_store.similarity_search(query, k=max_results)
+            docs = await vector_store.asimilarity_search(query, k=max_results)
             logger.info(f"[{agent_id}] Found {len(docs)} similar documents")
 
             if not docs:
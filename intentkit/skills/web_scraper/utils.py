@@ -8,16 +8,32 @@ to reduce code duplication and improve maintainability.
 import asyncio
 import base64
 import logging
+import multiprocessing
 import os
+import pickle
+import struct
 import tempfile
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
+import faiss
+import numpy as np
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from intentkit.abstracts.skill import SkillStoreABC
+from intentkit.models.skill import AgentSkillBlob
+from intentkit.skills.web_scraper.crawler import (
+    VALIDATORS_KEY,
+    VALIDATORS_SKILL,
+    Crawler,
+)
+from intentkit.skills.web_scraper.embeddings import CachedEmbeddings, fake_embeddings
 
 logger = logging.getLogger(__name__)
 
@@ -57,18 +73,99 @@ FALLBACK_HEADERS = {
 # Storage keys
 VECTOR_STORE_KEY_PREFIX = "vector_store"
 METADATA_KEY_PREFIX = "indexed_urls"
+VECTOR_STORE_SKILL = "web_scraper"
+VECTOR_STORE_BLOB_KEY = "vector_store"
+
+# Appended segments are merged into one above this count
+MAX_INDEX_SEGMENTS = 8
+# Agents whose loaded segments are kept in memory
+INDEX_CACHE_SIZE = 64
+# Memory-map segment files, flat index codes need the IFC flag
+SEGMENT_READ_FLAGS = (
+    getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+)
+
+# Chunking runs in worker processes above this much text
+CHUNK_IN_PROCESS_CHARS = 200_000
+CHUNK_WORKERS = min(4, os.cpu_count() or 1)
+
+# agent id -> segment id -> loaded segment, least recently used first
+_index_cache: OrderedDict[str, Dict[str, FAISS]] = OrderedDict()
+# agent id -> lock, dropped once no load of that agent holds it
+_index_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+_chunk_executor: Optional[ProcessPoolExecutor] = None
+
+
+class SegmentedVectorStore:
+    """Read-only view over the FAISS segments of an agent index.
+
+    Segments are searched separately and the hits are merged by distance, so
+    a memory-mapped segment never has to be copied into a merged index.
+    """
+
+    def __init__(self, segments: List[FAISS], embeddings: Embeddings):
+        self.segments = segments
+        self.embeddings = embeddings
+
+    @property
+    def ntotal(self) -> int:
+        """Total number of vectors in all segments."""
+        return sum(segment.index.ntotal for segment in self.segments)
+
+    async def asimilarity_search(self, query: str, k: int = 4) -> List[Document]:
+        """Return the k documents closest to the query over all segments."""
+        embedding = await self.embeddings.aembed_query(query)
+        hits = []
+        for segment in self.segments:
+            hits.extend(segment.similarity_search_with_score_by_vector(embedding, k=k))
+        hits.sort(key=lambda hit: hit[1])
+        return [doc for doc, _ in hits[:k]]
+
+
+def serialize_segment(vector_store: FAISS) -> bytes:
+    """Serialize a FAISS store to one binary blob.
+
+    Layout: 8 byte little-endian length of the FAISS index, the raw FAISS
+    index, then the pickled docstore and id mapping.
+    """
+    index_bytes = faiss.serialize_index(vector_store.index).tobytes()
+    docstore_bytes = pickle.dumps(
+        (vector_store.docstore, vector_store.index_to_docstore_id)
+    )
+    return struct.pack("<Q", len(index_bytes)) + index_bytes + docstore_bytes
+
+
+def deserialize_segment(data: bytes, embeddings: Embeddings) -> FAISS:
+    """Load a blob written by serialize_segment into a writable FAISS store."""
+    (index_size,) = struct.unpack_from("<Q", data)
+    index = faiss.deserialize_index(
+        np.frombuffer(data, dtype=np.uint8, count=index_size, offset=8)
+    )
+    docstore, index_to_docstore_id = pickle.loads(data[8 + index_size :])
+    return FAISS(embeddings, index, docstore, index_to_docstore_id)
 
 
 class VectorStoreManager:
-    """Manages vector store operations including creation, saving, loading, and merging."""
+    """Manages the agent vector index.
+
+    The index is a list of immutable segments stored as binary blobs, new
+    documents are appended as a new segment. Segments are written once to a
+    local cache dir, memory-mapped from there, and the loaded segments of
+    recently used agents are kept in memory.
+    """
 
     def __init__(self, skill_store: SkillStoreABC):
         self.skill_store = skill_store
 
-    def create_embeddings(self) -> OpenAIEmbeddings:
-        """Create OpenAI embeddings using system API key."""
+    def create_embeddings(self) -> CachedEmbeddings:
+        """Create cached OpenAI embeddings using system API key."""
+        if self.skill_store.get_system_config("fake_embeddings"):
+            return fake_embeddings()
         api_key = self.skill_store.get_system_config("openai_api_key")
-        return OpenAIEmbeddings(api_key=api_key)
+        embeddings = OpenAIEmbeddings(api_key=api_key)
+        return CachedEmbeddings(embeddings, embeddings.model)
 
     def get_storage_keys(self, agent_id: str) -> Tuple[str, str]:
         """Get storage keys for vector store and metadata."""
@@ -76,155 +173,223 @@ class VectorStoreManager:
         metadata_key = f"{METADATA_KEY_PREFIX}_{agent_id}"
         return vector_store_key, metadata_key
 
-    def encode_vector_store(self, vector_store: FAISS) -> Dict[str, str]:
-        """Encode FAISS vector store to base64 for storage."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            vector_store.save_local(temp_dir)
-
-            encoded_files = {}
-            for filename in os.listdir(temp_dir):
-                file_path = os.path.join(temp_dir, filename)
-                if os.path.isfile(file_path):
-                    with open(file_path, "rb") as f:
-                        encoded_files[filename] = base64.b64encode(f.read()).decode(
-                            "utf-8"
-                        )
-
-            return encoded_files
-
-    def decode_vector_store(
-        self, encoded_files: Dict[str, str], embeddings: OpenAIEmbeddings
-    ) -> FAISS:
-        """Decode base64 files back to FAISS vector store."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Decode and write files
-            for filename, encoded_content in encoded_files.items():
-                file_path = os.path.join(temp_dir, filename)
-                with open(file_path, "wb") as f:
-                    f.write(base64.b64decode(encoded_content))
-
-            # Load vector store
-            return FAISS.load_local(
-                temp_dir,
-                embeddings,
-                allow_dangerous_deserialization=True,
-            )
+    def _cache_dir(self, agent_id: str) -> str:
+        base_dir = self.skill_store.get_system_config("vector_index_cache_dir")
+        if not base_dir:
+            base_dir = os.path.join(tempfile.gettempdir(), "intentkit", "vector_index")
+        return os.path.join(base_dir, agent_id)
 
-    async def get_existing_vector_store(self, agent_id: str) -> Optional[Dict]:
-        """Get existing vector store data if it exists."""
-        vector_store_key, _ = self.get_storage_keys(agent_id)
-        return await self.skill_store.get_agent_skill_data(
-            agent_id, "web_scraper", vector_store_key
-        )
-
-    async def merge_with_existing(
+    def _open_segments(
         self,
-        new_documents: List[Document],
         agent_id: str,
-        chunk_size: int = DEFAULT_CHUNK_SIZE,
-        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
-    ) -> Tuple[FAISS, bool]:
-        """
-        Merge new documents with existing vector store or create new one.
+        segment_ids: List[str],
+        blobs: Dict[str, bytes],
+        embeddings: Embeddings,
+    ) -> Dict[str, FAISS]:
+        """Write new segment files and memory-map the requested segments."""
+        cache_dir = self._cache_dir(agent_id)
+        os.makedirs(cache_dir, exist_ok=True)
+        for segment_id, data in blobs.items():
+            (index_size,) = struct.unpack_from("<Q", data)
+            for suffix, content in (
+                (".faiss", data[8 : 8 + index_size]),
+                (".pkl", data[8 + index_size :]),
+            ):
+                # A unique temporary name, other processes may write the same file
+                fd, tmp_path = tempfile.mkstemp(
+                    prefix=f"{segment_id}{suffix}.", suffix=".tmp", dir=cache_dir
+                )
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(content)
+                    os.replace(tmp_path, os.path.join(cache_dir, segment_id + suffix))
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+
+        segments = {}
+        for segment_id in segment_ids:
+            path = os.path.join(cache_dir, segment_id)
+            index = faiss.read_index(path + ".faiss", SEGMENT_READ_FLAGS)
+            with open(path + ".pkl", "rb") as f:
+                docstore, index_to_docstore_id = pickle.load(f)
+            segments[segment_id] = FAISS(
+                embeddings, index, docstore, index_to_docstore_id
+            )
+        return segments
 
-        Returns:
-            Tuple of (vector_store, was_merged)
+    def _remove_stale_files(self, agent_id: str, segment_ids: List[str]) -> None:
+        """Remove files of segments that were compacted or deleted.
+
+        Segment IDs sort by time, files newer than the newest listed segment
+        may belong to a concurrent append and are kept.
         """
-        embeddings = self.create_embeddings()
-        existing_data = await self.get_existing_vector_store(agent_id)
+        cache_dir = self._cache_dir(agent_id)
+        if not os.path.isdir(cache_dir):
+            return
+        keep = set(segment_ids)
+        newest = max(segment_ids) if segment_ids else None
+        for filename in os.listdir(cache_dir):
+            segment_id = filename.split(".", 1)[0]
+            if segment_id not in keep and (newest is None or segment_id < newest):
+                try:
+                    os.remove(os.path.join(cache_dir, filename))
+                except OSError:
+                    pass
 
-        if existing_data and "faiss_files" in existing_data:
-            try:
-                logger.info(f"[{agent_id}] Merging content with existing vector store")
+    async def _migrate_legacy(self, agent_id: str) -> bool:
+        """Move a base64 encoded index from agent skill data into a segment."""
+        vector_store_key, _ = self.get_storage_keys(agent_id)
+        stored_data = await self.skill_store.get_agent_skill_data(
+            agent_id, VECTOR_STORE_SKILL, vector_store_key
+        )
+        if not stored_data or "faiss_files" not in stored_data:
+            return False
+
+        def convert() -> bytes:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                for filename, encoded_content in stored_data["faiss_files"].items():
+                    with open(os.path.join(temp_dir, filename), "wb") as f:
+                        f.write(base64.b64decode(encoded_content))
+                vector_store = FAISS.load_local(
+                    temp_dir,
+                    self.create_embeddings(),
+                    allow_dangerous_deserialization=True,
+                )
+            return serialize_segment(vector_store)
 
-                # Create new vector store from new documents
-                new_vector_store = FAISS.from_documents(new_documents, embeddings)
+        logger.info(f"[{agent_id}] Migrating vector store to binary segments")
+        data = await asyncio.to_thread(convert)
+        await self.skill_store.append_agent_skill_blob(
+            agent_id, VECTOR_STORE_SKILL, VECTOR_STORE_BLOB_KEY, data
+        )
+        await self.skill_store.delete_agent_skill_data(
+            agent_id, VECTOR_STORE_SKILL, vector_store_key
+        )
+        return True
 
-                # Load existing vector store
-                existing_vector_store = self.decode_vector_store(
-                    existing_data["faiss_files"], embeddings
-                )
+    async def _list_segments(self, agent_id: str) -> List[AgentSkillBlob]:
+        segments = await self.skill_store.list_agent_skill_blobs(
+            agent_id, VECTOR_STORE_SKILL, VECTOR_STORE_BLOB_KEY
+        )
+        if not segments and await self._migrate_legacy(agent_id):
+            segments = await self.skill_store.list_agent_skill_blobs(
+                agent_id, VECTOR_STORE_SKILL, VECTOR_STORE_BLOB_KEY
+            )
+        return segments
 
-                # Merge stores
-                existing_vector_store.merge_from(new_vector_store)
-                return existing_vector_store, True
+    async def load_vector_store(
+        self, agent_id: str, embeddings: Optional[Embeddings] = None
+    ) -> Optional[SegmentedVectorStore]:
+        """Load the vector index of an agent, None if it has no content.
 
-            except Exception as e:
-                logger.warning(
-                    f"[{agent_id}] Merge failed, creating new vector store: {e}"
+        Only segments that are not loaded yet are read, from the local cache
+        dir if present, otherwise from the blob store.
+        """
+        embeddings = embeddings or self.create_embeddings()
+        lock = _index_locks.setdefault(agent_id, asyncio.Lock())
+        async with lock:
+            segment_ids = [s.id for s in await self._list_segments(agent_id)]
+            if not segment_ids:
+                _index_cache.pop(agent_id, None)
+                return None
+
+            loaded = _index_cache.get(agent_id, {})
+            segments = {i: loaded[i] for i in segment_ids if i in loaded}
+            missing = [i for i in segment_ids if i not in segments]
+            if missing:
+                cache_dir = self._cache_dir(agent_id)
+                to_fetch = [
+                    i
+                    for i in missing
+                    if not os.path.exists(os.path.join(cache_dir, i + ".pkl"))
+                ]
+                blobs = await self.skill_store.get_agent_skill_blob_data(to_fetch)
+                segments.update(
+                    await asyncio.to_thread(
+                        self._open_segments, agent_id, missing, blobs, embeddings
+                    )
                 )
-            logger.info(f"[{agent_id}] Creating new vector store")
+                await asyncio.to_thread(self._remove_stale_files, agent_id, segment_ids)
+
+            _index_cache[agent_id] = segments
+            _index_cache.move_to_end(agent_id)
+            while len(_index_cache) > INDEX_CACHE_SIZE:
+                _index_cache.popitem(last=False)
 
-        # Create new vector store
-        logger.info(f"[{agent_id}] Creating new vector store")
-        vector_store = FAISS.from_documents(new_documents, embeddings)
-        return vector_store, False
+        return SegmentedVectorStore([segments[i] for i in segment_ids], embeddings)
 
-    async def save_vector_store(
+    async def append_documents(
         self,
-        vector_store: FAISS,
+        documents: List[Document],
         agent_id: str,
-        chunk_size: int = DEFAULT_CHUNK_SIZE,
-        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
-    ) -> None:
-        """Save vector store to agent skill data."""
-        vector_store_key, _ = self.get_storage_keys(agent_id)
-
-        logger.info(f"[{agent_id}] Saving vector store")
+        embeddings: Optional[Embeddings] = None,
+    ) -> bool:
+        """Index documents into a new segment of the agent index.
 
-        # Encode vector store
-        encoded_files = self.encode_vector_store(vector_store)
+        Returns:
+            bool: Whether the agent already had indexed content
+        """
+        embeddings = embeddings or self.create_embeddings()
+        existing = await self._list_segments(agent_id)
 
-        # Prepare data for storage
-        storage_data = {
-            "faiss_files": encoded_files,
-            "chunk_size": chunk_size,
-            "chunk_overlap": chunk_overlap,
-        }
+        vector_store = await FAISS.afrom_documents(documents, embeddings)
+        data = await asyncio.to_thread(serialize_segment, vector_store)
+        await self.skill_store.append_agent_skill_blob(
+            agent_id, VECTOR_STORE_SKILL, VECTOR_STORE_BLOB_KEY, data
+        )
+        logger.info(
+            f"[{agent_id}] Appended vector store segment of {self.format_size(len(data))}"
+        )
 
-        try:
-            # Save to storage
-            await self.skill_store.save_agent_skill_data(
-                agent_id=agent_id,
-                skill="web_scraper",
-                key=vector_store_key,
-                data=storage_data,
+        if len(existing) + 1 > MAX_INDEX_SEGMENTS:
+            await self._compact(agent_id, embeddings)
+        return bool(existing)
+
+    async def _compact(self, agent_id: str, embeddings: Embeddings) -> None:
+        """Merge all segments of an agent into one."""
+        segment_ids = [s.id for s in await self._list_segments(agent_id)]
+        if len(segment_ids) < 2:
+            return
+        blobs = await self.skill_store.get_agent_skill_blob_data(segment_ids)
+
+        def merge() -> bytes:
+            merged = deserialize_segment(blobs[segment_ids[0]], embeddings)
+            for segment_id in segment_ids[1:]:
+                merged.merge_from(deserialize_segment(blobs[segment_id], embeddings))
+            return serialize_segment(merged)
+
+        data = await asyncio.to_thread(merge)
+        new_id = await self.skill_store.replace_agent_skill_blobs(
+            agent_id, VECTOR_STORE_SKILL, VECTOR_STORE_BLOB_KEY, data, segment_ids
+        )
+        if new_id:
+            logger.info(
+                f"[{agent_id}] Compacted {len(segment_ids)} vector store segments"
             )
+        else:
+            logger.info(f"[{agent_id}] Vector store changed during compaction, skipped")
 
-            logger.info(f"[{agent_id}] Successfully saved vector store")
-
-        except Exception as e:
-            logger.error(f"[{agent_id}] Failed to save vector store: {e}")
-            raise
-
-    async def load_vector_store(self, agent_id: str) -> Optional[FAISS]:
-        """Load vector store for an agent."""
-        stored_data = await self.get_existing_vector_store(agent_id)
-
-        if not stored_data or "faiss_files" not in stored_data:
-            return None
-
-        try:
-            embeddings = self.create_embeddings()
-            return self.decode_vector_store(stored_data["faiss_files"], embeddings)
-        except Exception as e:
-            logger.error(f"Error loading vector store for agent {agent_id}: {e}")
-            return None
+    async def delete_vector_store(self, agent_id: str) -> None:
+        """Delete the vector index of an agent, including legacy data."""
+        vector_store_key, _ = self.get_storage_keys(agent_id)
+        await self.skill_store.delete_agent_skill_blobs(
+            agent_id, VECTOR_STORE_SKILL, VECTOR_STORE_BLOB_KEY
+        )
+        await self.skill_store.delete_agent_skill_data(
+            agent_id, VECTOR_STORE_SKILL, vector_store_key
+        )
+        # Pages must be fetched again to be indexed again
+        await self.skill_store.delete_agent_skill_data(
+            agent_id, VALIDATORS_SKILL, VALIDATORS_KEY
+        )
+        _index_cache.pop(agent_id, None)
+        await asyncio.to_thread(self._remove_stale_files, agent_id, [])
 
     async def get_content_size(self, agent_id: str) -> int:
-        """Get the current content size in bytes for an agent."""
-        stored_data = await self.get_existing_vector_store(agent_id)
-        if not stored_data:
-            return 0
-
-        # Calculate size from stored FAISS files
-        total_size = 0
-        if "faiss_files" in stored_data:
-            for encoded_content in stored_data["faiss_files"].values():
-                # Base64 encoded content size (approximate original size)
-                total_size += len(base64.b64decode(encoded_content))
-
-        return total_size
+        """Get the current index size in bytes for an agent."""
+        segments = await self._list_segments(agent_id)
+        return sum(segment.size for segment in segments)
 
     def format_size(self, size_bytes: int) -> str:
         """Format size in bytes to human readable format."""
@@ -253,6 +418,45 @@ class DocumentProcessor:
         )
         return text_splitter.split_documents(documents)
 
+    @staticmethod
+    async def acreate_chunks(
+        documents: List[Document],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    ) -> List[Document]:
+        """Split documents into chunks without blocking the event loop.
+
+        Large inputs are split in worker processes, one batch per worker.
+        """
+        global _chunk_executor
+
+        total_chars = sum(len(doc.page_content) for doc in documents)
+        if total_chars < CHUNK_IN_PROCESS_CHARS or CHUNK_WORKERS < 2:
+            return DocumentProcessor.create_chunks(documents, chunk_size, chunk_overlap)
+
+        if _chunk_executor is None:
+            # Forking a process with running threads is unsafe
+            _chunk_executor = ProcessPoolExecutor(
+                max_workers=CHUNK_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        loop = asyncio.get_running_loop()
+        batches = [documents[i::CHUNK_WORKERS] for i in range(CHUNK_WORKERS)]
+        results = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    _chunk_executor,
+                    DocumentProcessor.create_chunks,
+                    batch,
+                    chunk_size,
+                    chunk_overlap,
+                )
+                for batch in batches
+                if batch
+            ]
+        )
+        return [chunk for chunks in results for chunk in chunks]
+
     @staticmethod
     def clean_text(text: str) -> str:
         """Clean and normalize text content."""
@@ -489,21 +693,22 @@ async def scrape_and_index_urls(
     """
     Scrape URLs and index their content into vector store with size limits.
 
+    Pages not modified since they were last indexed are skipped, they are
+    returned as valid URLs but add no chunks.
+
     Args:
         urls: List of URLs to scrape
         agent_id: Agent identifier for storage
         skill_store: Skill store instance
         chunk_size: Size of text chunks
         chunk_overlap: Overlap between chunks
-        requests_per_second: Rate limiting for requests
+        requests_per_second: Rate limit per host
 
     Returns:
         Tuple of (total_chunks, was_merged, valid_urls)
     """
     from urllib.parse import urlparse
 
-    from langchain_community.document_loaders import WebBaseLoader
-
     # Validate URLs
     valid_urls = []
     for url in urls:
@@ -533,102 +738,35 @@ async def scrape_and_index_urls(
         )
         return 0, False, []
 
-    # Process URLs one by one with size checking
-    processed_urls = []
+    crawler = Crawler(agent_id, skill_store, requests_per_second)
+    result = await crawler.crawl(valid_urls, MAX_CONTENT_SIZE_BYTES - current_size)
+
     total_chunks = 0
     was_merged = False
-    size_limit_reached = False
-
-    for i, url in enumerate(valid_urls):
-        if current_size >= MAX_CONTENT_SIZE_BYTES:
-            size_limit_reached = True
-            logger.warning(f"[{agent_id}] Size limit reached after processing {i} URLs")
-            break
-
+    if result.documents:
         try:
-            logger.info(f"[{agent_id}] Processing URL {i + 1}/{len(valid_urls)}: {url}")
-
-            # Load single URL with enhanced headers
-            loader = WebBaseLoader(
-                web_paths=[url],
-                requests_per_second=requests_per_second,
-            )
-
-            # Configure loader with enhanced headers to bypass bot protection
-            loader.requests_kwargs = {
-                "verify": True,
-                "timeout": DEFAULT_REQUEST_TIMEOUT,
-                "headers": DEFAULT_HEADERS,
-            }
-
-            # Scrape the URL with retry logic
-            documents = None
-            try:
-                documents = await asyncio.to_thread(loader.load)
-            except Exception as primary_error:
-                # If primary headers fail, try fallback headers
-                logger.warning(
-                    f"[{agent_id}] Primary headers failed for {url}, trying fallback: {primary_error}"
-                )
-
-                loader.requests_kwargs["headers"] = FALLBACK_HEADERS
-                try:
-                    documents = await asyncio.to_thread(loader.load)
-                    logger.info(f"[{agent_id}] Fallback headers succeeded for {url}")
-                except Exception as fallback_error:
-                    logger.error(
-                        f"[{agent_id}] Both header sets failed for {url}: {fallback_error}"
-                    )
-                    raise fallback_error
-
-            if not documents:
-                logger.warning(f"[{agent_id}] No content extracted from {url}")
-                continue
-
-            # Check content size before processing
-            content_size = sum(
-                len(doc.page_content.encode("utf-8")) for doc in documents
-            )
-
-            if current_size + content_size > MAX_CONTENT_SIZE_BYTES:
-                logger.warning(
-                    f"[{agent_id}] Adding {url} would exceed size limit. Skipping."
-                )
-                size_limit_reached = True
-                break
-
-            # Process and index this URL's content
-            chunks, merged = await index_documents(
-                documents, agent_id, skill_store, chunk_size, chunk_overlap
+            total_chunks, was_merged = await index_documents(
+                result.documents, agent_id, skill_store, chunk_size, chunk_overlap
             )
+        except Exception as e:
+            logger.error(f"[{agent_id}] Error indexing scraped content: {e}")
+            return 0, False, []
 
-            if chunks > 0:
-                processed_urls.append(url)
-                total_chunks += chunks
-                was_merged = merged or was_merged
-                current_size += content_size
-
-                logger.info(
-                    f"[{agent_id}] Processed {url}: {chunks} chunks, current size: {vs_manager.format_size(current_size)}"
-                )
-
-            # Add delay for rate limiting
-            if i < len(valid_urls) - 1:  # Don't delay after the last URL
-                await asyncio.sleep(1.0 / requests_per_second)
+    # Saved only after indexing, a failed run must not mark pages as indexed
+    await crawler.save_validators(result.validators)
 
-        except Exception as e:
-            logger.error(f"[{agent_id}] Error processing {url}: {e}")
-            continue
+    indexed = {doc.metadata["source"] for doc in result.documents}
+    processed_urls = [
+        url for url in valid_urls if url in indexed or url in result.unchanged
+    ]
 
     # Log final results
-    if size_limit_reached:
+    if len(processed_urls) + len(result.failed) < len(valid_urls):
         logger.warning(
             f"[{agent_id}] Size limit reached. Processed {len(processed_urls)}/{len(valid_urls)} URLs"
         )
     else:
-        logger.info(
-            f"[{agent_id}] Successfully processed all {len(processed_urls)} URLs"
-        )
+        logger.info(f"[{agent_id}] Processed {len(processed_urls)} URLs")
 
     return total_chunks, was_merged, processed_urls
 
@@ -648,21 +786,16 @@ async def index_documents(
         Tuple of (total_chunks, was_merged)
     """
     # Process documents
-    split_docs = DocumentProcessor.create_chunks(documents, chunk_size, chunk_overlap)
+    split_docs = await DocumentProcessor.acreate_chunks(
+        documents, chunk_size, chunk_overlap
+    )
 
     if not split_docs:
         raise ValueError("No content could be processed into chunks")
 
-    # Handle vector store
+    # Append the chunks to the agent index
     vs_manager = VectorStoreManager(skill_store)
-    vector_store, was_merged = await vs_manager.merge_with_existing(
-        split_docs, agent_id, chunk_size, chunk_overlap
-    )
-
-    # Save vector store
-    await vs_manager.save_vector_store(
-        vector_store, agent_id, chunk_size, chunk_overlap
-    )
+    was_merged = await vs_manager.append_documents(split_docs, agent_id)
 
     return len(split_docs), was_merged
 
@@ -2,19 +2,22 @@ import logging
 from typing import List, Type
 from urllib.parse import urljoin, urlparse
 
-import httpx
 import openai
 from pydantic import BaseModel, Field
 
 from intentkit.skills.web_scraper.base import WebScraperBaseTool
+from intentkit.skills.web_scraper.crawler import CRAWLER_UPSTREAM
 from intentkit.skills.web_scraper.utils import (
     DEFAULT_CHUNK_OVERLAP,
     DEFAULT_CHUNK_SIZE,
+    DEFAULT_HEADERS,
+    FALLBACK_HEADERS,
     MetadataManager,
     ResponseFormatter,
     VectorStoreManager,
     scrape_and_index_urls,
 )
+from intentkit.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -80,28 +83,25 @@ class WebsiteIndexer(WebScraperBaseTool):
         """Fetch robots.txt content."""
         robots_url = urljoin(base_url, "/robots.txt")
 
-        # Import headers from utils
-        from intentkit.skills.web_scraper.utils import DEFAULT_HEADERS, FALLBACK_HEADERS
+        client = get_http_client(CRAWLER_UPSTREAM)
 
         # Try with primary headers first
-        async with httpx.AsyncClient(timeout=30, headers=DEFAULT_HEADERS) as client:
-            try:
-                response = await client.get(robots_url)
-                if response.status_code == 200:
-                    return response.text
-            except Exception as e:
-                logger.warning(
-                    f"Primary headers failed for robots.txt from {robots_url}: {e}"
-                )
+        try:
+            response = await client.get(robots_url, headers=DEFAULT_HEADERS)
+            if response.status_code == 200:
+                return response.text
+        except Exception as e:
+            logger.warning(
+                f"Primary headers failed for robots.txt from {robots_url}: {e}"
+            )
 
         # Try with fallback headers
-        async with httpx.AsyncClient(timeout=30, headers=FALLBACK_HEADERS) as client:
-            try:
-                response = await client.get(robots_url)
-                if response.status_code == 200:
-                    return response.text
-            except Exception as e:
-                logger.warning(f"Could not fetch robots.txt from {robots_url}: {e}")
+        try:
+            response = await client.get(robots_url, headers=FALLBACK_HEADERS)
+            if response.status_code == 200:
+                return response.text
+        except Exception as e:
+            logger.warning(f"Could not fetch robots.txt from {robots_url}: {e}")
         return ""
 
     def _extract_sitemaps_from_robots(
@@ -133,28 +133,25 @@ class WebsiteIndexer(WebScraperBaseTool):
 
     async def _fetch_sitemap_content(self, sitemap_url: str) -> str:
         """Fetch sitemap XML content."""
-        # Import headers from utils
-        from intentkit.skills.web_scraper.utils import DEFAULT_HEADERS, FALLBACK_HEADERS
+        client = get_http_client(CRAWLER_UPSTREAM)
 
         # Try with primary headers first
-        async with httpx.AsyncClient(timeout=30, headers=DEFAULT_HEADERS) as client:
-            try:
-                response = await client.get(sitemap_url)
-                if response.status_code == 200:
-                    return response.text
-            except Exception as e:
-                logger.warning(
-                    f"Primary headers failed for sitemap from {sitemap_url}: {e}"
-                )
+        try:
+            response = await client.get(sitemap_url, headers=DEFAULT_HEADERS)
+            if response.status_code == 200:
+                return response.text
+        except Exception as e:
+            logger.warning(
+                f"Primary headers failed for sitemap from {sitemap_url}: {e}"
+            )
 
         # Try with fallback headers
-        async with httpx.AsyncClient(timeout=30, headers=FALLBACK_HEADERS) as client:
-            try:
-                response = await client.get(sitemap_url)
-                if response.status_code == 200:
-                    return response.text
-            except Exception as e:
-                logger.warning(f"Could not fetch sitemap from {sitemap_url}: {e}")
+        try:
+            response = await client.get(sitemap_url, headers=FALLBACK_HEADERS)
+            if response.status_code == 200:
+                return response.text
+        except Exception as e:
+            logger.warning(f"Could not fetch sitemap from {sitemap_url}: {e}")
         return ""
 
     async def _get_all_sitemap_content(self, base_url: str) -> tuple[str, List[str]]:
@@ -390,7 +387,8 @@ Extract the URLs now:"""
                 unique_urls, agent_id, self.skill_store, chunk_size, chunk_overlap
             )
 
-            if total_chunks == 0:
+            # Unchanged pages are valid but add no chunks
+            if not valid_urls:
                 logger.error(
                     f"[{agent_id}] No content could be extracted from discovered URLs"
                 )
@@ -1,8 +1,19 @@
+import asyncio
+import json
+import logging
+import os
+import time
 from abc import ABC, abstractmethod
 from enum import IntEnum, StrEnum
+from typing import Optional
 
 import httpx
 
+logger = logging.getLogger(__name__)
+
+# Seconds a chain config snapshot is used before it is refreshed
+CHAIN_SNAPSHOT_MAX_AGE = 24 * 60 * 60
+
 
 class Chain(StrEnum):
     """
@@ -281,13 +292,118 @@ class ChainProvider(ABC):
     `init_chain_configs` method to populate the available chain configurations.
     """
 
-    def __init__(self):
+    def __init__(self, snapshot_path: Optional[str] = None):
         """
         Initializes the ChainProvider.
 
         Sets up an empty dictionary `chain_configs` to store the configurations.
+
+        Args:
+            snapshot_path: Optional file caching the configurations between
+                process restarts.
         """
         self.chain_configs: dict[Network, ChainConfig] = {}
+        self.snapshot_path = snapshot_path
+
+    async def init(self, max_age: float = CHAIN_SNAPSHOT_MAX_AGE) -> None:
+        """
+        Loads the chain configurations, call once at process start.
+
+        A snapshot younger than `max_age` is used without any request. Otherwise
+        the configurations are fetched and saved as the new snapshot. If the fetch
+        fails, an older snapshot is used when there is one.
+
+        Args:
+            max_age: Seconds a snapshot is fresh enough to skip the fetch.
+        """
+        if self.load_snapshot(max_age):
+            return
+        try:
+            await self.ainit_chain_configs()
+        except Exception as e:
+            if self.load_snapshot():
+                logger.warning(f"Using stale chain config snapshot: {e}")
+                return
+            logger.error(f"Failed to init chain configs: {e}")
+            return
+        self.save_snapshot()
+
+    async def ainit_chain_configs(self) -> dict[Network, ChainConfig]:
+        """
+        Async version of `init_chain_configs`.
+
+        Subclasses fetching over the network should override it, the default
+        runs `init_chain_configs` in a thread.
+
+        Returns:
+            A dictionary mapping `Network` enum members to `ChainConfig` objects.
+        """
+        return await asyncio.to_thread(self.init_chain_configs)
+
+    def load_snapshot(self, max_age: Optional[float] = None) -> bool:
+        """
+        Loads the chain configurations from the snapshot file.
+
+        Args:
+            max_age: Ignore the snapshot if it is older, in seconds. None
+                accepts any age.
+
+        Returns:
+            True if the configurations were loaded.
+        """
+        if not self.snapshot_path:
+            return False
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if max_age is not None and time.time() - snapshot["saved_at"] > max_age:
+                return False
+            self.chain_configs = {
+                Network(item["network"]): ChainConfig(
+                    Chain(item["chain"]),
+                    Network(item["network"]),
+                    item["rpc_url"],
+                    item["ens_url"],
+                    item["wss_url"],
+                )
+                for item in snapshot["configs"]
+            }
+            return True
+        except FileNotFoundError:
+            return False
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Invalid chain config snapshot {self.snapshot_path}: {e}")
+            return False
+
+    def save_snapshot(self) -> None:
+        """
+        Saves the chain configurations to the snapshot file.
+
+        The file holds RPC URLs with embedded keys, so only the owner can read it.
+        """
+        if not self.snapshot_path or not self.chain_configs:
+            return
+        snapshot = {
+            "saved_at": time.time(),
+            "configs": [
+                {
+                    "chain": str(c.chain),
+                    "network": str(c.network),
+                    "rpc_url": c.rpc_url,
+                    "ens_url": c.ens_url,
+                    "wss_url": c.wss_url,
+                }
+                for c in self.chain_configs.values()
+            ],
+        }
+        tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            logger.warning(f"Failed to save chain config snapshot: {e}")
 
     def get_chain_config(self, network: Network) -> ChainConfig:
         """
@@ -302,6 +418,9 @@ class ChainProvider(ABC):
         Raises:
             Exception: If no chain configuration is found for the specified network.
         """
+        if not self.chain_configs:
+            # Process started without init, fall back to the last snapshot
+            self.load_snapshot()
         chain_config = self.chain_configs.get(network)
         if not chain_config:
             raise Exception(f"chain config for network {network} not found")
@@ -357,16 +476,55 @@ class QuicknodeChainProvider(ChainProvider):
     populates the `chain_configs` dictionary.
     """
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, snapshot_path: Optional[str] = None):
         """
         Initializes the QuicknodeChainProvider.
 
         Args:
             api_key: Your QuickNode API key.
+            snapshot_path: Optional file caching the configurations between
+                process restarts.
         """
-        super().__init__()
+        super().__init__(snapshot_path)
         self.api_key = api_key
 
+    def _request_args(self, limit: int, offset: int) -> dict:
+        return {
+            "url": "https://api.quicknode.com/v0/endpoints",
+            "headers": {
+                "Accept": "application/json",
+                "x-api-key": self.api_key,
+            },
+            "params": {
+                "limit": limit,
+                "offset": offset,
+            },
+        }
+
+    def _parse_endpoints(self, json_dict: dict) -> dict[Network, ChainConfig]:
+        try:
+            for item in json_dict["data"]:
+                # Assuming 'item' contains 'chain', 'network', 'http_url', 'wss_url'
+                # and that these values can be used to construct the ChainConfig object
+                chain = Chain(item["chain"])
+                network = Network(item["network"])
+
+                self.chain_configs[network] = ChainConfig(
+                    chain,
+                    network,
+                    item["http_url"],
+                    item["http_url"],  # ens_url is the same as http_url in this case.
+                    item["wss_url"],
+                )
+        except (
+            KeyError,
+            TypeError,
+        ) as e:  # Handle potential data issues in the API response
+            raise Exception(
+                f"Error processing QuickNode API response: {e}. Check the API response format."
+            )
+        return self.chain_configs
+
     def init_chain_configs(
         self, limit: int = 100, offset: int = 0
     ) -> dict[Network, ChainConfig]:
@@ -375,7 +533,7 @@ class QuicknodeChainProvider(ChainProvider):
 
         This method retrieves a list of QuickNode endpoints using the provided
         API key and populates the `chain_configs` dictionary with `ChainConfig`
-        objects.
+        objects. It blocks, prefer `init` in async code.
 
         Args:
             limit: The maximum number of endpoints to retrieve (default: 100).
@@ -386,51 +544,43 @@ class QuicknodeChainProvider(ChainProvider):
 
         Raises:
             Exception: If an error occurs during the API request or processing
-                       the response.  More specific exception types are used
-                       for HTTP errors and request errors.
+                       the response.
         """
-        url = "https://api.quicknode.com/v0/endpoints"
-        headers = {
-            "Accept": "application/json",
-            "x-api-key": self.api_key,
-        }
-        params = {
-            "limit": limit,
-            "offset": offset,
-        }
-
         with httpx.Client(timeout=30) as client:  # Set a timeout for the request
             try:
-                response = client.get(url, timeout=30, headers=headers, params=params)
+                response = client.get(**self._request_args(limit, offset))
                 response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
                 json_dict = response.json()
+            except httpx.HTTPStatusError as http_err:
+                raise Exception(f"Quicknode API HTTP Error: {http_err}")
+            except httpx.RequestError as req_err:
+                raise Exception(f"Quicknode API Request Error: {req_err}")
+        return self._parse_endpoints(json_dict)
+
+    async def ainit_chain_configs(
+        self, limit: int = 100, offset: int = 0
+    ) -> dict[Network, ChainConfig]:
+        """
+        Async version of `init_chain_configs`.
 
-                for item in json_dict["data"]:
-                    # Assuming 'item' contains 'chain', 'network', 'http_url', 'wss_url'
-                    # and that these values can be used to construct the ChainConfig object
-                    chain = Chain(item["chain"])
-                    network = Network(item["network"])
-
-                    self.chain_configs[item["network"]] = ChainConfig(
-                        chain,
-                        network,
-                        item["http_url"],
-                        item[
-                            "http_url"
-                        ],  # ens_url is the same as http_url in this case.
-                        item["wss_url"],
-                    )
+        Args:
+            limit: The maximum number of endpoints to retrieve (default: 100).
+            offset: The number of endpoints to skip (default: 0).
+
+        Returns:
+            A dictionary mapping `Network` enum members to `ChainConfig` objects.
 
+        Raises:
+            Exception: If an error occurs during the API request or processing
+                       the response.
+        """
+        async with httpx.AsyncClient(timeout=30) as client:
+            try:
+                response = await client.get(**self._request_args(limit, offset))
+                response.raise_for_status()
+                json_dict = response.json()
             except httpx.HTTPStatusError as http_err:
-                raise (f"Quicknode API HTTP Error: {http_err}")
+                raise Exception(f"Quicknode API HTTP Error: {http_err}")
             except httpx.RequestError as req_err:
-                raise (f"Quicknode API Request Error: {req_err}")
-            except (
-                KeyError,
-                TypeError,
-            ) as e:  # Handle potential data issues in the API response
-                raise Exception(
-                    f"Error processing QuickNode API response: {e}. Check the API response format."
-                )
-            except Exception as e:
-                raise (f"Quicknode API An unexpected error occurred: {e}")
+                raise Exception(f"Quicknode API Request Error: {req_err}")
+        return self._parse_endpoints(json_dict)
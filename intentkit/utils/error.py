@@ -17,8 +17,14 @@ logger = logging.getLogger(__name__)
 class RateLimitExceeded(Exception):
     """Rate limit exceeded"""
 
-    def __init__(self, message: Optional[str] = "Rate limit exceeded"):
+    def __init__(
+        self,
+        message: Optional[str] = "Rate limit exceeded",
+        retry_after: Optional[float] = None,
+    ):
         self.message = message
+        # Seconds until the request may be retried, if known
+        self.retry_after = retry_after
         super().__init__(self.message)
 
 
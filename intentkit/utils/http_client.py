@@ -0,0 +1,174 @@
+"""
+Shared HTTP client pools for calls to upstream APIs.
+
+Clients are created once per upstream and reused, so repeated calls keep
+their connections alive instead of paying a DNS lookup, TCP connect and TLS
+handshake every time. Each upstream has its own connection limits, timeout
+and retry policy.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import random
+from typing import Dict, Optional, Tuple
+
+import httpx
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 is negotiated only when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Responses worth retrying, the upstream is busy or a gateway failed
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+# Methods that are safe to send twice
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# Longer Retry-After values are returned to the caller instead of waited on
+MAX_RETRY_AFTER = 10.0
+
+
+class HttpUpstream(BaseModel):
+    """Connection settings for one upstream."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    retries: int = 2
+    backoff: float = 0.5
+
+
+_upstreams: Dict[str, HttpUpstream] = {}
+# upstream name -> (client, event loop the client belongs to)
+_clients: Dict[str, Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Transport that retries failed requests with exponential backoff.
+
+    Connection failures are retried for every method. Read errors and
+    retryable status codes are retried for idempotent methods only, except
+    429 which means the upstream did not process the request.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, retries: int, backoff: float
+    ):
+        self._transport = transport
+        self._retries = retries
+        self._backoff = backoff
+
+    def _delay(self, attempt: int) -> float:
+        return self._backoff * (2**attempt) * (0.5 + random.random())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        idempotent = request.method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+                if attempt >= self._retries:
+                    raise
+                delay = self._delay(attempt)
+            except (httpx.ReadTimeout, httpx.RemoteProtocolError):
+                if attempt >= self._retries or not idempotent:
+                    raise
+                delay = self._delay(attempt)
+            else:
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt >= self._retries
+                    or (not idempotent and response.status_code != 429)
+                ):
+                    return response
+                delay = self._delay(attempt)
+                retry_after = response.headers.get("Retry-After")
+                if retry_after:
+                    try:
+                        delay = float(retry_after)
+                    except ValueError:
+                        pass
+                if delay > MAX_RETRY_AFTER:
+                    return response
+                await response.aclose()
+            logger.debug(
+                f"Retrying {request.method} {request.url.host} in {delay:.2f}s "
+                f"(attempt {attempt + 1})"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def register_http_upstream(name: str, **settings) -> None:
+    """Set connection settings for an upstream before its client is created.
+
+    Args:
+        name: Upstream name, usually the skill category
+        **settings: Fields of HttpUpstream to override
+    """
+    _upstreams[name] = HttpUpstream(**settings)
+
+
+def _create_client(upstream: HttpUpstream) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=upstream.max_connections,
+        max_keepalive_connections=upstream.max_keepalive_connections,
+        keepalive_expiry=upstream.keepalive_expiry,
+    )
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=limits)
+    return httpx.AsyncClient(
+        transport=RetryTransport(transport, upstream.retries, upstream.backoff),
+        timeout=httpx.Timeout(upstream.timeout, connect=upstream.connect_timeout),
+    )
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """Get the shared client for an upstream, creating it on first use.
+
+    The client is owned by the registry, callers must not close it or use it
+    as a context manager.
+
+    Args:
+        name: Upstream name, usually the skill category
+
+    Returns:
+        httpx.AsyncClient: Pooled client for the upstream
+    """
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(name)
+    if entry:
+        client, client_loop = entry
+        # Connections cannot be shared across event loops
+        if client_loop is loop and not client.is_closed:
+            return client
+    client = _create_client(_upstreams.get(name) or HttpUpstream())
+    _clients[name] = (client, loop)
+    return client
+
+
+async def close_http_clients(name: Optional[str] = None) -> None:
+    """Close pooled clients, call on shutdown.
+
+    Args:
+        name: Upstream to close, all upstreams if None
+    """
+    loop = asyncio.get_running_loop()
+    names = [name] if name else list(_clients.keys())
+    for n in names:
+        entry = _clients.pop(n, None)
+        if not entry:
+            continue
+        client, client_loop = entry
+        if client_loop is not loop:
+            continue
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close HTTP client for {n}: {e}")
@@ -0,0 +1,177 @@
+"""
+Rate limiting shared by skills and services.
+
+Limits use GCRA (generic cell rate algorithm), a sliding window that stores a
+single timestamp per key: the time the key is fully replenished. A limit of
+N per period allows bursts of up to N, then one more every period / N.
+
+The check and the update run in one Lua script, so concurrent callers in
+every process see a consistent count. Without Redis the same algorithm runs
+in process memory, which limits per process only.
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from intentkit.models.redis import get_redis
+from intentkit.utils.error import RateLimitExceeded
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_KEY_PREFIX = "intentkit:rate_limit:"
+# Keys tracked in process when Redis is absent
+LOCAL_KEYS_SIZE = 10000
+
+# KEYS[1]: limit key
+# ARGV: emission interval ms, period ms, cost
+# Returns: allowed (0/1), remaining, retry after ms, reset after ms
+GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local new_tat = tat + interval * cost
+local allow_at = new_tat - period
+if now < allow_at then
+    local remaining = math.floor((period - (tat - now)) / interval)
+    return {0, remaining, allow_at - now, tat - now}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+local remaining = math.floor((period - (new_tat - now)) / interval)
+return {1, remaining, 0, new_tat - now}
+"""
+
+_script = None
+_script_client = None
+# key -> time in ms the key is fully replenished
+_local: OrderedDict[str, float] = OrderedDict()
+
+
+class RateLimitStatus(BaseModel):
+    """Result of a rate limit check, with the headroom left."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    # Seconds until the next request is allowed, 0 if allowed now
+    retry_after: float
+    # Seconds until the full limit is available again
+    reset_after: float
+
+
+def rate_limit_key(*parts: str) -> str:
+    """Build a limit key from parts like user, agent, skill or category."""
+    return RATE_LIMIT_KEY_PREFIX + ":".join(str(part) for part in parts)
+
+
+def _get_script():
+    global _script, _script_client
+    redis = get_redis()
+    if _script is None or _script_client is not redis:
+        _script = redis.register_script(GCRA_SCRIPT)
+        _script_client = redis
+    return _script
+
+
+def _check_local(key: str, interval: float, period: float, cost: int) -> list:
+    """Same algorithm as GCRA_SCRIPT, on process memory."""
+    now = time.time() * 1000
+    tat = max(_local.get(key, now), now)
+    new_tat = tat + interval * cost
+    allow_at = new_tat - period
+    if now < allow_at:
+        remaining = math.floor((period - (tat - now)) / interval)
+        return [0, remaining, allow_at - now, tat - now]
+    _local[key] = new_tat
+    _local.move_to_end(key)
+    while len(_local) > LOCAL_KEYS_SIZE:
+        _local.popitem(last=False)
+    remaining = math.floor((period - (new_tat - now)) / interval)
+    return [1, remaining, 0, new_tat - now]
+
+
+async def rate_limit(
+    key: str, limit: int, period: float, cost: int = 1
+) -> RateLimitStatus:
+    """Count a request against a limit.
+
+    Args:
+        key: Limit key, see rate_limit_key
+        limit: Requests allowed per period
+        period: Period in seconds
+        cost: Requests this call counts as
+
+    Returns:
+        RateLimitStatus: Whether the request is allowed and the headroom left
+
+    Raises:
+        ValueError: If limit or period is not positive
+    """
+    if limit <= 0 or period <= 0:
+        raise ValueError(
+            f"Rate limit {key} needs a positive limit and period, "
+            f"got {limit} per {period}s"
+        )
+    period_ms = round(period * 1000)
+    # Whole milliseconds, at least 1 so the script never divides by zero
+    interval = max(1, round(period_ms / limit))
+    try:
+        result = await _get_script()(keys=[key], args=[interval, period_ms, cost])
+    except RuntimeError:
+        # Redis not initialized
+        result = _check_local(key, interval, period_ms, cost)
+    except RedisError as e:
+        logger.info(f"Redis error in rate limiting {key}, limiting in process: {e}")
+        result = _check_local(key, interval, period_ms, cost)
+
+    allowed, remaining, retry_after, reset_after = (float(x) for x in result)
+    return RateLimitStatus(
+        allowed=bool(allowed),
+        limit=limit,
+        remaining=max(0, int(remaining)),
+        retry_after=retry_after / 1000,
+        reset_after=reset_after / 1000,
+    )
+
+
+async def check_rate_limit(
+    key: str,
+    limit: int,
+    period: float,
+    cost: int = 1,
+    message: Optional[str] = None,
+) -> RateLimitStatus:
+    """Count a request against a limit, raising if it is exceeded.
+
+    Args:
+        key: Limit key, see rate_limit_key
+        limit: Requests allowed per period
+        period: Period in seconds
+        cost: Requests this call counts as
+        message: Error message, a default mentions the retry time
+
+    Returns:
+        RateLimitStatus: The headroom left
+
+    Raises:
+        RateLimitExceeded: If the limit is exceeded
+        ValueError: If limit or period is not positive
+    """
+    status = await rate_limit(key, limit, period, cost)
+    if not status.allowed:
+        raise RateLimitExceeded(
+            message
+            or f"Rate limit exceeded, retry in {math.ceil(status.retry_after)}s",
+            retry_after=status.retry_after,
+        )
+    return status
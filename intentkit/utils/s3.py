@@ -1,11 +1,18 @@
 """
 S3 utility module for storing and retrieving images from AWS S3.
+
+Blocking boto3 calls run in a bounded thread pool so uploads never stall the
+event loop.
 """
 
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from io import BytesIO
-from typing import Optional
+from functools import partial
+from typing import AsyncIterator, Callable, Optional
 
 import boto3
 import filetype
@@ -21,8 +28,21 @@ _client: Optional[S3Client] = None
 _prefix: Optional[str] = None
 _cdn_url: Optional[str] = None
 
-
-def init_s3(bucket: str, cdn_url: str, env: str) -> None:
+# Max concurrent S3 requests per process, boto3 calls block so they run here
+S3_MAX_CONCURRENCY = 8
+_executor = ThreadPoolExecutor(max_workers=S3_MAX_CONCURRENCY, thread_name_prefix="s3")
+# Streamed content larger than this is uploaded in parts of this size
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+# Bytes needed to detect the content type
+CONTENT_TYPE_HEAD_BYTES = 262
+# sha256 of recently uploaded content -> CDN URL, identical content is uploaded once
+UPLOADED_CACHE_SIZE = 10000
+_uploaded: OrderedDict[str, str] = OrderedDict()
+
+
+def init_s3(
+    bucket: str, cdn_url: str, env: str, endpoint_url: Optional[str] = None
+) -> None:
     """
     Initialize S3 configuration.
 
@@ -30,6 +50,7 @@ def init_s3(bucket: str, cdn_url: str, env: str) -> None:
         bucket: S3 bucket name
         cdn_url: CDN URL for the S3 bucket
         env: Environment name for the prefix
+        endpoint_url: Optional S3-compatible endpoint, e.g. MinIO for local runs
 
     Raises:
         ValueError: If bucket or cdn_url is empty
@@ -44,15 +65,185 @@ def init_s3(bucket: str, cdn_url: str, env: str) -> None:
     _bucket = bucket
     _cdn_url = cdn_url
     _prefix = f"{env}/intentkit/"
-    _client = boto3.client("s3")
+    _client = boto3.client("s3", endpoint_url=endpoint_url)
 
     logger.info(f"S3 initialized with bucket: {bucket}, prefix: {_prefix}")
 
 
+def _run(func: Callable, *args, **kwargs):
+    """Run a blocking boto3 call in the S3 thread pool, off the event loop."""
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(_executor, partial(func, *args, **kwargs))
+
+
+def _remember(digest: str, cdn_url: str) -> None:
+    _uploaded[digest] = cdn_url
+    _uploaded.move_to_end(digest)
+    while len(_uploaded) > UPLOADED_CACHE_SIZE:
+        _uploaded.popitem(last=False)
+
+
+def _guess_content_type(head: bytes, file_type: "FileType") -> str:
+    """Detect the content type from the first bytes, with a default per file type."""
+    if file_type == FileType.PDF:
+        return "application/pdf"
+    defaults = {
+        FileType.IMAGE: "image/jpeg",
+        FileType.VIDEO: "video/mp4",
+        FileType.AUDIO: "audio/mpeg",
+    }
+    if file_type not in defaults:
+        raise ValueError(f"Unsupported file type: {file_type}")
+    kind = filetype.guess(head)
+    if kind and kind.mime.startswith(f"{file_type.value}/"):
+        return kind.mime
+    return defaults[file_type]
+
+
+async def _upload_bytes(data: bytes, key: str, content_type: str) -> str:
+    """Upload bytes with a single PUT off the event loop, skipping known content.
+
+    Args:
+        data: Content to upload
+        key: Key to store the content under (without prefix)
+        content_type: Content type of the object
+
+    Returns:
+        str: The CDN URL of the stored object, or of the identical object
+            uploaded before
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    if digest in _uploaded:
+        _uploaded.move_to_end(digest)
+        logger.info(f"Identical content already uploaded to {_uploaded[digest]}")
+        return _uploaded[digest]
+
+    prefixed_key = f"{_prefix}{key}"
+    await _run(
+        _client.put_object,
+        Bucket=_bucket,
+        Key=prefixed_key,
+        Body=data,
+        ContentType=content_type,
+        ContentDisposition="inline",
+        Metadata={"sha256": digest},
+    )
+    cdn_url = f"{_cdn_url}/{prefixed_key}"
+    _remember(digest, cdn_url)
+    return cdn_url
+
+
+async def _upload_stream(
+    chunks: AsyncIterator[bytes],
+    key: str,
+    file_type: "FileType",
+    content_type: Optional[str] = None,
+) -> str:
+    """Upload a byte stream, holding at most one multipart part in memory.
+
+    Content smaller than one part is sent with a single PUT and deduplicated
+    by its hash. Larger content goes through a multipart upload, which is
+    aborted if anything fails.
+
+    Args:
+        chunks: Async iterator of content chunks
+        key: Key to store the content under (without prefix)
+        file_type: Type of the content, used for content type detection
+        content_type: Content type reported by the source, detected from the
+            content if missing or generic
+
+    Returns:
+        str: The CDN URL of the stored object
+    """
+    prefixed_key = f"{_prefix}{key}"
+    hasher = hashlib.sha256()
+    buffer = bytearray()
+    if content_type == "binary/octet-stream" or not content_type:
+        content_type = None
+    upload_id = None
+    parts = []
+
+    try:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            hasher.update(chunk)
+            buffer.extend(chunk)
+            if content_type is None and len(buffer) >= CONTENT_TYPE_HEAD_BYTES:
+                content_type = _guess_content_type(bytes(buffer), file_type)
+            if len(buffer) < MULTIPART_PART_SIZE:
+                continue
+            if upload_id is None:
+                response = await _run(
+                    _client.create_multipart_upload,
+                    Bucket=_bucket,
+                    Key=prefixed_key,
+                    ContentType=content_type,
+                    ContentDisposition="inline",
+                )
+                upload_id = response["UploadId"]
+            part = bytes(buffer)
+            buffer.clear()
+            response = await _run(
+                _client.upload_part,
+                Bucket=_bucket,
+                Key=prefixed_key,
+                UploadId=upload_id,
+                PartNumber=len(parts) + 1,
+                Body=part,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": len(parts) + 1})
+
+        if upload_id is None:
+            if not buffer:
+                raise ValueError("File bytes cannot be empty")
+            data = bytes(buffer)
+            return await _upload_bytes(
+                data, key, content_type or _guess_content_type(data, file_type)
+            )
+
+        if buffer:
+            response = await _run(
+                _client.upload_part,
+                Bucket=_bucket,
+                Key=prefixed_key,
+                UploadId=upload_id,
+                PartNumber=len(parts) + 1,
+                Body=bytes(buffer),
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": len(parts) + 1})
+        await _run(
+            _client.complete_multipart_upload,
+            Bucket=_bucket,
+            Key=prefixed_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except BaseException:
+        if upload_id is not None:
+            try:
+                await _run(
+                    _client.abort_multipart_upload,
+                    Bucket=_bucket,
+                    Key=prefixed_key,
+                    UploadId=upload_id,
+                )
+            except ClientError as e:
+                logger.error(f"Failed to abort multipart upload {upload_id}: {e}")
+        raise
+
+    cdn_url = f"{_cdn_url}/{prefixed_key}"
+    _remember(hasher.hexdigest(), cdn_url)
+    return cdn_url
+
+
 async def store_image(url: str, key: str) -> str:
     """
     Store an image from a URL to S3 asynchronously.
 
+    The image is streamed from the URL to S3, large images use a multipart
+    upload so the whole body is never held in memory.
+
     Args:
         url: Source URL of the image
         key: Key to store the image under (without prefix)
@@ -70,40 +261,17 @@ async def store_image(url: str, key: str) -> str:
         return url
 
     try:
-        # Download the image from the URL asynchronously
         async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True)
-            response.raise_for_status()
-
-            # Prepare the S3 key with prefix
-            prefixed_key = f"{_prefix}{key}"
-
-            # Use BytesIO to create a file-like object that implements read
-            file_obj = BytesIO(response.content)
-
-            # Determine the correct content type
-            content_type = response.headers.get("Content-Type", "")
-            if content_type == "binary/octet-stream" or not content_type:
-                # Try to detect the image type from the content
-                kind = filetype.guess(response.content)
-                if kind and kind.mime.startswith("image/"):
-                    content_type = kind.mime
-                else:
-                    # Default to JPEG if detection fails
-                    content_type = "image/jpeg"
-
-            # Upload to S3
-            _client.upload_fileobj(
-                file_obj,
-                _bucket,
-                prefixed_key,
-                ExtraArgs={"ContentType": content_type, "ContentDisposition": "inline"},
-            )
-
-            # Return the CDN URL
-            cdn_url = f"{_cdn_url}/{prefixed_key}"
-            logger.info(f"Image uploaded successfully to {cdn_url}")
-            return cdn_url
+            async with client.stream("GET", url, follow_redirects=True) as response:
+                response.raise_for_status()
+                cdn_url = await _upload_stream(
+                    response.aiter_bytes(),
+                    key,
+                    FileType.IMAGE,
+                    response.headers.get("Content-Type"),
+                )
+        logger.info(f"Image uploaded successfully to {cdn_url}")
+        return cdn_url
 
     except httpx.HTTPError as e:
         logger.error(f"Failed to download image from URL {url}: {str(e)}")
@@ -140,33 +308,12 @@ async def store_image_bytes(
         raise ValueError("Image bytes cannot be empty")
 
     try:
-        # Prepare the S3 key with prefix
-        prefixed_key = f"{_prefix}{key}"
-
-        # Use BytesIO to create a file-like object that implements read
-        file_obj = BytesIO(image_bytes)
-
         # Determine the correct content type if not provided
         if not content_type:
-            # Try to detect the image type from the content
-            kind = filetype.guess(image_bytes)
-            if kind and kind.mime.startswith("image/"):
-                content_type = kind.mime
-            else:
-                # Default to JPEG if detection fails
-                content_type = "image/jpeg"
+            content_type = _guess_content_type(image_bytes, FileType.IMAGE)
 
         logger.info("uploading image to s3")
-        # Upload to S3
-        _client.upload_fileobj(
-            file_obj,
-            _bucket,
-            prefixed_key,
-            ExtraArgs={"ContentType": content_type, "ContentDisposition": "inline"},
-        )
-
-        # Return the CDN URL
-        cdn_url = f"{_cdn_url}/{prefixed_key}"
+        cdn_url = await _upload_bytes(image_bytes, key, content_type)
         logger.info(f"image is uploaded to {cdn_url}")
         return cdn_url
 
@@ -216,49 +363,12 @@ async def store_file_bytes(
         )
 
     try:
-        # Prepare the S3 key with prefix
-        prefixed_key = f"{_prefix}{key}"
-
-        # Use BytesIO to create a file-like object that implements read
-        file_obj = BytesIO(file_bytes)
-
         # Determine content type based on file_type
-        content_type = ""
-        if file_type == FileType.IMAGE:
-            kind = filetype.guess(file_bytes)
-            if kind and kind.mime.startswith("image/"):
-                content_type = kind.mime
-            else:
-                content_type = "image/jpeg"
-        elif file_type == FileType.VIDEO:
-            kind = filetype.guess(file_bytes)
-            if kind and kind.mime.startswith("video/"):
-                content_type = kind.mime
-            else:
-                content_type = "video/mp4"
-        elif file_type == FileType.AUDIO:
-            kind = filetype.guess(file_bytes)
-            if kind and kind.mime.startswith("audio/"):
-                content_type = kind.mime
-            else:
-                content_type = "audio/mpeg"
-        elif file_type == FileType.PDF:
-            content_type = "application/pdf"
-        else:
-            raise ValueError(f"Unsupported file type: {file_type}")
+        content_type = _guess_content_type(file_bytes, file_type)
 
         logger.info(f"Uploading {file_type} to S3 with content type {content_type}")
 
-        # Upload to S3
-        _client.upload_fileobj(
-            file_obj,
-            _bucket,
-            prefixed_key,
-            ExtraArgs={"ContentType": content_type, "ContentDisposition": "inline"},
-        )
-
-        # Return the CDN URL
-        cdn_url = f"{_cdn_url}/{prefixed_key}"
+        cdn_url = await _upload_bytes(file_bytes, key, content_type)
         logger.info(f"{file_type} uploaded successfully to {cdn_url}")
         return cdn_url
 
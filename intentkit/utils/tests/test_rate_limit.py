@@ -0,0 +1,83 @@
+"""Tests for the GCRA rate limiter, in Redis (fakeredis) and in process."""
+
+import unittest
+
+from fakeredis import FakeAsyncRedis
+from intentkit.models import redis as redis_module
+from intentkit.utils import rate_limit as rate_limit_module
+from intentkit.utils.error import RateLimitExceeded
+from intentkit.utils.rate_limit import check_rate_limit, rate_limit
+
+
+class RateLimitCases:
+    """Cases run against both the Lua script and the in process fallback."""
+
+    async def test_allows_a_burst_up_to_the_limit(self):
+        statuses = [await rate_limit("k", 3, 60) for _ in range(4)]
+
+        self.assertEqual([s.allowed for s in statuses], [True, True, True, False])
+        self.assertEqual([s.remaining for s in statuses], [2, 1, 0, 0])
+        self.assertEqual(statuses[0].retry_after, 0)
+        # One more request is allowed every period / limit
+        self.assertAlmostEqual(statuses[3].retry_after, 20, delta=0.5)
+        self.assertAlmostEqual(statuses[3].reset_after, 60, delta=0.5)
+
+    async def test_denied_requests_are_not_counted(self):
+        await rate_limit("k", 2, 60)
+        await rate_limit("k", 2, 60)
+        await rate_limit("k", 2, 60)
+        status = await rate_limit("k", 2, 60)
+
+        self.assertFalse(status.allowed)
+        self.assertAlmostEqual(status.reset_after, 60, delta=0.5)
+
+    async def test_cost_counts_as_several_requests(self):
+        first = await rate_limit("k", 5, 60, cost=4)
+        second = await rate_limit("k", 5, 60, cost=2)
+
+        self.assertTrue(first.allowed)
+        self.assertEqual(first.remaining, 1)
+        self.assertFalse(second.allowed)
+
+    async def test_keys_are_limited_separately(self):
+        await rate_limit("a", 1, 60)
+
+        self.assertFalse((await rate_limit("a", 1, 60)).allowed)
+        self.assertTrue((await rate_limit("b", 1, 60)).allowed)
+
+    async def test_limit_above_one_per_millisecond(self):
+        status = await rate_limit("k", 5000, 1)
+
+        self.assertTrue(status.allowed)
+        self.assertLessEqual(status.remaining, 5000)
+        # The interval is at least 1 ms, so a burst holds at most 1000
+        self.assertFalse((await rate_limit("k", 5000, 1, cost=1001)).allowed)
+
+    async def test_non_positive_limit_is_rejected(self):
+        with self.assertRaises(ValueError):
+            await rate_limit("k", 0, 60)
+        with self.assertRaises(ValueError):
+            await rate_limit("k", 1, 0)
+
+    async def test_check_raises_with_retry_time(self):
+        await check_rate_limit("k", 1, 60)
+
+        with self.assertRaises(RateLimitExceeded) as raised:
+            await check_rate_limit("k", 1, 60)
+        self.assertAlmostEqual(raised.exception.retry_after, 60, delta=0.5)
+
+
+class TestRedisRateLimit(RateLimitCases, unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        redis_module._redis_client = FakeAsyncRedis(decode_responses=True)
+        self.addCleanup(setattr, redis_module, "_redis_client", None)
+
+
+class TestLocalRateLimit(RateLimitCases, unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        redis_module._redis_client = None
+        rate_limit_module._local.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Tests for S3 uploads against a moto stand-in."""
+
+import unittest
+from unittest.mock import patch
+
+import boto3
+import httpx
+from intentkit.utils import s3
+from intentkit.utils.s3 import FileType
+from moto import mock_aws
+
+BUCKET = "intentkit-test"
+CDN_URL = "https://cdn.example.com"
+# Smallest part size S3 accepts for all but the last part
+PART_SIZE = 5 * 1024 * 1024
+# PNG signature and header, enough for content type detection
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00\x00\x00\rIHDR" + b"\x00" * 300
+
+
+async def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+class TestS3Upload(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mock = mock_aws()
+        self.mock.start()
+        self.addCleanup(self.mock.stop)
+        self.client = boto3.client("s3", region_name="us-east-1")
+        self.client.create_bucket(Bucket=BUCKET)
+        with patch.dict("os.environ", {"AWS_DEFAULT_REGION": "us-east-1"}):
+            s3.init_s3(BUCKET, CDN_URL, "test")
+        s3._uploaded.clear()
+
+    def head(self, key):
+        return self.client.head_object(Bucket=BUCKET, Key=f"test/intentkit/{key}")
+
+    def serve(self, body: bytes, headers: dict):
+        """Make store_image download body with the given response headers."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body, headers=headers)
+        )
+        real_client = httpx.AsyncClient
+        return patch.object(
+            s3.httpx,
+            "AsyncClient",
+            lambda *args, **kwargs: real_client(transport=transport),
+        )
+
+    async def test_store_image_bytes_detects_content_type(self):
+        url = await s3.store_image_bytes(PNG_BYTES, "avatar.png")
+
+        self.assertEqual(url, f"{CDN_URL}/test/intentkit/avatar.png")
+        self.assertEqual(self.head("avatar.png")["ContentType"], "image/png")
+
+    async def test_store_image_keeps_upstream_content_type(self):
+        with self.serve(PNG_BYTES, {"Content-Type": "image/webp"}):
+            url = await s3.store_image("https://example.com/a", "a.webp")
+
+        self.assertEqual(url, f"{CDN_URL}/test/intentkit/a.webp")
+        self.assertEqual(self.head("a.webp")["ContentType"], "image/webp")
+
+    async def test_store_image_detects_generic_content_type(self):
+        with self.serve(PNG_BYTES, {"Content-Type": "binary/octet-stream"}):
+            await s3.store_image("https://example.com/b", "b.png")
+
+        self.assertEqual(self.head("b.png")["ContentType"], "image/png")
+
+    async def test_identical_content_is_uploaded_once(self):
+        first = await s3.store_file_bytes(PNG_BYTES, "one.png", FileType.IMAGE)
+        second = await s3.store_file_bytes(PNG_BYTES, "two.png", FileType.IMAGE)
+
+        self.assertEqual(first, second)
+        with self.assertRaises(self.client.exceptions.ClientError):
+            self.head("two.png")
+
+    async def test_large_stream_uses_multipart_upload(self):
+        data = PNG_BYTES + b"\x01" * (PART_SIZE + 1024)
+        with patch.object(s3, "MULTIPART_PART_SIZE", PART_SIZE):
+            url = await s3._upload_stream(
+                _chunks(data, 1024 * 1024), "big.png", FileType.IMAGE
+            )
+
+        self.assertEqual(url, f"{CDN_URL}/test/intentkit/big.png")
+        head = self.head("big.png")
+        self.assertEqual(head["ContentLength"], len(data))
+        self.assertEqual(head["ContentType"], "image/png")
+        # Multipart ETags end with the number of parts
+        self.assertTrue(head["ETag"].strip('"').endswith("-2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
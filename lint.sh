@@ -13,6 +13,13 @@ else
     uv run ruff check --fix
 fi
 
+echo "Checking skill manifest..."
+if [ "$1" = "ci" ]; then
+    uv run python scripts/build_skill_manifest.py --check
+else
+    uv run python scripts/build_skill_manifest.py
+fi
+
 echo "Validating JSON schema files..."
 
 # Function to validate a JSON schema file using Python
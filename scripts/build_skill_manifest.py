@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Generate intentkit/skills/manifest.json from the skill schema.json files.
+
+Run it after adding a skill category or changing a skill schema.
+
+Usage:
+  build_skill_manifest.py [--check]
+
+Returns:
+  0 - Manifest written, or up to date with --check
+  1 - Manifest is out of date (--check only)
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path to allow imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from intentkit.skills.registry import MANIFEST_PATH, build_manifest, write_manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="fail if manifest.json differs from the schemas instead of writing it",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                current = json.load(f)
+        except FileNotFoundError:
+            current = None
+        if current != build_manifest():
+            print(
+                f"{MANIFEST_PATH} is out of date, run scripts/build_skill_manifest.py"
+            )
+            sys.exit(1)
+        print("Skill manifest is up to date")
+        return
+
+    manifest = write_manifest()
+    print(f"Wrote {len(manifest['categories'])} skill categories to {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
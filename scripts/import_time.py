@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Measure the import time of intentkit modules and fail when over budget.
+
+Each module is imported in a fresh interpreter several times, the median of
+the cumulative time reported by `python -X importtime` is compared with the
+module budget.
+
+Usage:
+  import_time.py [MODULE=BUDGET_MS ...] [--runs N]
+
+Returns:
+  0 - All modules import within budget
+  1 - A module is over budget or failed to import
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Module -> import time budget in milliseconds
+DEFAULT_BUDGETS = {
+    "intentkit": 50,
+    "intentkit.config.config": 1500,
+    "intentkit.models.agent": 4000,
+}
+
+
+def measure(module: str) -> float:
+    """Import a module in a fresh interpreter, returning the time in ms."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    for line in reversed(result.stderr.splitlines()):
+        parts = [p.strip() for p in line.removeprefix("import time:").split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "budgets",
+        nargs="*",
+        help="MODULE=BUDGET_MS pairs, defaults to the built-in budgets",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="imports per module")
+    args = parser.parse_args()
+
+    budgets = DEFAULT_BUDGETS
+    if args.budgets:
+        budgets = {}
+        for item in args.budgets:
+            module, _, budget = item.partition("=")
+            budgets[module] = float(budget)
+
+    failed = False
+    for module, budget in budgets.items():
+        try:
+            times = [measure(module) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"FAIL {module}: {e}")
+            failed = True
+            continue
+        median = statistics.median(times)
+        status = "OK  " if median <= budget else "FAIL"
+        failed = failed or median > budget
+        print(f"{status} {module}: {median:.0f} ms (budget {budget:.0f} ms)")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()